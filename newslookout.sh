@@ -35,14 +35,9 @@ else
 		echo "Start date = $NEWSLOOKOUT_RUNDATE_FROM"
 		echo "End date = $NEWSLOOKOUT_RUNDATE_TO"
 		
-		start_date=$NEWSLOOKOUT_RUNDATE_FROM
-		end_date=$NEWSLOOKOUT_RUNDATE_TO
-		# loop through all dates in between:
-		until [[ $start_date > $end_date ]]; do 
-			#echo "Calculating and adding date: $start_date"
-			date_arr+=($start_date)
-			start_date=$(date -I -d "$start_date + 1 day")
-		done
+		# backfill all dates in between in one run, sharing the plugins and resources across the dates:
+		$PYTHON_BIN $PYTHON_APP  -c $CONFIG_FILE -d $NEWSLOOKOUT_RUNDATE_FROM --date-to $NEWSLOOKOUT_RUNDATE_TO
+		exit $?
 	else
 		# processing for single date:
 		if [ -z "$1" ]
@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: cassette.py                                                                                  #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: Record and replay the network traffic of the application for offline, deterministic runs      #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+"""
+ Provides:
+    NetworkCassette: Archive of recorded HTTP(S) interactions, saved as a compact zip file.
+    RecordingAdapter: Transport adapter that fetches over the network and records every response.
+    ReplayAdapter: Transport adapter that serves the recorded responses, with simulated latency and bandwidth.
+
+ The network mode is selected by the configuration parameter 'network_mode' in the [operation] section:
+    live   - fetch from the network (default)
+    record - fetch from the network and record every request/response into the cassette file
+    replay - serve all requests from the cassette file, nothing is fetched from the network
+"""
+
+# import standard python libraries:
+import bz2
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+from datetime import timedelta
+
+# import web retrieval python libraries:
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+##########
+
+# setup logging
+logger = logging.getLogger(__name__)
+
+NETWORK_MODE_LIVE = 'live'
+NETWORK_MODE_RECORD = 'record'
+NETWORK_MODE_REPLAY = 'replay'
+# all requests are routed to the local synthetic news site server, see module synthetic_site:
+NETWORK_MODE_SYNTHETIC = 'synthetic'
+
+
+class NetworkCassette:
+    """ Archive of recorded HTTP(S) interactions.
+
+    Each interaction is identified by the HTTP method and URL of the request, and holds the
+    status code, headers and body of the response. The bodies are bz2 compressed and the whole
+    cassette is saved into a single zip archive with an index.json file listing the interactions.
+    If the same request is recorded more than once, the latest response is retained.
+    """
+    indexFileName = 'index.json'
+    # cassettes opened by the application, indexed by file name:
+    _openCassettes = dict()
+    _registryLock = threading.Lock()
+
+    def __init__(self, cassetteFile: str, latency_ms: int = 0, bandwidth_kbps: int = 0):
+        """ Initialize the cassette, and load the recorded interactions if the file exists.
+
+        :param cassetteFile: Name of the zip archive holding the recorded interactions
+        :param latency_ms: Simulated latency in milliseconds added to each replayed response
+        :param bandwidth_kbps: Simulated bandwidth in kilobits per second for replayed responses, 0 for unlimited
+        """
+        self.cassetteFile = cassetteFile
+        self.latency_ms = max(0, latency_ms)
+        self.bandwidth_kbps = max(0, bandwidth_kbps)
+        self.interactions = dict()
+        self.isModified = False
+        self.replayCount = 0
+        self.missCount = 0
+        self._lock = threading.Lock()
+        if cassetteFile is not None and os.path.isfile(cassetteFile):
+            self.load()
+
+    @staticmethod
+    def getRequestKey(method: str, url: str) -> str:
+        """ Get the key identifying a request in the cassette.
+
+        :param method: HTTP method, e.g. GET
+        :param url: The URL requested
+        :return: Key string
+        """
+        return f'{str(method).upper()} {url}'
+
+    def __len__(self):
+        with self._lock:
+            return len(self.interactions)
+
+    def __contains__(self, requestKey):
+        with self._lock:
+            return requestKey in self.interactions
+
+    def addInteraction(self, url: str, body, status_code: int = 200, headers: dict = None,
+                       method: str = 'GET', elapsed_sec: float = 0.0):
+        """ Add the response for a request to the cassette.
+
+        :param url: The URL requested
+        :param body: Body of the response, str or bytes
+        :param status_code: HTTP status code of the response
+        :param headers: Dictionary of the response headers
+        :param method: HTTP method of the request
+        :param elapsed_sec: Time taken by the server to respond, in seconds
+        """
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+        if headers is None:
+            headers = {'Content-Type': 'text/html; charset=utf-8'}
+        interaction = {'method': str(method).upper(),
+                       'url': url,
+                       'status_code': int(status_code),
+                       'headers': dict(headers),
+                       'elapsed_sec': float(elapsed_sec),
+                       'body': bz2.compress(body)}
+        with self._lock:
+            self.interactions[NetworkCassette.getRequestKey(method, url)] = interaction
+            self.isModified = True
+
+    def recordResponse(self, response: requests.Response):
+        """ Record the given HTTP response, along with the request that was sent for it.
+
+        :param response: Response object returned by the transport adapter
+        """
+        try:
+            elapsed_sec = response.elapsed.total_seconds() if response.elapsed is not None else 0.0
+            # the body is saved after it has been decoded, so drop the transport encoding headers:
+            headers = {key: value for key, value in response.headers.items()
+                       if key.lower() not in ('content-encoding', 'transfer-encoding', 'content-length')}
+            self.addInteraction(response.request.url,
+                                response.content,
+                                status_code=response.status_code,
+                                headers=headers,
+                                method=response.request.method,
+                                elapsed_sec=elapsed_sec)
+        except Exception as e:
+            logger.error("Error recording response for URL %s: %s", response.url, e)
+
+    def getInteraction(self, method: str, url: str) -> dict:
+        """ Get the recorded interaction for the given request.
+
+        :param method: HTTP method of the request
+        :param url: The URL requested
+        :return: Dictionary with the recorded response, or None if it was not recorded.
+        """
+        with self._lock:
+            return self.interactions.get(NetworkCassette.getRequestKey(method, url))
+
+    def getSimulatedDelay(self, bodySize: int) -> float:
+        """ Calculate the time taken to deliver a response of the given size over the simulated network.
+
+        :param bodySize: Size of the response body in bytes
+        :return: Delay in seconds
+        """
+        delay_sec = self.latency_ms / 1000.0
+        if self.bandwidth_kbps > 0:
+            delay_sec += (bodySize * 8.0) / (self.bandwidth_kbps * 1000.0)
+        return delay_sec
+
+    def buildResponse(self, request: requests.PreparedRequest) -> requests.Response:
+        """ Build the response for the given request from the recorded interaction.
+        Requests that were not recorded get a 404 response, so that they are not retried.
+
+        :param request: The prepared request to respond to
+        :return: Response object
+        """
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        interaction = self.getInteraction(request.method, request.url)
+        if interaction is None:
+            with self._lock:
+                self.missCount += 1
+            logger.warning("Request not found in network cassette: %s %s", request.method, request.url)
+            response.status_code = 404
+            response.reason = 'Not Found'
+            response.headers = CaseInsensitiveDict({'Content-Type': 'text/plain', 'X-Cassette': 'miss'})
+            response._content = b''
+        else:
+            with self._lock:
+                self.replayCount += 1
+            response.status_code = interaction['status_code']
+            response.reason = 'OK' if response.status_code < 400 else 'Error'
+            response.headers = CaseInsensitiveDict(interaction['headers'])
+            response._content = bz2.decompress(interaction['body'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        delay_sec = self.getSimulatedDelay(len(response._content))
+        if delay_sec > 0:
+            time.sleep(delay_sec)
+        response.elapsed = timedelta(seconds=delay_sec)
+        return response
+
+    def load(self):
+        """ Load the interactions from the cassette file.
+        """
+        try:
+            with zipfile.ZipFile(self.cassetteFile, mode='r') as cassetteZip:
+                indexList = json.loads(cassetteZip.read(NetworkCassette.indexFileName).decode('utf-8'))
+                for entry in indexList:
+                    interaction = dict(entry)
+                    interaction['body'] = cassetteZip.read(entry['body'])
+                    self.interactions[NetworkCassette.getRequestKey(entry['method'], entry['url'])] = interaction
+            logger.info("Loaded %s recorded interactions from network cassette: %s",
+                        len(self.interactions), self.cassetteFile)
+        except Exception as e:
+            logger.error("Error loading network cassette %s: %s", self.cassetteFile, e)
+
+    def save(self):
+        """ Save all interactions into the cassette file.
+        The bodies are already bz2 compressed, so these are stored in the zip archive without re-compression.
+        """
+        with self._lock:
+            if self.isModified is False or self.cassetteFile is None:
+                return
+            try:
+                indexList = []
+                tempFileName = self.cassetteFile + '.tmp'
+                with zipfile.ZipFile(tempFileName, mode='w', compression=zipfile.ZIP_STORED) as cassetteZip:
+                    for counter, interaction in enumerate(self.interactions.values()):
+                        bodyFileName = f'bodies/{counter:06d}.bz2'
+                        cassetteZip.writestr(bodyFileName, interaction['body'])
+                        entry = {key: value for key, value in interaction.items() if key != 'body'}
+                        entry['body'] = bodyFileName
+                        indexList.append(entry)
+                    cassetteZip.writestr(NetworkCassette.indexFileName,
+                                         json.dumps(indexList, indent=1),
+                                         compress_type=zipfile.ZIP_DEFLATED)
+                os.replace(tempFileName, self.cassetteFile)
+                self.isModified = False
+                logger.info("Saved %s recorded interactions to network cassette: %s",
+                            len(indexList), self.cassetteFile)
+            except Exception as e:
+                logger.error("Error saving network cassette %s: %s", self.cassetteFile, e)
+
+    @classmethod
+    def fromFixtures(cls, cassetteFile: str, urlToFixtureMap: dict, latency_ms: int = 0, bandwidth_kbps: int = 0):
+        """ Create a cassette from saved fixture files, e.g. the test data of the plugins.
+        Files ending with .bz2 are decompressed, all others are read as-is.
+
+        :param cassetteFile: Name of the zip archive to save the cassette to, may be None to keep it in memory.
+        :param urlToFixtureMap: Dictionary mapping each URL to the name of the file with its content.
+        :param latency_ms: Simulated latency in milliseconds added to each replayed response
+        :param bandwidth_kbps: Simulated bandwidth in kilobits per second for replayed responses
+        :return: NetworkCassette object
+        """
+        cassette = cls(None, latency_ms=latency_ms, bandwidth_kbps=bandwidth_kbps)
+        cassette.cassetteFile = cassetteFile
+        for url, fixtureFileName in urlToFixtureMap.items():
+            try:
+                if fixtureFileName.endswith('.bz2'):
+                    with bz2.open(fixtureFileName, 'rb') as fixtureFile:
+                        body = fixtureFile.read()
+                else:
+                    with open(fixtureFileName, 'rb') as fixtureFile:
+                        body = fixtureFile.read()
+                cassette.addInteraction(url, body, headers=NetworkCassette.guessHeaders(fixtureFileName))
+            except Exception as e:
+                logger.error("Error adding fixture file %s to network cassette: %s", fixtureFileName, e)
+        if cassetteFile is not None:
+            cassette.save()
+        return cassette
+
+    @staticmethod
+    def guessHeaders(fileName: str) -> dict:
+        """ Guess the response headers from the name of the fixture file.
+
+        :param fileName: Name of the fixture file
+        :return: Dictionary of headers
+        """
+        if fileName.endswith('.xml'):
+            return {'Content-Type': 'application/rss+xml; charset=utf-8'}
+        elif fileName.endswith('.zip'):
+            return {'Content-Type': 'application/zip'}
+        elif fileName.endswith('.json'):
+            return {'Content-Type': 'application/json; charset=utf-8'}
+        return {'Content-Type': 'text/html; charset=utf-8'}
+
+    @classmethod
+    def getCassette(cls, cassetteFile: str, latency_ms: int = 0, bandwidth_kbps: int = 0):
+        """ Get the cassette for the given file, all network fetchers of the application share the same instance.
+
+        :param cassetteFile: Name of the zip archive holding the recorded interactions
+        :param latency_ms: Simulated latency in milliseconds added to each replayed response
+        :param bandwidth_kbps: Simulated bandwidth in kilobits per second for replayed responses
+        :return: NetworkCassette object
+        """
+        with cls._registryLock:
+            cassette = cls._openCassettes.get(cassetteFile)
+            if cassette is None:
+                cassette = cls(cassetteFile, latency_ms=latency_ms, bandwidth_kbps=bandwidth_kbps)
+                cls._openCassettes[cassetteFile] = cassette
+            return cassette
+
+    @classmethod
+    def saveAll(cls):
+        """ Save all the cassettes opened by the application, and release them.
+        """
+        with cls._registryLock:
+            for cassette in cls._openCassettes.values():
+                cassette.save()
+            cls._openCassettes.clear()
+
+
+class RecordingAdapter(HTTPAdapter):
+    """ Transport adapter that records every response it receives into the network cassette.
+    """
+
+    def __init__(self, cassette: NetworkCassette, baseAdapter: HTTPAdapter = None, **kwargs):
+        self.cassette = cassette
+        self.baseAdapter = baseAdapter if baseAdapter is not None else HTTPAdapter()
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = self.baseAdapter.send(request, **kwargs)
+        self.cassette.recordResponse(response)
+        return response
+
+    def close(self):
+        self.baseAdapter.close()
+        super().close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """ Transport adapter that serves the responses recorded in the network cassette,
+    no request is sent over the network.
+    """
+
+    def __init__(self, cassette: NetworkCassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        return self.cassette.buildResponse(request)
+
+
+def mountCassetteAdapters(session: requests.Session, network_mode: str, cassette: NetworkCassette,
+                          baseAdapter: HTTPAdapter = None) -> requests.Session:
+    """ Mount the transport adapters for the given network mode on the session.
+
+    :param session: The requests Session object
+    :param network_mode: One of: live, record or replay
+    :param cassette: The network cassette to record into or replay from
+    :param baseAdapter: Adapter used for the actual network transport of https URLs in record mode
+    :return: The session object
+    """
+    if cassette is None or network_mode == NETWORK_MODE_LIVE:
+        return session
+    if network_mode == NETWORK_MODE_RECORD:
+        session.mount('https://', RecordingAdapter(cassette, baseAdapter=baseAdapter))
+        session.mount('http://', RecordingAdapter(cassette))
+    elif network_mode == NETWORK_MODE_REPLAY:
+        replayAdapter = ReplayAdapter(cassette)
+        session.mount('https://', replayAdapter)
+        session.mount('http://', replayAdapter)
+    else:
+        logger.error("Unknown network mode: %s", network_mode)
+    return session
+
+
+# # end of file ##
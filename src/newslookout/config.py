@@ -98,6 +98,43 @@ class ConfigManager:
     rest_api_enabled: bool
     rest_api_host: str
     rest_api_port: int
+    network_mode: str
+    cassette_file: str
+    cassette_latency_ms: int
+    cassette_bandwidth_kbps: int
+    synthetic_site_url: str
+    fetch_workers_per_plugin: int
+    max_connections_per_domain: int
+    discovery_fetch_workers: int
+    domain_request_interval_ms: int
+    fetch_scheduler: str
+    global_fetch_workers: int
+    dataproc_mode: str
+    dataproc_processes: int
+    dataproc_parallel_plugins: int
+    dataproc_threads: int
+    dataproc_threads_max: int
+    dataproc_autoscale_queue_depth: int
+    parse_stage: str
+    parse_workers: int
+    parse_queue_size: int
+    url_queue_max_size: int
+    fetch_completed_queue_max_size: int
+    dataproc_queue_max_size: int
+    dataproc_queue_full_policy: str
+    dataproc_completed_queue_max_size: int
+    queue_journal_file: str
+    queue_journal_sync_interval_ms: int
+    distributed_role: str
+    run_mode: str
+    drain_pending_batch_size: int
+    drain_pending_max_attempts: int
+    daemon_schedule: str
+    backfill_parallel_dates: int
+    distributed_queue_file: str
+    lease_timeout_sec: int
+    lease_batch_size: int
+    distributed_worker_threads: int
 
     def __init__(self, configFileName, rundate):
         """ Read and apply the configuration data passed by the main application
@@ -214,6 +251,43 @@ class ConfigManager:
         self.rest_api_port = 8080
         self.rest_api_ssl_key = 'rest_svc.key'
         self.rest_api_ssl_cert = 'rest_svc.cer'
+        self.network_mode = 'live'
+        self.cassette_file = os.path.join(self.data_dir, 'network_cassette.zip')
+        self.cassette_latency_ms = 0
+        self.cassette_bandwidth_kbps = 0
+        self.synthetic_site_url = 'http://127.0.0.1:8899'
+        self.fetch_workers_per_plugin = 1
+        self.max_connections_per_domain = 2
+        self.discovery_fetch_workers = 4
+        self.domain_request_interval_ms = 1000
+        self.fetch_scheduler = 'per_plugin'
+        self.global_fetch_workers = 8
+        self.dataproc_mode = 'threads'
+        self.dataproc_processes = 0
+        self.dataproc_parallel_plugins = 4
+        self.dataproc_threads = 5
+        self.dataproc_threads_max = 0
+        self.dataproc_autoscale_queue_depth = 10
+        self.parse_stage = 'off'
+        self.parse_workers = 4
+        self.parse_queue_size = 100
+        self.url_queue_max_size = 0
+        self.fetch_completed_queue_max_size = 1000
+        self.dataproc_queue_max_size = 500
+        self.dataproc_queue_full_policy = 'block'
+        self.dataproc_completed_queue_max_size = 1000
+        self.queue_journal_file = None
+        self.queue_journal_sync_interval_ms = 1000
+        self.distributed_role = 'standalone'
+        self.run_mode = 'normal'
+        self.drain_pending_batch_size = 1000
+        self.drain_pending_max_attempts = 3
+        self.daemon_schedule = '*/15 * * * *'
+        self.backfill_parallel_dates = 2
+        self.distributed_queue_file = None
+        self.lease_timeout_sec = 300
+        self.lease_batch_size = 20
+        self.distributed_worker_threads = 4
 
     def checkAndSanitizeConfigString(self,
                                      sectionName: str,
@@ -396,6 +470,17 @@ class ConfigManager:
                 default=os.path.join(self.data_dir, 'cookies.txt')
             )
             self.readAndCheckSessionHistDb()
+            if self.config_parser.has_option('installation', 'queue_journal_file'):
+                self.queue_journal_file = self.checkAndSanitizeConfigString(
+                    'installation', 'queue_journal_file', default=''
+                )
+                if len(self.queue_journal_file) < 2:
+                    self.queue_journal_file = None
+            self.distributed_queue_file = os.path.join(self.data_dir, 'distributed_queue.db')
+            if self.config_parser.has_option('installation', 'distributed_queue_file'):
+                self.distributed_queue_file = self.checkAndSanitizeConfigString(
+                    'installation', 'distributed_queue_file', default=self.distributed_queue_file
+                )
         except Exception as e:
             print(f"Error reading environment configuration from file ({self.config_file}): {e}")
 
@@ -506,10 +591,340 @@ class ConfigManager:
                 maxValue=600,
                 minValue=3
             )
+            self.readNetworkCassetteCfg()
+            self.readFetchPoolCfg()
+            self.readDataProcCfg()
+            self.readParseStageCfg()
+            self.readQueueLimitsCfg()
+            self.readDistributedCfg()
+            self.readRunModeCfg()
+            if self.config_parser.has_option('operation', 'queue_journal_sync_interval_ms'):
+                self.queue_journal_sync_interval_ms = self.checkAndSanitizeConfigInt(
+                    'operation',
+                    'queue_journal_sync_interval_ms',
+                    default=1000,
+                    maxValue=60000,
+                    minValue=0
+                )
             self.rundate = ConfigManager.checkAndParseDate(self.rundate)
         except Exception as e:
             print(f"Error reading operational configuration from file ({self.config_file}): {e}")
 
+    def readNetworkCassetteCfg(self):
+        """ Read the configuration for recording or replaying the network traffic.
+        The parameter network_mode may be one of: live, record, replay or synthetic.
+        In synthetic mode, all requests are routed to the local synthetic news site server for load testing.
+        """
+        if not self.config_parser.has_option('operation', 'network_mode'):
+            return
+        network_mode = self.checkAndSanitizeConfigString('operation', 'network_mode', default='live').lower()
+        if network_mode not in ['live', 'record', 'replay', 'synthetic']:
+            print(f"Error: invalid value for parameter network_mode: {network_mode}, using live mode instead.")
+            network_mode = 'live'
+        self.network_mode = network_mode
+        self.cassette_file = self.checkAndSanitizeConfigString(
+            'operation',
+            'cassette_file',
+            default=os.path.join(self.data_dir, 'network_cassette.zip')
+        )
+        self.cassette_latency_ms = self.checkAndSanitizeConfigInt(
+            'operation',
+            'cassette_latency_ms',
+            default=0,
+            maxValue=60000,
+            minValue=0
+        )
+        self.cassette_bandwidth_kbps = self.checkAndSanitizeConfigInt(
+            'operation',
+            'cassette_bandwidth_kbps',
+            default=0,
+            minValue=0
+        )
+        if network_mode == 'synthetic':
+            self.synthetic_site_url = self.checkAndSanitizeConfigString(
+                'operation',
+                'synthetic_site_url',
+                default='http://127.0.0.1:8899'
+            )
+
+    def readFetchPoolCfg(self):
+        """ Read the configuration for the pool of content fetch workers of each plugin,
+        and the politeness limits applied to each web domain by all these workers together.
+        With fetch_scheduler = global, a single pool of global_fetch_workers serves the queues of all plugins.
+        During URL discovery, each plugin fetches up to discovery_fetch_workers feeds, categories or pages at a time.
+        """
+        if self.config_parser.has_option('operation', 'fetch_workers_per_plugin'):
+            self.fetch_workers_per_plugin = self.checkAndSanitizeConfigInt(
+                'operation',
+                'fetch_workers_per_plugin',
+                default=1,
+                maxValue=32,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'max_connections_per_domain'):
+            self.max_connections_per_domain = self.checkAndSanitizeConfigInt(
+                'operation',
+                'max_connections_per_domain',
+                default=2,
+                maxValue=32,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'discovery_fetch_workers'):
+            self.discovery_fetch_workers = self.checkAndSanitizeConfigInt(
+                'operation',
+                'discovery_fetch_workers',
+                default=4,
+                maxValue=32,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'domain_request_interval_ms'):
+            self.domain_request_interval_ms = self.checkAndSanitizeConfigInt(
+                'operation',
+                'domain_request_interval_ms',
+                default=1000,
+                maxValue=600000,
+                minValue=0
+            )
+        if self.config_parser.has_option('operation', 'fetch_scheduler'):
+            fetch_scheduler = self.checkAndSanitizeConfigString(
+                'operation', 'fetch_scheduler', default='per_plugin').lower()
+            if fetch_scheduler not in ['per_plugin', 'global']:
+                print(f"Error: invalid value for parameter fetch_scheduler: {fetch_scheduler}, using per_plugin.")
+                fetch_scheduler = 'per_plugin'
+            self.fetch_scheduler = fetch_scheduler
+        if self.config_parser.has_option('operation', 'global_fetch_workers'):
+            self.global_fetch_workers = self.checkAndSanitizeConfigInt(
+                'operation',
+                'global_fetch_workers',
+                default=8,
+                maxValue=128,
+                minValue=1
+            )
+
+    def readDataProcCfg(self):
+        """ Read the configuration for running the data processing plugins.
+        The parameter dataproc_mode may be one of: threads or processes.
+        In processes mode, the plugins run in a pool of dataproc_processes worker processes (0 means all CPU cores).
+        Up to dataproc_parallel_plugins plugins that do not depend on each other run concurrently on an article.
+        In threads mode, dataproc_threads threads process the articles, growing up to dataproc_threads_max threads
+        when the queue holds more than dataproc_autoscale_queue_depth articles per thread (0 disables autoscaling).
+        """
+        if self.config_parser.has_option('operation', 'dataproc_mode'):
+            dataproc_mode = self.checkAndSanitizeConfigString('operation', 'dataproc_mode', default='threads').lower()
+            if dataproc_mode not in ['threads', 'processes']:
+                print(f"Error: invalid value for parameter dataproc_mode: {dataproc_mode}, using threads instead.")
+                dataproc_mode = 'threads'
+            self.dataproc_mode = dataproc_mode
+        if self.config_parser.has_option('operation', 'dataproc_processes'):
+            self.dataproc_processes = self.checkAndSanitizeConfigInt(
+                'operation',
+                'dataproc_processes',
+                default=0,
+                maxValue=256,
+                minValue=0
+            )
+        if self.config_parser.has_option('operation', 'dataproc_parallel_plugins'):
+            self.dataproc_parallel_plugins = self.checkAndSanitizeConfigInt(
+                'operation',
+                'dataproc_parallel_plugins',
+                default=4,
+                maxValue=64,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'dataproc_threads'):
+            self.dataproc_threads = self.checkAndSanitizeConfigInt(
+                'operation',
+                'dataproc_threads',
+                default=5,
+                maxValue=256,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'dataproc_threads_max'):
+            self.dataproc_threads_max = self.checkAndSanitizeConfigInt(
+                'operation',
+                'dataproc_threads_max',
+                default=0,
+                maxValue=256,
+                minValue=0
+            )
+        if self.config_parser.has_option('operation', 'dataproc_autoscale_queue_depth'):
+            self.dataproc_autoscale_queue_depth = self.checkAndSanitizeConfigInt(
+                'operation',
+                'dataproc_autoscale_queue_depth',
+                default=10,
+                maxValue=100000,
+                minValue=1
+            )
+
+    def readParseStageCfg(self):
+        """ Read the configuration for parsing the fetched content separately from the fetch workers.
+        The parameter parse_stage may be one of: off, threads or processes.
+        When enabled, fetch workers only download, and push the responses into a parse queue of size
+        parse_queue_size, served by parse_workers threads (or worker processes, 0 means all CPU cores).
+        """
+        if self.config_parser.has_option('operation', 'parse_stage'):
+            parse_stage = self.checkAndSanitizeConfigString('operation', 'parse_stage', default='off').lower()
+            if parse_stage not in ['off', 'threads', 'processes']:
+                print(f"Error: invalid value for parameter parse_stage: {parse_stage}, using off instead.")
+                parse_stage = 'off'
+            self.parse_stage = parse_stage
+        if self.config_parser.has_option('operation', 'parse_workers'):
+            self.parse_workers = self.checkAndSanitizeConfigInt(
+                'operation',
+                'parse_workers',
+                default=4,
+                maxValue=256,
+                minValue=0
+            )
+        if self.config_parser.has_option('operation', 'parse_queue_size'):
+            self.parse_queue_size = self.checkAndSanitizeConfigInt(
+                'operation',
+                'parse_queue_size',
+                default=100,
+                maxValue=100000,
+                minValue=1
+            )
+
+    def readQueueLimitsCfg(self):
+        """ Read the high-water marks of the queues between the stages, 0 means the queue is unbounded.
+        When the data processing queue is full, the fetch workers either wait for the data processing
+        plugins to catch up, or shed the item so it is saved without data processing,
+        depending on the parameter dataproc_queue_full_policy: block or shed.
+        """
+        for paramName in ['url_queue_max_size', 'fetch_completed_queue_max_size',
+                          'dataproc_queue_max_size', 'dataproc_completed_queue_max_size']:
+            if self.config_parser.has_option('operation', paramName):
+                setattr(self, paramName, self.checkAndSanitizeConfigInt(
+                    'operation',
+                    paramName,
+                    default=getattr(self, paramName),
+                    maxValue=10000000,
+                    minValue=0
+                ))
+        if self.config_parser.has_option('operation', 'dataproc_queue_full_policy'):
+            policy = self.checkAndSanitizeConfigString('operation', 'dataproc_queue_full_policy',
+                                                       default='block').lower()
+            if policy not in ['block', 'shed']:
+                print(f"Error: invalid value for parameter dataproc_queue_full_policy: {policy}, using block instead.")
+                policy = 'block'
+            self.dataproc_queue_full_policy = policy
+
+    def readRunModeCfg(self):
+        """ Read the run mode, one of: normal, drain_pending or daemon.
+        In drain_pending mode, URL discovery is skipped and the pending URLs saved by earlier runs are fetched,
+        drain_pending_batch_size at a time, those attempted the fewest times and the oldest first.
+        Pending URLs already attempted drain_pending_max_attempts times are recorded as failed instead.
+        In daemon mode, the application keeps running and scrapes each plugin as per its schedule,
+        a cron expression given by daemon_schedule, or by <plugin name>_schedule in the [plugins] section.
+        When a range of dates is backfilled in one run, each plugin discovers the URLs of
+        backfill_parallel_dates dates concurrently.
+        """
+        if self.config_parser.has_option('operation', 'daemon_schedule'):
+            self.daemon_schedule = self.checkAndSanitizeConfigString('operation', 'daemon_schedule',
+                                                                     default='*/15 * * * *')
+        if self.config_parser.has_option('operation', 'run_mode'):
+            run_mode = self.checkAndSanitizeConfigString('operation', 'run_mode', default='normal').lower()
+            if run_mode not in ['normal', 'drain_pending', 'daemon']:
+                print(f"Error: invalid value for parameter run_mode: {run_mode}, using normal instead.")
+                run_mode = 'normal'
+            self.run_mode = run_mode
+        if self.config_parser.has_option('operation', 'drain_pending_batch_size'):
+            self.drain_pending_batch_size = self.checkAndSanitizeConfigInt(
+                'operation',
+                'drain_pending_batch_size',
+                default=1000,
+                maxValue=100000,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'drain_pending_max_attempts'):
+            self.drain_pending_max_attempts = self.checkAndSanitizeConfigInt(
+                'operation',
+                'drain_pending_max_attempts',
+                default=3,
+                maxValue=1000,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'backfill_parallel_dates'):
+            self.backfill_parallel_dates = self.checkAndSanitizeConfigInt(
+                'operation',
+                'backfill_parallel_dates',
+                default=2,
+                maxValue=64,
+                minValue=1
+            )
+
+    def readDistributedCfg(self):
+        """ Read the configuration for running the application distributed across many processes or machines.
+        The parameter distributed_role may be one of: standalone, coordinator or worker.
+        The coordinator discovers the URLs and puts them into the lease queue in distributed_queue_file,
+        the workers lease lease_batch_size URLs at a time with distributed_worker_threads threads each.
+        A leased URL not reported back within lease_timeout_sec seconds is leased again to another worker.
+        """
+        if self.config_parser.has_option('operation', 'distributed_role'):
+            role = self.checkAndSanitizeConfigString('operation', 'distributed_role', default='standalone').lower()
+            if role not in ['standalone', 'coordinator', 'worker']:
+                print(f"Error: invalid value for parameter distributed_role: {role}, using standalone instead.")
+                role = 'standalone'
+            self.distributed_role = role
+        if self.config_parser.has_option('operation', 'lease_timeout_sec'):
+            self.lease_timeout_sec = self.checkAndSanitizeConfigInt(
+                'operation',
+                'lease_timeout_sec',
+                default=300,
+                maxValue=86400,
+                minValue=5
+            )
+        if self.config_parser.has_option('operation', 'lease_batch_size'):
+            self.lease_batch_size = self.checkAndSanitizeConfigInt(
+                'operation',
+                'lease_batch_size',
+                default=20,
+                maxValue=10000,
+                minValue=1
+            )
+        if self.config_parser.has_option('operation', 'distributed_worker_threads'):
+            self.distributed_worker_threads = self.checkAndSanitizeConfigInt(
+                'operation',
+                'distributed_worker_threads',
+                default=4,
+                maxValue=256,
+                minValue=1
+            )
+
+    def getPluginSchedule(self, pluginName: str) -> str:
+        """ Get the schedule of the plugin's scrape cycles in daemon mode, as a cron expression.
+        This is read from the parameter <plugin name>_schedule in the [plugins] section, e.g.:
+         mod_en_in_ndtv_schedule = */10 6-22 * * *
+        If this is not given, the value of daemon_schedule in the [operation] section is used.
+
+        :param pluginName: Name of the plugin
+        :return: Cron expression
+        """
+        paramName = pluginName + '_schedule'
+        if self.config_parser.has_option('plugins', paramName):
+            return self.checkAndSanitizeConfigString('plugins', paramName, default=self.daemon_schedule)
+        return self.daemon_schedule
+
+    def getPluginFetchWorkers(self, pluginName: str) -> int:
+        """ Get the number of content fetch workers for the plugin.
+        This is read from the parameter <plugin name>_fetch_workers in the [plugins] section, e.g.:
+         mod_en_in_ndtv_fetch_workers = 4
+        If this is not given, the value of fetch_workers_per_plugin in the [operation] section is used.
+
+        :param pluginName: Name of the plugin
+        :return: Number of content fetch workers
+        """
+        paramName = pluginName + '_fetch_workers'
+        if self.config_parser.has_option('plugins', paramName):
+            return self.checkAndSanitizeConfigInt(
+                'plugins',
+                paramName,
+                default=self.fetch_workers_per_plugin,
+                maxValue=32,
+                minValue=1
+            )
+        return self.fetch_workers_per_plugin
+
     def applyNetworkConfig(self):
         """ Apply configuration for networking
         """
@@ -13,6 +13,10 @@
 #    ScrapeError                                                                                          #
 #    ExecutionResult                                                                                      #
 #    QueueStatus                                                                                          #
+#    StageBackpressure                                                                                    #
+#    ProgressCounters                                                                                     #
+#    CountedQueue                                                                                         #
+#    CancellationToken                                                                                    #
 #                                                                                                         #
 #                                                                                                         #
 # Notice:                                                                                                 #
@@ -38,6 +42,9 @@
 # import standard python libraries:
 import logging
 import datetime
+import queue
+import threading
+import time
 
 
 ##########
@@ -96,6 +103,8 @@ class ExecutionResult:
     articleID = None
     additionalLinks = []
     archivePath = None
+    article = None
+    rawHTML = None
 
     def __init__(self,
                  sURL: str,
@@ -108,7 +117,8 @@ class ExecutionResult:
                  success: bool = False,
                  additionalLinks: list = None,
                  archivePath: str = None,
-                 articleID: str = None):
+                 articleID: str = None,
+                 article=None):
         self.URL = sURL
         self.http_error = None
         self.rawDataFileName = rawDataFile
@@ -120,6 +130,10 @@ class ExecutionResult:
         self.publishDate = publishDate
         self.pluginName = pluginName
         self.wasSuccessful = success
+        # parsed NewsEvent carried in memory to the data processing plugins, and its
+        # raw HTML if saving the article is deferred until those plugins have completed:
+        self.article = article
+        self.rawHTML = None
         if additionalLinks is not None:
             self.additionalLinks = additionalLinks
         else:
@@ -195,6 +209,8 @@ class QueueStatus:
     fetchCompletQsize = 0
     # - Total fetch completed size
     fetchCompletCount = 0
+    # - Count of URLs whose fetch failed
+    fetchFailedCount = 0
     # - Data process input queue Size
     dataInputQsize = 0
     # - Data process completed queue size
@@ -264,7 +280,9 @@ class QueueStatus:
         return statusMessages
 
     def updateStatus(self):
-        """ Update the queue status
+        """ Update the queue status from a snapshot of the queue manager's progress counters,
+        which are kept by the threads putting items into the queues and taking them out,
+        so the queues are not locked to get their sizes.
         """
         self.fetchPendingCount = 0
         self.areAllPluginsStopped = False
@@ -272,32 +290,466 @@ class QueueStatus:
         self.countOfPluginsInURLSrcState = 0
         self.totalURLCount = 0
         self.totalPluginsURLSourcing = self.queue_mgr.totalPluginsURLSrcCount
-        for pluginName in self.queue_mgr.pluginNameToObjMap.keys():
-            self.qsizeMap.update({pluginName: self.queue_mgr.pluginNameToObjMap[pluginName].getQueueSize()})
-            self.fetchPendingCount = (
-                    self.fetchPendingCount +
-                    self.queue_mgr.pluginNameToObjMap[pluginName].getQueueSize()
-            )
-            self.totalQsizeMap[pluginName] = self.queue_mgr.pluginNameToObjMap[pluginName].urlQueueTotalSize
-            self.totalURLCount = self.totalURLCount + self.queue_mgr.pluginNameToObjMap[pluginName].urlQueueTotalSize
+        snapshot = self.queue_mgr.progressCounters.snapshot()
+        urlQueueDepths = ProgressCounters.getQueueDepths(snapshot, ProgressCounters.URL_QUEUE)
+        for pluginName, plugin in self.queue_mgr.pluginNameToObjMap.items():
+            if isinstance(plugin.urlQueue, CountedQueue):
+                pendingCount = urlQueueDepths.get(pluginName, 0)
+            else:
+                pendingCount = plugin.getQueueSize()
+            self.qsizeMap[pluginName] = pendingCount
+            self.fetchPendingCount = self.fetchPendingCount + pendingCount
+            self.totalQsizeMap[pluginName] = plugin.urlQueueTotalSize
+            self.totalURLCount = self.totalURLCount + plugin.urlQueueTotalSize
+            pluginState = plugin.pluginState
             self.isPluginStillFetchingoverNetwork = (
                     self.isPluginStillFetchingoverNetwork or
-                    self.queue_mgr.pluginNameToObjMap[pluginName].pluginState in [
-                        PluginTypes.STATE_GET_URL_LIST, PluginTypes.STATE_FETCH_CONTENT]
-            )
-            self.areAllPluginsStopped = (
-                    self.areAllPluginsStopped and
-                    self.queue_mgr.pluginNameToObjMap[pluginName].pluginState == PluginTypes.STATE_STOPPED)
-            self.currentState[pluginName] = PluginTypes.decodeNameFromIntVal(
-                self.queue_mgr.pluginNameToObjMap[pluginName].pluginState
+                    pluginState in [PluginTypes.STATE_GET_URL_LIST, PluginTypes.STATE_FETCH_CONTENT]
             )
-            if self.queue_mgr.pluginNameToObjMap[pluginName].pluginState == PluginTypes.STATE_GET_URL_LIST:
+            self.areAllPluginsStopped = self.areAllPluginsStopped and pluginState == PluginTypes.STATE_STOPPED
+            self.currentState[pluginName] = PluginTypes.decodeNameFromIntVal(pluginState)
+            if pluginState == PluginTypes.STATE_GET_URL_LIST:
                 self.countOfPluginsInURLSrcState = self.countOfPluginsInURLSrcState + 1
-        # update other queue parameters from the queue manager object
-        self.fetchCompletQsize = self.queue_mgr.fetchCompletedQueue.qsize()
-        self.fetchCompletCount = self.queue_mgr.fetchCompletedCount
-        self.dataInputQsize = self.queue_mgr.getCompletedQueueSize()
-        self.dataOutputQsize = self.queue_mgr.getDataProcessedQueueSize()
+        # update other queue parameters from the snapshot of the counters
+        self.fetchCompletQsize = ProgressCounters.getQueueDepths(
+            snapshot, ProgressCounters.FETCH_COMPLETED_QUEUE).get(None, 0)
+        self.fetchCompletCount = sum(snapshot.get(ProgressCounters.FETCH_SUCCEEDED, dict()).values())
+        self.fetchFailedCount = sum(snapshot.get(ProgressCounters.FETCH_FAILED, dict()).values())
+        self.dataInputQsize = ProgressCounters.getQueueDepths(snapshot, ProgressCounters.DATAPROC_QUEUE).get(None, 0)
+        self.dataOutputQsize = sum(snapshot.get(ProgressCounters.DATA_PROCESSED, dict()).values())
+
+
+class StageBackpressure:
+    """ Bounds a queue between two stages of the application at its high-water mark, and applies
+    backpressure to the producers when the downstream stage is saturated:
+    with policy 'block' the producer waits until there is space in the queue,
+    with policy 'shed' the item is not queued and is handed to the onShed callback instead.
+
+    End markers (None) and items put after shutdown are always accepted, so that producers
+    do not wait for consumers that have stopped. The queue depth, time spent blocked
+    and count of shed items are kept as metrics of the stage.
+    """
+    POLICY_BLOCK = 'block'
+    POLICY_SHED = 'shed'
+
+    def __init__(self, stageName: str, stageQueue, policy: str = 'block',
+                 shutdown_event: threading.Event = None, onShed=None):
+        """ Apply backpressure to the producers of the queue of a stage.
+
+        :param stageName: Name of the stage, used in logs and metrics
+        :param stageQueue: StageQueue created with the high-water mark as its maximum size
+        :param policy: block or shed
+        :param shutdown_event: Event signalling the application is shutting down
+        :param onShed: Callback invoked with each item that was shed
+        """
+        self.stageName = stageName
+        self.stageQueue = stageQueue
+        self.policy = policy
+        self.shutdown_event = shutdown_event
+        self.onShed = onShed
+        self.waitInterval = 1.0
+        self.metricsLock = threading.Lock()
+        self.peakSize = 0
+        self.blockedCount = 0
+        self.blockedSeconds = 0.0
+        self.shedCount = 0
+
+    def isShuttingDown(self) -> bool:
+        return self.shutdown_event is not None and self.shutdown_event.is_set()
+
+    def forcePut(self, item):
+        """ Put the item into the queue even if it is above its high-water mark.
+        """
+        self.stageQueue.put(item, force=True)
+
+    def put(self, item) -> bool:
+        """ Put the item into the queue, blocking or shedding it if the queue is full.
+
+        :param item: Item to be put into the queue
+        :return: True if the item was queued, False if it was shed
+        """
+        try:
+            self.stageQueue.put(item, block=False)
+        except queue.Full:
+            if item is None or self.isShuttingDown():
+                self.forcePut(item)
+            elif self.policy == StageBackpressure.POLICY_SHED:
+                with self.metricsLock:
+                    self.shedCount += 1
+                logger.debug("Stage %s: Queue full at %s items, shedding item", self.stageName, self.stageQueue.maxsize)
+                if self.onShed is not None:
+                    self.onShed(item)
+                return False
+            else:
+                self.putBlocking(item)
+        queueSize = self.stageQueue.qsize()
+        with self.metricsLock:
+            self.peakSize = max(self.peakSize, queueSize)
+        return True
+
+    def putBlocking(self, item):
+        """ Wait for space in the queue, recording the time spent blocked.
+        """
+        startTime = time.time()
+        while True:
+            try:
+                self.stageQueue.put(item, block=True, timeout=self.waitInterval)
+                break
+            except queue.Full:
+                if self.isShuttingDown():
+                    self.forcePut(item)
+                    break
+        with self.metricsLock:
+            self.blockedCount += 1
+            self.blockedSeconds += time.time() - startTime
+
+    def getMetrics(self) -> dict:
+        """ Get the metrics of this stage's queue.
+        """
+        with self.metricsLock:
+            return {
+                'size': self.stageQueue.qsize(),
+                'max_size': self.stageQueue.maxsize,
+                'peak_size': self.peakSize,
+                'policy': self.policy,
+                'blocked_count': self.blockedCount,
+                'blocked_seconds': round(self.blockedSeconds, 3),
+                'shed_count': self.shedCount
+            }
+
+
+class ProgressCounters:
+    """ Counters of the progress of the application, incremented by the threads that produce and consume
+    the work items as they do so: URLs queued and taken for fetching, fetches succeeded and failed,
+    and articles queued and processed by the data processing plugins.
+
+    Each thread increments its own cell of the counters, so increments need no lock, and reading
+    a counter sums the cells of all threads. Each counter may be kept by label, e.g. the plugin name.
+    Reading the status this way is cheap compared to walking the plugins and locking their queues.
+    """
+    URL_QUEUE = 'url_queue'
+    FETCH_COMPLETED_QUEUE = 'fetch_completed_queue'
+    DATAPROC_QUEUE = 'dataproc_queue'
+    FETCH_SUCCEEDED = 'fetch_succeeded'
+    FETCH_FAILED = 'fetch_failed'
+    DATA_PROCESSED = 'data_processed'
+
+    def __init__(self):
+        # thread identifier -> dictionary of (counter name, label) -> count, written only by that thread
+        self._cells = dict()
+        # counts at the last reset of each counter, subtracted when reading it:
+        self._baseline = dict()
+
+    def increment(self, counterName: str, count: int = 1, label: str = None):
+        """ Add to the counter, only the calling thread's cell is written.
+        """
+        cell = self._cells.get(threading.get_ident())
+        if cell is None:
+            cell = self._cells.setdefault(threading.get_ident(), dict())
+        key = (counterName, label)
+        cell[key] = cell.get(key, 0) + count
+
+    def snapshot(self) -> dict:
+        """ Take a snapshot of all counters.
+
+        :return: Dictionary of counter names mapped to dictionaries of their labels and counts
+        """
+        totals = dict()
+        for cell in list(self._cells.values()):
+            for key, count in list(cell.items()):
+                totals[key] = totals.get(key, 0) + count
+        result = dict()
+        for (counterName, label), count in totals.items():
+            result.setdefault(counterName, dict())[label] = count - self._baseline.get((counterName, label), 0)
+        return result
+
+    @staticmethod
+    def getQueueDepths(snapshot: dict, queueName: str) -> dict:
+        """ Get the depths of the counted queues of the given name from a snapshot of the counters.
+
+        :return: Dictionary of the labels of the queues mapped to their depths
+        """
+        inCounts = snapshot.get(queueName + '_in', dict())
+        outCounts = snapshot.get(queueName + '_out', dict())
+        return {label: count - outCounts.get(label, 0) for label, count in inCounts.items()}
+
+    def getByLabel(self, counterName: str) -> dict:
+        """ Get the counts of the counter for each of its labels.
+        """
+        counts = dict()
+        for cell in list(self._cells.values()):
+            for (name, label), count in list(cell.items()):
+                if name == counterName:
+                    counts[label] = counts.get(label, 0) + count
+        return {label: count - self._baseline.get((counterName, label), 0) for label, count in counts.items()}
+
+    def get(self, counterName: str, label: str = None) -> int:
+        """ Get the count of the counter, for the given label or for all labels if None.
+        """
+        counts = self.getByLabel(counterName)
+        if label is not None:
+            return counts.get(label, 0)
+        return sum(counts.values())
+
+    def reset(self, counterNames: list):
+        """ Restart the counters from zero, e.g. at the start of each scrape cycle.
+        """
+        for counterName in counterNames:
+            for label, count in self.getByLabel(counterName).items():
+                key = (counterName, label)
+                self._baseline[key] = self._baseline.get(key, 0) + count
+
+
+class StageQueue(queue.Queue):
+    """ Queue between two stages of the application, whose maximum size is the high-water mark of the stage.
+    Items may be forced into the queue above its maximum size, e.g. end markers and items put at shutdown,
+    these are counted as unfinished tasks like any other item.
+    """
+
+    def put(self, item, block=True, timeout=None, force=False):
+        """ Put the item into the queue, as queue.Queue.put() does.
+
+        :param force: Put the item without waiting, even if the queue is at its maximum size
+        """
+        if not force:
+            super().put(item, block=block, timeout=timeout)
+            return
+        with self.not_full:
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class CountedQueue(StageQueue):
+    """ Queue that counts the items put into it and taken from it in the progress counters,
+    so its depth is known without locking it. The end markers (None) are not counted.
+    The counts are updated while the queue's own lock is held, so no other lock is needed.
+    """
+
+    def __init__(self, counters: ProgressCounters, queueName: str, label: str = None, maxsize: int = 0):
+        """ Create the queue.
+
+        :param counters: Progress counters to update
+        :param queueName: The counters are named <queueName>_in and <queueName>_out
+        :param label: Label of the counters, e.g. the plugin name
+        :param maxsize: Maximum size of the queue, 0 for an unbounded queue
+        """
+        super().__init__(maxsize)
+        self.counters = counters
+        self.inCounter = queueName + '_in'
+        self.outCounter = queueName + '_out'
+        self.label = label
+
+    def _put(self, item):
+        super()._put(item)
+        if item is not None:
+            self.counters.increment(self.inCounter, label=self.label)
+
+    def _get(self):
+        item = super()._get()
+        if item is not None:
+            self.counters.increment(self.outCounter, label=self.label)
+        return item
+
+    def clear(self) -> int:
+        """ Remove all items from the queue, counting them as taken.
+
+        :return: Number of items removed, not including end markers
+        """
+        with self.mutex:
+            removedCount = sum(1 for item in self.queue if item is not None)
+            self.queue.clear()
+            self.not_full.notify_all()
+        if removedCount > 0:
+            self.counters.increment(self.outCounter, removedCount, label=self.label)
+        return removedCount
+
+    def depth(self) -> int:
+        """ Get the number of items in the queue from the progress counters, without locking the queue.
+        """
+        return self.counters.get(self.inCounter, self.label) - self.counters.get(self.outCounter, self.label)
+
+
+class CancellationToken:
+    """ Signals the cancellation of a task to the threads working on it, such as when URL discovery
+    reaches its timeout. The token is also cancelled once its parent event is set, e.g. the shutdown event,
+    and has the is_set() and wait() methods of threading.Event, so it can be passed wherever
+    a shutdown_event is accepted.
+
+    Callbacks added to the token are called when it is cancelled, for example to close an in-flight
+    HTTP response so that the thread blocked in reading it returns at once.
+    """
+
+    def __init__(self, parent: threading.Event = None):
+        """ Create the token.
+
+        :param parent: Event which, when set, cancels this token
+        """
+        self.parent = parent
+        self.reason = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = dict()
+        self._nextCallbackID = 0
+        self.pollInterval = 0.5
+
+    def cancel(self, reason: str = 'cancelled'):
+        """ Cancel the token and call its callbacks, only the first call has any effect.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug("Error calling the callback of a cancelled token: %s", e)
+
+    def set(self):
+        self.cancel()
+
+    def is_set(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.parent is not None and self.parent.is_set():
+            self.cancel('parent event was set')
+            return True
+        return False
+
+    def isCancelled(self) -> bool:
+        return self.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """ Wait until the token is cancelled, or the timeout elapses.
+
+        :param timeout: Maximum seconds to wait, None to wait indefinitely
+        :return: True if the token was cancelled, False if the timeout elapsed
+        """
+        if self.parent is None:
+            return self._event.wait(timeout)
+        endTime = None if timeout is None else time.time() + timeout
+        while not self.is_set():
+            waitTime = self.pollInterval if endTime is None else min(self.pollInterval, endTime - time.time())
+            if waitTime <= 0:
+                return False
+            self._event.wait(waitTime)
+        return True
+
+    def addCallback(self, callback) -> int:
+        """ Add a callback to be called without arguments when the token is cancelled.
+        It is called immediately if the token has already been cancelled.
+
+        :return: ID of the callback, used to remove it
+        """
+        with self._lock:
+            callbackID = self._nextCallbackID
+            self._nextCallbackID += 1
+            if not self._event.is_set():
+                self._callbacks[callbackID] = callback
+                return callbackID
+        callback()
+        return callbackID
+
+    def removeCallback(self, callbackID: int):
+        with self._lock:
+            self._callbacks.pop(callbackID, None)
+
+
+class BackfillProgress:
+    """ Progress of a backfill run, that scrapes a range of dates in one process,
+    with the URLs discovered, queued and fetched for each date.
+    A URL discovered by a plugin for several dates is attributed to the first date that discovered it,
+    and is queued only once.
+    """
+
+    def __init__(self, runDates: list, parallelDates: int = 1, pluginCount: int = 0):
+        """ Initialise the progress of each date.
+
+        :param runDates: Dates to be scraped, as datetime objects
+        :param parallelDates: Number of dates discovered concurrently by each plugin
+        :param pluginCount: Number of plugins discovering URLs for each date
+        """
+        self.runDates = list(runDates)
+        self.parallelDates = max(1, parallelDates)
+        self.pluginCount = pluginCount
+        self.lock = threading.Lock()
+        self.dateStats = {BackfillProgress.dateKey(runDate): {'discovering': 0,
+                                                              'plugins_done': 0,
+                                                              'discovered': 0,
+                                                              'queued': 0,
+                                                              'fetched': 0}
+                          for runDate in self.runDates}
+        # (plugin name, URL) mapped to the date it was queued for:
+        self.urlDates = dict()
+
+    @staticmethod
+    def dateKey(runDate) -> str:
+        return runDate.strftime('%Y-%m-%d')
+
+    @staticmethod
+    def getDateRange(dateFrom: datetime.datetime, dateTo: datetime.datetime) -> list:
+        """ Get all the dates from dateFrom to dateTo, both inclusive.
+        """
+        if dateTo.date() < dateFrom.date():
+            raise ValueError(f"End date {dateTo.date()} of the backfill is before its start date {dateFrom.date()}")
+        dayCount = (dateTo.date() - dateFrom.date()).days
+        return [dateFrom + datetime.timedelta(days=dayIndex) for dayIndex in range(dayCount + 1)]
+
+    def startDate(self, runDate):
+        """ Record that a plugin started discovering URLs for this date.
+        """
+        with self.lock:
+            self.dateStats[BackfillProgress.dateKey(runDate)]['discovering'] += 1
+
+    def recordDiscovered(self, runDate, pluginName: str, urlList: list) -> list:
+        """ Record the URLs discovered by a plugin for this date.
+
+        :return: The URLs not already discovered by this plugin for another date, to be queued
+        """
+        newURLs = []
+        thisDate = BackfillProgress.dateKey(runDate)
+        with self.lock:
+            for url in urlList:
+                if (pluginName, url) not in self.urlDates:
+                    self.urlDates[(pluginName, url)] = thisDate
+                    newURLs.append(url)
+            dateStats = self.dateStats[thisDate]
+            dateStats['discovering'] -= 1
+            dateStats['plugins_done'] += 1
+            dateStats['discovered'] += len(urlList)
+            dateStats['queued'] += len(newURLs)
+        return newURLs
+
+    def recordFetched(self, pluginName: str, url: str):
+        """ Record that the URL was fetched, against the date it was queued for.
+        """
+        with self.lock:
+            thisDate = self.urlDates.get((pluginName, url))
+            if thisDate is not None:
+                self.dateStats[thisDate]['fetched'] += 1
+
+    def getDateState(self, dateStats: dict) -> str:
+        if self.pluginCount > 0 and dateStats['plugins_done'] >= self.pluginCount:
+            return 'discovered'
+        if dateStats['discovering'] > 0 or dateStats['plugins_done'] > 0:
+            return 'discovering'
+        return 'pending'
+
+    def getStatus(self) -> dict:
+        """ Get the progress of each date of the backfill.
+        """
+        with self.lock:
+            return {
+                'date_from': BackfillProgress.dateKey(self.runDates[0]) if self.runDates else None,
+                'date_to': BackfillProgress.dateKey(self.runDates[-1]) if self.runDates else None,
+                'parallel_dates': self.parallelDates,
+                'dates': {thisDate: dict(dateStats, state=self.getDateState(dateStats))
+                          for thisDate, dateStats in self.dateStats.items()}
+            }
 
 
 # # end of file ##
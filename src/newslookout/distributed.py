@@ -0,0 +1,519 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: distributed.py                                                                               #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: Distributed scraping with a coordinator and many workers that lease URLs to fetch              #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+"""
+ Provides:
+    LeaseQueue: Shared queue of URLs in a SQLite database, leased in batches by the workers.
+    LeaseCoordinator: Runs in the coordinator, it moves the discovered URLs into the lease queue
+     and records the results reported by the workers.
+    DistributedFetchWorker: Runs in each worker process, it leases URLs, fetches and parses them,
+     and reports the results back to the coordinator.
+
+ The role of an instance of the application is selected by the configuration parameter
+ 'distributed_role' in the [operation] section:
+    standalone  - discover and fetch in this process (default)
+    coordinator - discover the URLs and own their state, data process and save the articles
+    worker      - lease URLs from the coordinator's queue, fetch and parse them
+
+ The lease queue is a SQLite database file given by 'distributed_queue_file' in the [installation] section,
+ shared by the coordinator and all the workers, e.g. on one machine or over a shared file system.
+ A leased URL that is not reported before its lease times out is leased again to another worker.
+"""
+
+# import standard python libraries:
+import json
+import logging
+import os
+import socket
+import sqlite3 as lite
+import threading
+import time
+from typing import Dict, List, Optional
+
+from newslookout.data_structs import PluginTypes, ExecutionResult
+from newslookout.network import HTTPError
+from newslookout.queue_journal import resultToJournalItem, resultFromJournalItem
+
+##########
+
+logger = logging.getLogger(__name__)
+
+##########
+
+
+class LeaseQueue:
+    """ Shared queue of URLs in a SQLite database, each URL is leased to one worker at a time.
+
+    A URL is in one of these states:
+        pending  - waiting to be leased
+        leased   - leased by a worker until its lease expires
+        reported - the worker has reported the result, it is waiting to be collected by the coordinator
+        done     - the coordinator has recorded the result
+    """
+    ddl_leases_table = """CREATE TABLE IF NOT EXISTS URL_LEASES (
+        plugin_name TEXT NOT NULL, url TEXT NOT NULL, state TEXT NOT NULL DEFAULT 'pending',
+        owner TEXT, expiry REAL, attempts INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (plugin_name, url))"""
+    ddl_results_table = """CREATE TABLE IF NOT EXISTS LEASE_RESULTS (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, plugin_name TEXT NOT NULL, url TEXT NOT NULL,
+        worker TEXT, result TEXT, reported REAL)"""
+    ddl_run_state_table = """CREATE TABLE IF NOT EXISTS RUN_STATE (
+        name TEXT PRIMARY KEY, value TEXT)"""
+
+    def __init__(self, dbFileName: str, leaseTimeoutSec: float = 300, maxAttempts: int = 3):
+        """ Initialise the lease queue, and create its tables if they do not exist.
+
+        :param dbFileName: SQLite database file shared by the coordinator and the workers
+        :param leaseTimeoutSec: Seconds after which a URL leased but not reported is leased again
+        :param maxAttempts: Number of leases of a URL after which it is reported as failed
+        """
+        self.dbFileName = dbFileName
+        self.leaseTimeoutSec = leaseTimeoutSec
+        self.maxAttempts = maxAttempts
+        self.threadLocal = threading.local()
+        dbDir = os.path.dirname(dbFileName)
+        if dbDir:
+            os.makedirs(dbDir, exist_ok=True)
+        con = self.getConnection()
+        con.execute('PRAGMA journal_mode=WAL;')
+        con.execute(self.ddl_leases_table)
+        con.execute(self.ddl_results_table)
+        con.execute(self.ddl_run_state_table)
+        con.execute('CREATE INDEX IF NOT EXISTS idx_url_leases_state ON URL_LEASES(state, expiry)')
+
+    def getConnection(self) -> lite.Connection:
+        """ Get the database connection of the calling thread.
+        """
+        con = getattr(self.threadLocal, 'connection', None)
+        if con is None:
+            con = lite.connect(self.dbFileName, timeout=60, isolation_level=None)
+            con.execute('PRAGMA synchronous=NORMAL;')
+            self.threadLocal.connection = con
+        return con
+
+    def startRun(self):
+        """ Called by the coordinator when it starts: clears the URLs completed by earlier runs,
+        the URLs left pending by an earlier run are resumed.
+        """
+        con = self.getConnection()
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("DELETE FROM URL_LEASES WHERE state = 'done'")
+        con.execute("INSERT OR REPLACE INTO RUN_STATE (name, value) VALUES ('status', 'running')")
+        con.execute("COMMIT")
+
+    def finishRun(self):
+        """ Called by the coordinator when all URLs have been completed, the workers exit after this.
+        """
+        self.getConnection().execute("INSERT OR REPLACE INTO RUN_STATE (name, value) VALUES ('status', 'finished')")
+
+    def getRunStatus(self) -> Optional[str]:
+        row = self.getConnection().execute("SELECT value FROM RUN_STATE WHERE name = 'status'").fetchone()
+        return row[0] if row else None
+
+    def addURLs(self, pluginName: str, urlList: list) -> int:
+        """ Add URLs to be fetched, URLs already in the queue are ignored.
+
+        :return: Number of URLs added
+        """
+        con = self.getConnection()
+        con.execute("BEGIN IMMEDIATE")
+        cur = con.executemany("INSERT OR IGNORE INTO URL_LEASES (plugin_name, url) VALUES (?, ?)",
+                              [(pluginName, url) for url in urlList])
+        con.execute("COMMIT")
+        return cur.rowcount
+
+    def leaseBatch(self, workerID: str, batchSize: int = 20, pluginNames: list = None) -> List[tuple]:
+        """ Lease a batch of URLs to the worker, these are pending URLs or URLs whose lease has expired.
+        URLs whose lease has expired too many times are reported as failed instead.
+
+        :param workerID: Identifier of the worker
+        :param batchSize: Maximum number of URLs to lease
+        :param pluginNames: Plugins loaded by the worker, all plugins if not given
+        :return: List of tuples of the plugin name and the URL leased
+        """
+        now = time.time()
+        con = self.getConnection()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            sqlQuery = ("SELECT plugin_name, url, attempts FROM URL_LEASES"
+                        " WHERE (state = 'pending' OR (state = 'leased' AND expiry < ?))")
+            sqlParams = [now]
+            if pluginNames is not None:
+                # filter by plugin in the query, so that the limit applies to the URLs this worker can fetch:
+                sqlQuery += " AND plugin_name IN ({})".format(", ".join("?" * len(pluginNames)))
+                sqlParams.extend(pluginNames)
+            rows = con.execute(sqlQuery + " LIMIT ?", sqlParams + [batchSize * 2]).fetchall()
+            leased = []
+            for pluginName, url, attempts in rows:
+                if attempts >= self.maxAttempts:
+                    logger.info(f"Lease queue: URL failed after {attempts} leases: {url}")
+                    con.execute("UPDATE URL_LEASES SET state = 'reported' WHERE plugin_name = ? AND url = ?",
+                                (pluginName, url))
+                    con.execute("INSERT INTO LEASE_RESULTS (plugin_name, url, worker, result, reported)"
+                                " VALUES (?, ?, ?, NULL, ?)", (pluginName, url, workerID, now))
+                    continue
+                if len(leased) < batchSize:
+                    leased.append((pluginName, url))
+            con.executemany(
+                "UPDATE URL_LEASES SET state = 'leased', owner = ?, expiry = ?, attempts = attempts + 1"
+                " WHERE plugin_name = ? AND url = ?",
+                [(workerID, now + self.leaseTimeoutSec, pluginName, url) for pluginName, url in leased])
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        return leased
+
+    def renewLeases(self, workerID: str):
+        """ Extend the leases of all the URLs held by the worker.
+        """
+        self.getConnection().execute("UPDATE URL_LEASES SET expiry = ? WHERE state = 'leased' AND owner = ?",
+                                     (time.time() + self.leaseTimeoutSec, workerID))
+
+    def reportResult(self, workerID: str, pluginName: str, url: str, result: Optional[dict]) -> bool:
+        """ Report the result of fetching a leased URL.
+
+        :param workerID: Identifier of the worker
+        :param pluginName: Name of the plugin that fetched the URL
+        :param url: URL that was fetched
+        :param result: Fetch result as a JSON serialisable dictionary, None if it could not be fetched
+        :return: False if the worker no longer holds the lease, so the result is discarded
+        """
+        con = self.getConnection()
+        con.execute("BEGIN IMMEDIATE")
+        cur = con.execute("UPDATE URL_LEASES SET state = 'reported' WHERE plugin_name = ? AND url = ?"
+                          " AND state = 'leased' AND owner = ?", (pluginName, url, workerID))
+        if cur.rowcount == 0:
+            con.execute("COMMIT")
+            logger.debug(f"Lease queue: lease of {url} expired for worker {workerID}, result discarded")
+            return False
+        con.execute("INSERT INTO LEASE_RESULTS (plugin_name, url, worker, result, reported) VALUES (?, ?, ?, ?, ?)",
+                    (pluginName, url, workerID, json.dumps(result) if result is not None else None, time.time()))
+        con.execute("COMMIT")
+        return True
+
+    def takeResults(self, maxCount: int = 100) -> List[tuple]:
+        """ Take the results reported by the workers, and mark their URLs as done.
+
+        :return: List of tuples of the plugin name, URL, worker and result dictionary (or None)
+        """
+        con = self.getConnection()
+        con.execute("BEGIN IMMEDIATE")
+        rows = con.execute("SELECT id, plugin_name, url, worker, result FROM LEASE_RESULTS ORDER BY id LIMIT ?",
+                           (maxCount,)).fetchall()
+        if rows:
+            con.executemany("DELETE FROM LEASE_RESULTS WHERE id = ?", [(row[0],) for row in rows])
+            con.executemany("UPDATE URL_LEASES SET state = 'done', owner = NULL WHERE plugin_name = ? AND url = ?",
+                            [(row[1], row[2]) for row in rows])
+        con.execute("COMMIT")
+        return [(pluginName, url, worker, json.loads(result) if result is not None else None)
+                for (rowID, pluginName, url, worker, result) in rows]
+
+    def getOutstandingCount(self, pluginName: str = None) -> int:
+        """ Get the number of URLs not yet done, for one or all plugins.
+        """
+        if pluginName is not None:
+            row = self.getConnection().execute(
+                "SELECT COUNT(*) FROM URL_LEASES WHERE state != 'done' AND plugin_name = ?", (pluginName,)).fetchone()
+        else:
+            row = self.getConnection().execute("SELECT COUNT(*) FROM URL_LEASES WHERE state != 'done'").fetchone()
+        return row[0]
+
+    def getStateCounts(self) -> Dict[str, int]:
+        rows = self.getConnection().execute("SELECT state, COUNT(*) FROM URL_LEASES GROUP BY state").fetchall()
+        return {state: count for state, count in rows}
+
+    def getWorkerCounts(self) -> Dict[str, int]:
+        """ Get the number of URLs currently leased by each worker.
+        """
+        rows = self.getConnection().execute(
+            "SELECT owner, COUNT(*) FROM URL_LEASES WHERE state = 'leased' GROUP BY owner").fetchall()
+        return {owner: count for owner, count in rows}
+
+
+def resultToReport(fetchResult: ExecutionResult) -> dict:
+    """ Convert the fetch result into the dictionary reported by a worker to the coordinator.
+    """
+    report = resultToJournalItem(fetchResult)
+    report['success'] = bool(fetchResult.wasSuccessful)
+    report['links'] = list(fetchResult.additionalLinks) if fetchResult.additionalLinks else []
+    http_error = getattr(fetchResult, 'http_error', None)
+    if http_error is not None:
+        report['http_error'] = {'status_code': http_error.status_code, 'message': http_error.message}
+    return report
+
+
+def resultFromReport(report: dict) -> ExecutionResult:
+    """ Re-create the fetch result from the dictionary reported by a worker.
+    """
+    fetchResult = resultFromJournalItem(report)
+    fetchResult.wasSuccessful = report.get('success', False)
+    fetchResult.additionalLinks = report.get('links', [])
+    if report.get('http_error') is not None:
+        fetchResult.http_error = HTTPError(report['http_error']['status_code'], report['url'],
+                                           report['http_error'].get('message'))
+    return fetchResult
+
+
+def getDefaultWorkerID() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class LeaseCoordinator:
+    """
+    Runs in the coordinator, in place of the fetch workers: it moves the URLs discovered by each
+    plugin into the lease queue, and records the results reported by the workers as if they had been
+    fetched locally, i.e. they are saved to the session history and queued for data processing.
+
+    It has the same interface as the global FetchScheduler, so the worker pairs use it the same way.
+    """
+
+    def __init__(self, queue_manager, session_history, lease_queue: LeaseQueue, poll_interval: float = 0.5):
+        """
+        Initialize the coordinator.
+
+        Args:
+            queue_manager: Queue manager
+            session_history: Database interface
+            lease_queue: The lease queue shared with the workers
+            poll_interval: Seconds to wait when there was nothing to do
+        """
+        self.queue_manager = queue_manager
+        self.session_history = session_history
+        self.lease_queue = lease_queue
+        self.poll_interval = poll_interval
+        self.thread: Optional[threading.Thread] = None
+
+        self._lock = threading.Lock()
+        self._plugins: Dict[str, dict] = {}
+        self.resultsCollected = 0
+
+    def register_plugin(self, plugin, url_discovery_complete: threading.Event):
+        """Add a plugin whose discovered URLs are to be leased to the workers."""
+        with self._lock:
+            self._plugins[type(plugin).__name__] = {
+                'plugin': plugin,
+                'discovery_complete': url_discovery_complete,
+                'end_marker_seen': False,
+                'queued': 0,
+                'fetched': 0,
+                'done': False
+            }
+
+    def start(self):
+        """Start coordinating the workers."""
+        self.lease_queue.startRun()
+        self.thread = threading.Thread(target=self.run, name="LeaseCoordinator", daemon=True)
+        self.thread.start()
+        logger.info(f"Lease coordinator started for {len(self._plugins)} plugins, "
+                    f"queue: {self.lease_queue.dbFileName}")
+
+    def join(self, timeout: Optional[float] = None):
+        if self.thread is not None:
+            self.thread.join(timeout=timeout)
+
+    def is_alive(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def is_plugin_active(self, plugin_name: str) -> bool:
+        """Check if the URLs of this plugin are still being discovered, fetched or recorded."""
+        with self._lock:
+            plugin_state = self._plugins.get(plugin_name)
+            return plugin_state is not None and not plugin_state['done'] and self.is_alive()
+
+    def all_done(self) -> bool:
+        with self._lock:
+            return all(p['done'] for p in self._plugins.values())
+
+    def run(self):
+        """Main loop of the coordinator."""
+        try:
+            while not self.queue_manager.shutdown_event.is_set():
+                busy = self.moveDiscoveredURLs()
+                busy = self.collectResults() or busy
+                self.checkPluginsDone()
+                if self.all_done():
+                    break
+                if not busy:
+                    time.sleep(self.poll_interval)
+        except Exception as e:
+            logger.error(f"Lease coordinator error: {e}")
+        finally:
+            if self.all_done():
+                self.lease_queue.finishRun()
+            logger.info(f"Lease coordinator finished, results collected = {self.resultsCollected}")
+
+    def moveDiscoveredURLs(self) -> bool:
+        """Move the URLs from the plugins' queues into the lease queue."""
+        moved = False
+        for plugin_name, plugin_state in list(self._plugins.items()):
+            urlQueue = plugin_state['plugin'].urlQueue
+            urlList = []
+            while True:
+                try:
+                    url = urlQueue.get_nowait()
+                    urlQueue.task_done()
+                except Exception:
+                    break
+                if url is None:
+                    plugin_state['end_marker_seen'] = True
+                    break
+                urlList.append(url)
+            if urlList:
+                self.lease_queue.addURLs(plugin_name, urlList)
+                with self._lock:
+                    plugin_state['queued'] += len(urlList)
+                moved = True
+        return moved
+
+    def collectResults(self) -> bool:
+        """Record the results reported by the workers."""
+        # imported here since the worker module is not needed by the worker processes' lease queue:
+        from newslookout.worker import ContentFetchWorker
+        results = self.lease_queue.takeResults()
+        for plugin_name, url, worker, report in results:
+            plugin_state = self._plugins.get(plugin_name)
+            if plugin_state is None:
+                continue
+            plugin = plugin_state['plugin']
+            if report is not None:
+                fetch_result = resultFromReport(report)
+            else:
+                fetch_result = ExecutionResult(url, 0, 0, None, plugin_name)
+            ContentFetchWorker.handle_fetch_result(plugin, url, fetch_result, self.session_history,
+                                                   self.queue_manager, f"Coordinator[{worker}]")
+            plugin.incrementProcessedCount()
+            with self._lock:
+                plugin_state['fetched'] += 1
+            self.resultsCollected += 1
+        return len(results) > 0
+
+    def checkPluginsDone(self):
+        """Mark the plugins whose URLs have all been discovered, fetched and recorded as stopped."""
+        for plugin_name, plugin_state in list(self._plugins.items()):
+            if plugin_state['done']:
+                continue
+            discovery_ended = plugin_state['end_marker_seen'] or plugin_state['discovery_complete'].is_set()
+            if discovery_ended and plugin_state['plugin'].urlQueue.empty() and \
+                    self.lease_queue.getOutstandingCount(plugin_name) == 0:
+                with self._lock:
+                    plugin_state['done'] = True
+                plugin_state['plugin'].pluginState = PluginTypes.STATE_STOPPED
+                logger.info(f"Lease coordinator: completed {plugin_name}, fetched {plugin_state['fetched']} URLs")
+
+    def get_status(self) -> dict:
+        """Get status of the coordinator, the lease queue and the work done for each plugin."""
+        with self._lock:
+            plugins_status = {
+                plugin_name: {
+                    'queued': plugin_state['queued'],
+                    'fetched': plugin_state['fetched'],
+                    'done': plugin_state['done']
+                }
+                for plugin_name, plugin_state in self._plugins.items()
+            }
+        return {
+            'role': 'coordinator',
+            'lease_states': self.lease_queue.getStateCounts(),
+            'leased_by_worker': self.lease_queue.getWorkerCounts(),
+            'plugins': plugins_status
+        }
+
+
+class DistributedFetchWorker(threading.Thread):
+    """
+    Runs in a worker process: it leases batches of URLs from the coordinator's queue, fetches and parses
+    them with the plugins loaded in this process, and reports the results back to the coordinator.
+    The articles are not saved by the worker, they are carried in the result and saved by the coordinator.
+    """
+
+    def __init__(self, lease_queue: LeaseQueue, plugins_map: dict, worker_id: str,
+                 shutdown_event: threading.Event, batch_size: int = 20, poll_interval: float = 1.0,
+                 name: str = None):
+        """
+        Initialize the worker.
+
+        Args:
+            lease_queue: The lease queue shared with the coordinator
+            plugins_map: Names of the content plugins mapped to the plugin instances of this process
+            worker_id: Identifier of this worker, leases are held in its name
+            shutdown_event: Event signalling the application is shutting down
+            batch_size: Number of URLs leased at a time
+            poll_interval: Seconds to wait when no URL could be leased
+            name: Thread name
+        """
+        super().__init__(name=name or worker_id, daemon=True)
+        self.lease_queue = lease_queue
+        self.plugins_map = plugins_map
+        self.worker_id = worker_id
+        self.shutdown_event = shutdown_event
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.fetchedCount = 0
+        self.discardedCount = 0
+
+    def run(self):
+        """Main execution method."""
+        logger.info(f"{self.name}: Distributed fetch worker started for plugins: {list(self.plugins_map.keys())}")
+        pluginNames = list(self.plugins_map.keys())
+        while not self.shutdown_event.is_set():
+            try:
+                batch = self.lease_queue.leaseBatch(self.worker_id, self.batch_size, pluginNames)
+            except Exception as e:
+                logger.error(f"{self.name}: Error leasing URLs: {e}")
+                batch = []
+            if not batch:
+                if self.lease_queue.getRunStatus() == 'finished':
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            for plugin_name, url in batch:
+                if self.shutdown_event.is_set():
+                    break
+                self.fetchURL(self.plugins_map[plugin_name], plugin_name, url)
+                self.lease_queue.renewLeases(self.worker_id)
+        logger.info(f"{self.name}: Distributed fetch worker finished, fetched = {self.fetchedCount}, "
+                    f"discarded = {self.discardedCount}")
+
+    def fetchURL(self, plugin, plugin_name: str, url: str):
+        """Fetch the URL with the plugin, and report the result."""
+        report = None
+        try:
+            fetch_result = plugin.fetchDataFromURL(url, self.name)
+            if fetch_result is not None:
+                report = resultToReport(fetch_result)
+        except Exception as e:
+            logger.error(f"{self.name}: Error fetching URL {url}: {e}")
+        if self.lease_queue.reportResult(self.worker_id, plugin_name, url, report):
+            self.fetchedCount += 1
+        else:
+            self.discardedCount += 1
+
+# # end of file ##
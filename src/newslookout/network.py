@@ -33,8 +33,10 @@
 # import standard python libraries:
 import time
 import random
-import functools
 import logging
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
 
 # import web retrieval python libraries:
 import http
@@ -47,6 +49,9 @@ from urllib3.exceptions import InsecureRequestWarning
 import newspaper
 
 from newslookout import scraper_utils
+from newslookout.data_structs import CancellationToken
+from newslookout.cassette import NetworkCassette, mountCassetteAdapters, NETWORK_MODE_LIVE, NETWORK_MODE_SYNTHETIC
+from newslookout.synthetic_site import mountSyntheticSiteAdapter
 
 ##########
 
@@ -80,6 +85,217 @@ class LegacySSLAdapter(HTTPAdapter):
                                        ssl_context=context)
 
 
+class PageCache:
+    """ Run-scoped cache of fetched pages with single-flight request coalescing.
+
+    All the discovery strategies of a run (newspaper source, main and non-content URLs,
+    recursive link extraction) go through this cache, so each URL is downloaded at most once per run.
+    If a second thread asks for a URL that is still being fetched, it waits for the first
+    fetch to complete instead of issuing its own request.
+    Only successful fetches and permanent HTTP errors are retained, transient failures are
+    handed to the waiting threads but are not cached so that a later call can retry them.
+    """
+
+    def __init__(self, maxEntries: int = 5000):
+        self.maxEntries = maxEntries
+        self._entries = OrderedDict()
+        self._inFlight = dict()
+        self._lock = threading.Lock()
+        self.hitCount = 0
+        self.missCount = 0
+        self.coalescedCount = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, cacheKey):
+        with self._lock:
+            return cacheKey in self._entries
+
+    def getOrFetch(self, cacheKey, fetchFunction, shutdown_event=None) -> tuple:
+        """ Get the cached result for the key, or call fetchFunction() to retrieve it.
+        Concurrent callers for the same key share a single call to fetchFunction().
+
+        :param cacheKey: Key identifying the page, e.g. the URL
+        :param fetchFunction: Function without arguments that returns the tuple (content, http_error)
+        :param shutdown_event: Event which, when set, stops the wait for an in-flight fetch
+        :return: Tuple (content, http_error)
+        """
+        with self._lock:
+            if cacheKey in self._entries:
+                self.hitCount += 1
+                return self._entries[cacheKey]
+            inFlightEntry = self._inFlight.get(cacheKey)
+            if inFlightEntry is None:
+                # this thread becomes the owner of the fetch:
+                inFlightEntry = {'done': threading.Event(), 'result': (None, None)}
+                self._inFlight[cacheKey] = inFlightEntry
+                self.missCount += 1
+                isOwner = True
+            else:
+                self.coalescedCount += 1
+                isOwner = False
+        if isOwner is False:
+            # wait for the owner thread to complete the fetch:
+            while not inFlightEntry['done'].wait(timeout=1):
+                if shutdown_event is not None and shutdown_event.is_set():
+                    return None, None
+            return inFlightEntry['result']
+        result = (None, None)
+        try:
+            result = fetchFunction()
+        finally:
+            with self._lock:
+                if PageCache.isCacheable(result):
+                    self._entries[cacheKey] = result
+                    if len(self._entries) > self.maxEntries:
+                        self._entries.popitem(last=False)
+                inFlightEntry['result'] = result
+                del self._inFlight[cacheKey]
+            inFlightEntry['done'].set()
+        return result
+
+    @staticmethod
+    def isCacheable(result) -> bool:
+        """ Check whether the fetch result should be retained for the rest of the run.
+
+        :param result: Tuple (content, http_error)
+        :return: True if content was retrieved, or the request failed with a permanent HTTP error.
+        """
+        if not isinstance(result, tuple) or len(result) != 2:
+            return False
+        content, http_error = result
+        if http_error is not None:
+            return http_error.is_permanent
+        return content is not None
+
+    def clear(self):
+        """ Remove all cached pages, e.g. at the end of the run. """
+        with self._lock:
+            self._entries.clear()
+
+    def getStats(self) -> dict:
+        """ Get the usage counters of this cache.
+
+        :return: Dictionary with the count of hits, misses, coalesced requests and cached entries.
+        """
+        with self._lock:
+            return {'hits': self.hitCount,
+                    'misses': self.missCount,
+                    'coalesced': self.coalescedCount,
+                    'entries': len(self._entries)}
+
+
+class DomainRateLimiter:
+    """ Politeness limits for each web domain, shared by all the fetch workers of a run.
+
+    When several workers fetch from the same plugin's queue, each of them would otherwise
+    apply its own delay, multiplying the request rate seen by the web server.
+    This limiter caps the number of simultaneous requests to a domain, and spaces out
+    the start of consecutive requests to a domain by a minimum interval.
+    """
+
+    def __init__(self, maxConnectionsPerDomain: int = 2, minIntervalSec: float = 1.0):
+        self.maxConnectionsPerDomain = max(1, maxConnectionsPerDomain)
+        self.minIntervalSec = max(0.0, minIntervalSec)
+        self._domainSemaphores = dict()
+        self._nextStartTime = dict()
+        self._activeCount = dict()
+        self._lock = threading.Lock()
+        self.waitCount = 0
+
+    @staticmethod
+    def getDomain(url: str) -> str:
+        """ Get the domain name of the URL, used as the key for the limits. """
+        try:
+            return urlparse(url).netloc.lower()
+        except Exception:
+            return ''
+
+    def acquire(self, url: str, shutdown_event=None) -> bool:
+        """ Wait until a request to the domain of this URL is allowed.
+        Every successful call must be followed by a call to release() for the same URL.
+
+        :param url: The URL about to be fetched
+        :param shutdown_event: Event which, when set, stops the wait
+        :return: True if the request may proceed, False if the wait was interrupted by shutdown.
+        """
+        domain = DomainRateLimiter.getDomain(url)
+        with self._lock:
+            domainSemaphore = self._domainSemaphores.get(domain)
+            if domainSemaphore is None:
+                domainSemaphore = threading.BoundedSemaphore(self.maxConnectionsPerDomain)
+                self._domainSemaphores[domain] = domainSemaphore
+        while not domainSemaphore.acquire(timeout=1):
+            if shutdown_event is not None and shutdown_event.is_set():
+                return False
+        with self._lock:
+            self._activeCount[domain] = self._activeCount.get(domain, 0) + 1
+            # reserve the next start time slot for this domain:
+            timeNow = time.time()
+            startTime = max(timeNow, self._nextStartTime.get(domain, 0))
+            self._nextStartTime[domain] = startTime + self.minIntervalSec
+            if startTime > timeNow:
+                self.waitCount += 1
+        waitTime = startTime - time.time()
+        if waitTime > 0:
+            if shutdown_event is not None:
+                if shutdown_event.wait(timeout=waitTime):
+                    self.release(url)
+                    return False
+            else:
+                time.sleep(waitTime)
+        return True
+
+    def release(self, url: str):
+        """ Release the slot taken by acquire() for the domain of this URL. """
+        domain = DomainRateLimiter.getDomain(url)
+        with self._lock:
+            domainSemaphore = self._domainSemaphores.get(domain)
+            if domainSemaphore is not None:
+                self._activeCount[domain] = max(0, self._activeCount.get(domain, 0) - 1)
+        if domainSemaphore is not None:
+            domainSemaphore.release()
+
+    def getWaitTime(self, url: str) -> float:
+        """ Get the time until a request to the domain of this URL would be allowed, without waiting.
+        This lets a scheduler pick work for another domain instead of blocking on this one.
+
+        :param url: Any URL of the domain
+        :return: Number of seconds to wait, zero if a request can start now.
+        """
+        domain = DomainRateLimiter.getDomain(url)
+        with self._lock:
+            if self._activeCount.get(domain, 0) >= self.maxConnectionsPerDomain:
+                return max(self.minIntervalSec, 0.1)
+            return max(0.0, self._nextStartTime.get(domain, 0) - time.time())
+
+
+class CancellableStream:
+    """ Raw stream of a streamed response, which stops the download when its token is cancelled.
+    The token is checked after each chunk of the body is received. The chunks are returned as soon as
+    they are received, instead of waiting to fill the chunk size, so a slow download is stopped promptly.
+    """
+
+    def __init__(self, rawStream, cancelToken: CancellationToken):
+        self.rawStream = rawStream
+        self.cancelToken = cancelToken
+
+    def stream(self, amt: int = 2 ** 16, decode_content: bool = None):
+        if hasattr(self.rawStream, 'read1'):
+            chunks = iter(lambda: self.rawStream.read1(amt, decode_content=decode_content), b'')
+        else:
+            chunks = self.rawStream.stream(amt, decode_content=decode_content)
+        for chunk in chunks:
+            if self.cancelToken.is_set():
+                raise requests.ConnectionError('Download cancelled')
+            yield chunk
+
+    def __getattr__(self, name):
+        return getattr(self.rawStream, name)
+
+
 class NetworkFetcher:
     """ The network manager class performs all the network processing for the application
     """
@@ -99,6 +315,15 @@ class NetworkFetcher:
     customHeader = dict()
     cookieJar = None
     newspaper_config = None
+    # page cache shared by all plugins for the duration of a run, see setRunPageCache():
+    runPageCache = None
+    # politeness limits per domain shared by all the fetch workers of a run, see setDomainRateLimiter():
+    domainRateLimiter = None
+    # network mode is one of: live, record, replay or synthetic, see modules cassette and synthetic_site:
+    network_mode = NETWORK_MODE_LIVE
+    cassette = None
+    # session used by the newspaper library's fetches when recording, replaying or routing to the synthetic site:
+    cassetteSession = None
 
     def __init__(self, app_config, allowedDomains):
         """ Read and apply the configuration data passed by the main application
@@ -133,6 +358,27 @@ class NetworkFetcher:
             legacy_adapter = LegacySSLAdapter()
             self.session.mount('https://', legacy_adapter)
 
+            # Record or replay all network traffic using the network cassette, if configured:
+            self.network_mode = getattr(self.app_config, 'network_mode', NETWORK_MODE_LIVE)
+            if self.network_mode == NETWORK_MODE_SYNTHETIC:
+                # route all requests to the local synthetic news site server, used for load testing:
+                mountSyntheticSiteAdapter(self.session, self.app_config.synthetic_site_url)
+                if NetworkFetcher.cassetteSession is None:
+                    NetworkFetcher.cassetteSession = mountSyntheticSiteAdapter(requests.Session(),
+                                                                               self.app_config.synthetic_site_url)
+                logger.info("Network fetcher is routing all requests to the synthetic site: %s",
+                            self.app_config.synthetic_site_url)
+            elif self.network_mode != NETWORK_MODE_LIVE:
+                self.cassette = NetworkCassette.getCassette(self.app_config.cassette_file,
+                                                            latency_ms=self.app_config.cassette_latency_ms,
+                                                            bandwidth_kbps=self.app_config.cassette_bandwidth_kbps)
+                mountCassetteAdapters(self.session, self.network_mode, self.cassette, baseAdapter=legacy_adapter)
+                if NetworkFetcher.cassetteSession is None:
+                    NetworkFetcher.cassetteSession = mountCassetteAdapters(
+                        requests.Session(), self.network_mode, self.cassette, baseAdapter=LegacySSLAdapter())
+                logger.info("Network fetcher is in %s mode, using the network cassette: %s",
+                            self.network_mode, self.app_config.cassette_file)
+
             # Cookies setup (simplified)
             self.cookieJar = self.loadAndSetCookies(self.app_config.cookie_file)
             if self.cookieJar:
@@ -141,13 +387,29 @@ class NetworkFetcher:
         except Exception as e:
             logger.error("Exception when configuring the network manager: %s", e)
 
+    @classmethod
+    def setRunPageCache(cls, pageCache):
+        """ Set the page cache to be shared by all network fetchers for the current run.
+
+        :param pageCache: PageCache object, or None to disable caching.
+        """
+        cls.runPageCache = pageCache
+
+    @classmethod
+    def setDomainRateLimiter(cls, rateLimiter):
+        """ Set the per-domain politeness limits to be applied by all the plugins' network fetchers.
+
+        :param rateLimiter: DomainRateLimiter object, or None to remove the limits.
+        """
+        cls.domainRateLimiter = rateLimiter
+
     @staticmethod
-    @functools.lru_cache(maxsize=100)
     def NewsPpr_get_html_2XX_only(url: str, config=None, response=None):
         """ Replacement for method: newspaper.network.get_html_2XX_only()
         Consolidated logic for http requests from newspaper. Handles error cases:
         - Attempt to find encoding of the html by using HTTP header. Fallback to 'ISO-8859-1' if not provided.
         - Error out if a non 2XX HTTP response code is returned.
+        Pages are shared with the other discovery fetches via the run's page cache, if one is set.
 
         :param url: URL to fetch
         :param config: newspaper.config object with HTTP protocol request options such as proxy, timeouts, etc.
@@ -162,16 +424,54 @@ class NetworkFetcher:
         headers = config.headers
         if response is not None:
             return newspaper.network._get_html_from_response(response)
-        response = requests.get(
-            url=url,
-            verify=False,
-            **newspaper.network.get_request_kwargs(timeout, useragent, proxies, headers)
-            )
-        html = newspaper.network._get_html_from_response(response)
-        if config.http_success_only:
+
+        # when recording or replaying network traffic, use the session with the cassette adapters mounted:
+        httpClient = NetworkFetcher.cassetteSession if NetworkFetcher.cassetteSession is not None else requests
+
+        def fetchWithNewspaperConfig() -> tuple:
+            httpResponse = httpClient.get(
+                url=url,
+                verify=False,
+                **newspaper.network.get_request_kwargs(timeout, useragent, proxies, headers)
+                )
+            http_error = None
+            if httpResponse.status_code >= 400:
+                http_error = HTTPError(httpResponse.status_code, url)
+            return newspaper.network._get_html_from_response(httpResponse), http_error
+
+        pageCache = NetworkFetcher.runPageCache
+        if pageCache is not None:
+            html, http_error = pageCache.getOrFetch((url, False), fetchWithNewspaperConfig)
+        else:
+            html, http_error = fetchWithNewspaperConfig()
+        if config.http_success_only and http_error is not None:
             # fail if HTTP sends a non 2XX response
-            response.raise_for_status()
-        return html
+            raise requests.HTTPError(str(http_error))
+        return html if html is not None else ''
+
+    @staticmethod
+    def readStreamedResponse(httpsResponse: requests.Response, cancelToken: CancellationToken):
+        """ Read the body of a streamed response, stopping the download when the token is cancelled.
+        Raises requests.ConnectionError if the download was cancelled.
+        """
+        httpsResponse.raw = CancellableStream(httpsResponse.raw, cancelToken)
+        # also abort the response if the token is cancelled while waiting for a chunk:
+        callbackID = cancelToken.addCallback(lambda: NetworkFetcher.abortResponse(httpsResponse))
+        try:
+            httpsResponse.content
+        finally:
+            cancelToken.removeCallback(callbackID)
+
+    @staticmethod
+    def abortResponse(httpsResponse: requests.Response):
+        """ Abort the download of a streamed response, called from another thread than the one reading it.
+        The raw response is closed, so the read in progress fails instead of running until the fetch timeout.
+        """
+        try:
+            httpsResponse.raw.close()
+        except Exception as e:
+            logger.debug("Could not close the raw response being aborted: %s", e)
+        httpsResponse.close()
 
     @staticmethod
     def sleepBeforeNextFetch(fix_sec: int = 3,
@@ -199,7 +499,8 @@ class NetworkFetcher:
             time.sleep(1)
 
     def fetchRawDataFromURL_with_error_handling(self, uRLtoFetch: str, pluginName: str,
-                                                getBytes: bool = False, shutdown_event=None):
+                                                getBytes: bool = False, shutdown_event=None,
+                                                rateLimited: bool = True):
         """
         Fetch raw HTML content from URL with proper HTTP error handling and shutdown checks.
 
@@ -209,12 +510,17 @@ class NetworkFetcher:
             uRLtoFetch (str): URL to fetch
             pluginName (str): Plugin name for logging
             getBytes (bool): Return bytes instead of string
+            shutdown_event: Event or CancellationToken which, when set, stops the fetch. If a CancellationToken
+             is given, the response is streamed and aborted when the token is cancelled, so that a download
+             in progress is aborted instead of running until the fetch timeout.
+            rateLimited (bool): Whether the fetch waits for the politeness limits of the URL's domain
 
         Returns:
             tuple: (content, http_error) where http_error is HTTPError or None
         """
         httpsResponse = None
         http_error = None
+        isCancellable = isinstance(shutdown_event, CancellationToken)
 
         if not uRLtoFetch or len(uRLtoFetch) < 11:
             return None, None
@@ -232,13 +538,23 @@ class NetworkFetcher:
                 ua = self.userAgentStrList[self.userAgentIndex]
                 self.session.headers.update({'user-agent': ua})
 
-                # Use the session
-                httpsResponse = self.session.get(
-                    uRLtoFetch,
-                    timeout=(self.connect_timeout, self.fetch_timeout),
-                    proxies=self.proxies,
-                    verify=False
-                )
+                # Use the session, within the politeness limits for this domain
+                rateLimiter = self.domainRateLimiter if rateLimited else None
+                if rateLimiter is not None and not rateLimiter.acquire(uRLtoFetch, shutdown_event):
+                    return None, None
+                try:
+                    httpsResponse = self.session.get(
+                        uRLtoFetch,
+                        timeout=(self.connect_timeout, self.fetch_timeout),
+                        proxies=self.proxies,
+                        verify=False,
+                        stream=isCancellable
+                    )
+                    if isCancellable:
+                        NetworkFetcher.readStreamedResponse(httpsResponse, shutdown_event)
+                finally:
+                    if rateLimiter is not None:
+                        rateLimiter.release(uRLtoFetch)
 
                 # CHECK FOR HTTP ERRORS
                 if httpsResponse.status_code >= 400:
@@ -300,17 +616,34 @@ class NetworkFetcher:
                         shutdown_event=shutdown_event
                     )
 
+        if isCancellable and shutdown_event.is_set():
+            logger.info(f"{pluginName}: Fetch cancelled for URL {uRLtoFetch}")
+            return None, None
         content = self.getDataFromHTTPResponse(httpsResponse, getBytes) if httpsResponse else None
         return content, http_error
 
-    def fetchRawDataFromURL(self, uRLtoFetch: str, pluginName: str, getBytes: bool = False, shutdown_event=None):
+    def fetchRawDataFromURL(self, uRLtoFetch: str, pluginName: str, getBytes: bool = False, shutdown_event=None,
+                            useCache: bool = False):
         """
         Fetch raw HTML content with HTTP error tracking and shutdown support.
 
+        Discovery fetches should set useCache=True, so that a URL requested by several
+        discovery strategies (or by several plugins at the same time) is downloaded only once per run.
+        The politeness limits of the domain apply to the content fetches only: the few discovery pages
+        are fetched once each, and spacing them out would delay the start of the content fetches.
+
         Returns:
             tuple: (content, http_error) where http_error is HTTPError object or None
         """
-        return self.fetchRawDataFromURL_with_error_handling(uRLtoFetch, pluginName, getBytes, shutdown_event)
+        pageCache = self.runPageCache
+        if useCache is False or pageCache is None:
+            return self.fetchRawDataFromURL_with_error_handling(uRLtoFetch, pluginName, getBytes, shutdown_event,
+                                                                rateLimited=not useCache)
+        return pageCache.getOrFetch(
+            (uRLtoFetch, getBytes),
+            lambda: self.fetchRawDataFromURL_with_error_handling(uRLtoFetch, pluginName, getBytes, shutdown_event,
+                                                                 rateLimited=False),
+            shutdown_event=shutdown_event)
 
     def getDataFromHTTPResponse(self,
                                 httpsResponse: requests.Response,
@@ -378,17 +711,24 @@ class NetworkFetcher:
     def getHTTPData(self,
                     uRLtoFetch: str,
                     postHeaders: dict = None,
-                    pluginName: str = None) -> requests.Response:
+                    pluginName: str = None,
+                    shutdown_event=None) -> requests.Response:
         """Fetch data using HTTP(s) GET Method, send back response object.
         Uses custom agent, proxy and timeouts configured for the network Fetcher object
 
         :param uRLtoFetch: URL to fetch
         :param postHeaders: Dictionary of key-value pairs to set custom headers in the request
         :param pluginName: Name of the plugin
-        :return: HTTP Response object
+        :param shutdown_event: Event or CancellationToken which, when set, stops the fetch. A download in progress
+         is aborted when a CancellationToken is cancelled.
+        :return: HTTP Response object, None if the fetch was cancelled
         """
         httpsResponse = None
+        isCancellable = isinstance(shutdown_event, CancellationToken)
         for retryCounter in range(self.retryCount):
+            if shutdown_event is not None and shutdown_event.is_set():
+                logger.info(f"{pluginName}: Fetch cancelled for URL {uRLtoFetch}")
+                return None
             logger.debug("RetryCounter %s: Posting HTTP content for URL %s",
                          retryCounter, uRLtoFetch.encode('ascii', "ignore"))
             try:
@@ -397,13 +737,16 @@ class NetworkFetcher:
                     postHeaders = self.customHeader
                 else:
                     postHeaders.update(self.customHeader)
-                httpsResponse = requests.get(
+                httpsResponse = self.session.get(
                     uRLtoFetch,
                     headers=postHeaders,
                     timeout=(self.connect_timeout, self.fetch_timeout),
                     proxies=self.proxies,
-                    verify=self.verify_ca_cert  # warning: false disables checking SSL certs!
+                    verify=self.verify_ca_cert,  # warning: false disables checking SSL certs!
+                    stream=isCancellable
                     )
+                if isCancellable:
+                    NetworkFetcher.readStreamedResponse(httpsResponse, shutdown_event)
                 break  # completed without error, so don't retry again.
             except Exception as e:
                 logger.error(f"{pluginName}: Stopping the download, general error (retry count = {retryCounter})" +
@@ -417,7 +760,11 @@ class NetworkFetcher:
                 # wait for a random time period
                 NetworkFetcher.sleepBeforeNextFetch(fix_sec=self.retryWaitFixed,
                                                     min_rand_sec=self.retry_wait_rand_min_sec,
-                                                    max_rand_sec=self.retry_wait_rand_max_sec)
+                                                    max_rand_sec=self.retry_wait_rand_max_sec,
+                                                    shutdown_event=shutdown_event)
+        if isCancellable and shutdown_event.is_set():
+            logger.info(f"{pluginName}: Fetch cancelled for URL {uRLtoFetch}")
+            return None
         return httpsResponse
 
     def postHTTPData(self, uRLtoFetch: str,
@@ -444,7 +791,7 @@ class NetworkFetcher:
                     postHeaders = self.customHeader
                 else:
                     postHeaders.update(self.customHeader)
-                httpsResponse = requests.post(
+                httpsResponse = self.session.post(
                     uRLtoFetch,
                     data=payload,
                     json=jsonBody,
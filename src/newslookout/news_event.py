@@ -62,6 +62,15 @@ class NewsEvent(JSONEncoder):
     triggerWordFlags = dict()
     uniqueID = ""
     html = None
+    duplicate = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # each event has its own data, since events are built concurrently by the fetch and parse workers:
+        self.urlData = dict()
+        self.triggerWordFlags = dict()
+        # set by the de-duplication plugin on an article that is not saved yet, so it is not saved at all:
+        self.duplicate = False
 
     def getPublishDate(self) -> datetime:
         if type(self.urlData["pubdate"]) == datetime:
@@ -157,6 +166,9 @@ class NewsEvent(JSONEncoder):
     def getFileName(self) -> str:
         return self.fileName
 
+    def isDuplicate(self) -> bool:
+        return self.duplicate
+
     def setClassification(self, classificationObj):
         self.urlData['classification'] = classificationObj
 
@@ -169,6 +181,9 @@ class NewsEvent(JSONEncoder):
     def setFileName(self, fileName: str):
         self.fileName = fileName
 
+    def markAsDuplicate(self):
+        self.duplicate = True
+
     def setPublishDate(self, publishDate):
         """ set the Publish Date of article """
         try:
@@ -256,6 +271,16 @@ class NewsEvent(JSONEncoder):
         except Exception as theError:
             logger.error("Exception caught reading JSON file %s: %s", jsonFileName, theError)
 
+    def writeToJSON(self, jsonFileName: str):
+        """ write object into JSON file
+        """
+        try:
+            with open(jsonFileName, 'wt', encoding='utf-8') as fp:
+                fp.write(self.toJSON())
+            logger.debug('Saved article as json file: %s', jsonFileName)
+        except Exception as theError:
+            logger.error("Exception caught writing JSON file %s: %s", jsonFileName, theError)
+
     @staticmethod
     def cleanText(textInput: str) -> str:
         """ Clean text - replace unicode characters, fix space gaps, remove repeated characters, etc.
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: parsed_document.py                                                                           #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: HTML document of a fetched page, parsed once and shared by all the extraction steps            #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+"""
+ Provides:
+    ParsedDocument: HTML document of a fetched page, parsed once and shared by all the extraction steps.
+    classXPath: XPath condition that matches elements by their class attribute like Beautiful Soup does.
+    elementText: Text of an lxml element without its scripts and style sheets, like Beautiful Soup's get_text().
+
+ The lxml tree of the page is built at most once: either adopted from the newspaper library's article after it
+ has parsed the page, or parsed on first use. The Beautiful Soup tree is likewise built only if a plugin uses it.
+ The document is the HTML text itself, so it is passed to the plugins' extraction methods in place of the
+ HTML content and each method uses the trees of the same document instead of parsing the page again.
+ The extraction steps only read these trees, they must not modify them.
+"""
+
+# import standard python libraries:
+import logging
+import threading
+
+# import web retrieval and text processing python libraries:
+from bs4 import BeautifulSoup
+from newspaper import parsers as newspaper_parsers
+
+# import this project's python libraries:
+from newslookout.scraper_utils import clean_non_utf8
+
+##########
+
+logger = logging.getLogger(__name__)
+
+##########
+
+
+def classXPath(className: str) -> str:
+    """ XPath condition that matches elements by their class attribute the same way Beautiful Soup does:
+    a single class name matches any one of the element's classes, a space separated list of class names
+    has to match the whole attribute.
+
+    :param className: Class name, or list of class names separated by spaces
+    :return: XPath condition to use in a predicate, e.g. '//div[' + classXPath('artText') + ']'
+    """
+    if className.split() == [className]:
+        return 'contains(concat(" ", normalize-space(@class), " "), " ' + className + ' ")'
+    return 'normalize-space(@class) = "' + className + '"'
+
+
+def elementText(element) -> str:
+    """ Text of an lxml element and its descendants, leaving out the code of scripts and style sheets
+    the same way Beautiful Soup's get_text() does.
+
+    :param element: Element of the lxml tree of a page
+    :return: Text of the element
+    """
+    return ''.join(element.xpath('.//text()[not(ancestor::script or ancestor::style)]'))
+
+
+class ParsedDocument(str):
+    """ HTML document of a fetched page, parsed once and shared by all the extraction steps.
+    """
+
+    def __new__(cls, htmlContent: str, url: str = None, lxmlRoot=None):
+        """ Create the document as the text of the HTML content.
+        """
+        return super().__new__(cls, htmlContent or '')
+
+    def __init__(self, htmlContent: str, url: str = None, lxmlRoot=None):
+        """ Initialise the document with the page's HTML content, this is parsed only when first needed.
+
+        :param htmlContent: HTML content of the page
+        :param url: URL of the page
+        :param lxmlRoot: lxml tree of this HTML content, if it has already been parsed
+        """
+        self.htmlContent = htmlContent
+        self.url = url
+        self._lxmlRoot = lxmlRoot
+        self._soup = None
+        self.lock = threading.Lock()
+        # number of times each kind of tree was built by this object:
+        self.parseCount = {'lxml': 0, 'soup': 0}
+
+    def __reduce__(self):
+        """ Pickle only the HTML content, the parsed trees are not sent to other processes.
+        """
+        return str, (str(self),)
+
+    def setLxmlRoot(self, lxmlRoot):
+        """ Adopt the lxml tree already parsed from this document's HTML content, e.g. by the newspaper library.
+        """
+        if lxmlRoot is not None:
+            with self.lock:
+                if self._lxmlRoot is None:
+                    self._lxmlRoot = lxmlRoot
+
+    @property
+    def lxmlRoot(self):
+        """ Root element of the lxml tree of the page, None if it could not be parsed.
+        """
+        with self.lock:
+            if self._lxmlRoot is None and self.htmlContent:
+                self._lxmlRoot = newspaper_parsers.fromstring(self.htmlContent)
+                self.parseCount['lxml'] += 1
+            return self._lxmlRoot
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """ Beautiful Soup tree of the page.
+        """
+        with self.lock:
+            if self._soup is None:
+                self._soup = BeautifulSoup(markup=clean_non_utf8(self.htmlContent), features='lxml')
+                self.parseCount['soup'] += 1
+            return self._soup
+
+# # end of file ##
@@ -52,6 +52,7 @@ class mod_dataprep(BasePlugin):
     """
     minArticleLengthInChars = 400
     pluginType = PluginTypes.MODULE_DATA_PROCESSOR  # implies data post-processor
+    dependsOnPlugins = []
 
     listOfFiles = []
     uRLdata = dict()
@@ -72,8 +73,8 @@ class mod_dataprep(BasePlugin):
         self.sessionHistDB = sessionHistoryObj
 
     def processDataObj(self, newsEventObj: NewsEvent):
-        """ Process given data object by this plugin, read the contents from the file and
-        directly write back the transformed data back to the same file.
+        """ Process given data object by this plugin, the transformed data is saved by the
+        data processor after all plugins have processed the object.
 
         :param newsEventObj: The NewsEvent object to be processed.
         :type newsEventObj: NewsEvent
@@ -87,10 +88,6 @@ class mod_dataprep(BasePlugin):
             newsEventObj.setText(
                 self.cleanText(newsEventObj.getText())
                 )
-            # prepare filename:
-            fileNameWOExt = newsEventObj.getFileName().replace('.json', '')
-            # save document to file:
-            newsEventObj.writeFiles(fileNameWOExt, '', saveHTMLFile=False)
         except Exception as e:
             logger.error(f'Error processing data: {e}')
 
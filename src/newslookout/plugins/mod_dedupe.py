@@ -57,6 +57,9 @@ class mod_dedupe(BasePlugin):
     """
     minArticleLengthInChars = 400
     pluginType = PluginTypes.MODULE_DATA_PROCESSOR  # implies data post-processor
+    dependsOnPlugins = ['mod_dataprep']
+    # every article has to be compared with all the others, so this is not run by separate worker processes:
+    runInMainProcess = True
     sizeDiff = 0.0
     similarPct = 1.0
     listOfFiles = []
@@ -130,10 +133,16 @@ class mod_dedupe(BasePlugin):
                                                               file2,
                                                               compareThreshold=self.similarPct,
                                                               maxSizePercentDiff=self.sizeDiff)
-                        # check that first article's file exist, only then delete the second article:
-                        if resultTuple is not None and os.path.isfile(resultTuple[1].getFileName()):
-                            self.removeArticle(resultTuple[2])
+                        # check that first article's file exist, only then delete the second article.
+                        # This article is not saved yet if its saving was deferred until after the
+                        # data processing plugins, so it is kept or dropped while still in memory:
+                        if resultTuple is not None and (resultTuple[1] is document1 or
+                                                        os.path.isfile(resultTuple[1].getFileName())):
+                            self.removeArticle(resultTuple[2], inMemory=resultTuple[2] is document1)
                             deletedCount = deletedCount + 1
+                            if resultTuple[2] is document1:
+                                # no need to compare the removed article with the remaining files:
+                                break
                 except Exception as e:
                     logger.error(f"Error comparing files: {newsEventObj.getFileName()} vs. {file2}: {e}")
         if deletedCount > 0:
@@ -256,18 +265,28 @@ class mod_dedupe(BasePlugin):
             logger.error(f"Error trying to calculate similarity of URLs: {e}")
         return document
 
-    def removeArticle(self, articleObject):
-        """ Remove article identified as duplicate
+    def removeArticle(self, articleObject, inMemory: bool = False):
+        """ Remove article identified as duplicate.
+        The article is also marked as duplicate, so that it is not saved again after the data processing.
+
+        :param articleObject: The duplicate article
+        :param inMemory: Whether the article is held in memory and has not been saved yet
         """
         try:
             logger.debug("Removing files for module: %s, Article ID = %s",
                          articleObject.getModuleName(),
                          articleObject.getArticleID())
-            if os.path.isfile(articleObject.getFileName()):
+            articleObject.markAsDuplicate()
+            fileExists = os.path.isfile(articleObject.getFileName())
+            if fileExists:
                 # delete it:
                 logger.info("Deleting duplicate article's json file: %s, for URL: %s",
                             articleObject.getFileName(), articleObject.getURL())
                 os.remove(articleObject.fileName)
+            elif inMemory:
+                logger.info("Dropping duplicate article before it is saved: %s, for URL: %s",
+                            articleObject.getFileName(), articleObject.getURL())
+            if fileExists or inMemory:
                 self.sessionHistDB.addDupURLToDeleteTbl(articleObject.getURL(),
                                                         articleObject.getModuleName(),
                                                         articleObject.getPublishDate(),
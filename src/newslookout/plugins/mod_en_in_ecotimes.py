@@ -44,13 +44,10 @@
 # import standard python libraries:
 import logging
 from datetime import datetime
-# import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
-# import lxml
-# import cchardet
 
 # import this project's python libraries:
 from newslookout.base_plugin import BasePlugin
+from newslookout.parsed_document import classXPath, elementText
 from newslookout.scraper_utils import getNetworkLocFromURL, filterRepeatedchars, deDupeList
 from newslookout.data_structs import PluginTypes
 
@@ -583,8 +580,6 @@ class mod_en_in_ecotimes(BasePlugin):
             # use the smallest sub-domain:
             if not ('economictimes' == netwLocation[0]):
                 industries.append(netwLocation[0])
-            # else:
-            #    docRoot = BeautifulSoup(htmlText, 'lxml')
             # TODO: parse html and try to identify the industry
         except Exception as e:
             logger.error("Error identifying industries for URL %s: %s",
@@ -619,43 +614,40 @@ class mod_en_in_ecotimes(BasePlugin):
         authors = []
         logger.debug("Re-attempting identifying authors for URL: %s", self.URLToFetch)
         try:
-            docRoot = BeautifulSoup(htmlText, 'lxml')
-            body_root = docRoot.find("span", "ag")
-            if body_root is not None:
-                if len(body_root.getText()) < 1:
-                    if body_root.find("img") is None:
-                        authors = []
-                    else:
-                        authors = [body_root.img['alt']]
+            docRoot = self.getParsedDocument(htmlText).lxmlRoot
+            body_root = docRoot.xpath('//span[' + classXPath('ag') + ']')
+            if len(body_root) > 0:
+                if len(elementText(body_root[0])) < 1:
+                    authorImages = body_root[0].xpath('.//img')
+                    if len(authorImages) > 0:
+                        authors = [authorImages[0].attrib['alt']]
                 else:
-                    authors = [body_root.getText()]
+                    authors = [elementText(body_root[0])]
         except Exception as e:
             logger.error("Error on re-attempting identifying authors from tags: %s, URL: %s",
                          e, self.URLToFetch)
         return (authors)
 
     def extractArticleBody(self, htmlContent):
-        """ Extract Article Text content using Beautiful Soup library
+        """ Extract Article Text content using the lxml tree of the page
         """
         body_text = ""
         try:
             # get article text data by parsing article-body tag:
-            docRoot = BeautifulSoup(htmlContent, 'lxml')
+            docRoot = self.getParsedDocument(htmlContent).lxmlRoot
             body_text = self.extractArticleBodyFormat1(docRoot)
             # Try this for paywall: <article data-apw = "1" class = "artData clr paywall">
-            if len(body_text) < 5 and len(docRoot.find_all("article", attrs={"class": "artData clr paywall"})) > 0:
+            if len(body_text) < 5 and len(docRoot.xpath('//article[' + classXPath('artData clr paywall') + ']')) > 0:
                 body_text = self.extractArticleBodyFormat2(docRoot)
             # Try this for blogs:
-            if len(body_text) < 5 and len(docRoot.find_all("div", attrs={"class": "blog-show"})) > 0:
+            if len(body_text) < 5 and len(docRoot.xpath('//div[' + classXPath('blog-show') + ']')) > 0:
                 body_text = self.extractArticleBodyFormat3(docRoot)
             # alternative format 4
-            if len(body_text) < 5 and len(docRoot.find_all("article", attrs={"class": "artData clr "})) > 0:
+            if len(body_text) < 5 and len(docRoot.xpath('//article[' + classXPath('artData clr ') + ']')) > 0:
                 body_text = self.extractArticleBodyFormat4(docRoot)
             # alternative format 5
             if len(body_text) < 5:
                 body_text = self.extractArticleBodyFormat5(docRoot)
-            # except Warning as w:
-            #    logger.warn("Warning when extracting text via BeautifulSoup: %s", w)
         except Exception as e:
             logger.error("Exception extracting article content via tags: %s", e)
         return (body_text)
@@ -666,18 +658,15 @@ class mod_en_in_ecotimes(BasePlugin):
         body_text = ""
         try:
             # get article text data by parsing article-body tag:
-            body_root = docRoot.find_all("div",
-                                         attrs={"itemprop": "mainContentOfPage",
-                                                "class": "article-body"}
-                                         )
+            body_root = docRoot.xpath('//div[@itemprop = "mainContentOfPage" and ' + classXPath('article-body') + ']')
             if len(body_root) > 0:
                 firstTag = body_root[0]
-                sub_section = firstTag.find_all("div", attrs={"class": "post-text artcle-txt article-type-news"})
+                sub_section = firstTag.xpath('.//div[' + classXPath('post-text artcle-txt article-type-news') + ']')
                 if len(sub_section) > 0:
-                    sub_sub_section = sub_section[0].find_all("div", attrs={"class": "Normal"})
+                    sub_sub_section = sub_section[0].xpath('.//div[' + classXPath('Normal') + ']')
 
                     if len(sub_sub_section) > 0:
-                        body_text = sub_sub_section[0].getText()
+                        body_text = elementText(sub_sub_section[0])
                         logger.debug("Successfully extracted article content in format 1")
 
         except Exception as e:
@@ -690,14 +679,14 @@ class mod_en_in_ecotimes(BasePlugin):
         body_text = ""
         try:
             # only get contents if its a blog type of article:
-            body_root = docRoot.find_all("article", attrs={"class": "artData clr paywall"})
+            body_root = docRoot.xpath('//article[' + classXPath('artData clr paywall') + ']')
             if len(body_root) > 0:
                 firstTag = body_root[0]
                 # <div data-brcount = "43" class = "artText medium">
-                sub_section = firstTag.find_all("div", attrs={"class": "artText"})
+                sub_section = firstTag.xpath('.//div[' + classXPath('artText') + ']')
 
                 if len(sub_section) > 0:
-                    body_text = sub_section[0].getText()
+                    body_text = elementText(sub_section[0])
                     logger.debug("Successfully extracted article content in format 2")
 
         except Exception as e:
@@ -711,13 +700,12 @@ class mod_en_in_ecotimes(BasePlugin):
         body_text = ""
         try:
             # only get contents if its a blog type of article:
-            body_root = docRoot.find_all("div", attrs={"class": "main-content"})
+            body_root = docRoot.xpath('//div[' + classXPath('main-content') + ']')
             if len(body_root) > 0:
                 firstTag = body_root[0]
                 # get only <p> contents
-                for paragraph in firstTag.children:
-                    if paragraph.name == 'p':
-                        body_text = body_text + paragraph.getText()
+                for paragraph in firstTag.xpath('./p'):
+                    body_text = body_text + elementText(paragraph)
 
                 logger.debug("Successfully extracted article content in format 3")
 
@@ -732,11 +720,11 @@ class mod_en_in_ecotimes(BasePlugin):
         body_text = ""
         try:
             # only get contents if its a blog type of article:
-            body_root = docRoot.find_all("article", attrs={"class": "artData clr "})
+            body_root = docRoot.xpath('//article[' + classXPath('artData clr ') + ']')
 
             if len(body_root) > 0:
                 firstTag = body_root[0]
-                body_text = firstTag.getText()
+                body_text = elementText(firstTag)
                 logger.debug("Successfully extracted article content in format 4")
 
         except Exception as e:
@@ -750,11 +738,11 @@ class mod_en_in_ecotimes(BasePlugin):
         body_text = ""
         try:
             # only get contents if its a blog type of article:
-            body_root = docRoot.find_all("div", attrs={"class": "artText"})
+            body_root = docRoot.xpath('//div[' + classXPath('artText') + ']')
 
             if len(body_root) > 0:
                 firstTag = body_root[0]
-                body_text = firstTag.getText()
+                body_text = elementText(firstTag)
                 logger.debug("Successfully extracted article content in format 5")
 
         except Exception as e:
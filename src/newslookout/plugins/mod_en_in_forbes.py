@@ -30,14 +30,12 @@
 
 # import standard python libraries:
 import logging
-# import re
-
-# import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
 
+# import this project's python libraries:
 from newslookout.data_structs import PluginTypes
 from newslookout.scraper_utils import cutStrBetweenTags, filterRepeatedchars, deDupeList
 from newslookout.base_plugin import BasePlugin
+from newslookout.parsed_document import classXPath, elementText
 
 # #########
 
@@ -140,8 +138,7 @@ class mod_en_in_forbes(BasePlugin):
         industries = []
         try:
             logger.debug("Extracting industries identified by the article.")
-            docRoot = BeautifulSoup(htmlText, 'lxml')
-            docRoot.find("span", "ag")
+            # TODO: parse html and try to identify the industry
         except Exception as e:
             logger.error("Error identifying the industries for URL %s: %s", uRLtoFetch, e)
         return (industries)
@@ -162,15 +159,15 @@ class mod_en_in_forbes(BasePlugin):
         return (authors)
 
     def extractArticleBody(self, htmlContent):
-        """ Extract article's text using the Beautiful Soup library """
+        """ Extract article's text using the lxml tree of the page """
         articleText = ""
         try:
             # get article text data by parsing specific tags:
-            article_html = BeautifulSoup(htmlContent, 'lxml')
+            article_html = self.getParsedDocument(htmlContent).lxmlRoot
             # <div id = "storyContent" class = "articlestorycontent">
-            body_root = article_html.find_all("div", "articlestorycontent")
+            body_root = article_html.xpath('//div[' + classXPath('articlestorycontent') + ']')
             if len(body_root) > 0:
-                articleText = body_root[0].getText()
+                articleText = elementText(body_root[0])
         except Exception as e:
             logger.error("Exception extracting article via tags: %s", e)
         return (articleText)
@@ -34,7 +34,7 @@ import logging
 import re
 
 # import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
+# from bs4 import BeautifulSoup
 
 from newslookout.data_structs import PluginTypes
 from newslookout.base_plugin import BasePlugin
@@ -178,7 +178,7 @@ class mod_en_in_hindu(BasePlugin):
         articleText = ""
         try:
             # get article text data by parsing specific tags:
-            docRoot = BeautifulSoup(htmlContent, 'lxml')
+            docRoot = self.getParsedDocument(htmlContent).soup
             matchParas = docRoot.find_all('p', {"class": 'body'})
             for para in matchParas:
                 articleText = articleText + para.get_text()
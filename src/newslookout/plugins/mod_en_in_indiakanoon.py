@@ -34,7 +34,7 @@ import logging
 import re
 
 # import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
+# from bs4 import BeautifulSoup
 import bs4
 
 from newslookout.base_plugin import BasePlugin
@@ -217,7 +217,7 @@ class mod_en_in_indiakanoon(BasePlugin):
         body_text = ""
         htmlContent = htmlContent.decode('UTF-8') if type(htmlContent) == bytes else htmlContent
         try:
-            result_tag = BeautifulSoup(htmlContent, 'lxml').find_all("div", attrs={"class": "docsource_main"})
+            result_tag = self.getParsedDocument(htmlContent).soup.find_all("div", attrs={"class": "docsource_main"})
             if result_tag is not None and len(result_tag) > 0:
                 allText = self.get_child_tags(result_tag[0])
             for item in allText:
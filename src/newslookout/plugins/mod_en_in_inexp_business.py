@@ -31,7 +31,7 @@
 import logging
 
 # import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
+# from bs4 import BeautifulSoup
 
 # import this project's python libraries:
 from newslookout.base_plugin import BasePlugin
@@ -156,7 +156,7 @@ class mod_en_in_inexp_business(BasePlugin):
         articleText = ""
         try:
             # get article text data by parsing specific tags:
-            article_html = BeautifulSoup(htmlContent, 'lxml')
+            article_html = self.getParsedDocument(htmlContent).soup
             # <div id = "storyContent" class = "articlestorycontent">
             body_root = article_html.find_all("div", "articlestorycontent")
             if len(body_root) > 0:
@@ -33,7 +33,7 @@ import logging
 import re
 
 # import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
+# from bs4 import BeautifulSoup
 
 from newslookout.base_plugin import BasePlugin
 from newslookout.data_structs import PluginTypes
@@ -421,7 +421,7 @@ class mod_en_in_moneycontrol(BasePlugin):
             # get article text data by parsing specific tags:
             try:
                 logger.debug("Parsing article content to extract body text.")
-                docRoot = BeautifulSoup(htmlContent, 'lxml')
+                docRoot = self.getParsedDocument(htmlContent).soup
                 articleTags = docRoot.find_all('div', attrs={'class': 'text_block'})
                 for tag in articleTags:
                     tempArray = tempArray + (tag.find_all('p', text=True))
@@ -38,6 +38,7 @@ import warnings
 
 # import this project's python libraries:
 from newslookout.base_plugin import BasePlugin
+from newslookout.parsed_document import classXPath, elementText
 from newslookout.scraper_utils import retainValidArticles, deDupeList, filterRepeatedchars
 from newslookout.data_structs import PluginTypes
 
@@ -239,10 +240,15 @@ class mod_en_in_ndtv(BasePlugin):
         # <item>
         # <link><![CDATA[https://www.ndtv.com/business/sbi-readies-mutual-fund-venture-for-ipo-2379481]]></link>
         for thisFeedURL in all_rss_feeds:
+            if self.isDiscoveryCancelled():
+                break
             try:
-                rawData, http_error = self.networkHelper.fetchRawDataFromURL(thisFeedURL, self.pluginName)
+                rawData, http_error = self.networkHelper.fetchRawDataFromURL(
+                    thisFeedURL, self.pluginName, shutdown_event=self.getDiscoveryCancelToken(), useCache=True)
                 if http_error:
                     return listOfURLS
+                if rawData is None:
+                    continue
                 rss_feed_xml = BeautifulSoup(rawData, 'lxml-xml')
                 for item in rss_feed_xml.channel:
                     if item.name == "item":
@@ -257,43 +263,44 @@ class mod_en_in_ndtv(BasePlugin):
         return listOfURLS
 
     def extractArticleBody(self, htmlContent):
-        """ Extract article's text using the Beautiful Soup library
+        """ Extract article's text using the lxml tree of the page
         """
         body_text = ""
         try:
             # get article text data by parsing specific tags:
-            docRoot = BeautifulSoup(htmlContent, 'lxml')
-            section = docRoot.find_all(class_=['ins_storybody',
-                                               'content_text row description',
-                                               'fullstoryCtrl_fulldetails'])
+            docRoot = self.getParsedDocument(htmlContent).lxmlRoot
+            section = docRoot.xpath('//*[' + ' or '.join([classXPath('ins_storybody'),
+                                                          classXPath('content_text row description'),
+                                                          classXPath('fullstoryCtrl_fulldetails')]) + ']')
             paragraphList = []
             for node in section:
-                paragraphList = paragraphList + node.find_all('p', text=True)
+                # only the paragraphs that have a single text or tag in them:
+                paragraphList = paragraphList + node.xpath('.//p[count(node()) = 1]')
             for item in paragraphList:
-                body_text = body_text + str(item.get_text())
-            section = docRoot.find_all('span', {"itemprop": 'articleBody'})
+                body_text = body_text + elementText(item)
+            section = docRoot.xpath('//span[@itemprop = "articleBody"]')
             if len(section) > 0:
                 for item in section:
-                    body_text = body_text + str(item.get_text())
-            section = docRoot.find_all('div', {"itemprop": 'articleBody'})
+                    body_text = body_text + elementText(item)
+            section = docRoot.xpath('//div[@itemprop = "articleBody"]')
             if len(section) > 0:
                 for item in section:
-                    body_text = body_text + str(item.get_text())
+                    body_text = body_text + elementText(item)
         except Exception as e:
             logger.error("Exception extracting article via tags: %s", e)
         return (body_text)
 
     def extractArticleTitle(self, htmlContent):
-        """ Extract article's text using the Beautiful Soup library
+        """ Extract article's title using the lxml tree of the page
         """
         title_text = ""
         try:
             # get article text data by parsing specific tags:
-            docRoot = BeautifulSoup(htmlContent, 'lxml')
-            section = docRoot.find_all('h1', {"itemprop": 'headline'})
+            docRoot = self.getParsedDocument(htmlContent).lxmlRoot
+            section = docRoot.xpath('//h1[@itemprop = "headline"]')
             if len(section) > 0:
                 for item in section:
-                    title_text = title_text + str(item.get_text())
+                    title_text = title_text + elementText(item)
         except Exception as e:
             logger.error("Exception extracting article via tags: %s", e)
         return (title_text)
@@ -32,7 +32,7 @@
 import logging
 import re
 # import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
+# from bs4 import BeautifulSoup
 
 from newslookout.data_structs import PluginTypes, ScrapeError
 from newslookout.scraper_utils import calculateCRC32, deDupeList, filterRepeatedchars
@@ -224,7 +224,7 @@ class mod_en_in_timesofindia(BasePlugin):
         body_text = ""
         try:
             logger.debug("Extracting article content.")
-            docRoot = BeautifulSoup(html_content, 'lxml')
+            docRoot = self.getParsedDocument(html_content).soup
             if len(docRoot.find_all("div", attrs={"class": "main-content single-article-content"})) > 0:
                 body_root = docRoot.find_all("div", attrs={"class": "main-content single-article-content"})
                 paragraphs = body_root[0].find_all("p")
@@ -241,7 +241,7 @@ class mod_en_in_timesofindia(BasePlugin):
         industries = []
         try:
             logger.debug("Extracting industries identified by the article.")
-            docRoot = BeautifulSoup(htmlText, 'lxml')
+            docRoot = self.getParsedDocument(htmlText).soup
             docRoot.find_all('div')
         except Exception as e:
             logger.error("Error extracting industries: %s", e)
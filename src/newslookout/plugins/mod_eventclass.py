@@ -68,6 +68,7 @@ class mod_eventclass(BasePlugin):
     """
     minArticleLengthInChars = 400
     pluginType = PluginTypes.MODULE_DATA_PROCESSOR  # implies data post-processor
+    dependsOnPlugins = ['mod_dataprep']
 
     dataFrame = None
     device = None
@@ -138,11 +139,8 @@ class mod_eventclass(BasePlugin):
             classificationObj = self.classifyText(newsEventObj.getText(), newsEventObj.getURL())
             # put classification field in NewsEvent document:
             newsEventObj.setClassification(classificationObj)
-            # prepare filename:
-            fileNameWOExt = newsEventObj.getFileName().replace('.json', '')
-            # save document to file:
-            newsEventObj.writeFiles(fileNameWOExt, '', saveHTMLFile=False)
-            logger.info(f"Completed classifying news event in: {fileNameWOExt} as: {classificationObj}")
+            # the document is saved by the data processor after all plugins have processed it
+            logger.info(f"Completed classifying news event in: {newsEventObj.getFileName()} as: {classificationObj}")
 
     def classifyText(self, textValue, url):
         """
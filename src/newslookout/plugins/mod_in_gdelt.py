@@ -131,9 +131,18 @@ class mod_in_gdelt(BasePlugin):
             searchResultsURLForDate, dataDirForDate = self.prepare_url_datadir_for_date(runDate)
             if searchResultsURLForDate is not None:
                 logger.debug('Downloading file from URL: %s', searchResultsURLForDate)
-                csv_zip = self.downloadDataArchive(searchResultsURLForDate, self.pluginName)
-                csv_files = mod_in_gdelt.extract_csvlist_from_archive(csv_zip, dataDirForDate)
+                csv_zip = self.downloadDataArchive(searchResultsURLForDate, self.pluginName,
+                                                   shutdown_event=self.getDiscoveryCancelToken())
+                if self.isDiscoveryCancelled():
+                    logger.info("%s: URL discovery cancelled while downloading %s",
+                                self.pluginName, searchResultsURLForDate)
+                    csv_zip = None
+                csv_files = mod_in_gdelt.extract_csvlist_from_archive(csv_zip, dataDirForDate) if csv_zip else []
                 for csv_filename in csv_files:
+                    if self.isDiscoveryCancelled():
+                        # return the URLs found so far, removing the files not searched:
+                        os.remove(csv_filename)
+                        continue
                     logger.debug("Expanded the fetched Zip archive to: %s", csv_filename)
                     url_items = mod_in_gdelt.extract_urls_from_csv(csv_filename, country_code='IN')
                     urlList = urlList + url_items
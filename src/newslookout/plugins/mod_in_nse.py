@@ -159,8 +159,8 @@ class mod_in_nse(BasePlugin):
             logging.captureWarnings(True)
             (publishDate, dataUniqueID) = self.extractUniqueIDFromURL(uRLtoFetch)
 
-            # Get shutdown event if available
-            shutdown_event = getattr(self, 'shutdown_event', None)
+            # cancels the download, this is the shutdown event outside of URL discovery:
+            shutdown_event = self.getDiscoveryCancelToken()
 
             # fetchRawDataFromURL to download Data Archive returns tuple
             fetch_result = self.networkHelper.fetchRawDataFromURL(
@@ -319,9 +319,17 @@ class mod_in_nse(BasePlugin):
         """ fetch Master Data"""
         if self.masterDataExtractedFlag is False:
             for masterFileName in self.masterData:
+                if self.isDiscoveryCancelled():
+                    break
                 try:
-                    masterRawData = self.networkHelper.fetchRawDataFromURL(self.masterData[masterFileName],
-                                                                           type(self).__name__)
+                    masterRawData, http_error = self.networkHelper.fetchRawDataFromURL(
+                        self.masterData[masterFileName],
+                        type(self).__name__,
+                        getBytes=True,
+                        shutdown_event=self.getDiscoveryCancelToken())
+                    if masterRawData is None:
+                        logger.error("Could not fetch master data file %s: %s", masterFileName, http_error)
+                        continue
                     sizeOfDataDownloaded = sizeOfDataDownloaded + len(masterRawData)
                     fullMasterPathName = os.path.join(dirPathName, masterFileName)
                     with open(fullMasterPathName, 'wb') as fp:
@@ -51,6 +51,7 @@ class mod_json_to_csv(BasePlugin):
 
     # implies web-scraper for news content, see data_structs.py for other types
     pluginType = PluginTypes.MODULE_DATA_PROCESSOR
+    dependsOnPlugins = ['mod_dataprep', 'mod_dedupe', 'mod_keywordflags', 'mod_eventclass']
 
     # main webpage URL
     mainURL = ""
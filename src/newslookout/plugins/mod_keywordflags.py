@@ -52,6 +52,7 @@ class mod_keywordflags(BasePlugin):
     """
     minArticleLengthInChars = 400
     pluginType = PluginTypes.MODULE_DATA_PROCESSOR  # implies data post-processor
+    dependsOnPlugins = ['mod_dataprep']
     listOfFiles = []
 
     keyword_flag_regex = {
@@ -116,10 +117,7 @@ class mod_keywordflags(BasePlugin):
         logger.debug("Started keyword based flag derivation for news event: %s for date: %s",
                      newsEventObj.getFileName(), runDate.strftime('%Y-%m-%d'))
         self.identifyTriggerWordFlags(newsEventObj)
-        # prepare filename:
-        fileNameWOExt = newsEventObj.getFileName().replace('.json', '')
-        # save document to file:
-        newsEventObj.writeFiles(fileNameWOExt, '', saveHTMLFile=False)
+        # the document is saved by the data processor after all plugins have processed it
 
     def identifyTriggerWordFlags(self, documentObj):
         """ Identify Trigger Word Flags, read from config file """
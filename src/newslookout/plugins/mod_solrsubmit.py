@@ -52,6 +52,7 @@ class mod_solrsubmit(BasePlugin):
     """
     minArticleLengthInChars = 400
     pluginType = PluginTypes.MODULE_DATA_PROCESSOR  # implies data post-processor
+    dependsOnPlugins = ['mod_dataprep', 'mod_dedupe', 'mod_keywordflags', 'mod_eventclass']
 
     listOfFiles = []
     uRLdata = dict()
@@ -32,7 +32,7 @@
 import logging
 
 # import web retrieval and text processing python libraries:
-from bs4 import BeautifulSoup
+# from bs4 import BeautifulSoup
 
 from newslookout.data_structs import PluginTypes
 from newslookout.base_plugin import BasePlugin
@@ -128,7 +128,7 @@ class myplugin(BasePlugin):
         industries = []
         try:
             logger.debug("Extracting industries identified by the article.")
-            docRoot = BeautifulSoup(htmlText, 'lxml')
+            docRoot = self.getParsedDocument(htmlText).soup
             docRoot.find("span", "ag")
         except Exception as e:
             logger.error("Error extracting industries: %s", e)
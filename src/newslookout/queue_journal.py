@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: queue_journal.py                                                                             #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: Durable journal of the work queues, replayed after the application stopped abruptly            #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+"""
+ Provides:
+    QueueJournal: Append-only journal on disk that backs the in-memory work queues.
+    resultToJournalItem: Convert a fetch result, with its article, into a journal item.
+    resultFromJournalItem: Re-create the fetch result from its journal item.
+
+ Each line of the journal is a JSON record, either putting an item into a queue or acknowledging
+ that the item was completely processed. The items put but not acknowledged when the application
+ stopped are replayed into the queues at the next start:
+    urls/<plugin name> - URLs queued for a plugin to fetch, acknowledged once fetched
+    dataproc           - fetched articles queued for the data processing plugins, acknowledged once processed
+
+ The journal is flushed after every record so it survives the process being killed, and synced to disk
+ at the configured interval. It is compacted down to its pending items when it is opened, and while running
+ once the records of completed items outnumber those of the pending items.
+"""
+
+# import standard python libraries:
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from newslookout.data_structs import ExecutionResult
+from newslookout.news_event import NewsEvent
+
+##########
+
+logger = logging.getLogger(__name__)
+
+##########
+
+
+class QueueJournal:
+    """ Append-only journal on disk that backs the in-memory work queues.
+    """
+    DATAPROC_QUEUE = 'dataproc'
+
+    def __init__(self, journalFile: str, syncIntervalSec: float = 1.0, compactMinRecords: int = 10000):
+        """ Initialise the journal.
+
+        :param journalFile: Name of the journal file
+        :param syncIntervalSec: Maximum interval between syncing the journal file to disk
+        :param compactMinRecords: Minimum number of records of completed items in the journal file,
+         before it is compacted while running
+        """
+        self.journalFile = journalFile
+        self.syncIntervalSec = syncIntervalSec
+        self.lock = threading.Lock()
+        self.fileHandle = None
+        self.lastSyncTime = time.time()
+        # keys of the items put but not yet acknowledged, for each queue:
+        self.pendingKeys = dict()
+        self.appendCount = 0
+        self.ackCount = 0
+        self.replayedCount = 0
+        self.compactMinRecords = compactMinRecords
+        # number of records in the journal file, and the number of times it was compacted while running:
+        self.recordCount = 0
+        self.compactionCount = 0
+
+    @staticmethod
+    def urlQueueName(pluginName: str) -> str:
+        """ Name of the journalled queue of URLs of the given plugin.
+        """
+        return f'urls/{pluginName}'
+
+    def readPendingItems(self) -> dict:
+        """ Read the journal file and identify the items that were put but not acknowledged.
+
+        :return: Dictionary of queue names mapped to dictionaries of the pending items' keys and values,
+         in the order they were put.
+        """
+        pendingItems = dict()
+        if not os.path.isfile(self.journalFile):
+            return pendingItems
+        with open(self.journalFile, 'rt', encoding='utf-8') as fp:
+            for lineNo, line in enumerate(fp, start=1):
+                try:
+                    record = json.loads(line)
+                    queueItems = pendingItems.setdefault(record['queue'], dict())
+                    if record['op'] == 'put':
+                        queueItems[record['key']] = record.get('item')
+                    elif record['op'] == 'ack':
+                        queueItems.pop(record['key'], None)
+                except Exception as e:
+                    # the last record may be incomplete if the application was killed while writing it
+                    logger.warning(f"Ignoring invalid record at line {lineNo} of queue journal {self.journalFile}: {e}")
+        return {queueName: items for queueName, items in pendingItems.items() if len(items) > 0}
+
+    def open(self) -> dict:
+        """ Replay the journal left by the previous run, compact it down to its pending items,
+        and open it for appending new records.
+
+        :return: Dictionary of queue names mapped to the lists of pending items to be replayed,
+         the key is replayed for the items put without a value.
+        """
+        pendingItems = self.readPendingItems()
+        journalDir = os.path.dirname(self.journalFile)
+        if journalDir:
+            os.makedirs(journalDir, exist_ok=True)
+        self.writePendingItems(pendingItems)
+        with self.lock:
+            self.pendingKeys = {queueName: set(items.keys()) for queueName, items in pendingItems.items()}
+            self.fileHandle = open(self.journalFile, 'at', encoding='utf-8')
+            self.replayedCount = sum(len(items) for items in pendingItems.values())
+            self.recordCount = self.replayedCount
+        if self.replayedCount > 0:
+            logger.info(f"Replaying {self.replayedCount} unfinished items from queue journal {self.journalFile}")
+        return {queueName: [item if item is not None else key for key, item in items.items()]
+                for queueName, items in pendingItems.items()}
+
+    def writePendingItems(self, pendingItems: dict):
+        """ Replace the journal file with one that only puts the pending items.
+        """
+        tempFile = self.journalFile + '.tmp'
+        with open(tempFile, 'wt', encoding='utf-8') as fp:
+            for queueName, items in pendingItems.items():
+                for key, item in items.items():
+                    fp.write(json.dumps({'op': 'put', 'queue': queueName, 'key': key, 'item': item}) + '\n')
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tempFile, self.journalFile)
+
+    def compactIfNeeded(self):
+        """ Compact the journal file down to its pending items, once the records of the completed items
+        are at least compactMinRecords, and outnumber the pending items. So the file does not keep growing
+        while the application runs for a long time, and the cost of compacting it is spread over the records.
+        This must be called with the lock acquired.
+        """
+        pendingCount = sum(len(keys) for keys in self.pendingKeys.values())
+        completedCount = self.recordCount - pendingCount
+        if self.fileHandle is None or completedCount < max(self.compactMinRecords, pendingCount):
+            return
+        self.fileHandle.close()
+        self.fileHandle = None
+        try:
+            pendingItems = self.readPendingItems()
+            self.writePendingItems(pendingItems)
+            self.recordCount = sum(len(items) for items in pendingItems.values())
+            self.compactionCount += 1
+            logger.debug(f"Compacted queue journal {self.journalFile} to {self.recordCount} pending items")
+        except Exception as e:
+            logger.error(f"Error compacting queue journal {self.journalFile}: {e}")
+        self.fileHandle = open(self.journalFile, 'at', encoding='utf-8')
+
+    def writeRecord(self, record: dict):
+        """ Append the record to the journal file, syncing it to disk if the sync interval has elapsed.
+        This must be called with the lock acquired.
+        """
+        self.fileHandle.write(json.dumps(record) + '\n')
+        self.fileHandle.flush()
+        self.recordCount += 1
+        if time.time() - self.lastSyncTime >= self.syncIntervalSec:
+            os.fsync(self.fileHandle.fileno())
+            self.lastSyncTime = time.time()
+
+    def append(self, queueName: str, key: str, item=None) -> bool:
+        """ Record an item put into the queue.
+
+        :param queueName: Name of the queue
+        :param key: Unique key of the item in its queue, used to acknowledge it
+        :param item: JSON serialisable value of the item, used to replay it
+        :return: False if the item is already pending in the journal, True otherwise
+        """
+        with self.lock:
+            queueKeys = self.pendingKeys.setdefault(queueName, set())
+            if key in queueKeys:
+                return False
+            if self.fileHandle is not None:
+                self.writeRecord({'op': 'put', 'queue': queueName, 'key': key, 'item': item})
+            queueKeys.add(key)
+            self.appendCount += 1
+        return True
+
+    def ack(self, queueName: str, key: str):
+        """ Acknowledge that the item has been completely processed, it is not replayed after this.
+        """
+        with self.lock:
+            queueKeys = self.pendingKeys.get(queueName)
+            if queueKeys is None or key not in queueKeys:
+                return
+            if self.fileHandle is not None:
+                self.writeRecord({'op': 'ack', 'queue': queueName, 'key': key})
+            queueKeys.discard(key)
+            self.ackCount += 1
+            self.compactIfNeeded()
+
+    def isPending(self, queueName: str, key: str) -> bool:
+        with self.lock:
+            return key in self.pendingKeys.get(queueName, set())
+
+    def getPendingCount(self, queueName: str = None) -> int:
+        with self.lock:
+            if queueName is not None:
+                return len(self.pendingKeys.get(queueName, set()))
+            return sum(len(keys) for keys in self.pendingKeys.values())
+
+    def close(self):
+        """ Sync and close the journal file, it is emptied if no items are pending.
+        """
+        with self.lock:
+            if self.fileHandle is None:
+                return
+            if sum(len(keys) for keys in self.pendingKeys.values()) == 0:
+                self.fileHandle.truncate(0)
+            self.fileHandle.flush()
+            os.fsync(self.fileHandle.fileno())
+            self.fileHandle.close()
+            self.fileHandle = None
+
+    def getStatus(self) -> dict:
+        return {
+            'journal_file': self.journalFile,
+            'pending': self.getPendingCount(),
+            'appended': self.appendCount,
+            'acknowledged': self.ackCount,
+            'replayed': self.replayedCount,
+            'compactions': self.compactionCount
+        }
+
+
+def resultToJournalItem(fetchResult: ExecutionResult) -> dict:
+    """ Convert a fetch result into a JSON serialisable journal item,
+    including the article and raw HTML carried in memory, if their saving was deferred.
+    Articles already saved on disk are replayed from their file instead.
+    """
+    publishDate = fetchResult.publishDate
+    if hasattr(publishDate, 'isoformat'):
+        publishDate = publishDate.isoformat()
+    item = {
+        'url': fetchResult.URL,
+        'plugin': fetchResult.pluginName,
+        'file': fetchResult.savedDataFileName,
+        'publish_date': publishDate,
+        'raw_size': fetchResult.rawDataSize,
+        'text_size': fetchResult.textSize,
+        'article_id': fetchResult.articleID
+    }
+    isSaved = fetchResult.savedDataFileName is not None and os.path.isfile(fetchResult.savedDataFileName + '.json')
+    if fetchResult.article is not None and fetchResult.rawHTML is not None and not isSaved:
+        item['article'] = fetchResult.article.urlData
+        item['file_name'] = fetchResult.article.getFileName()
+        item['html'] = NewsEvent.getBase64FromHTML(fetchResult.rawHTML)
+    return item
+
+
+def resultFromJournalItem(item: dict) -> ExecutionResult:
+    """ Re-create the fetch result from its journal item.
+    """
+    publishDate = item.get('publish_date')
+    if isinstance(publishDate, str):
+        try:
+            publishDate = datetime.fromisoformat(publishDate)
+        except ValueError:
+            pass
+    fetchResult = ExecutionResult(item['url'],
+                                  item.get('raw_size', 0),
+                                  item.get('text_size', 0),
+                                  publishDate,
+                                  item.get('plugin'),
+                                  dataFileName=item.get('file'),
+                                  success=True,
+                                  articleID=item.get('article_id'))
+    if item.get('article') is not None:
+        article = NewsEvent()
+        article.urlData = item['article']
+        article.setFileName(item.get('file_name'))
+        fetchResult.article = article
+        fetchResult.rawHTML = NewsEvent.getHTMLFromBase64(item.get('html', '')).encode('utf-8')
+    return fetchResult
+
+# # end of file ##
@@ -48,10 +48,16 @@ import signal
 import sys
 import traceback
 
-from newslookout.data_structs import PluginTypes, QueueStatus
+from newslookout.data_structs import PluginTypes, QueueStatus, StageBackpressure, ProgressCounters, CountedQueue
+from newslookout.data_structs import StageQueue
 from newslookout.session_hist import SessionHistory
-from newslookout.worker import WorkerPair, DataProcessor, StatusAPIServer
+from newslookout.worker import WorkerPair, DataProcessor, StatusAPIServer, FetchScheduler, DataProcessPool, ParseStage
+from newslookout.worker import DataProcPipeline, DataProcAutoscaler
+from newslookout.distributed import LeaseQueue, LeaseCoordinator, DistributedFetchWorker, getDefaultWorkerID
 from newslookout.config import ConfigManager
+from newslookout.network import NetworkFetcher, PageCache, DomainRateLimiter
+from newslookout.cassette import NetworkCassette
+from newslookout.queue_journal import QueueJournal, resultToJournalItem, resultFromJournalItem
 from newslookout import scraper_utils
 
 logger = logging.getLogger(__name__)
@@ -74,7 +80,6 @@ class QueueManager:
         self.runDate = datetime.now()
         self.available_cores = 1
         self.fetchCycleTime = 120
-        self.fetchCompletedCount = 0
         self.totalPluginsURLSrcCount = 0
         self.q_status = None
         self.status_api = None
@@ -89,9 +94,17 @@ class QueueManager:
         # Coordinated worker pairs
         self.worker_pairs = dict()  # plugin_name -> WorkerPair
 
+        # Global fetch scheduler, used instead of per-plugin content workers if configured
+        self.fetchScheduler = None
+
+        # Parse stage, separate from the content fetch workers if configured
+        self.parseStage = None
+
         # Data processing workers
         self.dataProcessWorkerList = []
         self.dataproc_threads = 5
+        self.dataProcessPool = None
+        self.dataProcAutoscaler = None
 
         # Progress monitoring
         self.progress_monitor = None
@@ -100,12 +113,39 @@ class QueueManager:
         self.dbAccessSemaphore = None
         self.sessionHistoryDB = None
         self.shutdown_event = threading.Event()
-
-        # Queues
-        self.fetchCompletedQueue = queue.Queue()
-        self.dataProcQueue = queue.Queue()
-        self.dataProcCompletedQueue = queue.Queue()
+        # set once the application is stopping, while shutdown_event ends each scrape cycle in daemon mode
+        self.stop_requested = threading.Event()
+
+        # Daemon mode: schedule of the scrape cycles, and the plugins scraped by the current cycle
+        self.daemonScheduler = None
+        self.cyclePluginNames = None
+        # progress of each date, when a range of dates is backfilled in one run
+        self.backfill = None
+
+        # Queues, with their depths and the items fetched and processed kept in the progress counters
+        self.progressCounters = ProgressCounters()
+        self.fetchCompletedQueue = None
+        self.dataProcQueue = None
+        self.dataProcCompletedQueue = None
         self.alreadyDataProcList = []
+        # fetch results whose article is not saved until its data processing completes, by URL
+        self.deferredArticles = dict()
+        self.deferredArticlesLock = threading.Lock()
+        # Backpressure on the queues between the stages, created again with their high-water marks in config()
+        self.fetchCompletedStage = None
+        self.dataProcStage = None
+        self.dataProcCompletedStage = None
+        self.initQueueLimits()
+        # Journal of the queues on disk, with the items left unfinished by the previous run
+        self.queueJournal = None
+        self.dataProcPipeline = None
+        # shared queue of URLs leased to the workers, when running distributed:
+        self.leaseQueue = None
+        self.distributedWorkers = []
+        self.replayedItems = dict()
+        # fetch results kept in the queue journal whose data processing did not complete by the end of a cycle,
+        # these are resumed by the next cycle in daemon mode:
+        self.unfinishedDataProcResults = []
 
         # Database operations queue
         self.dbCommandQueue = queue.Queue()
@@ -114,6 +154,9 @@ class QueueManager:
         # URL gathering timeout
         self.url_gathering_timeout = 600  # 10 minutes default
 
+        # Pages fetched during URL discovery, shared by all plugins for this run
+        self.pageCache = None
+
         self.q_status = QueueStatus(self)
 
     def config(self, app_config: ConfigManager):
@@ -155,6 +198,20 @@ class QueueManager:
             )
             logger.info(f"URL gathering timeout: {self.url_gathering_timeout}s")
 
+            self.initQueueLimits(self.app_config)
+            self.dataproc_threads = self.app_config.dataproc_threads
+
+            if self.app_config.queue_journal_file is not None:
+                self.queueJournal = QueueJournal(self.app_config.queue_journal_file,
+                                                 self.app_config.queue_journal_sync_interval_ms / 1000)
+                self.replayedItems = self.queueJournal.open()
+
+            if self.app_config.distributed_role != 'standalone':
+                self.leaseQueue = LeaseQueue(self.app_config.distributed_queue_file,
+                                             leaseTimeoutSec=self.app_config.lease_timeout_sec)
+                logger.info(f"Running as distributed {self.app_config.distributed_role}, "
+                            f"lease queue: {self.app_config.distributed_queue_file}")
+
         except Exception as e:
             logger.error(f"Error configuring queue manager: {e}")
 
@@ -169,6 +226,119 @@ class QueueManager:
         # Start database worker
         self._startDatabaseWorker()
 
+    def initQueueLimits(self, app_config: ConfigManager = None):
+        """
+        Create the queues between the stages, bounded at their configured high-water marks.
+        This is done before any items are queued, when the application is configured.
+
+        The fetch completed queue is drained by the progress monitor, so when it is full the fetch worker
+        writes the completed URLs to the database itself instead of waiting. The fetch workers wait while
+        the data processing queue is full, or shed the item to be saved without data processing if so
+        configured. The data processed queue only counts the items processed, so the items above its
+        high-water mark are always shed.
+
+        Args:
+            app_config: Application configuration, the queues are unbounded if not given
+        """
+        self.fetchCompletedQueue = CountedQueue(
+            self.progressCounters,
+            ProgressCounters.FETCH_COMPLETED_QUEUE,
+            maxsize=app_config.fetch_completed_queue_max_size if app_config else 0
+        )
+        self.dataProcQueue = CountedQueue(
+            self.progressCounters,
+            ProgressCounters.DATAPROC_QUEUE,
+            maxsize=app_config.dataproc_queue_max_size if app_config else 0
+        )
+        self.dataProcCompletedQueue = StageQueue(
+            maxsize=app_config.dataproc_completed_queue_max_size if app_config else 0
+        )
+        self.fetchCompletedStage = StageBackpressure(
+            'fetch_completed',
+            self.fetchCompletedQueue,
+            policy=StageBackpressure.POLICY_SHED,
+            shutdown_event=self.shutdown_event,
+            onShed=self._writeCompletedURLs
+        )
+        self.dataProcStage = StageBackpressure(
+            'data_processing_input',
+            self.dataProcQueue,
+            policy=app_config.dataproc_queue_full_policy if app_config else StageBackpressure.POLICY_BLOCK,
+            shutdown_event=self.shutdown_event,
+            onShed=self._saveArticleWithoutDataProc
+        )
+        self.dataProcCompletedStage = StageBackpressure(
+            'data_processing_output',
+            self.dataProcCompletedQueue,
+            policy=StageBackpressure.POLICY_SHED
+        )
+
+    def _replayURLQueue(self, plugin):
+        """Put the URLs left unfetched by the previous run back into the plugin's queue."""
+        queueName = QueueJournal.urlQueueName(plugin.pluginName)
+        urlList = self.replayedItems.pop(queueName, [])
+        if len(urlList) == 0:
+            return
+        unfetchedURLs = self.sessionHistoryDB.removeAlreadyFetchedURLs(urlList, plugin.pluginName)
+        for url in set(urlList) - set(unfetchedURLs):
+            self.queueJournal.ack(queueName, url)
+        for url in unfetchedURLs:
+            # put beyond the high-water mark, since the fetch workers have not started yet
+            plugin.urlQueueStage.forcePut(url)
+        plugin.urlQueueTotalSize += len(unfetchedURLs)
+        logger.info(f"{plugin.pluginName}: Resumed {len(unfetchedURLs)} URLs from the queue journal")
+
+    def _replayDataProcQueue(self):
+        """Put the articles left without data processing by the previous run, or the previous cycle in daemon mode,
+        back into the data processing queue."""
+        itemList = self.replayedItems.pop(QueueJournal.DATAPROC_QUEUE, [])
+        resultList = [resultFromJournalItem(item) for item in itemList] + self.unfinishedDataProcResults
+        self.unfinishedDataProcResults = []
+        for fetchResult in resultList:
+            if self.dataProcessWorkerList:
+                self.trackDeferredArticle(fetchResult)
+                self.dataProcStage.forcePut(fetchResult)
+            else:
+                self._saveArticleWithoutDataProc(fetchResult)
+        if len(resultList) > 0:
+            logger.info(f"Resumed {len(resultList)} articles for data processing from the queue journal")
+
+    def ackDataProcItem(self, fetchResult):
+        """Acknowledge in the journal that the data processing of the item is complete."""
+        if self.queueJournal is not None and fetchResult is not None:
+            self.queueJournal.ack(QueueJournal.DATAPROC_QUEUE, fetchResult.URL)
+
+    def getQueueMetrics(self) -> dict:
+        """Get the depth and backpressure metrics of the queues between the stages."""
+        metrics = {
+            'fetch_completed': self.fetchCompletedStage.getMetrics(),
+            'data_processing_input': self.dataProcStage.getMetrics(),
+            'data_processing_output': self.dataProcCompletedStage.getMetrics(),
+            'url_queues': {}
+        }
+        for plugin_name, plugin in self.pluginNameToObjMap.items():
+            if getattr(plugin, 'urlQueueStage', None) is not None:
+                metrics['url_queues'][plugin_name] = plugin.urlQueueStage.getMetrics()
+        metrics['counters'] = {counterName: {label if label is not None else 'all': count
+                                             for label, count in counts.items()}
+                               for counterName, counts in self.progressCounters.snapshot().items()}
+        if self.queueJournal is not None:
+            metrics['journal'] = self.queueJournal.getStatus()
+        if self.backfill is not None:
+            metrics['backfill'] = self.backfill.getStatus()
+        drainStatus = {plugin_name: pair.url_worker.get_drain_status()
+                       for plugin_name, pair in self.worker_pairs.items()
+                       if pair.url_worker is not None and pair.url_worker.drain_stats is not None}
+        if drainStatus:
+            metrics['drain_pending'] = drainStatus
+        if self.leaseQueue is not None:
+            metrics['distributed'] = {
+                'role': self.app_config.distributed_role,
+                'lease_states': self.leaseQueue.getStateCounts(),
+                'leased_by_worker': self.leaseQueue.getWorkerCounts()
+            }
+        return metrics
+
     def _startDatabaseWorker(self):
         """Start dedicated database worker thread."""
         self.dbWorkerThread = threading.Thread(
@@ -310,6 +480,15 @@ class QueueManager:
 
     def initPlugins(self):
         """Load and initialize all plugins."""
+        # Start each run with an empty page cache for the discovery fetches
+        self.pageCache = PageCache()
+        NetworkFetcher.setRunPageCache(self.pageCache)
+        # Politeness limits per domain, shared by the content fetch workers of all plugins
+        NetworkFetcher.setDomainRateLimiter(DomainRateLimiter(
+            self.app_config.max_connections_per_domain,
+            self.app_config.domain_request_interval_ms / 1000
+        ))
+
         # Load plugins
         self.pluginNameToObjMap = self.loadPlugins(
             self.app_config.install_prefix,
@@ -331,7 +510,10 @@ class QueueManager:
                                          PluginTypes.MODULE_DATA_PROCESSOR]:
                 plugin.config(self.app_config)
                 plugin.initNetworkHelper()
-                plugin.setURLQueue(queue.Queue())
+                self._initPluginQueue(plugin_name, plugin)
+                if self.queueJournal is not None:
+                    plugin.queueJournal = self.queueJournal
+                    self._replayURLQueue(plugin)
                 self.allowedDomainsList.extend(plugin.allowedDomains)
 
             elif plugin.pluginType == PluginTypes.MODULE_NEWS_AGGREGATOR:
@@ -340,7 +522,9 @@ class QueueManager:
 
             elif plugin.pluginType == PluginTypes.MODULE_DATA_PROCESSOR:
                 plugin.config(self.app_config)
-                plugin.additionalConfig(self.sessionHistoryDB)
+                # in processes mode, the models are loaded by the worker processes instead
+                if self.app_config.dataproc_mode != 'processes':
+                    plugin.additionalConfig(self.sessionHistoryDB)
 
             # Build domain-to-plugin map
             if plugin.pluginType in [PluginTypes.MODULE_NEWS_CONTENT,
@@ -351,12 +535,75 @@ class QueueManager:
                 for domain in plugin.allowedDomains:
                     self.domainToPluginMap[domain] = plugin_name
 
+        # With data processing plugins enabled, the parsed articles are passed to them in memory
+        # and saved once after they complete, instead of being saved and re-read from disk.
+        # The worker processes of the processes mode load the articles from disk, so they are saved when fetched.
+        hasDataProcPlugins = any(plugin.pluginType == PluginTypes.MODULE_DATA_PROCESSOR
+                                 for plugin in self.pluginNameToObjMap.values())
+        for plugin in self.pluginNameToObjMap.values():
+            if plugin.pluginType != PluginTypes.MODULE_DATA_PROCESSOR:
+                plugin.deferArticleWrite = hasDataProcPlugins and self.app_config.dataproc_mode != 'processes'
+
         # NOTE: Pending URL retrieval moved to URLDiscoveryWorker.run()
         # This allows progress bars to be displayed immediately when workers start
 
         logger.info(f"Initialized {len(self.pluginNameToObjMap)} plugins")
         self.q_status.updateStatus()
 
+    def _initPluginQueue(self, plugin_name: str, plugin):
+        """Give the content plugin an empty queue of URLs, bounded by its high-water mark."""
+        plugin.setURLQueue(CountedQueue(self.progressCounters, ProgressCounters.URL_QUEUE, plugin_name,
+                                        maxsize=self.app_config.url_queue_max_size))
+        plugin.urlQueueStage = StageBackpressure(
+            f'{plugin_name}_urls',
+            plugin.urlQueue,
+            shutdown_event=self.shutdown_event
+        )
+
+    def prepareNextCycle(self, pluginNames: list = None):
+        """
+        Reset the per-run state to start another scrape cycle in daemon mode.
+
+        The loaded plugins with their configuration and network sessions, the session history database,
+        the data processing plugins with their models and the status API are kept warm across the cycles.
+        The worker threads, the queues of URLs and the page cache are created afresh for each cycle.
+        The articles kept in the queue journal, whose data processing did not complete in the previous cycle,
+        are resumed when this cycle's data processing workers start.
+
+        :param pluginNames: Names of the content plugins to scrape in this cycle, all of them if None
+        """
+        self.cyclePluginNames = set(pluginNames) if pluginNames is not None else None
+        self.shutdown_event.clear()
+        self.worker_pairs = dict()
+        self.fetchScheduler = None
+        self.parseStage = None
+        self.dataProcessWorkerList = []
+        self.dataProcAutoscaler = None
+        self.distributedWorkers = []
+        self.alreadyDataProcList = []
+        self.progressCounters.reset([ProgressCounters.FETCH_SUCCEEDED, ProgressCounters.FETCH_FAILED,
+                                     ProgressCounters.DATA_PROCESSED])
+        # the database worker stops at the end of each cycle
+        if self.dbWorkerThread is None or not self.dbWorkerThread.is_alive():
+            self._startDatabaseWorker()
+        self.pageCache = PageCache()
+        NetworkFetcher.setRunPageCache(self.pageCache)
+        NetworkFetcher.setDomainRateLimiter(DomainRateLimiter(
+            self.app_config.max_connections_per_domain,
+            self.app_config.domain_request_interval_ms / 1000
+        ))
+        for plugin_name, plugin in self.pluginNameToObjMap.items():
+            if plugin.pluginType in [PluginTypes.MODULE_NEWS_CONTENT,
+                                     PluginTypes.MODULE_DATA_CONTENT,
+                                     PluginTypes.MODULE_NEWS_API]:
+                self._initPluginQueue(plugin_name, plugin)
+                plugin.pluginState = PluginTypes.STATE_GET_URL_LIST
+                plugin.urlQueueTotalSize = 0
+                with plugin.counterLock:
+                    plugin.urlProcessedCount = 0
+                plugin.listOfURLS = []
+        self.q_status.updateStatus()
+
     def _retrieve_pending_for_plugin(self, plugin_name: str, plugin) -> tuple:
         """Retrieve pending URLs for a single plugin."""
         if plugin.pluginType not in [PluginTypes.MODULE_NEWS_AGGREGATOR,
@@ -376,13 +623,29 @@ class QueueManager:
 
         Each plugin gets a WorkerPair that coordinates:
         - URL discovery worker (with timeout)
-        - Content fetching worker (monitors URL worker)
+        - Pool of content fetching workers (monitor URL worker), sized per plugin in the configuration
+        With the global fetch scheduler, the content fetching is done by its shared pool of workers instead.
+        As the distributed coordinator, the content is fetched by the workers that lease the discovered URLs.
         """
         logger.info("Initializing coordinated worker pairs...")
 
         worker_id = 0
+        self.fetchScheduler = None
+        if self.app_config.distributed_role == 'coordinator':
+            self.fetchScheduler = LeaseCoordinator(self, self.sessionHistoryDB, self.leaseQueue)
+        elif self.app_config.fetch_scheduler == 'global':
+            self.fetchScheduler = FetchScheduler(
+                self,
+                self.sessionHistoryDB,
+                num_workers=self.app_config.global_fetch_workers,
+                rate_limiter=NetworkFetcher.domainRateLimiter
+            )
+        self._initParseStage()
 
         for plugin_name, plugin in self.pluginNameToObjMap.items():
+            # in daemon mode, only the plugins due in this cycle are scraped
+            if self.cyclePluginNames is not None and plugin_name not in self.cyclePluginNames:
+                continue
             # Only create pairs for content plugins
             if plugin.pluginType in [PluginTypes.MODULE_NEWS_CONTENT,
                                      PluginTypes.MODULE_DATA_CONTENT,
@@ -397,40 +660,55 @@ class QueueManager:
                     worker_id="[" + str(worker_id) + "] " + plugin_name
                 )
 
-                # Initialize with timeout
+                # Initialize with timeout and the size of the content fetch pool
                 pair.initialize(
                     run_date=self.runDate,
-                    url_timeout=self.url_gathering_timeout
+                    url_timeout=self.url_gathering_timeout,
+                    fetch_workers=self.app_config.getPluginFetchWorkers(plugin_name),
+                    fetch_scheduler=self.fetchScheduler
                 )
 
                 self.worker_pairs[plugin_name] = pair
 
+        if self.backfill is not None:
+            self.backfill.pluginCount = len(self.worker_pairs)
+            logger.info(f"Backfilling {len(self.backfill.runDates)} dates, "
+                        f"{self.backfill.parallelDates} dates in parallel for each plugin")
         logger.info(f"Created {len(self.worker_pairs)} worker pairs")
 
     def initDataProcWorkers(self):
         """Initialize data processing workers."""
         logger.debug("Initializing data processing workers...")
+        # keyed by name, since several plugins may have the same priority:
         self.dataProcPluginsMap = {}
-        allPriorityValues = []
 
         try:
             for plugin_name, plugin in self.pluginNameToObjMap.items():
                 if plugin.pluginType == PluginTypes.MODULE_DATA_PROCESSOR:
-                    priority = plugin.executionPriority
-                    allPriorityValues.append(priority)
-                    self.dataProcPluginsMap[priority] = plugin
-
-            sortedPriorityKeys = sorted(set(allPriorityValues))
-
-            for key in self.dataProcPluginsMap.keys():
-                self.dataProcessWorkerList.append(DataProcessor(
-                    self.dataProcPluginsMap,
-                    sortedPriorityKeys,
-                    self,
-                    self.q_status,
-                    name=self.dataProcPluginsMap[key].pluginName,
-                    daemon=True
-                ))
+                    self.dataProcPluginsMap[plugin_name] = plugin
+
+            sortedPriorityKeys = sorted(self.dataProcPluginsMap.keys(),
+                                        key=lambda name: (self.dataProcPluginsMap[name].executionPriority, name))
+
+            if self.app_config.dataproc_mode == 'processes' and len(self.dataProcPluginsMap) > 0:
+                if self._initDataProcessPool(sortedPriorityKeys):
+                    return
+                # the plugins could not be loaded by the worker processes, so run them in this process instead:
+                self.app_config.dataproc_mode = 'threads'
+                for plugin in self.dataProcPluginsMap.values():
+                    plugin.additionalConfig(self.sessionHistoryDB)
+
+            # in daemon mode, the pipeline of the first cycle is reused
+            if self.dataProcPipeline is None:
+                self.dataProcPipeline = DataProcPipeline(self.dataProcPluginsMap, sortedPriorityKeys,
+                                                         max_parallel=self.app_config.dataproc_parallel_plugins)
+                if len(self.dataProcPluginsMap) > 0:
+                    logger.info(f"Data processing pipeline: {self.dataProcPipeline.getStatus()}")
+
+            if len(self.dataProcPluginsMap) > 0:
+                for workerIndex in range(self.dataproc_threads):
+                    self.dataProcessWorkerList.append(self._newDataProcessor(workerIndex + 1))
+                self._initDataProcAutoscaler()
 
         except Exception as e:
             logger.error(f"Error initializing data processing workers: {e}")
@@ -439,6 +717,97 @@ class QueueManager:
 
         logger.info(f"{len(self.dataProcessWorkerList)} data processing workers initialized")
 
+    def _initDataProcAutoscaler(self):
+        """Create the autoscaler of the data processing threads, if a maximum is configured."""
+        if len(self.dataProcPluginsMap) > 0 and self.app_config.dataproc_threads_max > self.dataproc_threads:
+            self.dataProcAutoscaler = DataProcAutoscaler(
+                self,
+                lambda workerIndex: self._newDataProcessor(self.dataproc_threads + workerIndex),
+                min_threads=self.dataproc_threads,
+                max_threads=self.app_config.dataproc_threads_max,
+                items_per_thread=self.app_config.dataproc_autoscale_queue_depth
+            )
+
+    def _newDataProcessor(self, workerIndex: int) -> DataProcessor:
+        """Create a data processing thread that runs all the data processing plugins through the pipeline."""
+        return DataProcessor(
+            self.dataProcPluginsMap,
+            self.dataProcPipeline.order,
+            self,
+            self.q_status,
+            name=f"DataProc-{workerIndex}",
+            daemon=True,
+            pipeline=self.dataProcPipeline
+        )
+
+    def _initDataProcessPool(self, sortedPriorityKeys: list) -> bool:
+        """Start the pool of data processing worker processes, with one feeder thread per process.
+        The plugins marked runInMainProcess, and the plugins that run after them, are run by the feeder threads
+        in this process through the data processing pipeline.
+        Returns False if the worker processes could not be started."""
+        # in daemon mode, the worker processes started for the first cycle are reused
+        if self.dataProcessPool is None:
+            allPluginsPipeline = DataProcPipeline(self.dataProcPluginsMap, sortedPriorityKeys, max_parallel=1)
+            mainProcessKeys = allPluginsPipeline.getDependentKeys(
+                [plugin_name for plugin_name, plugin in self.dataProcPluginsMap.items() if plugin.runInMainProcess])
+            enabledPluginNames = {plugin_name: plugin.executionPriority
+                                  for plugin_name, plugin in self.dataProcPluginsMap.items()
+                                  if plugin_name not in mainProcessKeys}
+            dataProcessPool = DataProcessPool(
+                self.app_config.config_file,
+                self.app_config.rundate,
+                enabledPluginNames,
+                num_processes=self.app_config.dataproc_processes
+            )
+            try:
+                dataProcessPool.start()
+            except Exception as e:
+                logger.error(f"Error starting the data processing worker processes, "
+                             f"running the data processing plugins in threads instead: {e}")
+                return False
+            self.dataProcessPool = dataProcessPool
+            mainProcessPlugins = {plugin_name: self.dataProcPluginsMap[plugin_name]
+                                  for plugin_name in mainProcessKeys}
+            for plugin in mainProcessPlugins.values():
+                plugin.additionalConfig(self.sessionHistoryDB)
+            self.dataProcPipeline = DataProcPipeline(mainProcessPlugins, mainProcessKeys,
+                                                     max_parallel=self.app_config.dataproc_parallel_plugins)
+            if len(mainProcessPlugins) > 0:
+                logger.info(f"Data processing plugins run in this process: {self.dataProcPipeline.getStatus()}")
+        for workerIndex in range(self.dataProcessPool.num_processes):
+            self.dataProcessWorkerList.append(DataProcessor(
+                self.dataProcPluginsMap,
+                sortedPriorityKeys,
+                self,
+                self.q_status,
+                name=f"DataProc-{workerIndex + 1}",
+                daemon=True,
+                process_pool=self.dataProcessPool,
+                pipeline=self.dataProcPipeline
+            ))
+        logger.info(f"{len(self.dataProcessWorkerList)} data processing workers initialized "
+                    f"with {self.dataProcessPool.num_processes} worker processes")
+        return True
+
+    def _initParseStage(self):
+        """Create the parse stage for the content plugins, if it is enabled in the configuration."""
+        self.parseStage = None
+        if self.app_config.parse_stage == 'off':
+            return
+        enabledPluginNames = {name: priority for name, priority in self.app_config.enabledPluginNames.items()
+                              if name in self.pluginNameToObjMap
+                              and ParseStage.supports_plugin(self.pluginNameToObjMap[name])}
+        self.parseStage = ParseStage(
+            self,
+            self.sessionHistoryDB,
+            num_workers=self.app_config.parse_workers,
+            queue_size=self.app_config.parse_queue_size,
+            mode=self.app_config.parse_stage,
+            config_file=self.app_config.config_file,
+            run_date=self.app_config.rundate,
+            plugin_names=enabledPluginNames
+        )
+
     def runAllJobs(self):
         """
         Execute all jobs with progress monitoring in main thread.
@@ -448,10 +817,17 @@ class QueueManager:
         2. Starts data processing workers
         3. Monitors progress in main thread
         4. Waits for all workers to complete
+        As a distributed worker, it only fetches the URLs leased from the coordinator.
         """
+        if self.app_config.distributed_role == 'worker':
+            self.runDistributedWorkers()
+            return
+
         # Initialize all components
         self.initWorkerPairs()
         self.initDataProcWorkers()
+        if self.queueJournal is not None:
+            self._replayDataProcQueue()
 
         # Start status API
         if self.status_api:
@@ -460,14 +836,24 @@ class QueueManager:
         try:
             logger.info("Starting all workers...")
 
+            # Start the parse stage before the fetch workers that feed it
+            if self.parseStage is not None:
+                self.parseStage.start()
+
             # Start worker pairs
             for plugin_name, pair in self.worker_pairs.items():
                 pair.start()
                 logger.info(f"Started worker pair for {plugin_name}")
 
+            # Start the shared fetch workers of the global scheduler
+            if self.fetchScheduler is not None:
+                self.fetchScheduler.start()
+
             # Start data processing workers
             for worker in self.dataProcessWorkerList:
                 worker.start()
+            if self.dataProcAutoscaler is not None:
+                self.dataProcAutoscaler.start()
 
             # Run progress monitoring in MAIN THREAD
             self._monitor_progress_main_thread()
@@ -484,6 +870,43 @@ class QueueManager:
             self.shutdown()
             raise
 
+    def runDistributedWorkers(self):
+        """
+        Lease URLs from the coordinator's queue, fetch and parse them, and report the results to it,
+        until the coordinator finishes its run or the application is shut down.
+        """
+        contentPlugins = {plugin_name: plugin for plugin_name, plugin in self.pluginNameToObjMap.items()
+                          if plugin.pluginType in [PluginTypes.MODULE_NEWS_CONTENT,
+                                                   PluginTypes.MODULE_DATA_CONTENT,
+                                                   PluginTypes.MODULE_NEWS_API]}
+        for plugin in contentPlugins.values():
+            # the articles are saved by the coordinator
+            plugin.deferArticleWrite = True
+        workerID = getDefaultWorkerID()
+        self.distributedWorkers = [
+            DistributedFetchWorker(self.leaseQueue,
+                                   contentPlugins,
+                                   f"{workerID}-{threadIndex + 1}",
+                                   self.shutdown_event,
+                                   batch_size=self.app_config.lease_batch_size,
+                                   name=f"DistFetch-{threadIndex + 1}")
+            for threadIndex in range(self.app_config.distributed_worker_threads)
+        ]
+        if self.status_api:
+            self.status_api.start()
+        logger.info(f"Starting {len(self.distributedWorkers)} distributed fetch workers as {workerID}")
+        for worker in self.distributedWorkers:
+            worker.start()
+        try:
+            while any(worker.is_alive() for worker in self.distributedWorkers):
+                for worker in self.distributedWorkers:
+                    worker.join(timeout=1)
+        except KeyboardInterrupt:
+            logger.error("Keyboard interrupt received")
+            self.shutdown()
+        logger.info(f"Distributed fetch workers completed, fetched "
+                    f"{sum(worker.fetchedCount for worker in self.distributedWorkers)} URLs")
+
     def _monitor_progress_main_thread(self):
         """
         Monitor progress in the main thread.
@@ -599,15 +1022,26 @@ class QueueManager:
 
             logger.info("Progress monitoring complete")
 
-    def _process_completed_urls(self):
-        """Process completed URLs from queue and save to database."""
+    def _drainCompletedQueue(self) -> list:
+        """Take all the fetch results waiting in the fetch completed queue."""
         results = []
-
         try:
             while not self.fetchCompletedQueue.empty():
                 results.append(self.fetchCompletedQueue.get_nowait())
         except queue.Empty:
             pass
+        return results
+
+    def _writeCompletedURLs(self, fetchResult):
+        """Queue the writing of the completed URLs to the database when the fetch completed queue is full,
+        so that the fetch workers do not wait for the progress monitor to drain it."""
+        results = self._drainCompletedQueue()
+        results.append(fetchResult)
+        self.queueDBOperation('write_queue', results, wait_for_result=False)
+
+    def _process_completed_urls(self):
+        """Process completed URLs from queue and save to database."""
+        results = self._drainCompletedQueue()
 
         if results:
             count = self.queueDBOperation(
@@ -621,7 +1055,41 @@ class QueueManager:
     def shutdown(self):
         """Shutdown all workers gracefully."""
         logger.info("Initiating shutdown...")
+        self.stop_requested.set()
+        self.finishCycle()
+
+        if self.dataProcessPool is not None:
+            logger.info("Stopping data processing worker processes...")
+            self.dataProcessPool.shutdown()
+        if self.dataProcPipeline is not None:
+            self.dataProcPipeline.shutdown()
+        if self.queueJournal is not None:
+            self.queueJournal.close()
 
+        # Stop database worker
+        logger.info("Stopping database worker...")
+        self.dbCommandQueue.put(None)  # Poison pill
+        if self.dbWorkerThread:
+            self.dbWorkerThread.join(timeout=5)
+
+        # Release the pages cached during this run
+        if self.pageCache is not None:
+            logger.info(f"Discovery page cache statistics: {self.pageCache.getStats()}")
+            self.pageCache.clear()
+            NetworkFetcher.setRunPageCache(None)
+        NetworkFetcher.setDomainRateLimiter(None)
+
+        # Save the network traffic recorded during this run
+        NetworkCassette.saveAll()
+        NetworkFetcher.cassetteSession = None
+
+        logger.info("Shutdown complete")
+
+    def finishCycle(self):
+        """
+        Stop the workers of this scrape cycle and save the articles left unprocessed.
+        The resources kept warm across the cycles in daemon mode are released by shutdown().
+        """
         # Signal shutdown
         self.shutdown_event.set()
 
@@ -631,6 +1099,16 @@ class QueueManager:
             pair.join(timeout=10)
             if pair.is_alive():
                 logger.warning(f"Worker pair {plugin_name} did not finish in time")
+        if self.fetchScheduler is not None:
+            self.fetchScheduler.join(timeout=10)
+            if self.fetchScheduler.is_alive():
+                logger.warning("Global fetch scheduler workers did not finish in time")
+        for worker in self.distributedWorkers:
+            join_with_logging(worker, 10, worker.name)
+        if self.parseStage is not None:
+            self.parseStage.stop(timeout=10)
+            if self.parseStage.is_alive():
+                logger.warning("Parse stage workers did not finish in time")
 
         # Wait for data processing workers
         logger.info("Waiting for data processing workers...")
@@ -638,21 +1116,84 @@ class QueueManager:
             worker.join(timeout=10)
             if worker.is_alive():
                 logger.warning(f"Data worker {worker.workerID} did not finish in time")
-
-        # Stop database worker
-        logger.info("Stopping database worker...")
-        self.dbCommandQueue.put(None)  # Poison pill
-        if self.dbWorkerThread:
-            self.dbWorkerThread.join(timeout=5)
-
-        logger.info("Shutdown complete")
+        if self.dataProcAutoscaler is not None and self.dataProcAutoscaler.is_alive():
+            self.dataProcAutoscaler.join(timeout=10)
+        self._saveUnprocessedArticles()
+        logger.info(f"Queue metrics: {self.getQueueMetrics()}")
 
     # Keep existing helper methods for compatibility
+    def _saveUnprocessedArticles(self):
+        """Save the articles whose saving was deferred, but whose data processing did not complete by shutdown:
+        those left in the data processing queue, and those still being processed by workers that did not stop.
+        Articles kept in the queue journal are not saved, they are resumed by the next cycle in daemon mode,
+        or by the next run."""
+        savedCount = 0
+        unfinishedResults = dict()
+        while True:
+            try:
+                fetchResult = self.dataProcQueue.get_nowait()
+            except queue.Empty:
+                break
+            if self._isJournalPending(fetchResult):
+                unfinishedResults[fetchResult.URL] = fetchResult
+        with self.deferredArticlesLock:
+            unprocessedList = list(self.deferredArticles.values())
+            self.deferredArticles.clear()
+        for fetchResult in unprocessedList:
+            if self._isJournalPending(fetchResult):
+                unfinishedResults[fetchResult.URL] = fetchResult
+                continue
+            if fetchResult.rawHTML is not None and fetchResult.article is not None and \
+                    not fetchResult.article.isDuplicate():
+                contentPlugin = self.pluginNameToObjMap.get(fetchResult.pluginName)
+                if contentPlugin is not None:
+                    contentPlugin.persistArticle(fetchResult)
+                    savedCount += 1
+        if savedCount > 0:
+            logger.info(f"Saved {savedCount} articles that were not processed by the data processing plugins")
+        self.unfinishedDataProcResults = list(unfinishedResults.values())
+
+    def _isJournalPending(self, fetchResult) -> bool:
+        """Check whether the data processing of the fetch result is kept in the queue journal."""
+        return fetchResult is not None and self.queueJournal is not None and \
+            self.queueJournal.isPending(QueueJournal.DATAPROC_QUEUE, fetchResult.URL)
+
+    def trackDeferredArticle(self, fetchResult):
+        """Keep the fetch result until its article is saved, if saving it was deferred until its data processing."""
+        if fetchResult is not None and fetchResult.rawHTML is not None:
+            with self.deferredArticlesLock:
+                self.deferredArticles[fetchResult.URL] = fetchResult
+
+    def releaseDeferredArticle(self, fetchResult):
+        """Stop keeping the fetch result for saving at shutdown, once its article has been handled."""
+        if fetchResult is not None:
+            with self.deferredArticlesLock:
+                self.deferredArticles.pop(fetchResult.URL, None)
+
+    def _saveArticleWithoutDataProc(self, fetchResult):
+        """Save the article of a fetch result that will not be data processed, if its saving was deferred."""
+        self.releaseDeferredArticle(fetchResult)
+        if fetchResult is not None and fetchResult.rawHTML is not None:
+            contentPlugin = self.pluginNameToObjMap.get(fetchResult.pluginName)
+            if contentPlugin is not None:
+                contentPlugin.persistArticle(fetchResult)
+        self.ackDataProcItem(fetchResult)
+
     def addToScrapeCompletedQueue(self, fetchResult):
-        """Add fetch result to completed queue."""
-        self.fetchCompletedCount += 1
-        self.fetchCompletedQueue.put(fetchResult)
-        self.dataProcQueue.put(fetchResult)
+        """Add fetch result to completed queue, waiting while the queues are at their high-water marks."""
+        self.progressCounters.increment(ProgressCounters.FETCH_SUCCEEDED, label=fetchResult.pluginName)
+        self.fetchCompletedStage.put(fetchResult)
+        if self.backfill is not None:
+            self.backfill.recordFetched(fetchResult.pluginName, fetchResult.URL)
+        if self.dataProcessWorkerList:
+            if self.queueJournal is not None:
+                self.queueJournal.append(QueueJournal.DATAPROC_QUEUE, fetchResult.URL,
+                                         resultToJournalItem(fetchResult))
+            self.trackDeferredArticle(fetchResult)
+            self.dataProcStage.put(fetchResult)
+        else:
+            # no data processing workers to consume the queue
+            self._saveArticleWithoutDataProc(fetchResult)
 
     def fetchFromDataProcInputQ(self, block=True, timeout=30):
         """Fetch from data processing input queue."""
@@ -662,15 +1203,26 @@ class QueueManager:
 
     def addToDataProcessedQueue(self, fetchResult):
         """Add to data processing output queue."""
-        self.dataProcCompletedQueue.put(fetchResult)
+        self.progressCounters.increment(ProgressCounters.DATA_PROCESSED)
+        self.dataProcCompletedStage.put(fetchResult)
+
+    @property
+    def fetchCompletedCount(self) -> int:
+        """Count of URLs fetched successfully in this scrape cycle."""
+        return self.progressCounters.get(ProgressCounters.FETCH_SUCCEEDED)
+
+    @property
+    def dataProcessedCount(self) -> int:
+        """Count of items data processed in this scrape cycle."""
+        return self.progressCounters.get(ProgressCounters.DATA_PROCESSED)
 
     def getCompletedQueueSize(self):
         """Get data processing input queue size."""
-        return self.dataProcQueue.qsize()
+        return self.dataProcQueue.depth()
 
     def getDataProcessedQueueSize(self):
-        """Get data processing output queue size."""
-        return self.dataProcCompletedQueue.qsize()
+        """Get count of items data processed, the output queue only keeps up to its high-water mark."""
+        return self.dataProcessedCount
 
     @staticmethod
     def loadPlugins(app_dir, plugins_dir, contrib_dir, enabled_names):
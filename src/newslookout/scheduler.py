@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: scheduler.py                                                                                 #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: Schedules of the scrape cycles run by the application in daemon mode                           #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+
+"""
+ Provides:
+    CronSchedule: Schedule given by a cron expression, with the next time it is due.
+    DaemonScheduler: Tracks when the scrape cycle of each plugin is due next, in daemon mode.
+
+ A cron expression has five fields: minute, hour, day of month, month and day of week (0 or 7 is Sunday).
+ Each field is '*', a number, a range 'a-b', a list 'a,b,c', or any of these with a step, e.g. '*/15' or '8-18/2'.
+ For example, every 15 minutes: '*/15 * * * *', or at 6:30 on weekdays: '30 6 * * 1-5'.
+"""
+
+# import standard python libraries:
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+##########
+
+logger = logging.getLogger(__name__)
+
+##########
+
+
+class CronSchedule:
+    """ Schedule given by a cron expression.
+    """
+    fieldRanges = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        """ Parse the cron expression.
+
+        :param expression: Cron expression with five fields
+        :raises ValueError: If the expression is not valid
+        """
+        self.expression = expression.strip()
+        fields = self.expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+        (self.minutes, self.hours, self.days, self.months, daysOfWeek) = [
+            CronSchedule.parseField(field, minValue, maxValue)
+            for field, (minValue, maxValue) in zip(fields, self.fieldRanges)]
+        # Sunday is either 0 or 7:
+        self.daysOfWeek = set(day % 7 for day in daysOfWeek)
+        # as in cron, if both the day of month and day of week are restricted, either may match:
+        self.daysRestricted = fields[2] != '*'
+        self.daysOfWeekRestricted = fields[4] != '*'
+
+    @staticmethod
+    def parseField(field: str, minValue: int, maxValue: int) -> set:
+        """ Get the set of values matched by a field of the cron expression.
+        """
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, stepStr = part.split('/', 1)
+                step = int(stepStr)
+                if step < 1:
+                    raise ValueError(f"Invalid step in cron field: '{field}'")
+            if part == '*':
+                start, end = minValue, maxValue
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-', 1))
+            else:
+                start = int(part)
+                end = maxValue if step > 1 else start
+            if start < minValue or end > maxValue or start > end:
+                raise ValueError(f"Value out of range {minValue}-{maxValue} in cron field: '{field}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def matchesDay(self, day: datetime) -> bool:
+        # datetime.weekday() is 0 for Monday, cron uses 0 for Sunday:
+        dayOfWeek = (day.weekday() + 1) % 7
+        if self.daysRestricted and self.daysOfWeekRestricted:
+            return day.day in self.days or dayOfWeek in self.daysOfWeek
+        return day.day in self.days and dayOfWeek in self.daysOfWeek
+
+    def getNextTime(self, after: datetime) -> datetime:
+        """ Get the first time matching the schedule, strictly after the given time.
+
+        :param after: Time after which the schedule is next due
+        :return: Next time the schedule is due, at the start of a minute
+        """
+        nextTime = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # a matching time is found within 5 years, unless the expression names a day that never occurs:
+        limit = after + timedelta(days=366 * 5)
+        while nextTime < limit:
+            if nextTime.month not in self.months:
+                nextTime = (nextTime.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self.matchesDay(nextTime):
+                nextTime = nextTime.replace(hour=0, minute=0) + timedelta(days=1)
+            elif nextTime.hour not in self.hours:
+                nextTime = nextTime.replace(minute=0) + timedelta(hours=1)
+            elif nextTime.minute not in self.minutes:
+                nextTime = nextTime + timedelta(minutes=1)
+            else:
+                return nextTime
+        raise ValueError(f"Cron expression is never due: '{self.expression}'")
+
+
+class DaemonScheduler:
+    """ Tracks when the scrape cycle of each plugin is due next.
+    All plugins are due when the daemon starts, and then as per their schedules.
+    """
+
+    def __init__(self, pluginSchedules: Dict[str, str], startTime: datetime = None):
+        """ Initialise the schedules.
+
+        :param pluginSchedules: Names of the plugins mapped to their cron expressions
+        :param startTime: Time the daemon started, all plugins are first due at this time
+        """
+        startTime = startTime or datetime.now()
+        self.lock = threading.Lock()
+        self.schedules = {pluginName: CronSchedule(expression) for pluginName, expression in pluginSchedules.items()}
+        self.nextRunTimes = {pluginName: startTime for pluginName in pluginSchedules}
+        self.lastRunTimes: Dict[str, Optional[datetime]] = {pluginName: None for pluginName in pluginSchedules}
+        self.cycleCount = 0
+
+    def getDuePlugins(self, now: datetime = None) -> List[str]:
+        """ Get the names of the plugins whose scrape cycle is due.
+        """
+        now = now or datetime.now()
+        with self.lock:
+            return [pluginName for pluginName, nextRunTime in self.nextRunTimes.items() if nextRunTime <= now]
+
+    def markRun(self, pluginNames: List[str], runTime: datetime = None):
+        """ Record that the scrape cycle of these plugins ran, and compute when each is due next.
+        Runs missed while a cycle was running are not repeated.
+        """
+        runTime = runTime or datetime.now()
+        with self.lock:
+            for pluginName in pluginNames:
+                self.lastRunTimes[pluginName] = runTime
+                self.nextRunTimes[pluginName] = self.schedules[pluginName].getNextTime(
+                    max(runTime, datetime.now()))
+            self.cycleCount += 1
+
+    def getNextRunTime(self) -> Optional[datetime]:
+        with self.lock:
+            return min(self.nextRunTimes.values()) if self.nextRunTimes else None
+
+    def getStatus(self) -> dict:
+        with self.lock:
+            return {
+                'cycles_run': self.cycleCount,
+                'plugins': {
+                    pluginName: {
+                        'schedule': self.schedules[pluginName].expression,
+                        'next_run': self.nextRunTimes[pluginName].isoformat(),
+                        'last_run': self.lastRunTimes[pluginName].isoformat()
+                        if self.lastRunTimes[pluginName] is not None else None
+                    }
+                    for pluginName in self.schedules
+                }
+            }
+
+# # end of file ##
@@ -84,6 +84,8 @@ from logging.handlers import RotatingFileHandler
 # Import core application components
 from newslookout.queue_manager import QueueManager
 from newslookout.config import ConfigManager
+from newslookout.data_structs import BackfillProgress, PluginTypes
+from newslookout.scheduler import DaemonScheduler
 from newslookout.scraper_utils import checkAndGetNLTKData
 from newslookout import scraper_utils
 
@@ -108,7 +110,7 @@ class NewsLookoutApp:
         >>> stats = app.get_statistics()
     """
 
-    def __init__(self, config_file: str, run_date: Optional[str] = None):
+    def __init__(self, config_file: str, run_date: Optional[str] = None, run_mode: Optional[str] = None):
         """
         Initialize the NewsLookout application.
 
@@ -116,6 +118,9 @@ class NewsLookoutApp:
             config_file (str): Path to the configuration file
             run_date (str, optional): Date to scrape in 'YYYY-MM-DD' format.
                                      Defaults to today.
+            run_mode (str, optional): Overrides the run_mode of the configuration file,
+                                     e.g. 'drain_pending' to only fetch the pending URLs,
+                                     or 'daemon' to keep running and scrape as per the schedule.
 
         Raises:
             FileNotFoundError: If config file doesn't exist
@@ -123,6 +128,8 @@ class NewsLookoutApp:
         """
         self.config_file = config_file
         self.run_date = run_date or datetime.now().strftime('%Y-%m-%d')
+        self.run_mode = run_mode
+        self.max_cycles = None
         self.app_config = None
         self.queue_manager = None
         self.is_running = False
@@ -156,6 +163,8 @@ class NewsLookoutApp:
             # Read configuration
             self.app_config = ConfigManager(self.config_file, self.run_date)
             self.app_config.app_version = __version__
+            if self.run_mode is not None:
+                self.app_config.run_mode = self.run_mode
 
             # Setup logging if not already configured
             if not logging.getLogger().handlers:
@@ -291,14 +300,21 @@ class NewsLookoutApp:
             logging.info(f"PID file {self.app_config.pid_file} does not exist, so unable to delete it.")
 
     def run(self, run_date: Optional[str] = None, max_runtime: Optional[int] = None,
-            blocking: bool = True) -> Dict[str, Any]:
+            blocking: bool = True, date_to: Optional[str] = None,
+            parallel_dates: Optional[int] = None) -> Dict[str, Any]:
         """
         Run the web scraping process.
 
         Args:
-            run_date (str, optional): Date to scrape in 'YYYY-MM-DD' format
+            run_date (str, optional): Date to scrape in 'YYYY-MM-DD' format,
+                                     or the first date of the range to backfill if date_to is given
             max_runtime (int, optional): Maximum runtime in seconds
             blocking (bool): If True, wait for completion. If False, run in background.
+            date_to (str, optional): Last date of the range to backfill in 'YYYY-MM-DD' format.
+                                    All the dates are scraped in this run, sharing the plugins,
+                                    network sessions, history database and data processing models.
+            parallel_dates (int, optional): Number of dates each plugin discovers concurrently
+                                           when backfilling, backfill_parallel_dates in the configuration by default
 
         Returns:
             dict: Statistics about the scraping run
@@ -307,6 +323,8 @@ class NewsLookoutApp:
             >>> app = NewsLookoutApp('config.conf')
             >>> stats = app.run(run_date='2026-01-21', max_runtime=3600)
             >>> print(f"Processed {stats['urls_processed']} URLs")
+            >>> stats = app.run('2026-01-01', date_to='2026-01-31', parallel_dates=4)
+            >>> print(stats['backfill']['dates']['2026-01-15'])
         """
         if self.is_running:
             logging.warning("Application is already running")
@@ -318,6 +336,9 @@ class NewsLookoutApp:
             self.app_config.rundate = ConfigManager.checkAndParseDate(run_date)
             self.queue_manager.runDate = self.app_config.rundate
 
+        if date_to:
+            self._setup_backfill(date_to, parallel_dates)
+
         self._stats['start_time'] = datetime.now()
         self.is_running = True
 
@@ -335,6 +356,24 @@ class NewsLookoutApp:
             logging.info("NewsLookout started in background")
             return {"status": "running", "message": "Application running in background"}
 
+    def _setup_backfill(self, date_to: str, parallel_dates: Optional[int] = None):
+        """
+        Set up the backfill of all dates from the run date to date_to, in this run.
+
+        Args:
+            date_to (str): Last date of the range in 'YYYY-MM-DD' format
+            parallel_dates (int, optional): Number of dates each plugin discovers concurrently
+        """
+        run_dates = BackfillProgress.getDateRange(self.app_config.rundate, ConfigManager.checkAndParseDate(date_to))
+        if len(run_dates) < 2:
+            return
+        self.queue_manager.backfill = BackfillProgress(
+            run_dates,
+            parallel_dates or self.app_config.backfill_parallel_dates
+        )
+        logging.info(f"Backfilling dates from {run_dates[0].strftime('%Y-%m-%d')} "
+                     f"to {run_dates[-1].strftime('%Y-%m-%d')}")
+
     def _execute(self, max_runtime: Optional[int] = None):
         """
         Execute the scraping process.
@@ -353,11 +392,14 @@ class NewsLookoutApp:
                 timer.start()
                 logging.info(f"Set maximum runtime: {max_runtime} seconds")
 
-            # Run all jobs
-            self.queue_manager.runAllJobs()
+            if self.app_config.run_mode == 'daemon':
+                self._run_daemon_cycles()
+            else:
+                # Run all jobs
+                self.queue_manager.runAllJobs()
 
-            # Finish up
-            self.queue_manager.shutdown()
+                # Finish up
+                self.queue_manager.shutdown()
 
             self._stats['end_time'] = datetime.now()
 
@@ -377,6 +419,77 @@ class NewsLookoutApp:
         finally:
             self.is_running = False
 
+    def run_daemon(self, max_runtime: Optional[int] = None, max_cycles: Optional[int] = None,
+                   blocking: bool = True) -> Dict[str, Any]:
+        """
+        Keep running and scrape the plugins as per their schedules, until stopped.
+
+        Args:
+            max_runtime (int, optional): Maximum runtime in seconds
+            max_cycles (int, optional): Stop after these many scrape cycles
+            blocking (bool): If True, wait until stopped. If False, run in background.
+
+        Returns:
+            dict: Statistics about the scrape cycles
+
+        Example:
+            >>> app = NewsLookoutApp('config.conf')
+            >>> app.run_daemon(max_cycles=4)
+        """
+        self.run_mode = 'daemon'
+        self.app_config.run_mode = 'daemon'
+        self.max_cycles = max_cycles
+        return self.run(max_runtime=max_runtime, blocking=blocking)
+
+    def _run_daemon_cycles(self):
+        """
+        Run the scrape cycles of the plugins as they fall due, until the application is stopped.
+
+        The plugins, the database connections, the data processing models and the status API are
+        initialised once and kept warm across the cycles, each cycle scrapes the URLs for the current date.
+        """
+        queue_manager = self.queue_manager
+        contentPluginNames = [plugin_name for plugin_name, plugin in queue_manager.pluginNameToObjMap.items()
+                              if plugin.pluginType in [PluginTypes.MODULE_NEWS_CONTENT,
+                                                       PluginTypes.MODULE_DATA_CONTENT,
+                                                       PluginTypes.MODULE_NEWS_API]]
+        queue_manager.daemonScheduler = DaemonScheduler(
+            {plugin_name: self.app_config.getPluginSchedule(plugin_name) for plugin_name in contentPluginNames})
+        logging.info(f"Running in daemon mode, schedule: {queue_manager.daemonScheduler.getStatus()}")
+        cyclesRun = 0
+        try:
+            while not queue_manager.stop_requested.is_set():
+                duePlugins = queue_manager.daemonScheduler.getDuePlugins()
+                if len(duePlugins) > 0:
+                    cycleStart = datetime.now()
+                    self.run_date = cycleStart.strftime('%Y-%m-%d')
+                    self.app_config.rundate = ConfigManager.checkAndParseDate(self.run_date)
+                    queue_manager.runDate = self.app_config.rundate
+                    logging.info(f"Starting scrape cycle {cyclesRun + 1} for plugins: {duePlugins}")
+                    # the first cycle runs all plugins, with the queues set up by initPlugins()
+                    if cyclesRun > 0:
+                        queue_manager.prepareNextCycle(duePlugins)
+                    queue_manager.runAllJobs()
+                    if queue_manager.stop_requested.is_set():
+                        break
+                    queue_manager.finishCycle()
+                    queue_manager.daemonScheduler.markRun(duePlugins, cycleStart)
+                    cyclesRun += 1
+                    self._update_statistics()
+                    if self.max_cycles is not None and cyclesRun >= self.max_cycles:
+                        break
+                nextRunTime = queue_manager.daemonScheduler.getNextRunTime()
+                if nextRunTime is None:
+                    break
+                logging.info(f"Next scrape cycle at {nextRunTime.isoformat()}")
+                # wake up periodically, in case the system clock changes while waiting
+                queue_manager.stop_requested.wait(
+                    timeout=min(max((nextRunTime - datetime.now()).total_seconds(), 0), 60))
+        finally:
+            self._stats['cycles_run'] = cyclesRun
+            if not queue_manager.stop_requested.is_set():
+                queue_manager.shutdown()
+
     def start(self):
         """
         Start the application in background mode.
@@ -446,6 +559,8 @@ class NewsLookoutApp:
                 - urls_processed: URLs successfully scraped
                 - urls_failed: URLs that failed
                 - data_processed: Number of items processed
+                - cycles_run: Scrape cycles completed, in daemon mode
+                - backfill: Progress of each date, when a range of dates was backfilled
                 - start_time: When execution started
                 - end_time: When execution ended
                 - duration: Runtime in seconds
@@ -460,6 +575,8 @@ class NewsLookoutApp:
 
         stats = dict(self._stats)
         stats['is_running'] = self.is_running
+        if self.queue_manager is not None and self.queue_manager.backfill is not None:
+            stats['backfill'] = self.queue_manager.backfill.getStatus()
 
         # Calculate duration
         if stats['start_time']:
@@ -598,6 +715,27 @@ def main():
         default=None,
         help='Run date in YYYY-MM-DD format (default: today)'
     )
+    parser.add_argument(
+        '--date-to',
+        default=None,
+        help='Backfill all dates from --date up to this date (YYYY-MM-DD) in one run'
+    )
+    parser.add_argument(
+        '--parallel-dates',
+        type=int,
+        default=None,
+        help='Number of dates discovered concurrently by each plugin when backfilling'
+    )
+    parser.add_argument(
+        '--drain-pending',
+        action='store_true',
+        help='Skip URL discovery and only fetch the backlog of pending URLs saved by earlier runs'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Keep running and scrape each plugin as per its schedule, until stopped'
+    )
     parser.add_argument(
         '--log-level',
         default=None,
@@ -626,8 +764,13 @@ def main():
             print(f"ERROR: Configuration file not found: {config_file}", file=sys.stderr)
             sys.exit(1)
 
-    app = NewsLookoutApp(config_file=config_file, run_date=args.date)
-    stats = app.run()
+    run_mode = None
+    if args.daemon:
+        run_mode = 'daemon'
+    elif args.drain_pending:
+        run_mode = 'drain_pending'
+    app = NewsLookoutApp(config_file=config_file, run_date=args.date, run_mode=run_mode)
+    stats = app.run(date_to=args.date_to, parallel_dates=args.parallel_dates)
     print(f"Done. URLs processed: {stats.get('urls_processed', 0)}")
 
 
@@ -26,7 +26,10 @@
 #    getPreviousDaysDate()                                                                                #
 #    loadPlugins()                                                                                        #
 #    getNetworkLocFromURL()                                                                               #
+#    resolveLink()                                                                                        #
 #    extractLinks()                                                                                       #
+#    extractLinksFromTree()                                                                               #
+#    getDomainOfHost()                                                                                    #
 #    normalizeURL()                                                                                       #
 #    checkAndGetNLTKData()                                                                                #
 #    calculateCRC32()                                                                                     #
@@ -57,6 +60,8 @@ import importlib
 import importlib.resources
 from datetime import date, datetime, timedelta
 from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
 import re
 import json
 import base64
@@ -74,6 +79,12 @@ logger = logging.getLogger(__name__)
 
 ##########
 
+# links starting with any of these prefixes are not followed:
+INVALID_LINK_PREFIXES = ('javascript:', 'JavaScript:', 'mailto:', '#', '?', 'tel:', '{{link}}', '{{showcmturl}}',
+                         'http://http://', 'whatsapp:')
+
+##########
+
 
 def retainValidArticles(articleList: list, validURLPatternsList: list) -> list:
     """ Retain only valid URLs
@@ -396,8 +407,23 @@ def getNetworkLocFromURL(URLStr: str) -> str:
     return res.parsed_url.netloc
 
 
+@lru_cache(maxsize=8192)
+def getDomainOfHost(hostName: str):
+    """ Get the registered domain of the host name, e.g. 'indiatimes.com' for 'economictimes.indiatimes.com'.
+    The result is cached since the links on the pages scraped are on a few hosts only.
+
+    :param hostName: Host name, in lower case
+    :return: The domain name, or None if the host name does not have a valid top level domain.
+    """
+    try:
+        return get_tld('http://' + hostName, as_object=True).fld
+    except Exception as e:
+        logger.debug(f'Error when identifying domain of host {hostName}: {e}')
+    return None
+
+
 def is_valid_url(url_to_check: str) -> bool:
-    """ Checks whether this is a valid URL
+    """ Checks whether this is a valid URL, i.e. its host name has a valid top level domain
 
     :param url_to_check: URL string to be checked
     :return: True if this is a valid URL, False otherwise.
@@ -405,8 +431,8 @@ def is_valid_url(url_to_check: str) -> bool:
     try:
         if url_to_check is None or url_to_check == '':
             return False
-        get_tld(url_to_check, as_object=True)
-        return True
+        hostName = urlsplit(url_to_check).hostname
+        return hostName is not None and getDomainOfHost(hostName) is not None
     except Exception as e:
         logger.debug(f'Error when checking is_valid_url: {e}')
     return False
@@ -434,6 +460,25 @@ def sameURLWithoutQueryParams(url1: str, url2: str) -> bool:
     return comparisonDecision
 
 
+def resolveLink(baseURL: str, linkValue: str):
+    """ Resolve the link found on a page into an absolute URL.
+
+    :param baseURL: URL of the page containing the link
+    :param linkValue: Value of the link's href attribute, absolute or relative
+    :return: The absolute URL, or None if the link is not to be followed or is not a valid URL.
+    """
+    linkValue = linkValue.strip()
+    if linkValue == '' or linkValue.startswith(INVALID_LINK_PREFIXES):
+        return None
+    if linkValue.startswith(('https://', 'http://')):
+        properLink = linkValue
+    else:
+        properLink = urljoin(baseURL, linkValue)
+    if is_valid_url(properLink):
+        return properLink
+    return None
+
+
 def extractLinks(url: str, docRoot: BeautifulSoup) -> list:
     """
     Extract all Links from beautifulSoup document object of HTML content
@@ -442,33 +487,35 @@ def extractLinks(url: str, docRoot: BeautifulSoup) -> list:
     """
     allLinks = []
     try:
-        section = docRoot.find_all("a")
-        rootTLDObj = get_tld(url, as_object=True)
-        if section is not None and len(section) > 0:
-            for tag in section:
-                if tag.name == "a" and "href" in tag.attrs.keys():
-                    linkValue = tag['href']
-                    if linkValue.startswith('/'):
-                        # convert to proper URL using network-location of the contianing page's url
-                        properLink = rootTLDObj.parsed_url.scheme\
-                                     + '://'\
-                                     + rootTLDObj.parsed_url.netloc\
-                                     + linkValue
-                        if is_valid_url(properLink):
-                            allLinks.append(properLink)
-                    elif (linkValue.startswith("javascript:") is False and
-                          linkValue.startswith('JavaScript:') is False and
-                          linkValue.startswith('mailto:') is False and
-                          linkValue.startswith('#') is False and
-                          linkValue.startswith('?') is False and
-                          linkValue.startswith('../') is False and
-                          linkValue.startswith('tel:') is False and
-                          linkValue.startswith('{{link}}') is False and
-                          linkValue.startswith('{{showcmturl}}') is False and
-                          linkValue.startswith('http://http://') is False and
-                          linkValue.startswith('whatsapp:') is False):
-                        if is_valid_url(linkValue):
-                            allLinks.append(linkValue)
+        for tag in docRoot.find_all("a", href=True):
+            properLink = resolveLink(url, tag['href'])
+            if properLink is not None:
+                allLinks.append(properLink)
+    except Exception as e:
+        logger.error("Error extracting all Links from html document: %s", e)
+    return allLinks
+
+
+def extractLinksFromTree(url: str, lxmlRoot) -> list:
+    """
+    Extract all Links from the lxml tree of the HTML content, this is much faster than extractLinks().
+    Relative links are resolved with reference to the page's url, or its base URL if the page sets one.
+    Ignore invalid tags such as - `javascript: , whatsappp:, mailto:`, etc.
+    """
+    allLinks = []
+    if lxmlRoot is None:
+        return allLinks
+    try:
+        baseURL = url
+        baseElement = lxmlRoot.find('head/base[@href]')
+        if baseElement is not None:
+            baseURL = urljoin(url, baseElement.get('href').strip())
+        for element in lxmlRoot.iter('a'):
+            linkValue = element.get('href')
+            if linkValue is not None:
+                properLink = resolveLink(baseURL, linkValue)
+                if properLink is not None:
+                    allLinks.append(properLink)
     except Exception as e:
         logger.error("Error extracting all Links from html document: %s", e)
     return allLinks
@@ -112,7 +112,7 @@ class SessionHistory:
     ddl_url_table = str('create table if not exists URL_LIST' +
                         '(url TEXT, plugin varchar(100), pubdate DATE, rawsize long, datasize long)')
     ddl_pending_urls_table = str('create table if not exists pending_urls (url varchar(255) NOT NULL PRIMARY KEY,' +
-                                 ' plugin_name varchar(100), attempts integer)')
+                                 ' plugin_name varchar(100), attempts integer, last_attempt real)')
     ddl_failed_urls_table = str('create table if not exists FAILED_URLS' +
                                 '(url TEXT, plugin_name varchar(100), failedtime timestamp)')
     ddl_deleted_dups_table = """
@@ -180,10 +180,17 @@ class SessionHistory:
                 cur.execute(self.ddl_deleted_dups_table)
                 cur.execute(self.ddl_http_errors_table)
                 con.commit()
+                # the pending URLs table of older versions does not record when each URL was last attempted:
+                pendingColumns = [row[1] for row in cur.execute('PRAGMA table_info(pending_urls)').fetchall()]
+                if 'last_attempt' not in pendingColumns:
+                    cur.execute('ALTER TABLE pending_urls ADD COLUMN last_attempt real')
+                    con.commit()
                 # Add indexes for performance
                 cur.execute('CREATE INDEX IF NOT EXISTS idx_url_list_url ON URL_LIST(url)')
                 cur.execute('CREATE INDEX IF NOT EXISTS idx_pending_urls_url ON pending_urls(url)')
                 cur.execute('CREATE INDEX IF NOT EXISTS idx_pending_urls_plugin ON pending_urls(plugin_name)')
+                cur.execute('CREATE INDEX IF NOT EXISTS idx_pending_urls_attempts ' +
+                            'ON pending_urls(plugin_name, attempts)')
                 cur.execute('CREATE INDEX IF NOT EXISTS idx_failed_urls_url ON FAILED_URLS(url)')
                 cur.execute('CREATE INDEX IF NOT EXISTS idx_http_errors_url ON HTTP_ERRORS(url)')
                 con.commit()
@@ -471,6 +478,92 @@ class SessionHistory:
                 sqlCon.close()
             self.dbAccessSemaphore.release()
 
+    @retry_db_op()
+    def retrievePendingBatch(self, pluginName: str, batchSize: int, notAttemptedSince: float) -> list:
+        """
+        Retrieve the next batch of pending URLs to be fetched, the URLs attempted the least number of times
+        first and the oldest first among these. Each URL retrieved is marked as attempted now,
+        so it is not retrieved again while it is being fetched.
+
+        Args:
+            pluginName (str): Name of the plugin
+            batchSize (int): Maximum number of URLs to retrieve
+            notAttemptedSince (float): Only retrieve URLs not attempted since this time, i.e. during this run
+
+        Returns:
+            list: URLs to be fetched
+        """
+        sqlCon = None
+        urlList = []
+        try:
+            self.dbAccessSemaphore.acquire()
+            sqlCon = SessionHistory.openConnFromfile(self.dbFileName)
+            cur = sqlCon.cursor()
+            rows = cur.execute(
+                'SELECT rowid, url FROM pending_urls WHERE plugin_name = ? ' +
+                'AND (last_attempt IS NULL OR last_attempt < ?) ORDER BY attempts, rowid LIMIT ?',
+                (pluginName, notAttemptedSince, batchSize)).fetchall()
+            attemptTime = time.time()
+            cur.executemany('UPDATE pending_urls SET attempts = COALESCE(attempts, 0) + 1, last_attempt = ? ' +
+                            'WHERE rowid = ?', [(attemptTime, row[0]) for row in rows])
+            sqlCon.commit()
+            urlList = [row[1] for row in rows]
+        except Exception as e:
+            logger.error(f"Error retrieving batch of pending URLs: {e}")
+            raise e
+        finally:
+            if sqlCon:
+                sqlCon.close()
+            self.dbAccessSemaphore.release()
+        return urlList
+
+    @retry_db_op()
+    def evictPendingURLs(self, pluginName: str, maxAttempts: int = None, urlList: list = None) -> int:
+        """
+        Remove URLs from the pending table without fetching them, recording them as failed:
+        those attempted maxAttempts times or more, and those in the given list.
+
+        Returns:
+            int: Number of URLs removed
+        """
+        sqlCon = None
+        evictedCount = 0
+        try:
+            self.dbAccessSemaphore.acquire()
+            sqlCon = SessionHistory.openConnFromfile(self.dbFileName)
+            cur = sqlCon.cursor()
+            failTime = datetime.now()
+            if maxAttempts is not None:
+                cur.execute('INSERT INTO FAILED_URLS (url, plugin_name, failedtime) ' +
+                            'SELECT url, plugin_name, ? FROM pending_urls WHERE plugin_name = ? AND attempts >= ?',
+                            (failTime, pluginName, maxAttempts))
+                evictedCount += cur.execute('DELETE FROM pending_urls WHERE plugin_name = ? AND attempts >= ?',
+                                            (pluginName, maxAttempts)).rowcount
+            if urlList:
+                cur.executemany('INSERT INTO FAILED_URLS (url, plugin_name, failedtime) VALUES (?, ?, ?)',
+                                [(sURL, pluginName, failTime) for sURL in urlList])
+                evictedCount += cur.executemany('DELETE FROM pending_urls WHERE url = ? AND plugin_name = ?',
+                                                [(sURL, pluginName) for sURL in urlList]).rowcount
+            sqlCon.commit()
+        except Exception as e:
+            logger.error(f"Error evicting pending URLs: {e}")
+            raise e
+        finally:
+            if sqlCon:
+                sqlCon.close()
+            self.dbAccessSemaphore.release()
+        return evictedCount
+
+    def countPendingURLs(self, pluginName: str) -> int:
+        """Count the URLs in the pending table for the plugin."""
+        try:
+            with lite.connect(self.dbFileName, timeout=SessionHistory.db_connect_timeout) as con:
+                return con.execute('SELECT COUNT(*) FROM pending_urls WHERE plugin_name = ?',
+                                   (pluginName,)).fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error counting pending URLs: {e}")
+            return 0
+
     @retry_db_op()
     def addURLToFailedTable(self, fetchResult, pluginName: str, failTime: datetime):
         """Add URL to failed URLs table."""
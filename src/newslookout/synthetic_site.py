@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: synthetic_site.py                                                                            #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: Local synthetic news web-site server for load testing the application                         #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+"""
+ Provides:
+    SyntheticNewsSite: Local HTTP server that serves news web-sites shaped like the ones the plugins scrape.
+    SyntheticSiteAdapter: Transport adapter that routes every request of the application to the local server.
+
+ Requests are served under a path prefixed with the host name of the original site, for example:
+ https://www.ndtv.com/business/abc-1234567 is served at http://127.0.0.1:8899/www.ndtv.com/business/abc-1234567
+ Main pages, section pages and archive list pages contain links to articles, RSS feeds list the articles,
+ and article pages are templated from the plugins' saved HTML pages in the test-data directory.
+ Data archives are served for GDELT (the saved zip file) and for NSE/BSE (generated zip files).
+
+ To run a scrape against the local server, start it with:
+    python -m newslookout.synthetic_site --port 8899 --latency-ms 50 --error-rate 0.01 --throttle-rate 0.01
+ and set the following in the [operation] section of the configuration file:
+    network_mode = synthetic
+    synthetic_site_url = http://127.0.0.1:8899
+ The main URL and RSS feeds of a plugin may be pointed at specific pages of the server
+ in the [plugins] section, e.g.: mod_en_in_ndtv_rss_feeds = https://feeds.feedburner.com/synthetic?page=2
+"""
+
+# import standard python libraries:
+import argparse
+import bz2
+import io
+import logging
+import os
+import random
+import re
+import threading
+import time
+import zipfile
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# import web retrieval python libraries:
+from requests.adapters import HTTPAdapter
+
+##########
+
+# setup logging
+logger = logging.getLogger(__name__)
+
+# Shape of each web-site served, indexed by host name.
+# The article URL format takes the article ID, the fixture is the saved page used as template for articles.
+SITE_PROFILES = {
+    'economictimes.indiatimes.com': {
+        'articleURL': 'https://economictimes.indiatimes.com/industry/synthetic-news-{id}/articleshow/{id}.cms',
+        'articleRegex': r'articleshow/([0-9]+)\.cms',
+        'fixture': 'mod_en_in_ecotimes_73837853.html.bz2',
+        'fixtureID': '73837853'},
+    'www.ndtv.com': {
+        'articleURL': 'https://www.ndtv.com/business/synthetic-news-{id}',
+        'articleRegex': r'synthetic-news-([0-9]+)$',
+        'fixture': 'mod_en_in_ndtv_2373245.html.bz2',
+        'fixtureID': '2373245'},
+    'feeds.feedburner.com': {
+        'articleURL': 'https://www.ndtv.com/business/synthetic-news-{id}',
+        'articleRegex': r'synthetic-news-([0-9]+)$',
+        'fixture': None,
+        'fixtureID': None},
+    'www.business-standard.com': {
+        'articleURL': 'https://www.business-standard.com/article/companies/synthetic-news-{id}_1.html',
+        'articleRegex': r'synthetic-news-([0-9]+)_1\.html',
+        'fixture': 'mod_en_in_business_std_119011800410.html.bz2',
+        'fixtureID': '119011800410'},
+    'www.thehindu.com': {
+        'articleURL': 'https://www.thehindu.com/business/synthetic-news/article{id}.ece',
+        'articleRegex': r'synthetic-news/article([0-9]+)\.ece',
+        'fixture': 'mod_en_in_hindu_30713792.html.bz2',
+        'fixtureID': '30713792'},
+    'www.livemint.com': {
+        'articleURL': 'https://www.livemint.com/companies/news/synthetic-news-{id}.html',
+        'articleRegex': r'synthetic-news-([0-9]+)\.html',
+        'fixture': 'mod_en_in_livemint_11613646112891.html.bz2',
+        'fixtureID': '11613646112891'},
+    'www.moneycontrol.com': {
+        'articleURL': 'https://www.moneycontrol.com/news/business/synthetic-news-{id}.html',
+        'articleRegex': r'synthetic-news-([0-9]+)\.html',
+        'fixture': 'mod_en_in_moneycontrol_6541471.html.bz2',
+        'fixtureID': '6541471'},
+}
+
+GENERIC_ARTICLE_TEMPLATE = """<html><head><title>Synthetic news article {id}</title>
+<meta property="article:published_time" content="{date}T10:00:00+05:30"/>
+<script type="application/ld+json">{{"datePublished":"{date}T10:00:00+05:30"}}</script>
+</head><body><h1>Synthetic news article {id}</h1>
+<div class="article">{text}</div></body></html>"""
+
+GENERIC_ARTICLE_TEXT = ("<p>The company reported a steady increase in revenue for the quarter, driven by strong demand "
+                        "across its businesses. Analysts expect the growth to continue over the coming year as "
+                        "input costs ease and new capacity comes on stream.</p>") * 8
+
+
+class SyntheticNewsSite:
+    """ Local HTTP server serving synthetic news web-sites.
+
+    The knobs control the load the server can generate:
+     latency_ms: Delay in milliseconds before each response
+     error_rate: Fraction of requests answered with HTTP 500
+     throttle_rate: Fraction of requests answered with HTTP 429 (Too Many Requests)
+     articles_per_page: Number of article links on each list page and RSS feed
+     article_count: Total number of distinct articles on each site
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8899, fixture_dir: str = None,
+                 latency_ms: int = 0, error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 articles_per_page: int = 50, article_count: int = 10000, seed: int = 1):
+        self.host = host
+        self.port = port
+        self.fixture_dir = fixture_dir
+        self.latency_ms = max(0, latency_ms)
+        self.error_rate = min(max(error_rate, 0.0), 1.0)
+        self.throttle_rate = min(max(throttle_rate, 0.0), 1.0)
+        self.articles_per_page = max(1, articles_per_page)
+        self.article_count = max(1, article_count)
+        self.firstArticleID = 1000000
+        self.randomGen = random.Random(seed)
+        self._lock = threading.Lock()
+        self.templates = dict()
+        self.requestCount = 0
+        self.statusCounts = dict()
+        self.httpServer = None
+        self.serverThread = None
+
+    @property
+    def baseURL(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    def start(self):
+        """ Start serving requests in a background thread.
+        If port 0 was given, the port is assigned by the operating system.
+        """
+        self.httpServer = ThreadingHTTPServer((self.host, self.port), SyntheticSiteRequestHandler)
+        self.httpServer.daemon_threads = True
+        self.httpServer.site = self
+        self.port = self.httpServer.server_address[1]
+        self.serverThread = threading.Thread(target=self.httpServer.serve_forever,
+                                             name='SyntheticNewsSite',
+                                             daemon=True)
+        self.serverThread.start()
+        logger.info("Synthetic news site server started at: %s", self.baseURL)
+        return self
+
+    def stop(self):
+        """ Stop the server.
+        """
+        if self.httpServer is not None:
+            self.httpServer.shutdown()
+            self.httpServer.server_close()
+            self.httpServer = None
+        logger.info("Synthetic news site server stopped, statistics: %s", self.getStats())
+
+    def getStats(self) -> dict:
+        """ Get the count of requests served, by HTTP status code.
+        """
+        with self._lock:
+            return {'requests': self.requestCount, 'status': dict(self.statusCounts)}
+
+    def recordStatus(self, status_code: int):
+        with self._lock:
+            self.requestCount += 1
+            self.statusCounts[status_code] = self.statusCounts.get(status_code, 0) + 1
+
+    def pickFailureStatus(self) -> int:
+        """ Decide whether to fail this request, using the configured error and throttling rates.
+
+        :return: The HTTP status code to fail with, or None to serve the request.
+        """
+        with self._lock:
+            draw = self.randomGen.random()
+        if draw < self.throttle_rate:
+            return 429
+        if draw < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+    def getArticleIDsForPage(self, pageKey: str, pageNo: int) -> list:
+        """ Get the IDs of the articles linked from a list page.
+        Each page links to a different window of articles, so that following the links discovers more articles.
+
+        :param pageKey: The path of the page
+        :param pageNo: Page number, from the query parameter 'page'
+        :return: List of article IDs
+        """
+        offset = (sum(ord(c) for c in pageKey) * 7 + pageNo * self.articles_per_page) % self.article_count
+        return [self.firstArticleID + ((offset + i) % self.article_count) for i in range(self.articles_per_page)]
+
+    def getTemplate(self, profile: dict) -> str:
+        """ Get the article template for the site profile, read from the fixture file.
+        """
+        fixtureName = profile.get('fixture') if profile is not None else None
+        if fixtureName is None or self.fixture_dir is None:
+            return None
+        with self._lock:
+            if fixtureName not in self.templates:
+                try:
+                    with bz2.open(os.path.join(self.fixture_dir, fixtureName), 'rb') as fixtureFile:
+                        self.templates[fixtureName] = fixtureFile.read().decode('utf-8', errors='ignore')
+                except Exception as e:
+                    logger.error("Error reading fixture file %s for the synthetic site: %s", fixtureName, e)
+                    self.templates[fixtureName] = None
+            return self.templates[fixtureName]
+
+    @staticmethod
+    def getArticleURL(siteHost: str, articleID: int) -> str:
+        profile = SITE_PROFILES.get(siteHost)
+        if profile is None:
+            return f'https://{siteHost}/news/synthetic-news-{articleID}'
+        return profile['articleURL'].format(id=articleID)
+
+    def makeListPage(self, siteHost: str, pagePath: str, pageNo: int) -> bytes:
+        """ Make an HTML page listing the links to articles, e.g. main page, section or archive list.
+        """
+        links = [f'<li><a href="{SyntheticNewsSite.getArticleURL(siteHost, articleID)}">'
+                 f'Synthetic news {articleID}</a></li>'
+                 for articleID in self.getArticleIDsForPage(pagePath, pageNo)]
+        nextPage = f'<a href="https://{siteHost}{pagePath}?page={pageNo + 1}">Next page</a>'
+        htmlText = (f'<html><head><title>{siteHost} {pagePath}</title></head><body>'
+                    f'<ul>{"".join(links)}</ul>{nextPage}</body></html>')
+        return htmlText.encode('utf-8')
+
+    def makeRSSFeed(self, siteHost: str, pagePath: str, pageNo: int) -> bytes:
+        """ Make an RSS feed listing the articles.
+        """
+        if siteHost == 'feeds.feedburner.com':
+            siteHost = 'www.ndtv.com'
+        pubDate = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0530')
+        items = [f'<item><title>Synthetic news {articleID}</title>'
+                 f'<link>{SyntheticNewsSite.getArticleURL(siteHost, articleID)}</link>'
+                 f'<pubDate>{pubDate}</pubDate></item>'
+                 for articleID in self.getArticleIDsForPage(pagePath, pageNo)]
+        rssText = ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                   f'<title>{siteHost}</title><link>https://{siteHost}/</link>'
+                   f'{"".join(items)}</channel></rss>')
+        return rssText.encode('utf-8')
+
+    def makeArticlePage(self, siteHost: str, articleID: str) -> bytes:
+        """ Make an article page from the site's template, with the article ID substituted.
+        """
+        profile = SITE_PROFILES.get(siteHost)
+        template = self.getTemplate(profile)
+        if template is not None:
+            htmlText = template.replace(profile['fixtureID'], str(articleID))
+        else:
+            htmlText = GENERIC_ARTICLE_TEMPLATE.format(id=articleID,
+                                                       date=datetime.now().strftime('%Y-%m-%d'),
+                                                       text=GENERIC_ARTICLE_TEXT)
+        return htmlText.encode('utf-8')
+
+    def makeDataArchive(self, siteHost: str, pagePath: str) -> bytes:
+        """ Make the zip data archive for GDELT, NSE or BSE.
+        The GDELT archive is read from the fixture, NSE and BSE archives are generated.
+        """
+        fileName = pagePath.rsplit('/', 1)[-1]
+        if siteHost == 'data.gdeltproject.org' and self.fixture_dir is not None:
+            fixtureFile = os.path.join(self.fixture_dir, 'mod_in_gdelt_20210203.zip')
+            if os.path.isfile(fixtureFile):
+                with open(fixtureFile, 'rb') as fp:
+                    return fp.read()
+        dateSuffix = re.sub(r'[^0-9]', '', fileName) or '010121'
+        csvLines = ['SC_CODE,SC_NAME,SC_GROUP,OPEN,HIGH,LOW,CLOSE,LAST,NO_TRADES,ISIN_CODE']
+        for counter in range(self.articles_per_page):
+            price = 100 + counter
+            csvLines.append(f'{500000 + counter},SYNTHETIC{counter},A,{price},{price + 2},{price - 2},'
+                            f'{price + 1},{price + 1},{10 * counter},INE{counter:09d}')
+        csvData = '\n'.join(csvLines).encode('utf-8')
+        if siteHost == 'www.bseindia.com':
+            memberName = f'EQ_ISINCODE_{dateSuffix}.CSV'
+        else:
+            memberName = f'Pd{dateSuffix}.csv'
+        archiveBuffer = io.BytesIO()
+        with zipfile.ZipFile(archiveBuffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(memberName, csvData)
+        return archiveBuffer.getvalue()
+
+    def getResponse(self, requestPath: str) -> tuple:
+        """ Get the response for the requested path.
+
+        :param requestPath: Path of the request, starting with the host name of the original site
+        :return: Tuple of (HTTP status code, content type, body bytes)
+        """
+        splitPath = urlsplit(requestPath)
+        pathParts = splitPath.path.lstrip('/').split('/', 1)
+        siteHost = pathParts[0]
+        pagePath = '/' + (pathParts[1] if len(pathParts) > 1 else '')
+        try:
+            pageNo = int(parse_qs(splitPath.query).get('page', ['0'])[0])
+        except ValueError:
+            pageNo = 0
+        if not siteHost:
+            return 404, 'text/plain', b'Not Found'
+        profile = SITE_PROFILES.get(siteHost)
+        if pagePath.lower().endswith('.zip'):
+            return 200, 'application/zip', self.makeDataArchive(siteHost, pagePath)
+        if profile is not None:
+            articleMatch = re.search(profile['articleRegex'], pagePath)
+            if articleMatch is not None:
+                return 200, 'text/html; charset=utf-8', self.makeArticlePage(siteHost, articleMatch.group(1))
+        elif re.search(r'synthetic-news-([0-9]+)$', pagePath) is not None:
+            return 200, 'text/html; charset=utf-8', self.makeArticlePage(siteHost, pagePath.rsplit('-', 1)[-1])
+        if (siteHost == 'feeds.feedburner.com' or 'rss' in pagePath.lower()
+                or pagePath.lower().endswith('.xml')):
+            return 200, 'application/rss+xml; charset=utf-8', self.makeRSSFeed(siteHost, pagePath, pageNo)
+        return 200, 'text/html; charset=utf-8', self.makeListPage(siteHost, pagePath, pageNo)
+
+
+class SyntheticSiteRequestHandler(BaseHTTPRequestHandler):
+    """ Handles the HTTP requests made to the synthetic news site server.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        site = self.server.site
+        if site.latency_ms > 0:
+            time.sleep(site.latency_ms / 1000.0)
+        failureStatus = site.pickFailureStatus()
+        if failureStatus is not None:
+            statusCode, contentType, body = failureStatus, 'text/plain', b'Synthetic failure'
+        else:
+            statusCode, contentType, body = site.getResponse(self.path)
+        site.recordStatus(statusCode)
+        self.send_response(statusCode)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(body)))
+        if statusCode == 429:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("Synthetic site: " + format, *args)
+
+
+class SyntheticSiteAdapter(HTTPAdapter):
+    """ Transport adapter that routes every request to the synthetic news site server.
+    The URL of the response is set back to the original URL, so the plugins see the original site.
+    """
+
+    def __init__(self, synthetic_site_url: str, **kwargs):
+        self.synthetic_site_url = synthetic_site_url.rstrip('/')
+        super().__init__(**kwargs)
+
+    def getRoutedURL(self, url: str) -> str:
+        splitURL = urlsplit(url)
+        routedURL = f'{self.synthetic_site_url}/{splitURL.netloc}{splitURL.path}'
+        if splitURL.query:
+            routedURL = routedURL + '?' + splitURL.query
+        return routedURL
+
+    def send(self, request, **kwargs):
+        originalURL = request.url
+        routedRequest = request.copy()
+        routedRequest.url = self.getRoutedURL(originalURL)
+        kwargs['verify'] = False
+        response = super().send(routedRequest, **kwargs)
+        response.url = originalURL
+        response.request = request
+        return response
+
+
+def mountSyntheticSiteAdapter(session, synthetic_site_url: str):
+    """ Route all requests made by the session to the synthetic news site server.
+
+    :param session: The requests Session object
+    :param synthetic_site_url: Base URL of the synthetic news site server, e.g. http://127.0.0.1:8899
+    :return: The session object
+    """
+    adapter = SyntheticSiteAdapter(synthetic_site_url)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def main():
+    """ Run the synthetic news site server until interrupted.
+    """
+    parser = argparse.ArgumentParser(description='Local synthetic news web-site server for load testing NewsLookout')
+    parser.add_argument('--host', default='127.0.0.1', help='Host address to listen on')
+    parser.add_argument('--port', type=int, default=8899, help='Port number to listen on')
+    parser.add_argument('--fixture-dir', default='test-data', help='Directory with saved pages used as templates')
+    parser.add_argument('--latency-ms', type=int, default=0, help='Delay before each response, in milliseconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failed with HTTP 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests failed with HTTP 429')
+    parser.add_argument('--articles-per-page', type=int, default=50, help='Links on each list page and feed')
+    parser.add_argument('--article-count', type=int, default=10000, help='Distinct articles on each site')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for the random failures')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    site = SyntheticNewsSite(host=args.host, port=args.port, fixture_dir=args.fixture_dir,
+                             latency_ms=args.latency_ms, error_rate=args.error_rate,
+                             throttle_rate=args.throttle_rate, articles_per_page=args.articles_per_page,
+                             article_count=args.article_count, seed=args.seed).start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
+
+# # end of file ##
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# #########################################################################################################
+#                                                                                                         #
+# File name: url_filter.py                                                                                #
+# Application: The NewsLookout Web Scraping Application                                                   #
+# Date: 2021-06-23                                                                                        #
+# Purpose: Compiled filter for the URLs to be fetched by a plugin                                         #
+# Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com  #
+#                                                                                                         #
+#                                                                                                         #
+# Notice:                                                                                                 #
+# This software is intended for demonstration and educational purposes only. This software is             #
+# experimental and a work in progress. Under no circumstances should these files be used in               #
+# relation to any critical system(s). Use of these files is at your own risk.                             #
+#                                                                                                         #
+# Before using it for web scraping any website, always consult that website's terms of use.               #
+# Do not use this software to fetch any data from any website that has forbidden use of web               #
+# scraping or similar mechanisms, or violates its terms of use in any other way. The author is            #
+# not liable for such kind of inappropriate use of this software.                                         #
+#                                                                                                         #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,                     #
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR                #
+# PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE               #
+# FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR                    #
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER                  #
+# DEALINGS IN THE SOFTWARE.                                                                               #
+#                                                                                                         #
+# #########################################################################################################
+
+"""
+ Provides:
+    compileSubStringsPattern: Compile a list of sub-strings into a regular expression matching any of them.
+    URLFilter: Filter for the URLs to be fetched, compiled from a plugin's lists of URLs and URL sub-strings.
+
+ The URL filter is compiled once, when the plugin is configured, from its lists:
+    validURLStringsToCheck - URLs are kept only if these contain any of these sub-strings
+    invalidURLSubStrings   - URLs containing any of these sub-strings are removed
+    nonContentURLs         - URLs that are the same as any of these, ignoring query parameters, are removed
+    nonContentStrings      - URLs containing any of these sub-strings are removed
+ Each list of sub-strings is compiled into a single regular expression shaped like a trie of the sub-strings,
+ so all of them are searched for in one pass over the URL. The non-content URLs are kept in a set of their
+ network locations and paths, so each URL is looked up with a single split of the URL.
+"""
+
+# import standard python libraries:
+import logging
+import re
+from urllib.parse import urlsplit
+
+# import this project's python libraries:
+from newslookout.scraper_utils import getDomainOfHost
+
+##########
+
+logger = logging.getLogger(__name__)
+
+##########
+
+
+def compileSubStringsPattern(subStrings: list):
+    """ Compile the list of sub-strings into a regular expression that matches any of them.
+    The expression follows a trie of the sub-strings, so that the common prefixes are matched only once.
+
+    :param subStrings: List of the sub-strings, None values are ignored
+    :return: The compiled regular expression, or None if the list has no sub-strings.
+    """
+    trieRoot = dict()
+    for subString in set(subStrings):
+        if subString is None:
+            continue
+        trieNode = trieRoot
+        for character in subString:
+            trieNode = trieNode.setdefault(character, dict())
+        # an empty key marks the end of a sub-string:
+        trieNode[''] = None
+    if len(trieRoot) == 0:
+        return None
+
+    def nodeToPattern(trieNode: dict) -> str:
+        branches = [re.escape(character) + nodeToPattern(childNode)
+                    for character, childNode in sorted(trieNode.items()) if character != '']
+        if len(branches) == 0:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in trieNode:
+            # a sub-string ends at this node, the longer sub-strings continuing from it are optional:
+            pattern = '(?:' + pattern + ')?'
+        return pattern
+
+    return re.compile(nodeToPattern(trieRoot))
+
+
+class URLFilter:
+    """ Filter for the URLs to be fetched, compiled from a plugin's lists of URLs and URL sub-strings.
+    """
+
+    def __init__(self, validURLStringsToCheck: list = None, invalidURLSubStrings: list = None,
+                 nonContentURLs: list = None, nonContentStrings: list = None):
+        """ Compile the filter from the lists of URLs and sub-strings.
+        """
+        self.validPattern = compileSubStringsPattern(validURLStringsToCheck or [])
+        self.invalidPattern = compileSubStringsPattern(invalidURLSubStrings or [])
+        # invalid and non-content sub-strings are both removed, so these are searched for together:
+        self.excludedPattern = compileSubStringsPattern((invalidURLSubStrings or []) + (nonContentStrings or []))
+        self.nonContentKeys = set()
+        for nonContentURL in nonContentURLs or []:
+            try:
+                urlParts = urlsplit(nonContentURL)
+                if urlParts.hostname is None or getDomainOfHost(urlParts.hostname) is None:
+                    raise ValueError('Invalid host name')
+                self.nonContentKeys.add((urlParts.netloc, urlParts.path))
+            except Exception as e:
+                logger.warning(f"Ignoring invalid non-content URL {nonContentURL}: {e}")
+
+    @classmethod
+    def fromPlugin(cls, pluginInstance):
+        """ Compile the filter from the lists of URLs and sub-strings of the plugin.
+        """
+        return cls(validURLStringsToCheck=pluginInstance.validURLStringsToCheck,
+                   invalidURLSubStrings=pluginInstance.invalidURLSubStrings,
+                   nonContentURLs=pluginInstance.nonContentURLs,
+                   nonContentStrings=pluginInstance.nonContentStrings)
+
+    @staticmethod
+    def getURLString(urlItem):
+        """ Get the URL string of the item, which is either a string or a newspaper Article.
+        """
+        if isinstance(urlItem, str):
+            return urlItem
+        return getattr(urlItem, 'url', None)
+
+    def isValidURLString(self, url: str) -> bool:
+        """ Check whether the URL contains a valid sub-string, if any are given, and no invalid sub-string.
+        """
+        if self.validPattern is not None and (len(url) <= 9 or self.validPattern.search(url) is None):
+            return False
+        return self.invalidPattern is None or self.invalidPattern.search(url) is None
+
+    def isNonContentURL(self, url: str) -> bool:
+        """ Check whether the URL is the same as any of the non-content URLs, ignoring its query parameters.
+        URLs that cannot be parsed are also treated as non-content URLs.
+        """
+        try:
+            urlParts = urlsplit(url)
+            return (urlParts.netloc, urlParts.path) in self.nonContentKeys
+        except Exception as e:
+            logger.debug(f"While checking whether URL {url} is a non-content URL, got exception: {e}")
+        return True
+
+    def isContentURL(self, url: str) -> bool:
+        """ Check in a single pass whether the URL is valid and is not a non-content URL, so it is to be fetched.
+        """
+        if url is None or len(url) < 2:
+            return False
+        if self.validPattern is not None and (len(url) <= 9 or self.validPattern.search(url) is None):
+            return False
+        if self.excludedPattern is not None and self.excludedPattern.search(url) is not None:
+            return False
+        try:
+            urlParts = urlsplit(url)
+        except Exception as e:
+            logger.debug(f"While filtering URL {url}, got exception: {e}")
+            return False
+        if urlParts.hostname is None or getDomainOfHost(urlParts.hostname) is None:
+            return False
+        return (urlParts.netloc, urlParts.path) not in self.nonContentKeys
+
+    def filterInvalidURLs(self, urlList: list) -> list:
+        """ Keep only the URLs with valid sub-strings, and remove those with invalid sub-strings.
+
+        :param urlList: List of URL strings or newspaper Articles
+        :return: List of the URL strings retained
+        """
+        urlStrings = [self.getURLString(urlItem) for urlItem in urlList]
+        return [url for url in urlStrings if url is not None and self.isValidURLString(url)]
+
+    def filterContentURLs(self, urlList: list) -> list:
+        """ Remove the invalid and non-content URLs, and duplicates, from the list.
+
+        :param urlList: List of URL strings or newspaper Articles
+        :return: List of the unique URL strings to be fetched, in their original order
+        """
+        seenURLs = set()
+        contentURLs = []
+        for urlItem in urlList:
+            url = self.getURLString(urlItem)
+            if url is None or url in seenURLs:
+                continue
+            seenURLs.add(url)
+            if self.isContentURL(url):
+                contentURLs.append(url)
+        return contentURLs
+
+# # end of file ##
@@ -23,6 +23,20 @@
 #    DataProcessor                                                                                        #
 #        run                                                                                              #
 #                                                                                                         #
+#    DataProcPipeline                                                                                     #
+#        run                                                                                              #
+#                                                                                                         #
+#    DataProcAutoscaler                                                                                   #
+#        run                                                                                              #
+#                                                                                                         #
+#    ParseStage                                                                                           #
+#        submit                                                                                           #
+#        parse                                                                                            #
+#                                                                                                         #
+#    FetchScheduler                                                                                       #
+#        next_item                                                                                        #
+#        item_done                                                                                        #
+#                                                                                                         #
 #    ProgressWatcher                                                                                      #
 #        run                                                                                              #
 #                                                                                                         #
@@ -47,6 +61,9 @@
 
 
 import copy
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -54,6 +71,7 @@ import logging
 import threading
 import time
 import queue
+import random
 from datetime import datetime
 from typing import Optional
 
@@ -65,8 +83,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-from newslookout.data_structs import PluginTypes, QueueStatus
+from newslookout.data_structs import PluginTypes, QueueStatus, CancellationToken, ProgressCounters
 from newslookout import scraper_utils
+from newslookout.queue_journal import QueueJournal
 
 
 logger = logging.getLogger(__name__)
@@ -451,34 +470,46 @@ class DataProcessor(threading.Thread):
     Worker thread for asynchronous data processing.
 
     Reads saved articles/data and processes them via data processing plugins.
+    Items are processed back-to-back while the input queue has work, the thread blocks on the
+    queue when it is idle, and the queue status is refreshed on a separate timer.
 
     Attributes:
         dataProcPluginsMap (dict): Map of priorities to plugin objects
         sortedPriorityKeys (list): Sorted list of priorities
-        waitTimeSec (int): Time to wait between queue checks
+        statusRefreshInterval (int): Seconds between refreshes of the queue status
+        queueBlockTimeout (int): Seconds to block on the empty queue before re-checking the exit conditions
     """
 
     def __init__(self, dataProcPluginsMap: dict, sortedPriorityKeys: list,
-                 queue_manager, queue_status, daemon=False, target=None, name=None):
+                 queue_manager, queue_status, daemon=False, target=None, name=None, process_pool=None,
+                 pipeline=None):
         """
         Initialize the data processor.
 
         Args:
-            dataProcPluginsMap (dict): Map of priorities to plugin objects
-            sortedPriorityKeys (list): Sorted priorities
+            dataProcPluginsMap (dict): Map of plugin names (or priorities) to plugin objects
+            sortedPriorityKeys (list): Keys of the plugins map, sorted by the priority of the plugins
             queue_manager: Queue manager instance
             queue_status: Queue status tracker
             daemon (bool, optional): Whether this is a daemon thread
             target (callable, optional): Alternative method to run
             name (str, optional): Thread name
+            process_pool (DataProcessPool, optional): Pool of worker processes that run the plugins instead
+            pipeline (DataProcPipeline, optional): Runs the plugins in the order of their dependencies,
+             independent plugins concurrently; the plugins run one by one in priority order if not given
         """
         self.workerID = name
+        self.process_pool = process_pool
+        self.pipeline = pipeline
         self.dataProcPluginsMap = dataProcPluginsMap
         self.sortedPriorityKeys = sortedPriorityKeys
         self.queue_manager = queue_manager
         self.q_status = queue_status
-        self.waitTimeSec = 5
+        self.statusRefreshInterval = 5
         self.queueBlockTimeout = 2
+        self.itemsProcessed = 0
+        # set by the autoscaler to stop this thread after its current item, when the pool shrinks:
+        self.retire_event = threading.Event()
 
         logger.debug("Data processor %s initialized with plugins: %s",
                      self.workerID, self.dataProcPluginsMap)
@@ -486,21 +517,84 @@ class DataProcessor(threading.Thread):
 
     @staticmethod
     def processItem(queue_manager, itemInQueue, sortedPriorityKeys: list,
-                    dataProcPluginsMap: dict, workerID: str):
+                    dataProcPluginsMap: dict, workerID: str, pipeline=None):
         """
         Process a single item through all data processing plugins.
 
         Args:
             queue_manager: Queue manager instance
             itemInQueue: Item to process
-            sortedPriorityKeys (list): Sorted priorities
-            dataProcPluginsMap (dict): Map of priorities to plugins
+            sortedPriorityKeys (list): Keys of the plugins map, sorted by priority
+            dataProcPluginsMap (dict): Map of plugin names (or priorities) to plugins
             workerID (str): Worker identifier
+            pipeline (DataProcPipeline, optional): Pipeline that runs the plugins instead
         """
-        item_doc = None
         queue_manager.alreadyDataProcList.append(itemInQueue.URL)
         queue_manager.addToDataProcessedQueue(itemInQueue)
+        if pipeline is not None:
+            item_doc = pipeline.run(itemInQueue.URL, itemInQueue.savedDataFileName, workerID,
+                                    article=itemInQueue.article)
+        else:
+            item_doc = DataProcessor.runDataProcPlugins(itemInQueue.URL, itemInQueue.savedDataFileName,
+                                                        sortedPriorityKeys, dataProcPluginsMap, workerID,
+                                                        article=itemInQueue.article)
+        DataProcessor.saveProcessedDocument(queue_manager, itemInQueue, item_doc)
+
+    @staticmethod
+    def saveProcessedDocument(queue_manager, itemInQueue, item_doc):
+        """
+        Save the document once, after all data processing plugins have run on it.
+
+        The article carried in memory by the item is saved by its content plugin, so it goes
+        to the archive if that is enabled. A document loaded from its JSON file is written back to it.
+        A document marked as duplicate by the de-duplication plugin is not saved.
+
+        Args:
+            queue_manager: Queue manager instance
+            itemInQueue: Item that was processed
+            item_doc: Document returned by runDataProcPlugins()
+        """
+        if item_doc is None:
+            return
+        queue_manager.releaseDeferredArticle(itemInQueue)
+        try:
+            if item_doc.isDuplicate():
+                logger.debug(f"Not saving the duplicate article of URL {itemInQueue.URL}")
+            elif itemInQueue.article is not None:
+                itemInQueue.article = item_doc
+                contentPlugin = queue_manager.pluginNameToObjMap.get(itemInQueue.pluginName)
+                if contentPlugin is not None:
+                    contentPlugin.persistArticle(itemInQueue)
+            elif item_doc.getFileName():
+                item_doc.writeToJSON(item_doc.getFileName())
+        except Exception as e:
+            logger.error(f"Error saving processed document for URL {itemInQueue.URL}: {e}")
+        # release the document and html held by the item, now that they are saved:
+        itemInQueue.article = None
+        itemInQueue.rawHTML = None
+
+    @staticmethod
+    def runDataProcPlugins(itemURL: str, savedDataFileName: str, sortedPriorityKeys: list,
+                           dataProcPluginsMap: dict, workerID: str, article=None):
+        """
+        Run the document of an item through all data processing plugins.
+
+        The document is the parsed article carried in memory by the item, if available,
+        otherwise it is loaded from the saved data file. The plugins do not save the document,
+        it is saved once by the caller after all plugins have run.
 
+        Args:
+            itemURL (str): URL of the item
+            savedDataFileName (str): Name of the data file saved for the item
+            sortedPriorityKeys (list): Sorted priorities
+            dataProcPluginsMap (dict): Map of priorities to plugins
+            workerID (str): Worker identifier
+            article (NewsEvent): Parsed article carried by the item, if any
+
+        Returns:
+            NewsEvent: The processed document, None if it could not be loaded
+        """
+        item_doc = article
         for priorityVal in sortedPriorityKeys:
             thisPlugin = None
             try:
@@ -508,12 +602,12 @@ class DataProcessor(threading.Thread):
                 logger.debug(f'Processing data using plugin: {thisPlugin.pluginName}')
 
                 if item_doc is None:
-                    item_doc = thisPlugin.loadDocument(itemInQueue.savedDataFileName)
+                    item_doc = thisPlugin.loadDocument(savedDataFileName)
                     if item_doc is None:
                         logger.warning(
                             f"Data processor {workerID}: Could not load document from "
-                            f"'{itemInQueue.savedDataFileName}' (file missing or unreadable). "
-                            f"URL = {itemInQueue.URL} – skipping all data processing plugins."
+                            f"'{savedDataFileName}' (file missing or unreadable). "
+                            f"URL = {itemURL} – skipping all data processing plugins."
                         )
                         break  # Skip remaining plugins for this item
                     logger.debug(f'Loaded document for URL: {item_doc.getURL()}')
@@ -524,19 +618,28 @@ class DataProcessor(threading.Thread):
 
             except Exception as pluginError:
                 logger.error(f"Data processor {workerID} plugin {thisPlugin.pluginName} error: " +
-                             f"{pluginError}; file = {itemInQueue.savedDataFileName}, " +
-                             f"URL = {itemInQueue.URL}")
+                             f"{pluginError}; file = {savedDataFileName}, " +
+                             f"URL = {itemURL}")
+        return item_doc
 
     def run(self):
         """Main thread execution method for data processing."""
         itemInQueue = None
-        self.q_status.updateStatus()
-        check_interval = 5
-        last_check = time.time()
+        self.refreshStatus()
+        last_status_refresh = time.time()
 
         logger.info(f'Data processing thread {self.workerID} started')
 
-        while True:
+        while not self.queue_manager.shutdown_event.is_set():
+            if self.retire_event.is_set():
+                logger.info(f"Data processor {self.workerID}: Retired by the autoscaler - exiting")
+                break
+
+            # Refresh the queue status on its own timer, not after every item
+            if time.time() - last_status_refresh >= self.statusRefreshInterval:
+                self.refreshStatus()
+                last_status_refresh = time.time()
+
             # Exit if all content-fetching worker pairs are dead AND input queue is drained
             all_pairs_dead = not any(
                 p.is_alive() for p in self.queue_manager.worker_pairs.values()
@@ -546,19 +649,17 @@ class DataProcessor(threading.Thread):
                 break
 
             # Legacy condition kept as secondary guard
+            parse_stage = getattr(self.queue_manager, 'parseStage', None)
+            parse_pending = isinstance(parse_stage, ParseStage) and parse_stage.get_pending() > 0
             if not (self.q_status.isPluginStillFetchingoverNetwork or
-                    self.q_status.dataInputQsize > 0):
+                    self.q_status.dataInputQsize > 0 or
+                    not self.queue_manager.dataProcQueue.empty() or
+                    parse_pending):
                 logger.info(f"Data processor {self.workerID}: isPluginStillFetching=False and queue empty - exiting")
                 break
 
-            # Periodic shutdown check
-            if time.time() - last_check > check_interval:
-                if self.queue_manager.shutdown_event.is_set():
-                    logger.info(f"Data processor {self.workerID} stopping due to shutdown")
-                    break
-                last_check = time.time()
-
             try:
+                # Blocks only while the queue is empty, items are processed back-to-back otherwise
                 itemInQueue = self.queue_manager.fetchFromDataProcInputQ(
                     block=True,
                     timeout=self.queueBlockTimeout
@@ -566,18 +667,24 @@ class DataProcessor(threading.Thread):
 
                 if itemInQueue is not None and \
                         itemInQueue.URL not in self.queue_manager.alreadyDataProcList:
-                    DataProcessor.processItem(
-                        self.queue_manager,
-                        itemInQueue,
-                        self.sortedPriorityKeys,
-                        self.dataProcPluginsMap,
-                        self.workerID
-                    )
+                    if self.process_pool is not None:
+                        self.processItemInPool(itemInQueue)
+                    else:
+                        DataProcessor.processItem(
+                            self.queue_manager,
+                            itemInQueue,
+                            self.sortedPriorityKeys,
+                            self.dataProcPluginsMap,
+                            self.workerID,
+                            pipeline=self.pipeline
+                        )
                 else:
                     self.queue_manager.addToDataProcessedQueue(itemInQueue)
                     if itemInQueue is not None:
                         logger.debug('Data processor %s: Ignoring already processed file for URL %s',
                                      self.workerID, itemInQueue.URL)
+                self.queue_manager.ackDataProcItem(itemInQueue)
+                self.itemsProcessed += 1
 
             except queue.Empty:
                 logger.debug('Data processor %s: Queue empty, size = %s',
@@ -586,13 +693,437 @@ class DataProcessor(threading.Thread):
             except Exception as e:
                 logger.error(f"Data processor {self.workerID} error: {e}")
 
+        if self.queue_manager.shutdown_event.is_set():
+            logger.info(f"Data processor {self.workerID} stopping due to shutdown")
+        logger.info(f'Data processing thread {self.workerID} finished, items processed = {self.itemsProcessed}')
+
+    def processItemInPool(self, itemInQueue):
+        """
+        Hand over an item to the pool of worker processes and wait for its plugins to complete.
+        Only the data file name is sent, the worker process loads and saves the document itself,
+        so an article carried in memory by the item is saved before it is handed over.
+        The plugins that have to run in this process, given by the pipeline, are run afterwards
+        on the saved document, one item at a time.
+
+        Args:
+            itemInQueue: Item to process
+        """
+        self.queue_manager.alreadyDataProcList.append(itemInQueue.URL)
+        try:
+            if itemInQueue.article is not None:
+                DataProcessor.saveProcessedDocument(self.queue_manager, itemInQueue, itemInQueue.article)
+            self.process_pool.processItem(itemInQueue)
+            if self.pipeline is not None and self.pipeline.order:
+                with self.process_pool.mainProcessLock:
+                    item_doc = self.pipeline.run(itemInQueue.URL, itemInQueue.savedDataFileName, self.workerID)
+                    DataProcessor.saveProcessedDocument(self.queue_manager, itemInQueue, item_doc)
+        except Exception as e:
+            logger.error(f"Data processor {self.workerID}: Error in worker process for URL {itemInQueue.URL}: {e}")
+        self.queue_manager.addToDataProcessedQueue(itemInQueue)
+
+    def refreshStatus(self):
+        """Refresh the queue status used by the exit conditions of this thread."""
+        try:
+            self.q_status.updateStatus()
+        except Exception as statusCheckError:
+            logger.error("Data processor: Error checking plugin state: %s", statusCheckError)
+
+
+class DataProcAutoscaler(threading.Thread):
+    """
+    Grows and shrinks the pool of data processing threads with the depth of the data processing queue.
+
+    Every check interval, the number of threads needed is the queue depth divided by items_per_thread,
+    bounded by min_threads and max_threads. Threads are added as soon as they are needed, and one idle
+    thread is retired after the queue has needed fewer threads for scale_down_checks consecutive checks.
+    """
+
+    def __init__(self, queue_manager, create_worker, min_threads: int, max_threads: int,
+                 items_per_thread: int = 10, check_interval: float = 2.0, scale_down_checks: int = 3):
+        """
+        Initialize the autoscaler.
+
+        Args:
+            queue_manager: Queue manager, its dataProcessWorkerList holds the pool of threads
+            create_worker (callable): Creates a new data processing thread, given its index
+            min_threads (int): Minimum number of threads in the pool
+            max_threads (int): Maximum number of threads in the pool
+            items_per_thread (int): Queued items per thread before another thread is added
+            check_interval (float): Seconds between checks of the queue depth
+            scale_down_checks (int): Consecutive checks needing fewer threads before one is retired
+        """
+        super().__init__(name="DataProcAutoscaler", daemon=True)
+        self.queue_manager = queue_manager
+        self.create_worker = create_worker
+        self.min_threads = max(1, min_threads)
+        self.max_threads = max(self.min_threads, max_threads)
+        self.items_per_thread = max(1, items_per_thread)
+        self.check_interval = check_interval
+        self.scale_down_checks = scale_down_checks
+        self.belowTargetChecks = 0
+        self.workersCreated = 0
+        self.scaledUp = 0
+        self.scaledDown = 0
+        self.peakThreads = 0
+
+    def getActiveWorkers(self) -> list:
+        return [worker for worker in self.queue_manager.dataProcessWorkerList
+                if worker.is_alive() and not worker.retire_event.is_set()]
+
+    def getTargetThreads(self) -> int:
+        queueDepth = self.queue_manager.dataProcQueue.qsize()
+        neededThreads = -(-queueDepth // self.items_per_thread)
+        return min(self.max_threads, max(self.min_threads, neededThreads))
+
+    def check(self):
+        """Compare the threads in the pool with the number needed for the queue depth, and adjust the pool."""
+        activeWorkers = self.getActiveWorkers()
+        targetThreads = self.getTargetThreads()
+        if targetThreads > len(activeWorkers):
+            self.belowTargetChecks = 0
+            for i in range(targetThreads - len(activeWorkers)):
+                self.workersCreated += 1
+                worker = self.create_worker(self.workersCreated)
+                self.queue_manager.dataProcessWorkerList.append(worker)
+                worker.start()
+                self.scaledUp += 1
+            logger.info(f"Data processing autoscaler: added {targetThreads - len(activeWorkers)} threads, "
+                        f"queue depth = {self.queue_manager.dataProcQueue.qsize()}")
+        elif targetThreads < len(activeWorkers):
+            self.belowTargetChecks += 1
+            if self.belowTargetChecks >= self.scale_down_checks:
+                self.belowTargetChecks = 0
+                activeWorkers[-1].retire_event.set()
+                self.scaledDown += 1
+                logger.info(f"Data processing autoscaler: retiring thread {activeWorkers[-1].workerID}, "
+                            f"queue depth = {self.queue_manager.dataProcQueue.qsize()}")
+        else:
+            self.belowTargetChecks = 0
+        self.peakThreads = max(self.peakThreads, len(self.getActiveWorkers()))
+
+    def run(self):
+        """Adjust the pool until all its threads have exited, or the application shuts down."""
+        while not self.queue_manager.shutdown_event.wait(timeout=self.check_interval):
+            if not any(worker.is_alive() for worker in self.queue_manager.dataProcessWorkerList):
+                break
             try:
-                time.sleep(self.waitTimeSec)
-                self.q_status.updateStatus()
-            except Exception as statusCheckError:
-                logger.error("Data processor: Error checking plugin state: %s", statusCheckError)
+                self.check()
+            except Exception as e:
+                logger.error(f"Data processing autoscaler error: {e}")
+
+    def get_status(self) -> dict:
+        return {
+            'threads': len(self.getActiveWorkers()),
+            'min_threads': self.min_threads,
+            'max_threads': self.max_threads,
+            'peak_threads': self.peakThreads,
+            'scaled_up': self.scaledUp,
+            'scaled_down': self.scaledDown
+        }
+
+
+class DataProcPipeline:
+    """
+    Runs the data processing plugins on a document in the order of their dependencies.
+
+    A plugin lists the names of the plugins it needs to run after in its attribute dependsOnPlugins,
+    plugins that are not enabled are ignored. A plugin that does not declare this runs after all the plugins
+    of a lower priority, as before. Plugins whose dependencies have completed run concurrently on the same
+    document in a shared pool of threads, so independent plugins must update separate fields of the document.
+    """
+
+    def __init__(self, dataProcPluginsMap: dict, sortedPriorityKeys: list, max_parallel: int = 4):
+        """
+        Build the dependency graph of the plugins.
+
+        Args:
+            dataProcPluginsMap (dict): Map of plugin names to plugin objects
+            sortedPriorityKeys (list): Plugin names sorted by their priority
+            max_parallel (int): Maximum number of plugins running concurrently, over all documents
+        """
+        self.plugins = dataProcPluginsMap
+        self.order = list(sortedPriorityKeys)
+        self.dependencies = self.buildDependencies(dataProcPluginsMap, self.order)
+        self.order = self.sortByDependencies(self.dependencies, self.order)
+        if self.order is None:
+            logger.error("Cyclic dependencies between the data processing plugins, running them in priority order")
+            self.dependencies = {key: set(self.getLowerPriorityKeys(sortedPriorityKeys, key))
+                                 for key in sortedPriorityKeys}
+            self.order = list(sortedPriorityKeys)
+        self.executor = None
+        if max_parallel > 1 and max(len(stage) for stage in self.getStages() or [[]]) > 1:
+            self.executor = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix='DataProcPlugin')
+
+    @staticmethod
+    def getLowerPriorityKeys(sortedPriorityKeys: list, key) -> list:
+        """The keys of all the plugins before the given one in the priority order."""
+        return sortedPriorityKeys[:sortedPriorityKeys.index(key)]
+
+    @staticmethod
+    def buildDependencies(dataProcPluginsMap: dict, sortedPriorityKeys: list) -> dict:
+        """
+        Map each plugin to the set of enabled plugins it depends on.
+        Plugins without declared dependencies depend on all plugins of a lower priority.
+        """
+        namesToKeys = {getattr(plugin, 'pluginName', key): key for key, plugin in dataProcPluginsMap.items()}
+        dependencies = {}
+        for key in sortedPriorityKeys:
+            plugin = dataProcPluginsMap[key]
+            declared = getattr(plugin, 'dependsOnPlugins', None)
+            if declared is None:
+                thisPriority = getattr(plugin, 'executionPriority', None)
+                dependencies[key] = set(
+                    otherKey for otherKey in DataProcPipeline.getLowerPriorityKeys(sortedPriorityKeys, key)
+                    if getattr(dataProcPluginsMap[otherKey], 'executionPriority', None) != thisPriority
+                    or thisPriority is None)
+            else:
+                dependencies[key] = set(namesToKeys[name] for name in declared
+                                        if name in namesToKeys and namesToKeys[name] != key)
+        return dependencies
+
+    @staticmethod
+    def sortByDependencies(dependencies: dict, sortedPriorityKeys: list) -> Optional[list]:
+        """
+        Order the plugins so each runs after its dependencies, keeping the priority order otherwise.
+
+        Returns:
+            list: Keys of the plugins in the order to run them, None if the dependencies are cyclic
+        """
+        order = []
+        remaining = list(sortedPriorityKeys)
+        while remaining:
+            ready = [key for key in remaining if dependencies[key].issubset(order)]
+            if not ready:
+                return None
+            order.append(ready[0])
+            remaining.remove(ready[0])
+        return order
+
+    def getDependentKeys(self, keys: list) -> list:
+        """The given plugins and all the plugins that run after them, directly or through other plugins,
+        in the order to run them."""
+        dependentKeys = set(keys)
+        for key in self.order:
+            if self.dependencies[key] & dependentKeys:
+                dependentKeys.add(key)
+        return [key for key in self.order if key in dependentKeys]
+
+    def getStages(self) -> List[list]:
+        """Group the plugins into stages, the plugins of a stage only depend on those of the earlier stages."""
+        stages = []
+        completed = set()
+        remaining = list(self.order)
+        while remaining:
+            stage = [key for key in remaining if self.dependencies[key].issubset(completed)]
+            stages.append(stage)
+            completed.update(stage)
+            remaining = [key for key in remaining if key not in completed]
+        return stages
+
+    def runPlugin(self, key, item_doc, itemURL: str, savedDataFileName: str, workerID: str):
+        """Run one plugin on the document, logging its errors so the other plugins still run."""
+        thisPlugin = self.plugins[key]
+        try:
+            logger.debug(f'Processing data using plugin: {thisPlugin.pluginName}')
+            thisPlugin.processDataObj(item_doc)
+        except Exception as pluginError:
+            logger.error(f"Data processor {workerID} plugin {thisPlugin.pluginName} error: " +
+                         f"{pluginError}; file = {savedDataFileName}, " +
+                         f"URL = {itemURL}")
+
+    def run(self, itemURL: str, savedDataFileName: str, workerID: str, article=None):
+        """
+        Run the document of an item through all the plugins.
+
+        Args:
+            itemURL (str): URL of the item
+            savedDataFileName (str): Name of the data file saved for the item
+            workerID (str): Worker identifier
+            article (NewsEvent): Parsed article carried by the item, loaded from the data file if not given
+
+        Returns:
+            NewsEvent: The processed document, None if it could not be loaded
+        """
+        if not self.order:
+            return article
+        item_doc = article
+        if item_doc is None:
+            try:
+                item_doc = self.plugins[self.order[0]].loadDocument(savedDataFileName)
+            except Exception as e:
+                logger.error(f"Data processor {workerID}: Error loading document '{savedDataFileName}': {e}")
+            if item_doc is None:
+                logger.warning(f"Data processor {workerID}: Could not load document from "
+                               f"'{savedDataFileName}' (file missing or unreadable). "
+                               f"URL = {itemURL} – skipping all data processing plugins.")
+                return None
+        if self.executor is None:
+            for key in self.order:
+                self.runPlugin(key, item_doc, itemURL, savedDataFileName, workerID)
+            return item_doc
+        waitingOn = {key: set(self.dependencies[key]) for key in self.order}
+        running = {}
+        while waitingOn or running:
+            ready = [key for key in self.order if key in waitingOn and not waitingOn[key]]
+            for key in ready:
+                del waitingOn[key]
+            if len(ready) == 1 and not running:
+                # nothing to run alongside it, so run it in this thread
+                self.runPlugin(ready[0], item_doc, itemURL, savedDataFileName, workerID)
+                completed = ready
+            else:
+                for key in ready:
+                    running[self.executor.submit(self.runPlugin, key, item_doc, itemURL,
+                                                 savedDataFileName, workerID)] = key
+                done, notDone = wait(running.keys(), return_when=FIRST_COMPLETED)
+                completed = [running.pop(future) for future in done]
+            for key in completed:
+                for dependencies in waitingOn.values():
+                    dependencies.discard(key)
+        return item_doc
+
+    def getStatus(self) -> dict:
+        return {
+            'stages': [[getattr(self.plugins[key], 'pluginName', key) for key in stage] for stage in self.getStages()],
+            'parallel': self.executor is not None
+        }
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
 
-        logger.info(f'Data processing thread {self.workerID} finished')
+
+# data processing plugins loaded once by each worker process of a DataProcessPool:
+_processDataProcPluginsMap = {}
+_processSortedPriorityKeys = []
+_processDataProcPipeline = None
+
+
+def initDataProcessWorker(configFile: str, runDate, enabledPluginNames: dict):
+    """
+    Initialize a worker process of the DataProcessPool: read the configuration, then load and
+    configure the data processing plugins - including their models - once for the life of the process.
+
+    Args:
+        configFile (str): Configuration file of the application
+        runDate: Run date of the application
+        enabledPluginNames (dict): Names of the data processing plugins mapped to their priority
+    """
+    global _processDataProcPluginsMap, _processSortedPriorityKeys, _processDataProcPipeline
+    # imported here since the queue manager module imports this module:
+    from newslookout.config import ConfigManager
+    from newslookout.queue_manager import QueueManager
+    from newslookout.session_hist import SessionHistory
+    try:
+        app_config = ConfigManager(configFile, runDate)
+        sessionHistoryDB = SessionHistory(app_config.completed_urls_datafile, threading.Semaphore())
+        pluginsMap = QueueManager.loadPlugins(app_config.install_prefix,
+                                              app_config.plugins_dir,
+                                              app_config.plugins_contributed_dir,
+                                              enabledPluginNames)
+        _processDataProcPluginsMap = {}
+        for pluginName, plugin in pluginsMap.items():
+            plugin.config(app_config)
+            plugin.additionalConfig(sessionHistoryDB)
+            _processDataProcPluginsMap[pluginName] = plugin
+        _processSortedPriorityKeys = sorted(_processDataProcPluginsMap.keys(),
+                                            key=lambda name: (_processDataProcPluginsMap[name].executionPriority, name))
+        _processDataProcPipeline = DataProcPipeline(_processDataProcPluginsMap, _processSortedPriorityKeys,
+                                                    max_parallel=app_config.dataproc_parallel_plugins)
+        logger.info(f"Data processing worker process {os.getpid()} loaded plugins: {list(pluginsMap.keys())}")
+    except Exception as e:
+        logger.error(f"Error initializing data processing worker process {os.getpid()}: {e}")
+        # fail the pool, instead of failing each item later without the plugins:
+        raise
+
+
+def processItemInWorkerProcess(itemURL: str, savedDataFileName: str) -> tuple:
+    """
+    Run the data processing plugins loaded in this worker process on the document of one item,
+    the document is loaded from its data file and saved back to it here.
+
+    Returns:
+        tuple: (URL of the item, process ID of this worker process)
+    """
+    item_doc = _processDataProcPipeline.run(itemURL, savedDataFileName, f"process-{os.getpid()}")
+    if item_doc is not None and item_doc.getFileName() and not item_doc.isDuplicate():
+        item_doc.writeToJSON(item_doc.getFileName())
+    return itemURL, os.getpid()
+
+
+class DataProcessPool:
+    """
+    Pool of worker processes that run the data processing plugins, so that CPU-bound plugins
+    scale with the available cores instead of contending on the GIL with the fetch threads.
+
+    Each process loads the plugins and their models once. Items are handed over by reference, i.e. by their
+    URL and saved data file name, so the articles are not copied to and from the worker processes.
+    Plugins that compare an article with the other articles, like the de-duplication plugin, keep state
+    that has to be shared by all the items, so they are not loaded by the worker processes. The data processors
+    run these plugins in the application's process instead, holding mainProcessLock.
+    """
+
+    def __init__(self, configFile: str, runDate, enabledPluginNames: dict, num_processes: int = 0):
+        """
+        Initialize the pool.
+
+        Args:
+            configFile (str): Configuration file of the application, read again by each worker process
+            runDate: Run date of the application
+            enabledPluginNames (dict): Names of the data processing plugins run by the worker processes,
+             mapped to their priority
+            num_processes (int): Number of worker processes, 0 to use all CPU cores
+        """
+        self.configFile = configFile
+        self.runDate = runDate
+        self.enabledPluginNames = enabledPluginNames
+        self.num_processes = num_processes if num_processes > 0 else multiprocessing.cpu_count()
+        self.executor = None
+        # taken while running the plugins that run in the application's process, one item at a time:
+        self.mainProcessLock = threading.Lock()
+
+    def start(self):
+        """Start the worker processes.
+
+        Raises:
+            BrokenProcessPool: If a worker process could not load the plugins
+        """
+        logger.info(f"Starting {self.num_processes} data processing worker processes "
+                    f"for plugins: {list(self.enabledPluginNames.keys())}")
+        # worker processes are spawned, not forked, since the parent process is running many threads:
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=initDataProcessWorker,
+            initargs=(self.configFile, self.runDate, self.enabledPluginNames)
+        )
+        try:
+            # wait for the first worker process to load the plugins:
+            self.executor.submit(os.getpid).result()
+        except Exception:
+            self.shutdown()
+            raise
+
+    def processItem(self, itemInQueue) -> int:
+        """
+        Process an item in one of the worker processes and wait for it to complete.
+
+        Args:
+            itemInQueue: Item to process
+
+        Returns:
+            int: Process ID of the worker process that processed the item
+        """
+        future = self.executor.submit(processItemInWorkerProcess, itemInQueue.URL, itemInQueue.savedDataFileName)
+        itemURL, processID = future.result()
+        return processID
+
+    def shutdown(self):
+        """Stop the worker processes, cancelling items not yet started."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
 
 
 class WorkerPair:
@@ -601,8 +1132,9 @@ class WorkerPair:
 
     This class ensures proper lifecycle management:
     - URL worker starts immediately, times out after configured seconds
-    - Content worker monitors URL worker status
-    - Content worker terminates when queue is empty AND URL worker is done
+    - Content workers monitor URL worker status, a pool of them may consume the plugin's URL queue
+    - Content workers terminate when queue is empty AND URL worker is done
+    - Plugin is marked as stopped only when the last content worker of the pool exits
     """
 
     def __init__(self, plugin, session_history, queue_manager, worker_id: str):
@@ -623,7 +1155,13 @@ class WorkerPair:
 
         # Worker threads
         self.url_worker: Optional[URLDiscoveryWorker] = None
-        self.content_worker: Optional[ContentFetchWorker] = None
+        self.content_workers: List[ContentFetchWorker] = []
+        self.fetch_workers = 1
+        self.fetch_scheduler: Optional[FetchScheduler] = None
+
+        # Count of content workers in the pool that have not yet exited
+        self._fetch_pool_lock = threading.Lock()
+        self._active_fetch_workers = 0
 
         # Coordination flags
         self.url_discovery_complete = threading.Event()
@@ -635,15 +1173,27 @@ class WorkerPair:
 
         logger.info(f"WorkerPair {worker_id} created for plugin {self.plugin_name}")
 
-    def initialize(self, run_date: datetime, url_timeout: int = 600):
+    @property
+    def content_worker(self) -> Optional['ContentFetchWorker']:
+        """First content worker of the pool, kept for callers that expect a single content worker."""
+        return self.content_workers[0] if self.content_workers else None
+
+    def initialize(self, run_date: datetime, url_timeout: int = 600, fetch_workers: int = 1,
+                   fetch_scheduler: Optional['FetchScheduler'] = None):
         """
-        Initialize both workers in the pair.
+        Initialize the URL worker and the pool of content workers.
 
         Args:
             run_date: Date for scraping
             url_timeout: Maximum seconds for URL discovery
+            fetch_workers: Number of content workers consuming the plugin's URL queue
+            fetch_scheduler: Global fetch scheduler, if given it fetches the URLs instead of this pair's own workers
         """
         self.url_discovery_timeout = url_timeout
+        self.fetch_scheduler = fetch_scheduler
+        self.fetch_workers = 0 if fetch_scheduler is not None else max(1, fetch_workers)
+        if fetch_scheduler is not None:
+            fetch_scheduler.register_plugin(self.plugin, self.url_discovery_complete)
 
         # Create URL discovery worker
         self.url_worker = URLDiscoveryWorker(
@@ -656,29 +1206,63 @@ class WorkerPair:
             name=f"URL-{self.worker_id}"
         )
 
-        # Create content fetch worker
-        self.content_worker = ContentFetchWorker(
-            self.plugin,
-            self.session_history,
-            self.queue_manager,
-            self.url_discovery_complete,
-            name=f"Fetch-{self.worker_id}"
-        )
-
-        logger.info(f"WorkerPair {self.worker_id} initialized with {url_timeout}s URL timeout")
+        # Create the pool of content fetch workers
+        self.content_workers = []
+        for pool_index in range(self.fetch_workers):
+            self.content_workers.append(ContentFetchWorker(
+                self.plugin,
+                self.session_history,
+                self.queue_manager,
+                self.url_discovery_complete,
+                name=f"Fetch-{self.worker_id}-{pool_index + 1}",
+                worker_pair=self,
+                pool_index=pool_index if self.fetch_workers > 1 else None
+            ))
+
+        logger.info(f"WorkerPair {self.worker_id} initialized with {url_timeout}s URL timeout"
+                    f" and {self.fetch_workers} content worker(s)")
 
     def start(self):
-        """Start both workers in the pair."""
-        if not self.url_worker or not self.content_worker:
+        """Start the URL worker and all the content workers."""
+        if not self.url_worker or (not self.content_workers and self.fetch_scheduler is None):
             raise RuntimeError("Workers not initialized. Call initialize() first.")
 
         logger.info(f"Starting WorkerPair {self.worker_id}")
 
+        with self._fetch_pool_lock:
+            self._active_fetch_workers = len(self.content_workers)
+
         # Start URL worker first
         self.url_worker.start()
 
-        # Start content worker (it will wait for URLs)
-        self.content_worker.start()
+        # Start content workers (they will wait for URLs)
+        for content_worker in self.content_workers:
+            content_worker.start()
+
+    def get_active_fetch_workers(self) -> int:
+        """Get the number of content workers in the pool that have not yet exited."""
+        with self._fetch_pool_lock:
+            return self._active_fetch_workers
+
+    def fetch_worker_finished(self, pass_on_end_marker: bool = False) -> bool:
+        """
+        Record that one content worker of the pool has exited.
+
+        Only one end marker is added to the plugin's queue, so a worker that received it
+        puts it back for the workers of the pool that are still running.
+
+        Args:
+            pass_on_end_marker: Whether the exiting worker received the queue end marker
+
+        Returns:
+            bool: True if this was the last content worker of the pool
+        """
+        with self._fetch_pool_lock:
+            self._active_fetch_workers = max(0, self._active_fetch_workers - 1)
+            # put back while holding the lock, so no other worker exits in between and leaves it in the queue:
+            if pass_on_end_marker and self._active_fetch_workers > 0:
+                self.plugin.putIntoURLQueue(None)
+            return self._active_fetch_workers == 0
 
     def join(self, timeout: Optional[float] = None):
         """
@@ -690,26 +1274,39 @@ class WorkerPair:
         if self.url_worker:
             self.url_worker.join(timeout=timeout)
 
-        if self.content_worker:
-            self.content_worker.join(timeout=timeout)
+        for content_worker in self.content_workers:
+            content_worker.join(timeout=timeout)
 
     def is_alive(self) -> bool:
         """Check if any worker in the pair is still running."""
         url_alive = self.url_worker.is_alive() if self.url_worker else False
-        content_alive = self.content_worker.is_alive() if self.content_worker else False
+        content_alive = any(w.is_alive() for w in self.content_workers)
+        if self.fetch_scheduler is not None:
+            content_alive = self.fetch_scheduler.is_plugin_active(self.plugin_name)
+        # responses of this plugin may still be waiting in the parse stage:
+        parse_stage = getattr(self.queue_manager, 'parseStage', None)
+        if isinstance(parse_stage, ParseStage) and parse_stage.get_pending(self.plugin_name) > 0:
+            content_alive = True
         return url_alive or content_alive
 
     def get_status(self) -> dict:
-        """Get status of both workers."""
+        """Get status of the URL worker and the pool of content workers."""
+        content_workers_alive = sum(1 for w in self.content_workers if w.is_alive())
+        if self.fetch_scheduler is not None and self.fetch_scheduler.is_plugin_active(self.plugin_name):
+            content_workers_alive = 1
         return {
             'worker_id': self.worker_id,
             'plugin': self.plugin_name,
             'url_worker_alive': self.url_worker.is_alive() if self.url_worker else False,
-            'content_worker_alive': self.content_worker.is_alive() if self.content_worker else False,
+            'content_worker_alive': content_workers_alive > 0,
+            'content_workers_alive': content_workers_alive,
+            'fetch_workers': self.fetch_workers,
             'url_discovery_complete': self.url_discovery_complete.is_set(),
             'queue_size': self.plugin.getQueueSize(),
             'total_urls': self.plugin.urlQueueTotalSize,
-            'processed_urls': self.plugin.urlProcessedCount if hasattr(self.plugin, 'urlProcessedCount') else 0
+            'processed_urls': self.plugin.urlProcessedCount if hasattr(self.plugin, 'urlProcessedCount') else 0,
+            'first_url_queued_sec': self.url_worker.get_first_url_delay() if self.url_worker else None,
+            'discovery_cancelled': self.url_worker.get_cancel_reason() if self.url_worker else None
         }
 
 
@@ -747,6 +1344,17 @@ class URLDiscoveryWorker(threading.Thread):
         self.run_date = run_date
         self.timeout = timeout
         self.start_time = None
+        # progress of draining the pending URLs, in the drain_pending run mode:
+        self.drain_stats = None
+        # URLs already handed to the fetch queue, as they were streamed by the discovery sources:
+        self.seen_urls = set()
+        self.stream_lock = threading.Lock()
+        self.stream_closed = False
+        self.streamed_count = 0
+        self.first_url_time = None
+        # cancelled when discovery times out, the discovery sources then return the URLs found so far:
+        self.cancel_token = None
+        self.cancel_grace_period = 10
 
         logger.debug(f"URLDiscoveryWorker {name} initialized")
 
@@ -762,6 +1370,18 @@ class URLDiscoveryWorker(threading.Thread):
                 logger.info(f"{self.name}: Shutdown detected before start")
                 return
 
+            if getattr(getattr(self.queue_manager, 'app_config', None), 'run_mode', None) == 'drain_pending':
+                self._drain_pending_urls()
+                if not self.queue_manager.shutdown_event.is_set():
+                    self.plugin.putQueueEndMarker()
+                return
+
+            if getattr(self.queue_manager, 'backfill', None) is not None:
+                self._discover_backfill_urls(self.queue_manager.backfill)
+                if not self.queue_manager.shutdown_event.is_set():
+                    self.plugin.putQueueEndMarker()
+                return
+
             # STEP 1: Retrieve pending URLs from database
             logger.info(f"{self.name}: Retrieving pending URLs from database...")
             pending_urls = []
@@ -773,7 +1393,8 @@ class URLDiscoveryWorker(threading.Thread):
                     # They should only be processed in dedicated content-only runs
                     # For now, log and skip to focus on new URL discovery
                     logger.warning(
-                        f"{self.name}: Skipping {len(pending_urls)} pending URLs - they will be processed in next run without URL discovery")
+                        f"{self.name}: Skipping {len(pending_urls)} pending URLs - fetch them in a run "
+                        f"without URL discovery, with run_mode = drain_pending or --drain-pending")
                     # DO NOT ADD: for url in pending_urls: self.plugin.urlQueue.put(url)
             except Exception as e:
                 logger.error(f"{self.name}: Error retrieving pending URLs: {e}")
@@ -782,18 +1403,10 @@ class URLDiscoveryWorker(threading.Thread):
             urls = self._discover_urls_with_timeout()
 
             if urls and not self.queue_manager.shutdown_event.is_set():
-                # Add URLs to plugin queue
-                logger.info(f"{self.name}: Adding {len(urls)} newly discovered URLs to queue")
-
-                # Queue DB operation for pending URLs
-                self.queue_manager.queueDBOperation(
-                    'add_pending',
-                    (urls, self.plugin_name),
-                    wait_for_result=False
-                )
-
-                # Add to plugin's fetch queue
-                self.plugin.addURLsListToQueue(urls, self.session_history)
+                # Add the URLs not already streamed into the queue during discovery
+                queued_count = self._queue_discovered_urls(urls)
+                logger.info(f"{self.name}: Discovered {len(urls)} URLs, {self.streamed_count} were queued "
+                            f"during discovery and {queued_count} at its end")
 
             # Signal completion and add end marker
             if not self.queue_manager.shutdown_event.is_set():
@@ -816,6 +1429,172 @@ class URLDiscoveryWorker(threading.Thread):
             logger.info(f"{self.name}: URL discovery complete (elapsed: {elapsed:.1f}s)")
             self.completion_event.set()
 
+    def _drain_pending_urls(self):
+        """
+        Feed the URLs in the pending table to the content fetch workers instead of discovering new URLs,
+        in batches, the URLs attempted the fewest times and the oldest first. URLs attempted too many times,
+        and URLs that are not content URLs of this plugin, are recorded as failed without fetching them.
+        The queue is topped up as the fetch workers consume it, so the backlog is not held in memory.
+        """
+        app_config = self.queue_manager.app_config
+        batch_size = app_config.drain_pending_batch_size
+        self.drain_stats = {
+            'pending_at_start': self.session_history.countPendingURLs(self.plugin_name),
+            'evicted': 0,
+            'queued': 0,
+            'start_time': self.start_time
+        }
+        self.drain_stats['evicted'] = self.session_history.evictPendingURLs(
+            self.plugin_name, maxAttempts=app_config.drain_pending_max_attempts)
+        logger.info(f"{self.name}: Draining {self.drain_stats['pending_at_start']} pending URLs, "
+                    f"evicted {self.drain_stats['evicted']} URLs attempted "
+                    f"{app_config.drain_pending_max_attempts} times or more")
+        while not self.queue_manager.shutdown_event.is_set():
+            # wait for the fetch workers to consume the URLs queued earlier
+            while self.plugin.getQueueSize() > batch_size and \
+                    not self.queue_manager.shutdown_event.wait(timeout=0.5):
+                pass
+            pending_urls = self.session_history.retrievePendingBatch(self.plugin_name, batch_size, self.start_time)
+            if not pending_urls:
+                break
+            content_urls = self.plugin.filterNonContentURLs(pending_urls)
+            non_content_urls = list(set(pending_urls) - set(content_urls))
+            if non_content_urls:
+                self.drain_stats['evicted'] += self.session_history.evictPendingURLs(
+                    self.plugin_name, urlList=non_content_urls)
+            self.drain_stats['queued'] += self.plugin.queueURLs(content_urls)
+        logger.info(f"{self.name}: Queued {self.drain_stats['queued']} pending URLs for fetching, "
+                    f"evicted {self.drain_stats['evicted']}")
+
+    def _queue_discovered_urls(self, urls: list, streamed: bool = False) -> int:
+        """
+        Put the discovered URLs into the plugin's fetch queue, skipping those already queued in this run.
+        This is also the callback through which the plugin's discovery sources stream the URLs as they find them,
+        until discovery completes or times out.
+
+        Args:
+            urls: Discovered URLs
+            streamed: True if the URLs were streamed by a discovery source while discovery is running
+
+        Returns:
+            int: Number of new URLs handed to the queue
+        """
+        with self.stream_lock:
+            if streamed and self.stream_closed:
+                return 0
+            new_urls = [url for url in scraper_utils.deDupeList(urls) if url not in self.seen_urls]
+            if not new_urls or self.queue_manager.shutdown_event.is_set():
+                return 0
+            self.seen_urls.update(new_urls)
+            if streamed:
+                self.streamed_count += len(new_urls)
+            # Queue DB operation for pending URLs
+            self.queue_manager.queueDBOperation(
+                'add_pending',
+                (new_urls, self.plugin_name),
+                wait_for_result=False
+            )
+            # Add to plugin's fetch queue
+            self.plugin.addURLsListToQueue(new_urls, self.session_history)
+            if self.first_url_time is None and self.plugin.urlQueueTotalSize > 0:
+                self.first_url_time = time.time()
+                logger.info(f"{self.name}: First URLs queued {self.first_url_time - self.start_time:.1f}s "
+                            f"after discovery started")
+            return len(new_urls)
+
+    def get_first_url_delay(self) -> Optional[float]:
+        """Get the seconds from the start of URL discovery until the first URL was queued for fetching."""
+        if self.first_url_time is None or self.start_time is None:
+            return None
+        return round(self.first_url_time - self.start_time, 2)
+
+    def get_cancel_reason(self) -> Optional[str]:
+        """Get the reason URL discovery was cancelled, e.g. timeout or shutdown, None if it was not cancelled."""
+        if self.cancel_token is None or not self.cancel_token.is_set():
+            return None
+        return self.cancel_token.reason
+
+    def _discover_backfill_urls(self, backfill):
+        """
+        Discover the URLs of each date of the backfill, with a few dates discovered concurrently.
+        The URLs of each date are queued as soon as that date is discovered, so they are fetched
+        while the other dates are still being discovered. The timeout applies to each batch of dates.
+        The plugin's getURLsListForDate() runs concurrently for these dates, so it must keep the state
+        of each date in local variables.
+        """
+        if not hasattr(self.plugin, 'getURLsListForDate'):
+            logger.warning(f"{self.name}: Plugin does not support URL discovery")
+            return
+        queue_lock = threading.Lock()
+        self.cancel_token = CancellationToken(parent=self.queue_manager.shutdown_event)
+        self.plugin.discoveryCancelToken = self.cancel_token
+
+        def discover_date(run_date: datetime) -> int:
+            backfill.startDate(run_date)
+            urls = []
+            try:
+                urls = self.plugin.getURLsListForDate(run_date, self.session_history) or []
+            finally:
+                new_urls = backfill.recordDiscovered(run_date, self.plugin_name, urls)
+            if new_urls and not self.queue_manager.shutdown_event.is_set():
+                self.queue_manager.queueDBOperation('add_pending', (new_urls, self.plugin_name),
+                                                    wait_for_result=False)
+                with queue_lock:
+                    self.plugin.addURLsListToQueue(new_urls, self.session_history)
+            return len(new_urls)
+
+        timeout = self.timeout * -(-len(backfill.runDates) // backfill.parallelDates)
+        executor = ThreadPoolExecutor(max_workers=backfill.parallelDates,
+                                      thread_name_prefix=f"{self.plugin_name}-backfill")
+        futures = {executor.submit(discover_date, run_date): run_date for run_date in backfill.runDates}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run_date = futures[future].strftime('%Y-%m-%d')
+                    if future.exception() is not None:
+                        logger.error(f"{self.name}: Error discovering URLs for {run_date}: {future.exception()}")
+                    else:
+                        logger.info(f"{self.name}: Queued {future.result()} new URLs for {run_date}")
+                if self.queue_manager.shutdown_event.is_set():
+                    logger.warning(f"{self.name}: Shutdown during backfill URL discovery")
+                    self.cancel_token.cancel('shutdown')
+                    break
+                if time.time() - self.start_time >= timeout:
+                    logger.warning(f"{self.name}: Backfill URL discovery timeout reached ({timeout}s), "
+                                   f"{len(pending)} dates not discovered")
+                    self.cancel_token.cancel('timeout')
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            if pending:
+                # the dates being discovered return their URLs found so far once the token is cancelled:
+                wait(pending, timeout=self.cancel_grace_period)
+                if any(not future.done() for future in pending):
+                    logger.error(f"{self.name}: Backfill discovery threads did not stop within "
+                                 f"{self.cancel_grace_period}s of being cancelled")
+            self.plugin.discoveryCancelToken = None
+
+    def get_drain_status(self) -> Optional[dict]:
+        """Get the progress of draining the pending URLs, with the rate of fetching and evicting them."""
+        if self.drain_stats is None:
+            return None
+        elapsed = max(time.time() - self.drain_stats['start_time'], 1e-6)
+        pending_now = self.session_history.countPendingURLs(self.plugin_name)
+        removed = self.drain_stats['pending_at_start'] - pending_now
+        fetched = self.plugin.urlProcessedCount if hasattr(self.plugin, 'urlProcessedCount') else None
+        return {
+            'pending_at_start': self.drain_stats['pending_at_start'],
+            'pending_now': pending_now,
+            'queued': self.drain_stats['queued'],
+            'evicted': self.drain_stats['evicted'],
+            'fetched': fetched,
+            'fetched_per_sec': round(fetched / elapsed, 2) if fetched is not None else None,
+            'removed_per_sec': round(removed / elapsed, 2),
+            'elapsed_sec': round(elapsed, 1)
+        }
+
     def _discover_urls_with_timeout(self) -> list:
         """
         Discover URLs with timeout checking.
@@ -839,10 +1618,18 @@ class URLDiscoveryWorker(threading.Thread):
             discovered_urls = []
             discovery_error = [None]  # List to allow modification in nested function
 
+            # the discovery sources stop their network fetches and loops once this token is cancelled
+            cancel_token = CancellationToken(parent=self.queue_manager.shutdown_event)
+            self.cancel_token = cancel_token
+
             def discover():
                 try:
                     logger.info(f"{self.name}: Starting URL discovery call...")
                     start_time = time.time()
+                    self.plugin.discoveryCancelToken = cancel_token
+                    # the URLs found by each discovery source are queued straight away
+                    self.plugin.urlDiscoveryCallback = lambda found_urls: self._queue_discovered_urls(
+                        found_urls, streamed=True)
                     result = self.plugin.getURLsListForDate(
                         self.run_date,
                         self.session_history
@@ -855,6 +1642,9 @@ class URLDiscoveryWorker(threading.Thread):
                 except Exception as e:
                     discovery_error[0] = e
                 finally:
+                    self.plugin.urlDiscoveryCallback = None
+                    if self.plugin.discoveryCancelToken is cancel_token:
+                        self.plugin.discoveryCancelToken = None
                     discovery_complete.set()
 
             discovery_thread = threading.Thread(target=discover, daemon=True)
@@ -874,25 +1664,30 @@ class URLDiscoveryWorker(threading.Thread):
                 # Check for shutdown
                 if self.queue_manager.shutdown_event.is_set():
                     logger.warning(f"{self.name}: Shutdown during URL discovery")
-                    self.plugin.is_stopped = True
+                    cancel_token.cancel('shutdown')
                     break
 
                 # Check for timeout
                 if elapsed >= self.timeout:
                     logger.warning(f"{self.name}: URL discovery timeout reached ({self.timeout}s)")
-                    logger.warning(f"{self.name}: Forcing discovery complete with {len(discovered_urls)} URLs found")
-                    self.plugin.is_stopped = True
+                    logger.warning(f"{self.name}: Cancelling discovery with {self.streamed_count} URLs "
+                                   f"queued while it was running")
+                    cancel_token.cancel('timeout')
                     break
 
-            # CRITICAL: If thread is still running, give it 2 more seconds then force-stop
+            # Once cancelled, the in-flight fetches are aborted and the discovery sources return
+            # the URLs found so far, these are still queued
             if discovery_thread.is_alive():
-                logger.warning(f"{self.name}: Discovery thread still running, waiting 2 seconds...")
-                discovery_thread.join(timeout=2)
+                logger.warning(f"{self.name}: Waiting up to {self.cancel_grace_period}s for the cancelled "
+                               f"discovery thread to return its partial results...")
+                discovery_thread.join(timeout=self.cancel_grace_period)
                 if discovery_thread.is_alive():
-                    logger.error(f"{self.name}: Discovery thread did not stop, but continuing anyway")
+                    logger.error(f"{self.name}: Discovery thread did not stop within {self.cancel_grace_period}s "
+                                 f"of being cancelled, its remaining URLs are not queued")
 
-            # Wait a bit for thread to finish
-            discovery_thread.join(timeout=1)
+            # URLs found by a discovery thread that outlives the grace period are not queued after the end marker
+            with self.stream_lock:
+                self.stream_closed = True
 
             if discovery_error[0]:
                 logger.error(f"{self.name}: Discovery error: {discovery_error[0]}")
@@ -913,10 +1708,12 @@ class ContentFetchWorker(threading.Thread):
     - Monitors URL discovery worker status
     - Processes URLs as they arrive
     - Terminates when queue empty AND URL discovery complete
+    - Several workers of a pool may consume the same plugin's URL queue
     """
 
     def __init__(self, plugin, session_history, queue_manager,
-                 url_discovery_complete: threading.Event, name: str):
+                 url_discovery_complete: threading.Event, name: str,
+                 worker_pair: Optional[WorkerPair] = None, pool_index: Optional[int] = None):
         """
         Initialize content fetch worker.
 
@@ -926,14 +1723,18 @@ class ContentFetchWorker(threading.Thread):
             queue_manager: Queue manager
             url_discovery_complete: Event indicating URL discovery is done
             name: Thread name
+            worker_pair: WorkerPair owning the pool this worker belongs to, if any
+            pool_index: Index of this worker in the pool, when the pool has more than one worker
         """
         self.plugin = plugin
         self.plugin_name = type(plugin).__name__
-        super().__init__(name=self.plugin_name, daemon=True)
+        thread_name = self.plugin_name if pool_index is None else f"{self.plugin_name}-{pool_index + 1}"
+        super().__init__(name=thread_name, daemon=True)
 
         self.session_history = session_history
         self.queue_manager = queue_manager
         self.url_discovery_complete = url_discovery_complete
+        self.worker_pair = worker_pair
 
         self.queue_check_interval = 2  # Check queue every 2 seconds
         self.shutdown_check_interval = 1  # Check shutdown every second
@@ -946,6 +1747,7 @@ class ContentFetchWorker(threading.Thread):
 
         consecutive_empty_checks = 0
         max_empty_checks = 5  # Exit after 5 consecutive empty queue checks when discovery is done
+        received_end_marker = False
 
         try:
             while True:
@@ -961,6 +1763,7 @@ class ContentFetchWorker(threading.Thread):
                     # Check for sentinel
                     if url is None:
                         logger.info(f"{self.name}: Received queue end marker")
+                        received_end_marker = True
                         break
 
                     # Reset empty counter - we got a URL
@@ -994,8 +1797,9 @@ class ContentFetchWorker(threading.Thread):
             logger.error(f"{self.name}: Error during content fetching: {e}")
 
         finally:
-            # Update plugin state
-            self.plugin.pluginState = PluginTypes.STATE_STOPPED
+            # Update plugin state once the last worker of the pool has exited
+            if self.worker_pair is None or self.worker_pair.fetch_worker_finished(received_end_marker):
+                self.plugin.pluginState = PluginTypes.STATE_STOPPED
             queue_size = self.plugin.urlQueue.qsize()
             logger.info(f"{self.name}: Content fetching complete. Final queue size: {queue_size}")
 
@@ -1020,64 +1824,555 @@ class ContentFetchWorker(threading.Thread):
         Args:
             url: URL to fetch and process
         """
+        ContentFetchWorker.process_url(self.plugin, url, self.session_history, self.queue_manager,
+                                       self.name, self.url_discovery_complete)
+
+    @staticmethod
+    def process_url(plugin, url: str, session_history, queue_manager, worker_name: str,
+                    url_discovery_complete: threading.Event):
+        """
+        Fetch a single URL with the plugin and record the result.
+
+        This is shared by the per-plugin content workers and the workers of the global fetch scheduler.
+
+        Args:
+            plugin: Plugin instance that fetches the URL
+            url: URL to fetch and process
+            session_history: Database interface
+            queue_manager: Queue manager
+            worker_name: Name of the calling worker, for logging
+            url_discovery_complete: Event indicating URL discovery is done for this plugin
+        """
         try:
             # skip Check if already attempted
-            # if self.session_history.url_was_attempted(url, self.plugin_name):
-            #     logger.debug(f"{self.name}: URL already attempted: {url}")
+            # if session_history.url_was_attempted(url, type(plugin).__name__):
+            #     logger.debug(f"{worker_name}: URL already attempted: {url}")
             #     return
 
             # Fetch content
-            logger.debug(f"{self.name}: Fetching URL: {url}")
+            logger.debug(f"{worker_name}: Fetching URL: {url}")
             # Diagnostic logging every 50 URLs
-            self.plugin.urlProcessedCount = getattr(self.plugin, 'urlProcessedCount', 0) + 1
-            if self.plugin.urlProcessedCount % 50 == 0:
-                queue_remaining = self.plugin.urlQueue.qsize()
-                logger.info(f"{self.name}: Processed {self.plugin.urlProcessedCount} URLs, "
+            processed_count = plugin.incrementProcessedCount()
+            if processed_count % 50 == 0:
+                queue_remaining = plugin.urlQueue.qsize()
+                logger.info(f"{worker_name}: Processed {processed_count} URLs, "
                             f"{queue_remaining} remaining in queue, "
-                            f"Discovery complete: {self.url_discovery_complete.is_set()}")
-            fetch_result = self.plugin.fetchDataFromURL(url, self.name)
+                            f"Discovery complete: {url_discovery_complete.is_set()}")
+            parse_stage = getattr(queue_manager, 'parseStage', None)
+            if isinstance(parse_stage, ParseStage) and parse_stage.supports_plugin(plugin):
+                # download only, the raw data is parsed by the separate parse stage:
+                fetch_result, html_content = plugin.fetchRawDataForURL(url, worker_name)
+                if html_content is not None:
+                    parse_stage.submit(plugin, url, html_content, fetch_result, worker_name)
+                    return
+            else:
+                fetch_result = plugin.fetchDataFromURL(url, worker_name)
+            ContentFetchWorker.handle_fetch_result(plugin, url, fetch_result, session_history,
+                                                   queue_manager, worker_name)
+
+        except Exception as e:
+            logger.error(f"{worker_name}: Error processing URL {url}: {e}")
+            ContentFetchWorker.ack_url(plugin, url, queue_manager)
 
+    @staticmethod
+    def ack_url(plugin, url: str, queue_manager):
+        """Acknowledge in the queue journal, if enabled, that the plugin has finished fetching the URL."""
+        queue_journal = getattr(queue_manager, 'queueJournal', None)
+        if isinstance(queue_journal, QueueJournal):
+            queue_journal.ack(QueueJournal.urlQueueName(plugin.pluginName), url)
+
+    @staticmethod
+    def handle_fetch_result(plugin, url: str, fetch_result, session_history, queue_manager, worker_name: str):
+        """
+        Record the result of fetching a URL: queue it for data processing, or note the failure.
+
+        Args:
+            plugin: Plugin instance that fetched the URL
+            url: URL that was fetched
+            fetch_result: ExecutionResult returned by the plugin
+            session_history: Database interface
+            queue_manager: Queue manager
+            worker_name: Name of the calling worker, for logging
+        """
+        plugin_name = type(plugin).__name__
+        try:
             if fetch_result:
                 # Handle HTTP errors
                 if hasattr(fetch_result, 'http_error') and fetch_result.http_error:
                     if fetch_result.http_error.is_permanent:
-                        self.session_history.addHTTPError(
+                        session_history.addHTTPError(
                             url,
-                            self.plugin_name,
+                            plugin_name,
                             fetch_result.http_error.status_code,
                             fetch_result.http_error.message
                         )
-                        logger.info(f"{self.name}: HTTP {fetch_result.http_error.status_code}: {url}")
+                        logger.info(f"{worker_name}: HTTP {fetch_result.http_error.status_code}: {url}")
+                    queue_manager.progressCounters.increment(ProgressCounters.FETCH_FAILED, label=plugin_name)
                     return
 
                 # Handle successful fetch
                 if fetch_result.wasSuccessful:
-                    self.queue_manager.addToScrapeCompletedQueue(fetch_result)
+                    queue_manager.addToScrapeCompletedQueue(fetch_result)
 
                     # Handle additional links
                     if fetch_result.additionalLinks:
-                        filtered_urls = self.session_history.removeAlreadyFetchedURLs(
+                        filtered_urls = session_history.removeAlreadyFetchedURLs(
                             fetch_result.additionalLinks,
-                            self.plugin_name
+                            plugin_name
                         )
 
                         if filtered_urls:
-                            logger.debug(f"{self.name}: Adding {len(filtered_urls)} additional URLs")
-                            self.queue_manager.queueDBOperation(
+                            logger.debug(f"{worker_name}: Adding {len(filtered_urls)} additional URLs")
+                            queue_manager.queueDBOperation(
                                 'add_pending',
-                                (filtered_urls, self.plugin_name),
+                                (filtered_urls, plugin_name),
                                 wait_for_result=False
                             )
                 else:
                     # Failed fetch
-                    self.queue_manager.queueDBOperation(
+                    queue_manager.progressCounters.increment(ProgressCounters.FETCH_FAILED, label=plugin_name)
+                    queue_manager.queueDBOperation(
                         'add_failed',
-                        (url, self.plugin_name, datetime.now()),
+                        (url, plugin_name, datetime.now()),
                         wait_for_result=False
                     )
 
         except Exception as e:
-            logger.error(f"{self.name}: Error processing URL {url}: {e}")
+            logger.error(f"{worker_name}: Error processing URL {url}: {e}")
+        finally:
+            ContentFetchWorker.ack_url(plugin, url, queue_manager)
+
+
+# content plugins loaded once by each worker process of a ParseStage in processes mode:
+_processContentPluginsMap = {}
+
+
+def initParseWorkerProcess(configFile: str, runDate, enabledPluginNames: dict):
+    """
+    Initialize a worker process of the ParseStage: read the configuration, then load and configure
+    the content plugins once for the life of the process.
+
+    Args:
+        configFile (str): Configuration file of the application
+        runDate: Run date of the application
+        enabledPluginNames (dict): Names of the content plugins mapped to their priority
+    """
+    global _processContentPluginsMap
+    # imported here since the queue manager module imports this module:
+    from newslookout.config import ConfigManager
+    from newslookout.queue_manager import QueueManager
+    try:
+        app_config = ConfigManager(configFile, runDate)
+        pluginsMap = QueueManager.loadPlugins(app_config.install_prefix,
+                                              app_config.plugins_dir,
+                                              app_config.plugins_contributed_dir,
+                                              enabledPluginNames)
+        for pluginName, plugin in pluginsMap.items():
+            plugin.config(app_config)
+            plugin.initNetworkHelper()
+        _processContentPluginsMap = pluginsMap
+        logger.info(f"Parse worker process {os.getpid()} loaded plugins: {list(pluginsMap.keys())}")
+    except Exception as e:
+        logger.error(f"Error initializing parse worker process {os.getpid()}: {e}")
+
+
+def parseRawDataInWorkerProcess(pluginName: str, url: str, htmlContent: str, workerID: str) -> tuple:
+    """
+    Parse the raw data of a URL with the plugin loaded in this worker process.
+
+    Returns:
+        tuple: (parsed NewsEvent, list of additional links, cleaned HTML content)
+    """
+    return _processContentPluginsMap[pluginName].parseRawData(url, htmlContent, f"{workerID}-{os.getpid()}")
+
+
+class ParseStage:
+    """
+    Parse stage of the content pipeline, separate from the network fetch workers.
+
+    Features:
+    - Fetch workers only download, and push the raw responses into a bounded parse queue
+    - A pool of ParseWorker threads cleans and parses them, then saves the articles
+    - In processes mode, the CPU bound parsing runs in a pool of worker processes,
+      and only the saving of files remains in the parse threads of the main process
+    - A full parse queue blocks the fetch workers, so parsing backlogs do not grow without limit
+    """
+
+    def __init__(self, queue_manager, session_history, num_workers: int = 4, queue_size: int = 100,
+                 mode: str = 'threads', config_file: str = None, run_date=None, plugin_names: dict = None):
+        """
+        Initialize the parse stage.
+
+        Args:
+            queue_manager: Queue manager
+            session_history: Database interface
+            num_workers: Number of parse threads, and of worker processes in processes mode
+            queue_size: Maximum number of raw responses waiting in the parse queue
+            mode: threads or processes
+            config_file: Configuration file, read again by each worker process in processes mode
+            run_date: Run date of the application, for the worker processes
+            plugin_names: Names of the content plugins mapped to their priority, for the worker processes
+        """
+        self.queue_manager = queue_manager
+        self.session_history = session_history
+        self.num_workers = num_workers if num_workers > 0 else multiprocessing.cpu_count()
+        self.parseQueue = queue.Queue(maxsize=max(1, queue_size))
+        self.mode = mode
+        self.config_file = config_file
+        self.run_date = run_date
+        self.plugin_names = plugin_names if plugin_names is not None else {}
+        self.executor = None
+        self.workers: List[ParseWorker] = []
+        self.stop_event = threading.Event()
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, int] = {}
+        self.parsedCount = 0
+
+    @staticmethod
+    def supports_plugin(plugin) -> bool:
+        """Check if the plugin's fetching can be split into download and parse, i.e. it does not
+        override fetchDataFromURL() of the base plugin class."""
+        from newslookout.base_plugin import BasePlugin
+        return getattr(type(plugin), 'fetchDataFromURL', None) is BasePlugin.fetchDataFromURL
+
+    def start(self):
+        """Start the parse threads, and the worker processes in processes mode."""
+        if self.mode == 'processes':
+            # worker processes are spawned, not forked, since the parent process is running many threads:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=initParseWorkerProcess,
+                initargs=(self.config_file, self.run_date, self.plugin_names)
+            )
+        self.workers = [ParseWorker(self, name=f"Parse-{index + 1}") for index in range(self.num_workers)]
+        for worker in self.workers:
+            worker.start()
+        logger.info(f"Parse stage started with {self.num_workers} workers in {self.mode} mode, "
+                    f"queue size {self.parseQueue.maxsize}")
+
+    def submit(self, plugin, url: str, html_content: str, fetch_result, worker_name: str):
+        """
+        Push a downloaded response into the parse queue, blocking while the queue is full.
+
+        Args:
+            plugin: Plugin instance that downloaded the URL
+            url: URL that was downloaded
+            html_content: Raw HTML content of the URL
+            fetch_result: ExecutionResult returned by the plugin's download
+            worker_name: Name of the fetch worker, for logging
+        """
+        plugin_name = type(plugin).__name__
+        with self._lock:
+            self._pending[plugin_name] = self._pending.get(plugin_name, 0) + 1
+        while True:
+            try:
+                self.parseQueue.put((plugin, url, html_content, fetch_result), timeout=1)
+                return
+            except queue.Full:
+                if self.queue_manager.shutdown_event.is_set():
+                    logger.info(f"{worker_name}: Parse queue full at shutdown, dropping URL {url}")
+                    self.item_done(plugin_name)
+                    return
+
+    def item_done(self, plugin_name: str):
+        """Record that a submitted response has been parsed and its result recorded."""
+        with self._lock:
+            self._pending[plugin_name] = max(0, self._pending.get(plugin_name, 0) - 1)
+            self.parsedCount += 1
+
+    def get_pending(self, plugin_name: str = None) -> int:
+        """Get the number of responses submitted but not yet completely processed, for one or all plugins."""
+        with self._lock:
+            if plugin_name is not None:
+                return self._pending.get(plugin_name, 0)
+            return sum(self._pending.values())
+
+    def parse(self, plugin, url: str, html_content: str, worker_name: str) -> tuple:
+        """Parse the raw data in this thread, or in a worker process in processes mode."""
+        if self.executor is not None:
+            future = self.executor.submit(parseRawDataInWorkerProcess, type(plugin).__name__,
+                                          url, html_content, worker_name)
+            return future.result()
+        return plugin.parseRawData(url, html_content, worker_name)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Let the parse workers drain the queue, then stop them and the worker processes."""
+        self.stop_event.set()
+        for worker in self.workers:
+            worker.join(timeout=timeout)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def is_alive(self) -> bool:
+        """Check if any parse worker is still running."""
+        return any(w.is_alive() for w in self.workers)
+
+    def get_status(self) -> dict:
+        """Get status of the parse stage."""
+        return {
+            'mode': self.mode,
+            'workers': self.num_workers,
+            'workers_alive': sum(1 for w in self.workers if w.is_alive()),
+            'queue_size': self.parseQueue.qsize(),
+            'pending': self.get_pending(),
+            'parsed': self.parsedCount
+        }
+
+
+class ParseWorker(threading.Thread):
+    """
+    Worker thread of the parse stage, it parses downloaded responses of any plugin and saves the articles.
+    """
+
+    def __init__(self, parse_stage: ParseStage, name: str):
+        """
+        Initialize the parse worker.
+
+        Args:
+            parse_stage: The ParseStage owning this worker
+            name: Thread name
+        """
+        super().__init__(name=name, daemon=True)
+        self.parse_stage = parse_stage
+        self.queue_manager = parse_stage.queue_manager
+
+    def run(self):
+        """Main execution method."""
+        logger.info(f"{self.name}: Starting parsing")
+        # the queue is drained even after shutdown, so the articles already downloaded are saved:
+        while True:
+            try:
+                plugin, url, html_content, fetch_result = self.parse_stage.parseQueue.get(timeout=1)
+            except queue.Empty:
+                if self.parse_stage.stop_event.is_set() or self.queue_manager.shutdown_event.is_set():
+                    break
+                continue
+            plugin_name = type(plugin).__name__
+            try:
+                valid_data, additional_links, html_content = self.parse_stage.parse(
+                    plugin, url, html_content, self.name)
+                fetch_result = plugin.saveParsedData(url, valid_data, additional_links, html_content, fetch_result)
+            except Exception as e:
+                logger.info("%s: Ignoring URL %s due to: %s", plugin_name, url.encode('ascii', "ignore"), e)
+            try:
+                ContentFetchWorker.handle_fetch_result(plugin, url, fetch_result, self.parse_stage.session_history,
+                                                       self.queue_manager, self.name)
+            finally:
+                self.parse_stage.item_done(plugin_name)
+        logger.info(f"{self.name}: Parsing complete")
+
+
+class FetchScheduler:
+    """
+    Global fetch scheduler that shares one pool of fetch workers across all plugins.
+
+    Features:
+    - Owns a pool of FetchSchedulerWorker threads instead of per-plugin content workers
+    - Pulls URLs from the per-plugin queues, weighted by each plugin's backlog
+    - Skips plugins whose web domain is at its politeness limit, so idle capacity moves to other plugins
+    - Marks a plugin as stopped once its queue end marker is seen and none of its URLs are in flight
+    """
+
+    def __init__(self, queue_manager, session_history, num_workers: int = 8, rate_limiter=None):
+        """
+        Initialize the fetch scheduler.
+
+        Args:
+            queue_manager: Queue manager
+            session_history: Database interface
+            num_workers: Number of fetch workers shared by all plugins
+            rate_limiter: DomainRateLimiter used to skip plugins whose domain is busy
+        """
+        self.queue_manager = queue_manager
+        self.session_history = session_history
+        self.num_workers = max(1, num_workers)
+        self.rate_limiter = rate_limiter
+        self.workers: List[FetchSchedulerWorker] = []
+        self.idle_wait = 0.2
+
+        self._lock = threading.Lock()
+        self._plugins: Dict[str, dict] = {}
+
+    def register_plugin(self, plugin, url_discovery_complete: threading.Event):
+        """
+        Add a plugin whose URL queue is to be served by this scheduler.
+
+        Args:
+            plugin: Plugin instance
+            url_discovery_complete: Event indicating URL discovery is done for this plugin
+        """
+        plugin_name = type(plugin).__name__
+        with self._lock:
+            self._plugins[plugin_name] = {
+                'plugin': plugin,
+                'discovery_complete': url_discovery_complete,
+                'domain_url': plugin.mainURL if getattr(plugin, 'mainURL', None) else '',
+                'end_marker_seen': False,
+                'in_flight': 0,
+                'fetched': 0,
+                'done': False
+            }
+
+    def start(self):
+        """Start the pool of fetch workers."""
+        logger.info(f"Starting global fetch scheduler with {self.num_workers} workers "
+                    f"for {len(self._plugins)} plugins")
+        self.workers = [FetchSchedulerWorker(self, name=f"Fetch-Pool-{index + 1}")
+                        for index in range(self.num_workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for all the fetch workers to complete."""
+        for worker in self.workers:
+            worker.join(timeout=timeout)
+
+    def is_alive(self) -> bool:
+        """Check if any fetch worker of the pool is still running."""
+        return any(w.is_alive() for w in self.workers)
+
+    def is_plugin_active(self, plugin_name: str) -> bool:
+        """Check if the scheduler still has work for this plugin."""
+        with self._lock:
+            plugin_state = self._plugins.get(plugin_name)
+            return plugin_state is not None and not plugin_state['done'] and self.is_alive()
+
+    def all_done(self) -> bool:
+        """Check if the queues of all registered plugins have been completely processed."""
+        with self._lock:
+            return all(p['done'] for p in self._plugins.values())
+
+    def _get_backlog(self, plugin_state: dict) -> int:
+        """Get the number of URLs waiting in the plugin's queue."""
+        return plugin_state['plugin'].urlQueue.qsize()
+
+    def _check_plugin_done(self, plugin_name: str, plugin_state: dict):
+        """Mark the plugin as stopped if all of its URLs have been fetched. Called with the lock held."""
+        if plugin_state['done'] or plugin_state['in_flight'] > 0:
+            return
+        queue_ended = plugin_state['end_marker_seen'] or (
+            plugin_state['discovery_complete'].is_set() and plugin_state['plugin'].urlQueue.empty())
+        if queue_ended and plugin_state['plugin'].urlQueue.empty():
+            plugin_state['done'] = True
+            plugin_state['plugin'].pluginState = PluginTypes.STATE_STOPPED
+            logger.info(f"Fetch scheduler: completed {plugin_name}, fetched {plugin_state['fetched']} URLs")
+
+    def next_item(self) -> Optional[tuple]:
+        """
+        Pick the next URL to fetch, from the plugin with the most work whose domain can be requested now.
+
+        Returns:
+            tuple: (plugin, url), or None if no URL is ready to be fetched at the moment
+        """
+        with self._lock:
+            candidates = []
+            weights = []
+            for plugin_name, plugin_state in self._plugins.items():
+                if plugin_state['done']:
+                    continue
+                backlog = self._get_backlog(plugin_state)
+                if backlog == 0:
+                    self._check_plugin_done(plugin_name, plugin_state)
+                    continue
+                if (self.rate_limiter is not None and plugin_state['domain_url']
+                        and self.rate_limiter.getWaitTime(plugin_state['domain_url']) > 0):
+                    continue
+                candidates.append(plugin_name)
+                weights.append(backlog)
+            while candidates:
+                plugin_name = random.choices(candidates, weights=weights)[0]
+                plugin_state = self._plugins[plugin_name]
+                try:
+                    url = plugin_state['plugin'].urlQueue.get_nowait()
+                    plugin_state['plugin'].urlQueue.task_done()
+                except queue.Empty:
+                    url = None
+                if url is not None:
+                    plugin_state['in_flight'] += 1
+                    return plugin_state['plugin'], url
+                # the queue end marker, or an empty queue:
+                if plugin_state['plugin'].urlQueue.empty():
+                    plugin_state['end_marker_seen'] = True
+                    self._check_plugin_done(plugin_name, plugin_state)
+                index = candidates.index(plugin_name)
+                del candidates[index]
+                del weights[index]
+        return None
+
+    def item_done(self, plugin):
+        """Record that a URL picked by next_item() has been processed."""
+        plugin_name = type(plugin).__name__
+        with self._lock:
+            plugin_state = self._plugins[plugin_name]
+            plugin_state['in_flight'] -= 1
+            plugin_state['fetched'] += 1
+            self._check_plugin_done(plugin_name, plugin_state)
+
+    def get_discovery_event(self, plugin) -> threading.Event:
+        """Get the URL discovery completion event of the plugin."""
+        return self._plugins[type(plugin).__name__]['discovery_complete']
+
+    def get_status(self) -> dict:
+        """Get status of the scheduler and the work done for each plugin."""
+        with self._lock:
+            plugins_status = {
+                plugin_name: {
+                    'queue_size': self._get_backlog(plugin_state),
+                    'in_flight': plugin_state['in_flight'],
+                    'fetched': plugin_state['fetched'],
+                    'done': plugin_state['done']
+                }
+                for plugin_name, plugin_state in self._plugins.items()
+            }
+        return {
+            'workers': self.num_workers,
+            'workers_alive': sum(1 for w in self.workers if w.is_alive()),
+            'plugins': plugins_status
+        }
+
+
+class FetchSchedulerWorker(threading.Thread):
+    """
+    Worker thread of the global fetch scheduler, it fetches URLs of any plugin as picked by the scheduler.
+    """
+
+    def __init__(self, scheduler: FetchScheduler, name: str):
+        """
+        Initialize the fetch worker.
+
+        Args:
+            scheduler: The FetchScheduler owning this worker
+            name: Thread name
+        """
+        super().__init__(name=name, daemon=True)
+        self.scheduler = scheduler
+        self.queue_manager = scheduler.queue_manager
+
+    def run(self):
+        """Main execution method."""
+        logger.info(f"{self.name}: Starting content fetching for all plugins")
+        try:
+            while not self.queue_manager.shutdown_event.is_set():
+                item = self.scheduler.next_item()
+                if item is None:
+                    if self.scheduler.all_done():
+                        break
+                    # nothing can be fetched right now, wait for URLs or for the domain limits
+                    self.queue_manager.shutdown_event.wait(timeout=self.scheduler.idle_wait)
+                    continue
+                plugin, url = item
+                try:
+                    ContentFetchWorker.process_url(plugin, url, self.scheduler.session_history,
+                                                   self.queue_manager, self.name,
+                                                   self.scheduler.get_discovery_event(plugin))
+                finally:
+                    self.scheduler.item_done(plugin)
+        except Exception as e:
+            logger.error(f"{self.name}: Error during content fetching: {e}")
+        logger.info(f"{self.name}: Content fetching complete")
 
 
 class ProgressWatcher(threading.Thread):
@@ -1293,6 +2588,7 @@ class StatusAPIServer:
                 "endpoints": {
                     "/status": "Get detailed application status",
                     "/status/summary": "Get summary statistics",
+                    "/status/schedule": "Get the next run times of the plugins in daemon mode",
                     "/health": "Health check endpoint"
                 }
             }
@@ -1320,6 +2616,11 @@ class StatusAPIServer:
             """Get summary statistics."""
             return JSONResponse(content=self._get_summary_status())
 
+        @self.app.get("/status/schedule")
+        async def get_schedule():
+            """Get the schedule of the scrape cycles in daemon mode."""
+            return JSONResponse(content=self._get_schedule_status())
+
     def _get_comprehensive_status(self) -> Dict[str, Any]:
         """
         Generate comprehensive status report.
@@ -1340,9 +2641,22 @@ class StatusAPIServer:
             "database": self._get_database_status(),
             "performance": self._get_performance_metrics()
         }
+        if getattr(self.queue_manager, 'daemonScheduler', None) is not None:
+            status["schedule"] = self._get_schedule_status()
+        if getattr(self.queue_manager, 'backfill', None) is not None:
+            status["backfill"] = self.queue_manager.backfill.getStatus()
 
         return status
 
+    def _get_schedule_status(self) -> Dict[str, Any]:
+        """Generate the schedule status, with the next run time of each plugin in daemon mode."""
+        daemonScheduler = getattr(self.queue_manager, 'daemonScheduler', None)
+        if daemonScheduler is None:
+            return {"daemon": False}
+        schedule = daemonScheduler.getStatus()
+        schedule["daemon"] = True
+        return schedule
+
     def _get_summary_status(self) -> Dict[str, Any]:
         """Generate summary status."""
         q_status = self.queue_manager.q_status
@@ -1395,12 +2709,14 @@ class StatusAPIServer:
                     plugin_info['worker_pair'] = {
                         'url_discovery_complete': pair.url_discovery_complete.is_set(),
                         'url_worker_alive': pair.url_worker.is_alive() if pair.url_worker else False,
-                        'content_worker_alive': pair.content_worker.is_alive() if pair.content_worker else False
+                        'content_worker_alive': pair.get_status()['content_worker_alive'],
+                        'fetch_workers': pair.fetch_workers
                     }
 
                 plugins_status["content_plugins"].append(plugin_info)
 
             elif plugin.pluginType == PluginTypes.MODULE_DATA_PROCESSOR:
+                plugin_info['depends_on'] = getattr(plugin, 'dependsOnPlugins', None)
                 plugins_status["data_processing"].append(plugin_info)
 
         return plugins_status
@@ -1420,7 +2736,8 @@ class StatusAPIServer:
             },
             "database_operations": {
                 "size": self.queue_manager.dbCommandQueue.qsize()
-            }
+            },
+            "backpressure": self.queue_manager.getQueueMetrics()
         }
 
     def _get_workers_status(self) -> dict:
@@ -1442,6 +2759,18 @@ class StatusAPIServer:
                         "error": str(e)
                     })
 
+        # Global fetch scheduler, if enabled
+        if getattr(self.queue_manager, 'fetchScheduler', None) is not None:
+            workers_status["fetch_scheduler"] = self.queue_manager.fetchScheduler.get_status()
+
+        # Parse stage, if enabled
+        if getattr(self.queue_manager, 'parseStage', None) is not None:
+            workers_status["parse_stage"] = self.queue_manager.parseStage.get_status()
+
+        # Autoscaler of the data processing threads, if enabled
+        if getattr(self.queue_manager, 'dataProcAutoscaler', None) is not None:
+            workers_status["data_processing_autoscaler"] = self.queue_manager.dataProcAutoscaler.get_status()
+
         # Data processing workers (unchanged)
         if hasattr(self.queue_manager, 'dataProcessWorkerList'):
             for worker in self.queue_manager.dataProcessWorkerList:
@@ -1480,6 +2809,7 @@ class StatusAPIServer:
             },
             "content_fetching": {
                 "completed": q_status.fetchCompletCount,
+                "failed": q_status.fetchFailedCount,
                 "total": q_status.totalURLCount,
                 "pending": q_status.fetchPendingCount,
                 "progress_percent": 0,
@@ -1527,7 +2857,11 @@ class StatusAPIServer:
         return metrics
 
     def start(self):
-        """Start the API server in a background thread with proper error handling."""
+        """Start the API server in a background thread with proper error handling.
+        In daemon mode, the server started by the first scrape cycle keeps running for the later cycles."""
+        if self.server_thread is not None and self.server_thread.is_alive():
+            return
+
         def run_server():
             try:
                 config = uvicorn.Config(
@@ -165,9 +165,143 @@ def test_extractLinksFromURLList():
     assert isinstance(result, list), 'extr_links_from_urls_list must return a list'
 
 
+def test_extractLinksFromURLList_fetches_pages_concurrently():
+    import threading
+    import time
+    from datetime import datetime
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    from newslookout.plugins.mod_en_in_ecotimes import mod_en_in_ecotimes
+    plugin = mod_en_in_ecotimes()
+    plugin.config(app_inst.app_config)
+    plugin.initNetworkHelper()
+    app_inst.app_config.discovery_fetch_workers = 3
+    concurrency = {'active': 0, 'peak': 0}
+    concurrencyLock = threading.Lock()
+
+    def slowFetch(url, name, **kw):
+        with concurrencyLock:
+            concurrency['active'] += 1
+            concurrency['peak'] = max(concurrency['peak'], concurrency['active'])
+        time.sleep(0.2)
+        with concurrencyLock:
+            concurrency['active'] -= 1
+        pageIndex = url.rsplit('/', 1)[-1]
+        return (f'<html><body><a href="https://economictimes.indiatimes.com/markets/news/'
+                f'article-{pageIndex}/articleshow/9999999{pageIndex}.cms">link</a></body></html>', None)
+    plugin.networkHelper.fetchRawDataFromURL = slowFetch
+    pagesToScan = [f'https://economictimes.indiatimes.com/industry/{i}' for i in range(6)]
+    startTime = time.time()
+    result = plugin.extr_links_from_urls_list(datetime(2021, 6, 10), pagesToScan)
+    assert time.time() - startTime < 1.0, 'Pages were not fetched concurrently'
+    assert concurrency['peak'] == 3, 'Concurrent fetches exceeded discovery_fetch_workers'
+    assert [url.rsplit('/', 1)[-1] for url in result] == [f'9999999{i}.cms' for i in range(6)], \
+        'Links should be in the order of the pages'
+
+
+def test_runConcurrently_bounds_threads_of_nested_calls():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    from newslookout.plugins.mod_en_in_ecotimes import mod_en_in_ecotimes
+    plugin = mod_en_in_ecotimes()
+    plugin.config(app_inst.app_config)
+    app_inst.app_config.discovery_fetch_workers = 3
+    threadNames = set()
+    threadNamesLock = threading.Lock()
+
+    def fetchPage(pageIndex):
+        with threadNamesLock:
+            threadNames.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return pageIndex
+
+    def discoverFromSource(sourceIndex):
+        # each discovery source fetches its pages concurrently too:
+        return plugin.runConcurrently(fetchPage, [(sourceIndex, i) for i in range(4)])
+
+    def discoverDate(dateIndex):
+        return plugin.runConcurrently(discoverFromSource, [(dateIndex, i) for i in range(3)])
+    # two dates of a backfill discovered at the same time:
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='backfill') as executor:
+        results = list(executor.map(discoverDate, range(2)))
+    assert results == [[[((dateIndex, i), j) for j in range(4)] for i in range(3)] for dateIndex in range(2)]
+    discoveryThreads = [name for name in threadNames if not name.startswith('backfill')]
+    assert 0 < len(discoveryThreads) <= 2, 'Nested discovery calls should share discovery_fetch_workers - 1 threads'
+
+
+def test_getURLsListForDate_runs_concurrently_for_several_dates():
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_ecotimes import mod_en_in_ecotimes
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    plugin = mod_en_in_ecotimes()
+    plugin.config(app_inst.app_config)
+    plugin.listOfURLS = ['https://economictimes.indiatimes.com/queued/articleshow/99999990.cms']
+
+    def extr_links_from_main_noncont(runDate):
+        time.sleep(0.2)
+        return [f'https://economictimes.indiatimes.com/news/articleshow/9999{runDate.day:04d}.cms']
+    plugin.getArticlesListFromRSS = lambda rssFeeds: []
+    plugin.extractArticlesListWithNewsP = lambda: []
+    plugin.extr_links_from_main_noncont = extr_links_from_main_noncont
+    sessionHistoryDB = MagicMock()
+    sessionHistoryDB.retrieveTodoURLList.return_value = []
+    runDates = [datetime(2021, 6, day) for day in range(1, 4)]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda runDate: plugin.getURLsListForDate(runDate, sessionHistoryDB), runDates))
+    assert results == [[f'https://economictimes.indiatimes.com/news/articleshow/9999{day:04d}.cms']
+                       for day in range(1, 4)]
+    assert plugin.listOfURLS == ['https://economictimes.indiatimes.com/queued/articleshow/99999990.cms'], \
+        'Discovery of a date should not change the state of the plugin'
+
+
 def test_downloadDataArchive():
-    # TODO: implement this
-    pass
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from newslookout.data_structs import CancellationToken
+    from newslookout.plugins.mod_in_gdelt import mod_in_gdelt
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+
+    class SlowArchiveHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/zip')
+            self.send_header('Content-Length', '100000')
+            self.end_headers()
+            try:
+                for _ in range(100):
+                    self.wfile.write(b'0' * 100)
+                    self.wfile.flush()
+                    time.sleep(0.2)
+            except OSError:
+                pass
+
+        def log_message(self, format, *args):
+            pass
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowArchiveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        plugin = mod_in_gdelt()
+        plugin.config(app_inst.app_config)
+        cancelToken = CancellationToken(parent=threading.Event())
+        threading.Timer(0.5, cancelToken.cancel, args=('timeout',)).start()
+        startTime = time.time()
+        archive = plugin.downloadDataArchive(f'http://127.0.0.1:{server.server_address[1]}/archive.zip',
+                                             plugin.pluginName, shutdown_event=cancelToken)
+        assert time.time() - startTime < 5, 'Cancelled archive download was not aborted'
+        assert archive == b'', 'Cancelled archive download should not return partial data'
+    finally:
+        server.shutdown()
+        server.server_close()
 
 
 def test_clearQueue():
@@ -383,6 +517,27 @@ def test_extractPublishedDate_valid():
     assert result == datetime(2021, 6, 10)
 
 
+def test_extractPublishedDate_follows_pattern_priority():
+    import re
+    from datetime import datetime
+    from newslookout.base_plugin import BasePlugin
+    html = '<html><body><div data-date="2021-06-08">Related</div>' + \
+           '<script>{"datePublished": "2021-06-10T10:30:00+05:30"}</script>' + \
+           '<span data-date="2999-01-01">Future</span></body></html>'
+    patterns = {dateRegex: (re.compile(dateRegex), BasePlugin.articleDateRegexps[dateRegex])
+                for dateRegex in BasePlugin.articleDateRegexps}
+    # the date from the pattern listed first is used, even if another pattern matches earlier in the page:
+    result = BasePlugin.extractPublishedDate(html, patterns, URL='http://x.com/a', plugin_name='test')
+    assert result == datetime(2021, 6, 10, 10, 30)
+    futureDateRegex = r'(data\-date=")(2999\-[0-9]{2}\-[0-9]{2})(")'
+    patterns = {futureDateRegex: (re.compile(futureDateRegex), '%Y-%m-%d')}
+    patterns.update({dateRegex: (re.compile(dateRegex), BasePlugin.articleDateRegexps[dateRegex])
+                     for dateRegex in BasePlugin.articleDateRegexps})
+    # a date in the future is skipped in favour of the next pattern:
+    result = BasePlugin.extractPublishedDate(html.encode('utf-8'), patterns, URL='http://x.com/a', plugin_name='test')
+    assert result == datetime(2021, 6, 10, 10, 30)
+
+
 def test_extractPublishedDate_no_match_raises():
     from newslookout.base_plugin import BasePlugin
     from newslookout.data_structs import ScrapeError
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_cassette.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for recording and replaying the network traffic of the application
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+# import standard python libraries:
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from . import getAppFolders, getMockAppInstance, read_bz2html_file
+
+# ###################################
+
+NDTV_RSS_URL = 'https://feeds.feedburner.com/ndtvprofit-latest'
+NDTV_ARTICLE_URL = 'https://www.ndtv.com/business/sample-article-2373245'
+
+
+@pytest.fixture()
+def seeded_cassette(tmp_path):
+    """Create a cassette seeded from the test data fixtures."""
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    from newslookout.cassette import NetworkCassette
+    cassetteFile = str(tmp_path / 'cassette.zip')
+    NetworkCassette.fromFixtures(
+        cassetteFile,
+        {NDTV_RSS_URL: os.path.join(testdataFolder, 'mod_en_in_ndtv_rss.xml'),
+         NDTV_ARTICLE_URL: os.path.join(testdataFolder, 'mod_en_in_ndtv_2373245.html.bz2')})
+    yield cassetteFile
+    NetworkCassette.saveAll()
+    from newslookout.network import NetworkFetcher
+    NetworkFetcher.cassetteSession = None
+
+
+def getFetcherForMode(network_mode: str, cassetteFile: str, latency_ms: int = 0, bandwidth_kbps: int = 0):
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    app_inst.app_config.network_mode = network_mode
+    app_inst.app_config.cassette_file = cassetteFile
+    app_inst.app_config.cassette_latency_ms = latency_ms
+    app_inst.app_config.cassette_bandwidth_kbps = bandwidth_kbps
+    from newslookout.network import NetworkFetcher
+    return NetworkFetcher(app_inst.app_config, ['ndtv.com'])
+
+
+def test_cassette_seeded_from_fixtures(seeded_cassette):
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    from newslookout.cassette import NetworkCassette
+    cassette = NetworkCassette(seeded_cassette)
+    assert len(cassette) == 2, 'Fixtures were not loaded into the cassette'
+    interaction = cassette.getInteraction('GET', NDTV_RSS_URL)
+    assert interaction['status_code'] == 200
+    assert interaction['headers']['Content-Type'].startswith('application/rss+xml')
+
+
+def test_replay_mode_serves_recorded_pages(seeded_cassette):
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    netw_inst = getFetcherForMode('replay', seeded_cassette)
+    content, http_error = netw_inst.fetchRawDataFromURL(NDTV_ARTICLE_URL, 'mod_en_in_ndtv')
+    assert http_error is None
+    expectedHTML = read_bz2html_file(os.path.join(testdataFolder, 'mod_en_in_ndtv_2373245.html.bz2'))
+    assert content == expectedHTML, 'Replayed page does not match the recorded page'
+    rssContent, http_error = netw_inst.fetchRawDataFromURL(NDTV_RSS_URL, 'mod_en_in_ndtv')
+    assert http_error is None
+    assert rssContent.find('<item>') > 0
+
+
+def test_replay_mode_unrecorded_url_is_permanent_error(seeded_cassette):
+    netw_inst = getFetcherForMode('replay', seeded_cassette)
+    content, http_error = netw_inst.fetchRawDataFromURL('https://www.ndtv.com/not-recorded', 'mod_en_in_ndtv')
+    assert content is None
+    assert http_error.status_code == 404
+    assert http_error.is_permanent is True
+    assert netw_inst.cassette.missCount == 1, 'Unrecorded URL should not be retried'
+
+
+def test_simulated_latency_and_bandwidth():
+    from newslookout.cassette import NetworkCassette
+    cassette = NetworkCassette(None, latency_ms=200, bandwidth_kbps=800)
+    # 100,000 bytes at 800 kbps take 1 second, in addition to the 0.2 second latency:
+    assert cassette.getSimulatedDelay(100000) == pytest.approx(1.2)
+    assert NetworkCassette(None).getSimulatedDelay(100000) == 0
+    cassette = NetworkCassette(None, latency_ms=300)
+    cassette.addInteraction('http://example.com/page', '<html>page</html>')
+    request = requests.Request('GET', 'http://example.com/page').prepare()
+    startTime = time.time()
+    response = cassette.buildResponse(request)
+    assert time.time() - startTime >= 0.3
+    assert response.status_code == 200
+    assert response.text == '<html>page</html>'
+
+
+def test_record_mode_saves_responses(tmp_path):
+    from newslookout.cassette import NetworkCassette, RecordingAdapter
+    cassetteFile = str(tmp_path / 'recorded.zip')
+    cassette = NetworkCassette(cassetteFile)
+    liveResponse = requests.Response()
+    liveResponse.status_code = 200
+    liveResponse.headers['Content-Type'] = 'text/html; charset=utf-8'
+    liveResponse.headers['Content-Encoding'] = 'gzip'
+    liveResponse._content = b'<html>live page</html>'
+    liveResponse.request = requests.Request('GET', 'https://example.com/live').prepare()
+    liveResponse.url = liveResponse.request.url
+    baseAdapter = MagicMock()
+    baseAdapter.send.return_value = liveResponse
+    session = requests.Session()
+    session.mount('https://', RecordingAdapter(cassette, baseAdapter=baseAdapter))
+    assert session.get('https://example.com/live').text == '<html>live page</html>'
+    cassette.save()
+    reloadedCassette = NetworkCassette(cassetteFile)
+    interaction = reloadedCassette.getInteraction('GET', 'https://example.com/live')
+    assert interaction is not None, 'Recorded response was not saved to the cassette file'
+    assert 'Content-Encoding' not in interaction['headers']
+    request = requests.Request('GET', 'https://example.com/live').prepare()
+    assert reloadedCassette.buildResponse(request).content == b'<html>live page</html>'
+
+
+# end of file
@@ -112,6 +112,152 @@ def test_QueueStatus_init():
     assert type(qstatusobj) == QueueStatus, 'QueueStatus is not initialising correctly'
 
 
+def test_StageBackpressure_blocks_producer_until_consumed():
+    import threading
+    import time
+    from newslookout.data_structs import StageBackpressure, StageQueue
+    stageQueue = StageQueue(maxsize=2)
+    stage = StageBackpressure('test_stage', stageQueue)
+    assert stage.put('item-1') is True
+    assert stage.put('item-2') is True
+    producer = threading.Thread(target=stage.put, args=('item-3',))
+    producer.start()
+    time.sleep(0.3)
+    assert producer.is_alive(), 'Producer was not blocked at the high-water mark'
+    assert stageQueue.get() == 'item-1'
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    # end markers are accepted even when the queue is full:
+    stage.put(None)
+    assert stageQueue.qsize() == 3
+    metrics = stage.getMetrics()
+    assert metrics['max_size'] == 2
+    assert metrics['peak_size'] == 3
+    assert metrics['blocked_count'] == 1
+    assert metrics['blocked_seconds'] >= 0.3
+    assert metrics['shed_count'] == 0
+
+
+def test_StageBackpressure_sheds_items_when_full():
+    import threading
+    from newslookout.data_structs import StageBackpressure, StageQueue
+    shedItems = []
+    stageQueue = StageQueue(maxsize=1)
+    stage = StageBackpressure('test_stage', stageQueue, policy=StageBackpressure.POLICY_SHED,
+                              onShed=shedItems.append)
+    assert stage.put('item-1') is True
+    assert stage.put('item-2') is False
+    assert shedItems == ['item-2']
+    assert stage.getMetrics()['shed_count'] == 1
+    # producers waiting at a full queue are released at shutdown:
+    shutdownEvent = threading.Event()
+    blockingStage = StageBackpressure('test_stage', StageQueue(maxsize=1), shutdown_event=shutdownEvent)
+    blockingStage.waitInterval = 0.1
+    blockingStage.put('item-1')
+    producer = threading.Thread(target=blockingStage.put, args=('item-2',))
+    producer.start()
+    shutdownEvent.set()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    assert blockingStage.stageQueue.qsize() == 2, 'Item put at shutdown was lost'
+
+
+def test_StageQueue_forced_items_are_unfinished_tasks():
+    import threading
+    from newslookout.data_structs import StageQueue
+    stageQueue = StageQueue(maxsize=1)
+    stageQueue.put('item-1')
+    stageQueue.put('item-2', force=True)
+    stageQueue.put(None, force=True)
+    assert stageQueue.qsize() == 3
+    joiner = threading.Thread(target=stageQueue.join)
+    joiner.start()
+    for expectedItem in ['item-1', 'item-2', None]:
+        assert stageQueue.get_nowait() == expectedItem
+        joiner.join(timeout=0.1)
+        assert joiner.is_alive(), 'join() returned before all the items were done'
+        stageQueue.task_done()
+    joiner.join(timeout=5)
+    assert not joiner.is_alive()
+
+
+def test_BackfillProgress_date_range():
+    from datetime import datetime
+    import pytest
+    from newslookout.data_structs import BackfillProgress
+    runDates = BackfillProgress.getDateRange(datetime(2021, 2, 27), datetime(2021, 3, 2))
+    assert [BackfillProgress.dateKey(runDate) for runDate in runDates] == \
+        ['2021-02-27', '2021-02-28', '2021-03-01', '2021-03-02']
+    assert len(BackfillProgress.getDateRange(datetime(2021, 3, 2), datetime(2021, 3, 2))) == 1
+    with pytest.raises(ValueError):
+        BackfillProgress.getDateRange(datetime(2021, 3, 2), datetime(2021, 3, 1))
+    backfill = BackfillProgress(runDates, parallelDates=0, pluginCount=2)
+    assert backfill.parallelDates == 1
+    backfill.startDate(runDates[0])
+    backfill.startDate(runDates[1])
+    assert backfill.recordDiscovered(runDates[0], 'mod_in_bse', ['a', 'b']) == ['a', 'b']
+    assert backfill.recordDiscovered(runDates[1], 'mod_in_bse', ['b', 'c']) == ['c']
+    status = backfill.getStatus()['dates']
+    assert status['2021-02-27']['state'] == 'discovering', 'Date should be discovered by both plugins'
+    assert status['2021-03-02']['state'] == 'pending'
+
+
+def test_CancellationToken_cancels_with_parent_and_calls_callbacks():
+    import threading
+    from newslookout.data_structs import CancellationToken
+    parentEvent = threading.Event()
+    token = CancellationToken(parent=parentEvent)
+    token.pollInterval = 0.05
+    closedItems = []
+    callbackID = token.addCallback(lambda: closedItems.append('response-1'))
+    removedID = token.addCallback(lambda: closedItems.append('response-2'))
+    token.removeCallback(removedID)
+    assert not token.is_set()
+    assert token.wait(timeout=0.1) is False
+    parentEvent.set()
+    assert token.wait(timeout=1) is True, 'Token should be cancelled with its parent event'
+    assert token.reason == 'parent event was set'
+    assert closedItems == ['response-1']
+    # callbacks added after cancelling are called at once:
+    token.addCallback(lambda: closedItems.append('response-3'))
+    assert closedItems == ['response-1', 'response-3']
+    timeoutToken = CancellationToken()
+    timeoutToken.cancel('timeout')
+    timeoutToken.cancel('shutdown')
+    assert timeoutToken.isCancelled() and timeoutToken.reason == 'timeout'
+    assert callbackID == 0
+
+
+def test_ProgressCounters_counted_by_concurrent_threads():
+    import threading
+    from newslookout.data_structs import ProgressCounters, CountedQueue
+    counters = ProgressCounters()
+
+    def fetchURLs():
+        for _ in range(10000):
+            counters.increment(ProgressCounters.FETCH_SUCCEEDED, label='mod_en_in_ndtv')
+    threads = [threading.Thread(target=fetchURLs) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counters.increment(ProgressCounters.FETCH_FAILED, 3, label='mod_en_in_trak')
+    assert counters.get(ProgressCounters.FETCH_SUCCEEDED) == 80000, 'Increments from concurrent threads were lost'
+    assert counters.get(ProgressCounters.FETCH_FAILED, 'mod_en_in_trak') == 3
+    counters.reset([ProgressCounters.FETCH_SUCCEEDED])
+    counters.increment(ProgressCounters.FETCH_SUCCEEDED, label='mod_en_in_ndtv')
+    assert counters.snapshot()[ProgressCounters.FETCH_SUCCEEDED] == {'mod_en_in_ndtv': 1}
+    # the depth of a counted queue is known without locking it, end markers are not counted:
+    urlQueue = CountedQueue(counters, ProgressCounters.URL_QUEUE, 'mod_en_in_ndtv')
+    for url in ['url-1', 'url-2', 'url-3', None]:
+        urlQueue.put(url)
+    assert urlQueue.get() == 'url-1'
+    assert urlQueue.depth() == 2
+    assert ProgressCounters.getQueueDepths(counters.snapshot(), ProgressCounters.URL_QUEUE) == {'mod_en_in_ndtv': 2}
+    assert urlQueue.clear() == 2
+    assert urlQueue.depth() == 0 and urlQueue.qsize() == 0
+
+
 if __name__ == "__main__":
     test_decodeNameFromIntVal()
 
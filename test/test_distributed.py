@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_distributed.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for the distributed coordinator and workers leasing URLs
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+# import standard python libraries:
+import os
+import queue
+import threading
+import time
+
+from newslookout.data_structs import PluginTypes
+
+# ###################################
+
+
+class FakeContentPlugin:
+    """Stands in for a content plugin in the worker processes, it fetches without any network access."""
+    pluginName = 'mod_fake_content'
+
+    def fetchDataFromURL(self, url, workerID):
+        from newslookout.data_structs import ExecutionResult
+        time.sleep(0.005)
+        return ExecutionResult(url, 100, 10, None, self.pluginName, success=True, articleID=url.split('-')[-1])
+
+
+def runFakeWorkerProcess(dbFileName: str, workerID: str):
+    """Entry point of a worker process, it runs a distributed fetch worker until the coordinator finishes."""
+    from newslookout.distributed import LeaseQueue, DistributedFetchWorker
+    worker = DistributedFetchWorker(LeaseQueue(dbFileName, leaseTimeoutSec=30),
+                                    {FakeContentPlugin.pluginName: FakeContentPlugin()},
+                                    workerID,
+                                    threading.Event(),
+                                    batch_size=5,
+                                    poll_interval=0.05)
+    worker.start()
+    worker.join(timeout=60)
+
+
+def test_LeaseQueue_leases_and_expiry(tmp_path):
+    from newslookout.distributed import LeaseQueue
+    leaseQueue = LeaseQueue(os.path.join(tmp_path, 'leases.db'), leaseTimeoutSec=0.2, maxAttempts=2)
+    leaseQueue.startRun()
+    assert leaseQueue.addURLs('mod_a', [f'https://a.example.com/news-{i}' for i in range(6)]) == 6
+    assert leaseQueue.addURLs('mod_a', ['https://a.example.com/news-0']) == 0, 'Duplicate URL was added'
+    firstBatch = leaseQueue.leaseBatch('worker-1', batchSize=4)
+    secondBatch = leaseQueue.leaseBatch('worker-2', batchSize=4)
+    assert len(firstBatch) == 4 and len(secondBatch) == 2
+    assert set(firstBatch).isdisjoint(secondBatch), 'URL leased to two workers at once'
+    assert leaseQueue.leaseBatch('worker-3', pluginNames=['mod_b']) == []
+    pluginName, url = firstBatch[0]
+    assert leaseQueue.reportResult('worker-1', pluginName, url, {'url': url}) is True
+    assert leaseQueue.reportResult('worker-2', pluginName, firstBatch[1][1], {}) is False, \
+        'Result accepted from a worker that does not hold the lease'
+    time.sleep(0.3)
+    # the unreported leases have expired, so these are leased again
+    reLeased = leaseQueue.leaseBatch('worker-3', batchSize=10)
+    assert len(reLeased) == 5
+    assert leaseQueue.reportResult('worker-1', pluginName, firstBatch[1][1], {}) is False, \
+        'Result accepted after the lease expired'
+    time.sleep(0.3)
+    # leased twice and not reported, so these are reported as failed
+    assert leaseQueue.leaseBatch('worker-3', batchSize=10) == []
+    results = leaseQueue.takeResults()
+    assert results[0] == (pluginName, url, 'worker-1', {'url': url})
+    assert len(results) == 6
+    assert all(result is None for (p, u, w, result) in results[1:])
+    assert leaseQueue.getOutstandingCount() == 0
+    leaseQueue.finishRun()
+    assert leaseQueue.getRunStatus() == 'finished'
+
+
+def test_LeaseQueue_leases_only_loaded_plugins(tmp_path):
+    from newslookout.distributed import LeaseQueue
+    leaseQueue = LeaseQueue(os.path.join(tmp_path, 'leases.db'))
+    leaseQueue.startRun()
+    leaseQueue.addURLs('mod_a', [f'https://a.example.com/news-{i}' for i in range(50)])
+    leaseQueue.addURLs('mod_b', [f'https://b.example.com/news-{i}' for i in range(3)])
+    # the URLs of other plugins queued ahead should not starve this worker:
+    leased = leaseQueue.leaseBatch('worker-1', batchSize=5, pluginNames=['mod_b'])
+    assert sorted(leased) == [('mod_b', f'https://b.example.com/news-{i}') for i in range(3)]
+    assert len(leaseQueue.leaseBatch('worker-2', batchSize=5)) == 5
+
+
+def test_workers_in_separate_processes_fetch_each_url_once(tmp_path):
+    import multiprocessing
+    from newslookout.distributed import LeaseQueue
+    dbFileName = os.path.join(tmp_path, 'leases.db')
+    leaseQueue = LeaseQueue(dbFileName, leaseTimeoutSec=30)
+    leaseQueue.startRun()
+    allURLs = [f'https://fake.example.com/news-{i}' for i in range(150)]
+    leaseQueue.addURLs(FakeContentPlugin.pluginName, allURLs)
+    spawnContext = multiprocessing.get_context('spawn')
+    processes = [spawnContext.Process(target=runFakeWorkerProcess, args=(dbFileName, f'host-{i}'))
+                 for i in range(3)]
+    for process in processes:
+        process.start()
+    results = []
+    deadline = time.time() + 120
+    while len(results) < len(allURLs) and time.time() < deadline:
+        results.extend(leaseQueue.takeResults())
+        time.sleep(0.05)
+    leaseQueue.finishRun()
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+    assert sorted(url for (p, url, w, r) in results) == sorted(allURLs), 'Each URL should be fetched exactly once'
+    assert all(result['success'] and result['article_id'] == url.split('-')[-1]
+               for (p, url, w, result) in results)
+    assert len(set(worker for (p, u, worker, r) in results)) == 3, 'Every worker process should get a share'
+
+
+def test_LeaseCoordinator_records_reported_results(tmp_path):
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.distributed import LeaseQueue, LeaseCoordinator, resultToReport
+    from newslookout.network import HTTPError
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    leaseQueue = LeaseQueue(os.path.join(tmp_path, 'leases.db'), leaseTimeoutSec=30)
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    sessionHistory = MagicMock()
+    sessionHistory.removeAlreadyFetchedURLs.side_effect = lambda urls, pluginName: urls
+    pluginInst = mod_en_in_ndtv()
+    pluginInst.setURLQueue(queue.Queue())
+    discoveryComplete = threading.Event()
+    coordinator = LeaseCoordinator(queueManager, sessionHistory, leaseQueue, poll_interval=0.05)
+    coordinator.register_plugin(pluginInst, discoveryComplete)
+    for i in range(3):
+        pluginInst.urlQueue.put(f'https://www.ndtv.com/business/news-{i}')
+    pluginInst.urlQueue.put(None)
+    coordinator.start()
+    deadline = time.time() + 10
+    leased = []
+    while len(leased) < 3 and time.time() < deadline:
+        leased.extend(leaseQueue.leaseBatch('worker-1', batchSize=10))
+        time.sleep(0.05)
+    assert coordinator.is_plugin_active(pluginInst.pluginName)
+    fetched = ExecutionResult(leased[0][1], 100, 10, None, pluginInst.pluginName, success=True,
+                              additionalLinks=['https://www.ndtv.com/business/news-9'])
+    notFound = ExecutionResult(leased[1][1], 0, 0, None, pluginInst.pluginName)
+    notFound.http_error = HTTPError(404, leased[1][1], 'Not Found')
+    leaseQueue.reportResult('worker-1', pluginInst.pluginName, leased[0][1], resultToReport(fetched))
+    leaseQueue.reportResult('worker-1', pluginInst.pluginName, leased[1][1], resultToReport(notFound))
+    leaseQueue.reportResult('worker-1', pluginInst.pluginName, leased[2][1], None)
+    coordinator.join(timeout=10)
+    assert not coordinator.is_alive(), 'Coordinator did not finish after all results were collected'
+    assert pluginInst.pluginState == PluginTypes.STATE_STOPPED
+    completedResult = queueManager.addToScrapeCompletedQueue.call_args[0][0]
+    assert completedResult.URL == leased[0][1] and completedResult.wasSuccessful
+    queueManager.queueDBOperation.assert_any_call(
+        'add_pending', (['https://www.ndtv.com/business/news-9'], 'mod_en_in_ndtv'), wait_for_result=False)
+    sessionHistory.addHTTPError.assert_called_once_with(leased[1][1], 'mod_en_in_ndtv', 404, 'Not Found')
+    assert queueManager.queueDBOperation.call_args[0][0] == 'add_failed'
+    assert leaseQueue.getRunStatus() == 'finished'
+    assert coordinator.get_status()['plugins']['mod_en_in_ndtv'] == {'queued': 3, 'fetched': 3, 'done': True}
+
+
+# end of file
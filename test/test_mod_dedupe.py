@@ -96,6 +96,68 @@ def test_processDataObj():
         pytest.fail(f'processDataObj raised an unexpected exception: {e}')
 
 
+def test_processDataObj_drops_deferred_duplicate(tmp_path):
+    """Of two near-identical articles whose saving was deferred until the data processing, only one is saved."""
+    import difflib
+    import glob
+    from datetime import datetime
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.news_event import NewsEvent
+    from newslookout.plugins.mod_dedupe import mod_dedupe
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.plugins.mod_en_in_livemint import mod_en_in_livemint
+    from newslookout.queue_manager import QueueManager
+    from newslookout.worker import DataProcessor
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    app_inst.app_config.data_dir = str(tmp_path)
+
+    class TextDoc:
+        """Text embedding with the similarity of the texts, instead of the spacy model."""
+        def __init__(self, text):
+            self.text = text
+
+        def similarity(self, other):
+            return difflib.SequenceMatcher(None, self.text, other.text).ratio()
+    dedupePlugin = mod_dedupe()
+    dedupePlugin.config(app_inst.app_config)
+    dedupePlugin.sessionHistDB = MagicMock()
+    dedupePlugin.nlpModel = TextDoc
+    queueManager = QueueManager()
+    articleText = 'The central bank kept its policy rate unchanged on Thursday. ' * 40
+    fetchResults = []
+    for contentPlugin, articleID, text in [(mod_en_in_ndtv(), '2373245', articleText + 'More details awaited.'),
+                                           (mod_en_in_livemint(), '11623254', articleText)]:
+        contentPlugin.config(app_inst.app_config)
+        contentPlugin.deferArticleWrite = True
+        # saved as files, which are compared by the de-duplication plugin:
+        contentPlugin.use_archive_storage = False
+        queueManager.pluginNameToObjMap[contentPlugin.pluginName] = contentPlugin
+        article = NewsEvent()
+        article.setURL(f'https://www.example.com/{contentPlugin.pluginName}/{articleID}')
+        article.setArticleID(articleID)
+        article.setModuleName(contentPlugin.pluginName)
+        article.setPublishDate(datetime(2021, 6, 10))
+        article.setHTML('<html>sample</html>')
+        article.setText(text)
+        fetchResult = contentPlugin.saveParsedData(article.getURL(), article, [], '<html>sample</html>',
+                                                   ExecutionResult(article.getURL(), 0, 0, None,
+                                                                   contentPlugin.pluginName))
+        assert fetchResult.rawHTML is not None, 'Saving of the article was not deferred'
+        queueManager.trackDeferredArticle(fetchResult)
+        fetchResults.append(fetchResult)
+    for fetchResult in fetchResults:
+        DataProcessor.processItem(queueManager, fetchResult, [1], {1: dedupePlugin}, 'worker-1')
+    # nothing is left to be saved at shutdown:
+    queueManager._saveUnprocessedArticles()
+    savedFiles = glob.glob(os.path.join(str(tmp_path), '**', '*.json'), recursive=True)
+    assert len(savedFiles) == 1, 'Duplicate article was saved'
+    assert os.path.basename(savedFiles[0]).startswith('mod_en_in_ndtv'), 'The longer article was not kept'
+    assert dedupePlugin.sessionHistDB.addDupURLToDeleteTbl.call_count == 1
+    assert dedupePlugin.sessionHistDB.addDupURLToDeleteTbl.call_args[0][0] == fetchResults[1].URL
+
+
 if __name__ == "__main__":
     test_plugin_subclass()
 
@@ -152,6 +152,44 @@ class TestNetworkFetcher:
             assert err is not None
             assert err.is_permanent is False
 
+    def test_cancelled_fetch_aborts_download(self):
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from newslookout.data_structs import CancellationToken
+
+        class SlowBodyHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html')
+                self.send_header('Content-Length', '100000')
+                self.end_headers()
+                try:
+                    for _ in range(100):
+                        self.wfile.write(b'<p>slow</p>' * 10)
+                        self.wfile.flush()
+                        time.sleep(0.2)
+                except OSError:
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SlowBodyHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            cancelToken = CancellationToken(parent=threading.Event())
+            threading.Timer(0.5, cancelToken.cancel, args=('timeout',)).start()
+            startTime = time.time()
+            content, err = self.netw_inst.fetchRawDataFromURL(
+                f'http://127.0.0.1:{server.server_address[1]}/slow-page', 'plugin1', shutdown_event=cancelToken)
+            assert time.time() - startTime < 5, 'Cancelled fetch did not abort the download in progress'
+            assert content is None
+            assert err is None
+        finally:
+            server.shutdown()
+            server.server_close()
+
     def test_getDataFromHTTPResponse_missing_content_type(self):
         """Regression test for BUG-05: None content-type should not crash."""
         from newslookout import network
@@ -163,6 +201,158 @@ class TestNetworkFetcher:
         assert result == '<html>test</html>'
 
 
+class TestPageCache:
+    def setup_method(self):
+        """Set up a NetworkFetcher that shares a fresh page cache for each test."""
+        (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+        app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+        from newslookout import network
+        self.pageCache = network.PageCache()
+        network.NetworkFetcher.setRunPageCache(self.pageCache)
+        self.netw_inst = network.NetworkFetcher(app_inst.app_config, ['example.com'])
+
+    def teardown_method(self):
+        from newslookout import network
+        network.NetworkFetcher.setRunPageCache(None)
+
+    def test_cached_fetch_downloads_once(self):
+        with patch.object(self.netw_inst, 'fetchRawDataFromURL_with_error_handling',
+                          return_value=('<html>page</html>', None)) as mock_fetch:
+            for _ in range(3):
+                content, err = self.netw_inst.fetchRawDataFromURL('http://example.com/', 'plugin1', useCache=True)
+                assert content == '<html>page</html>'
+                assert err is None
+            assert mock_fetch.call_count == 1, 'Cached URL was downloaded more than once in the run'
+        assert self.pageCache.getStats()['hits'] == 2
+
+    def test_uncached_fetch_bypasses_cache(self):
+        with patch.object(self.netw_inst, 'fetchRawDataFromURL_with_error_handling',
+                          return_value=('<html>page</html>', None)) as mock_fetch:
+            self.netw_inst.fetchRawDataFromURL('http://example.com/', 'plugin1')
+            self.netw_inst.fetchRawDataFromURL('http://example.com/', 'plugin1')
+            assert mock_fetch.call_count == 2
+        assert len(self.pageCache) == 0
+
+    def test_transient_errors_not_cached(self):
+        from newslookout import network
+        transientError = network.HTTPError(503, 'http://example.com/')
+        with patch.object(self.netw_inst, 'fetchRawDataFromURL_with_error_handling',
+                          return_value=(None, transientError)) as mock_fetch:
+            self.netw_inst.fetchRawDataFromURL('http://example.com/', 'plugin1', useCache=True)
+            self.netw_inst.fetchRawDataFromURL('http://example.com/', 'plugin1', useCache=True)
+            assert mock_fetch.call_count == 2, 'Transient HTTP errors should be retried, not cached'
+        permanentError = network.HTTPError(404, 'http://example.com/gone')
+        with patch.object(self.netw_inst, 'fetchRawDataFromURL_with_error_handling',
+                          return_value=(None, permanentError)) as mock_fetch:
+            self.netw_inst.fetchRawDataFromURL('http://example.com/gone', 'plugin1', useCache=True)
+            content, err = self.netw_inst.fetchRawDataFromURL('http://example.com/gone', 'plugin1', useCache=True)
+            assert mock_fetch.call_count == 1
+            assert err.status_code == 404
+
+    def test_concurrent_requests_are_coalesced(self):
+        import threading
+        import time
+        callCount = []
+
+        def slowFetch():
+            callCount.append(1)
+            time.sleep(0.5)
+            return '<html>slow</html>', None
+
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(self.pageCache.getOrFetch(('http://example.com/', False), slowFetch)))
+            for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert len(callCount) == 1, 'Concurrent requests for the same URL were not coalesced'
+        assert results == [('<html>slow</html>', None)] * 5
+        assert self.pageCache.getStats()['coalesced'] + self.pageCache.getStats()['hits'] == 4
+
+    def test_newspaper_fetch_uses_page_cache(self):
+        from newslookout import network
+        self.pageCache.getOrFetch(('http://example.com/home', False), lambda: ('<html>home</html>', None))
+        with patch('requests.get') as mock_get:
+            html = network.NetworkFetcher.NewsPpr_get_html_2XX_only('http://example.com/home')
+            assert mock_get.call_count == 0
+        assert html == '<html>home</html>'
+
+
+class TestDomainRateLimiter:
+    def test_requests_to_domain_are_spaced_out(self):
+        import time
+        from newslookout.network import DomainRateLimiter
+        rateLimiter = DomainRateLimiter(maxConnectionsPerDomain=4, minIntervalSec=0.2)
+        startTimes = []
+        for _ in range(3):
+            assert rateLimiter.acquire('https://www.example.com/page') is True
+            startTimes.append(time.time())
+            rateLimiter.release('https://www.example.com/page')
+        assert startTimes[2] - startTimes[0] >= 0.39, 'Requests to the same domain were not spaced out'
+        # another domain is not delayed by the first one:
+        otherStart = time.time()
+        rateLimiter.acquire('https://other.example.org/page')
+        rateLimiter.release('https://other.example.org/page')
+        assert time.time() - otherStart < 0.1
+
+    def test_concurrent_requests_to_domain_are_capped(self):
+        import threading
+        import time
+        from newslookout.network import DomainRateLimiter
+        rateLimiter = DomainRateLimiter(maxConnectionsPerDomain=2, minIntervalSec=0)
+        counterLock = threading.Lock()
+        inProgress = [0]
+        maxInProgress = [0]
+
+        def fetchPage():
+            rateLimiter.acquire('https://www.example.com/page')
+            with counterLock:
+                inProgress[0] += 1
+                maxInProgress[0] = max(maxInProgress[0], inProgress[0])
+            time.sleep(0.1)
+            with counterLock:
+                inProgress[0] -= 1
+            rateLimiter.release('https://www.example.com/page')
+
+        threads = [threading.Thread(target=fetchPage) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert maxInProgress[0] == 2, 'More simultaneous requests to the domain than allowed'
+
+    def test_wait_is_interrupted_by_shutdown(self):
+        import threading
+        from newslookout.network import DomainRateLimiter
+        rateLimiter = DomainRateLimiter(maxConnectionsPerDomain=1, minIntervalSec=0)
+        assert rateLimiter.acquire('https://www.example.com/a') is True
+        shutdown_event = threading.Event()
+        shutdown_event.set()
+        assert rateLimiter.acquire('https://www.example.com/b', shutdown_event=shutdown_event) is False
+        rateLimiter.release('https://www.example.com/a')
+
+    def test_limits_apply_to_content_fetches_only(self):
+        from newslookout import network
+        (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+        app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+        netw_inst = network.NetworkFetcher(app_inst.app_config, ['example.com'])
+        rateLimiter = MagicMock()
+        rateLimiter.acquire.return_value = True
+        network.NetworkFetcher.setDomainRateLimiter(rateLimiter)
+        try:
+            response = MagicMock(status_code=200, encoding='utf-8', text='<html>page</html>')
+            with patch.object(netw_inst.session, 'get', return_value=response):
+                netw_inst.fetchRawDataFromURL('http://example.com/feed', 'plugin1', useCache=True)
+                assert rateLimiter.acquire.call_count == 0, 'Discovery fetch waited for the politeness limits'
+                netw_inst.fetchRawDataFromURL('http://example.com/article', 'plugin1')
+                assert rateLimiter.acquire.call_count == 1, 'Content fetch did not wait for the politeness limits'
+                rateLimiter.release.assert_called_once_with('http://example.com/article')
+        finally:
+            network.NetworkFetcher.setDomainRateLimiter(None)
+
+
 if __name__ == "__main__":
     test_sleepBeforeNextFetch()
 
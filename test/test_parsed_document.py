@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_parsed_document.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for the HTML document parsed once and shared by the extraction steps
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+import os
+
+from . import getAppFolders, getMockAppInstance
+from . import read_bz2html_file
+
+# ###################################
+
+
+def test_ParsedDocument_parses_once():
+    from newslookout.parsed_document import ParsedDocument
+    htmlContent = '<html><body><p>Text</p><a href="/a.html">A</a></body></html>'
+    document = ParsedDocument(htmlContent)
+    assert document.parseCount == {'lxml': 0, 'soup': 0}, 'Document should be parsed lazily'
+    assert document.soup is document.soup
+    assert document.lxmlRoot is document.lxmlRoot
+    assert document.parseCount == {'lxml': 1, 'soup': 1}
+    assert document == htmlContent and document.find('/a.html') > 0, 'Document should be usable as the HTML text'
+    import lxml.html
+    adoptedRoot = lxml.html.fromstring(htmlContent)
+    otherDocument = ParsedDocument(htmlContent)
+    otherDocument.setLxmlRoot(adoptedRoot)
+    assert otherDocument.lxmlRoot is adoptedRoot
+    assert otherDocument.parseCount['lxml'] == 0
+    import pickle
+    unpickledDocument = pickle.loads(pickle.dumps(otherDocument))
+    assert type(unpickledDocument) is str and unpickledDocument == htmlContent, 'Only the HTML text should be pickled'
+
+
+def test_getParsedDocument_returns_given_document():
+    from newslookout.base_plugin import BasePlugin
+    from newslookout.parsed_document import ParsedDocument
+    htmlContent = '<html><body><p>Text</p></body></html>'
+    document = ParsedDocument(htmlContent)
+    assert BasePlugin.getParsedDocument(document) is document
+    sameContentDocument = BasePlugin.getParsedDocument(htmlContent)
+    assert sameContentDocument is not document, 'A document should not be looked up by its content'
+    assert isinstance(sameContentDocument, ParsedDocument) and sameContentDocument == htmlContent
+
+
+def test_parseRawData_shares_document(monkeypatch):
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    import newslookout.base_plugin
+    from newslookout.parsed_document import ParsedDocument
+    from newslookout.plugins.mod_en_in_ecotimes import mod_en_in_ecotimes
+    createdDocuments = []
+
+    class RecordedDocument(ParsedDocument):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            createdDocuments.append(self)
+
+    monkeypatch.setattr(newslookout.base_plugin, 'ParsedDocument', RecordedDocument)
+    pluginClassInst = mod_en_in_ecotimes()
+    pluginClassInst.config(app_inst.app_config)
+    pluginClassInst.initNetworkHelper()
+    htmlContent = read_bz2html_file(os.path.join(testdataFolder, 'mod_en_in_ecotimes_73837853.html.bz2'))
+    uRLtoFetch = "https://economictimes.indiatimes.com/markets/expert-view/a-reasonable-budget-but-still-unclear-on-" +\
+                 "fiscal-deficit-front-swaminathan-aiyar/articleshow/73837853.cms"
+    validData, additionalLinks, cleanedHTML = pluginClassInst.parseRawData(uRLtoFetch, htmlContent, 1)
+    assert validData is not None and validData.getArticleID() == '73837853'
+    assert len(additionalLinks) == 42, 'Links not extracted from the shared document'
+    assert len(createdDocuments) == 1, 'The page should be parsed into a single document'
+    assert createdDocuments[0].parseCount == {'lxml': 0, 'soup': 0}, \
+        "The lxml tree parsed by newspaper should be re-used by all the extraction steps"
+
+# end of file
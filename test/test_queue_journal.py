@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_queue_journal.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for the durable journal of the work queues
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+# import standard python libraries:
+import os
+
+from . import getAppFolders, getMockAppInstance
+
+# ###################################
+
+
+def getSampleResult():
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.news_event import NewsEvent
+    article = NewsEvent()
+    article.setURL('https://www.ndtv.com/business/sample-article-2373245')
+    article.setArticleID('2373245')
+    article.setText('Sample article text.')
+    article.setFileName('/data/mod_en_in_ndtv_2373245.json')
+    fetchResult = ExecutionResult(article.getURL(), 1000, 20, None, 'mod_en_in_ndtv',
+                                  dataFileName='/data/mod_en_in_ndtv_2373245', success=True, article=article)
+    fetchResult.rawHTML = '<html>sample ₹ article</html>'.encode('utf-8')
+    return fetchResult
+
+
+def test_journal_replays_unacknowledged_items(tmp_path):
+    from newslookout.queue_journal import QueueJournal, resultToJournalItem
+    journalFile = str(tmp_path / 'queue_journal.jsonl')
+    journal = QueueJournal(journalFile)
+    assert journal.open() == {}
+    urlQueue = QueueJournal.urlQueueName('mod_en_in_ndtv')
+    for i in range(3):
+        assert journal.append(urlQueue, f'https://www.ndtv.com/news-{i}') is True
+    assert journal.append(urlQueue, 'https://www.ndtv.com/news-0') is False, 'Pending item was journalled twice'
+    journal.ack(urlQueue, 'https://www.ndtv.com/news-1')
+    fetchResult = getSampleResult()
+    journal.append(QueueJournal.DATAPROC_QUEUE, fetchResult.URL, resultToJournalItem(fetchResult))
+    assert journal.getPendingCount() == 3
+    # the application is killed while writing a record, without closing the journal:
+    with open(journalFile, 'at', encoding='utf-8') as fp:
+        fp.write('{"op": "ack", "queue": "urls/mod_en')
+    resumedJournal = QueueJournal(journalFile)
+    pendingItems = resumedJournal.open()
+    assert pendingItems[urlQueue] == ['https://www.ndtv.com/news-0', 'https://www.ndtv.com/news-2']
+    assert len(pendingItems[QueueJournal.DATAPROC_QUEUE]) == 1
+    assert resumedJournal.isPending(urlQueue, 'https://www.ndtv.com/news-2')
+    with open(journalFile, 'rt', encoding='utf-8') as fp:
+        assert len(fp.readlines()) == 3, 'Journal was not compacted to its pending items'
+    resumedJournal.ack(urlQueue, 'https://www.ndtv.com/news-0')
+    resumedJournal.ack(urlQueue, 'https://www.ndtv.com/news-2')
+    resumedJournal.ack(QueueJournal.DATAPROC_QUEUE, fetchResult.URL)
+    resumedJournal.close()
+    assert os.path.getsize(journalFile) == 0, 'Journal was not emptied when all items were completed'
+    assert resumedJournal.getStatus()['replayed'] == 3
+
+
+def test_journal_is_compacted_while_running(tmp_path):
+    from newslookout.queue_journal import QueueJournal
+    journalFile = str(tmp_path / 'queue_journal.jsonl')
+    journal = QueueJournal(journalFile, compactMinRecords=10)
+    journal.open()
+    urlQueue = QueueJournal.urlQueueName('mod_en_in_ndtv')
+    for i in range(30):
+        journal.append(urlQueue, f'https://www.ndtv.com/news-{i}')
+    for i in range(25):
+        journal.ack(urlQueue, f'https://www.ndtv.com/news-{i}')
+    assert journal.getStatus()['compactions'] > 0
+    with open(journalFile, 'rt', encoding='utf-8') as fp:
+        assert len(fp.readlines()) < 20, 'Journal kept the records of the completed items'
+    journal.append(urlQueue, 'https://www.ndtv.com/news-30')
+    resumedJournal = QueueJournal(journalFile)
+    assert resumedJournal.open()[urlQueue] == [f'https://www.ndtv.com/news-{i}' for i in range(25, 31)]
+    resumedJournal.close()
+
+
+def test_journal_item_keeps_deferred_article():
+    from newslookout.queue_journal import resultToJournalItem, resultFromJournalItem
+    fetchResult = getSampleResult()
+    restoredResult = resultFromJournalItem(resultToJournalItem(fetchResult))
+    assert restoredResult.URL == fetchResult.URL
+    assert restoredResult.pluginName == 'mod_en_in_ndtv'
+    assert restoredResult.savedDataFileName == fetchResult.savedDataFileName
+    assert restoredResult.wasSuccessful is True
+    assert restoredResult.article.getText() == 'Sample article text.'
+    assert restoredResult.article.getFileName() == '/data/mod_en_in_ndtv_2373245.json'
+    assert restoredResult.rawHTML == fetchResult.rawHTML
+
+
+def test_journal_item_of_saved_article_has_no_html(tmp_path):
+    from newslookout.queue_journal import resultToJournalItem, resultFromJournalItem
+    fetchResult = getSampleResult()
+    fetchResult.savedDataFileName = str(tmp_path / 'mod_en_in_ndtv_2373245')
+    with open(fetchResult.savedDataFileName + '.json', 'wt', encoding='utf-8') as fp:
+        fp.write('{}')
+    item = resultToJournalItem(fetchResult)
+    assert 'html' not in item and 'article' not in item
+    assert resultFromJournalItem(item).savedDataFileName == fetchResult.savedDataFileName
+
+
+def test_queue_manager_resumes_data_processing(tmp_path):
+    from unittest.mock import MagicMock
+    from newslookout.queue_journal import QueueJournal, resultToJournalItem
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    journalFile = str(tmp_path / 'queue_journal.jsonl')
+    journal = QueueJournal(journalFile)
+    journal.open()
+    fetchResult = getSampleResult()
+    journal.append(QueueJournal.DATAPROC_QUEUE, fetchResult.URL, resultToJournalItem(fetchResult))
+    app_inst.app_config.queue_journal_file = journalFile
+    queueManager = app_inst.queue_manager
+    queueManager.config(app_inst.app_config)
+    queueManager.dataProcessWorkerList = [MagicMock()]
+    queueManager._replayDataProcQueue()
+    resumedResult = queueManager.dataProcQueue.get_nowait()
+    assert resumedResult.URL == fetchResult.URL
+    assert resumedResult.article.getArticleID() == '2373245'
+    queueManager.ackDataProcItem(resumedResult)
+    assert queueManager.queueJournal.getPendingCount() == 0
+    queueManager.queueJournal.close()
+
+
+
+def test_queue_manager_resumes_unfinished_data_processing_in_next_cycle(tmp_path):
+    from unittest.mock import MagicMock
+    from newslookout.queue_journal import QueueJournal, resultToJournalItem
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    app_inst.app_config.queue_journal_file = str(tmp_path / 'queue_journal.jsonl')
+    queueManager = app_inst.queue_manager
+    queueManager.config(app_inst.app_config)
+    contentPlugin = MagicMock()
+    queueManager.pluginNameToObjMap = {'mod_en_in_ndtv': contentPlugin}
+    fetchResult = getSampleResult()
+    queueManager.queueJournal.append(QueueJournal.DATAPROC_QUEUE, fetchResult.URL, resultToJournalItem(fetchResult))
+    queueManager.trackDeferredArticle(fetchResult)
+    queueManager.dataProcQueue.put(fetchResult)
+    # the daemon cycle ends before the article is data processed:
+    queueManager._saveUnprocessedArticles()
+    contentPlugin.persistArticle.assert_not_called()
+    assert queueManager.dataProcQueue.empty()
+    queueManager.dataProcessWorkerList = [MagicMock()]
+    queueManager._replayDataProcQueue()
+    assert queueManager.dataProcQueue.get_nowait() is fetchResult, 'Article was not resumed by the next cycle'
+    queueManager.ackDataProcItem(fetchResult)
+    assert queueManager.queueJournal.getPendingCount() == 0
+    queueManager.queueJournal.close()
+
+# end of file
@@ -48,10 +48,160 @@ def test_queue_manager_init_config():
                                   '2021-06-10',
                                   config_file)
     app_inst.queue_manager.config(app_inst.app_config)
-    assert type(app_inst.queue_manager.fetchCompletedQueue) == queue.Queue, \
+    from newslookout.data_structs import CountedQueue
+    assert type(app_inst.queue_manager.fetchCompletedQueue) == CountedQueue, \
         'Queue manager: fetchCompletedQueue was not configured correctly.'
 
 
+def test_queue_manager_bounded_queues():
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder,
+                                  '2021-06-10',
+                                  config_file)
+    queueManager = app_inst.queue_manager
+    app_inst.app_config.dataproc_queue_max_size = 2
+    app_inst.app_config.dataproc_queue_full_policy = 'shed'
+    queueManager.config(app_inst.app_config)
+    assert queueManager.fetchCompletedQueue.maxsize == app_inst.app_config.fetch_completed_queue_max_size
+    contentPlugin = MagicMock()
+    queueManager.pluginNameToObjMap = {'mod_en_in_ndtv': contentPlugin}
+    queueManager.dataProcessWorkerList = [MagicMock()]
+    for i in range(3):
+        fetchResult = ExecutionResult(f'https://www.ndtv.com/news-{i}', 1000, 500, None, 'mod_en_in_ndtv',
+                                      success=True)
+        fetchResult.rawHTML = b'<html></html>'
+        queueManager.addToScrapeCompletedQueue(fetchResult)
+    assert queueManager.dataProcQueue.qsize() == 2
+    assert contentPlugin.persistArticle.call_count == 1, 'Shed article was not saved'
+    metrics = queueManager.getQueueMetrics()
+    assert metrics['data_processing_input']['shed_count'] == 1
+    assert metrics['fetch_completed']['size'] == 3
+
+
+def test_queue_manager_full_completed_queue_writes_to_db():
+    from unittest.mock import patch
+    from newslookout.data_structs import ExecutionResult
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder,
+                                  '2021-06-10',
+                                  config_file)
+    queueManager = app_inst.queue_manager
+    app_inst.app_config.fetch_completed_queue_max_size = 2
+    queueManager.config(app_inst.app_config)
+    queueManager.dataProcessWorkerList = []
+    fetchResults = [ExecutionResult(f'https://www.ndtv.com/news-{i}', 1000, 500, None, 'mod_en_in_ndtv',
+                                    success=True) for i in range(3)]
+    with patch.object(queueManager, 'queueDBOperation') as mockDBOperation:
+        for fetchResult in fetchResults:
+            queueManager.addToScrapeCompletedQueue(fetchResult)
+    # the fetch worker did not wait for the progress monitor to drain the full queue:
+    mockDBOperation.assert_called_once_with('write_queue', fetchResults, wait_for_result=False)
+    assert queueManager.fetchCompletedQueue.qsize() == 0
+    assert queueManager.getQueueMetrics()['fetch_completed']['shed_count'] == 1
+    queueManager.shutdown()
+
+
+def test_queue_manager_prepare_next_cycle():
+    import threading
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import PluginTypes
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder,
+                                  '2021-06-10',
+                                  config_file)
+    queueManager = app_inst.queue_manager
+    contentPlugin = MagicMock()
+    contentPlugin.pluginType = PluginTypes.MODULE_NEWS_CONTENT
+    contentPlugin.counterLock = threading.Lock()
+    contentPlugin.pluginState = PluginTypes.STATE_STOPPED
+    contentPlugin.urlQueueTotalSize = 40
+    contentPlugin.urlProcessedCount = 40
+    queueManager.pluginNameToObjMap = {'mod_en_in_ndtv': contentPlugin}
+    dataPipeline = MagicMock()
+    queueManager.dataProcPipeline = dataPipeline
+    queueManager.worker_pairs = {'mod_en_in_ndtv': MagicMock()}
+    queueManager.finishCycle()
+    assert queueManager.shutdown_event.is_set()
+    assert not queueManager.stop_requested.is_set(), 'Finishing a cycle should not stop the application'
+    dataPipeline.shutdown.assert_not_called()
+    queueManager.prepareNextCycle(['mod_en_in_ndtv'])
+    assert not queueManager.shutdown_event.is_set()
+    assert queueManager.worker_pairs == {}
+    assert queueManager.cyclePluginNames == {'mod_en_in_ndtv'}
+    assert queueManager.dataProcPipeline is dataPipeline, 'Data processing pipeline was not kept warm'
+    assert queueManager.dbWorkerThread.is_alive()
+    contentPlugin.setURLQueue.assert_called_once()
+    assert contentPlugin.pluginState == PluginTypes.STATE_GET_URL_LIST
+    assert contentPlugin.urlQueueTotalSize == 0 and contentPlugin.urlProcessedCount == 0
+    queueManager.shutdown()
+    assert queueManager.stop_requested.is_set()
+    dataPipeline.shutdown.assert_called_once()
+
+
+def test_queue_manager_dataproc_falls_back_to_threads():
+    from concurrent.futures.process import BrokenProcessPool
+    from unittest.mock import MagicMock, patch
+    from newslookout.data_structs import PluginTypes
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder,
+                                  '2021-06-10',
+                                  config_file)
+    queueManager = app_inst.queue_manager
+    app_inst.app_config.dataproc_mode = 'processes'
+    queueManager.config(app_inst.app_config)
+    dataProcPlugin = MagicMock()
+    dataProcPlugin.pluginType = PluginTypes.MODULE_DATA_PROCESSOR
+    dataProcPlugin.executionPriority = 3
+    dataProcPlugin.dependsOnPlugins = None
+    queueManager.pluginNameToObjMap = {'mod_keywordflags': dataProcPlugin}
+    with patch('newslookout.queue_manager.DataProcessPool.start', side_effect=BrokenProcessPool('init failed')):
+        queueManager.initDataProcWorkers()
+    assert queueManager.dataProcessPool is None
+    assert app_inst.app_config.dataproc_mode == 'threads'
+    dataProcPlugin.additionalConfig.assert_called_once_with(queueManager.sessionHistoryDB)
+    assert len(queueManager.dataProcessWorkerList) == queueManager.dataproc_threads
+    assert all(worker.process_pool is None and worker.pipeline is queueManager.dataProcPipeline
+               for worker in queueManager.dataProcessWorkerList), 'Plugins are not run in threads'
+
+
+def test_queue_status_from_progress_counters():
+    import queue
+    from unittest.mock import MagicMock, patch
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder,
+                                  '2021-06-10',
+                                  config_file)
+    queueManager = app_inst.queue_manager
+    queueManager.config(app_inst.app_config)
+    contentPlugin = mod_en_in_ndtv()
+    queueManager._initPluginQueue('mod_en_in_ndtv', contentPlugin)
+    queueManager.pluginNameToObjMap = {'mod_en_in_ndtv': contentPlugin}
+    queueManager.dataProcessWorkerList = [MagicMock()]
+    contentPlugin.queueURLs([f'https://www.ndtv.com/business/news-{i}' for i in range(5)])
+    contentPlugin.putQueueEndMarker()
+    fetchedURL = contentPlugin.getNextItemFromFetchQueue(timeout=1)
+    queueManager.addToScrapeCompletedQueue(
+        ExecutionResult(fetchedURL, 1000, 500, None, 'mod_en_in_ndtv', success=True))
+    # the status is read from the counters, without locking the queues for their sizes:
+    with patch.object(queue.Queue, 'qsize', side_effect=AssertionError('Queue size was polled')):
+        queueManager.q_status.updateStatus()
+    assert queueManager.q_status.fetchPendingCount == 4
+    assert queueManager.q_status.qsizeMap['mod_en_in_ndtv'] == 4
+    assert queueManager.q_status.fetchCompletCount == 1
+    assert queueManager.q_status.dataInputQsize == 1
+    assert queueManager.q_status.dataOutputQsize == 0
+    queueManager.fetchFromDataProcInputQ(timeout=1)
+    queueManager.addToDataProcessedQueue(ExecutionResult(fetchedURL, 1000, 500, None, 'mod_en_in_ndtv'))
+    queueManager.q_status.updateStatus()
+    assert queueManager.q_status.dataInputQsize == 0
+    assert queueManager.q_status.dataOutputQsize == 1
+    assert queueManager.getQueueMetrics()['counters']['fetch_succeeded'] == {'mod_en_in_ndtv': 1}
+
+
 if __name__ == "__main__":
     test_queue_manager_init_config()
 
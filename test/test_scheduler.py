@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_scheduler.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for the schedules of the scrape cycles in daemon mode
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+# import standard python libraries:
+from datetime import datetime
+
+import pytest
+
+# ###################################
+
+
+def test_cron_schedule_next_time():
+    from newslookout.scheduler import CronSchedule
+    everyQuarterHour = CronSchedule('*/15 * * * *')
+    assert everyQuarterHour.getNextTime(datetime(2021, 6, 10, 10, 7, 30)) == datetime(2021, 6, 10, 10, 15)
+    assert everyQuarterHour.getNextTime(datetime(2021, 6, 10, 10, 15)) == datetime(2021, 6, 10, 10, 30), \
+        'Next time should be strictly after the given time'
+    assert everyQuarterHour.getNextTime(datetime(2021, 12, 31, 23, 50)) == datetime(2022, 1, 1, 0, 0)
+    # Friday 2021-06-11, next weekday run is on Monday:
+    weekdayMornings = CronSchedule('30 6 * * 1-5')
+    assert weekdayMornings.getNextTime(datetime(2021, 6, 11, 7, 0)) == datetime(2021, 6, 14, 6, 30)
+    assert CronSchedule('0 0 29 2 *').getNextTime(datetime(2021, 6, 10)) == datetime(2024, 2, 29, 0, 0)
+    assert CronSchedule('0 8-18/2 * * 0').getNextTime(datetime(2021, 6, 10, 9, 0)) == datetime(2021, 6, 13, 8, 0)
+    # with both day fields restricted, either of them matches, as in cron:
+    assert CronSchedule('0 0 1 * 1').getNextTime(datetime(2021, 6, 10)) == datetime(2021, 6, 14, 0, 0)
+
+
+def test_cron_schedule_invalid_expressions():
+    from newslookout.scheduler import CronSchedule
+    for expression in ['* * * *', '60 * * * *', '*/0 * * * *', 'a * * * *', '5-1 * * * *']:
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+
+def test_daemon_scheduler_due_plugins():
+    from newslookout.scheduler import DaemonScheduler
+    startTime = datetime(2021, 6, 10, 10, 7)
+    scheduler = DaemonScheduler({'mod_en_in_ndtv': '*/15 * * * *', 'mod_en_in_forbes': '0 * * * *'},
+                                startTime=startTime)
+    assert sorted(scheduler.getDuePlugins(startTime)) == ['mod_en_in_forbes', 'mod_en_in_ndtv'], \
+        'All plugins should be due when the daemon starts'
+    scheduler.markRun(['mod_en_in_ndtv', 'mod_en_in_forbes'], datetime(2099, 1, 1, 10, 7))
+    assert scheduler.getDuePlugins(datetime(2099, 1, 1, 10, 10)) == []
+    assert scheduler.getDuePlugins(datetime(2099, 1, 1, 10, 15)) == ['mod_en_in_ndtv']
+    assert scheduler.getNextRunTime() == datetime(2099, 1, 1, 10, 15)
+    status = scheduler.getStatus()
+    assert status['cycles_run'] == 1
+    assert status['plugins']['mod_en_in_forbes']['next_run'] == '2099-01-01T11:00:00'
+    assert status['plugins']['mod_en_in_forbes']['last_run'] == '2099-01-01T10:07:00'
+
+
+# end of file
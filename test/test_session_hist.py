@@ -191,6 +191,35 @@ def test_addURLsToPendingTable():
         os.remove(testdbFile)
 
 
+def test_retrievePendingBatch_and_evictPendingURLs(tmp_path):
+    import time
+    import newslookout.session_hist
+    testdbFile = os.path.join(tmp_path, 'pending.db')
+    # a database of an older version, without the time of the last attempt:
+    with sqlite3.connect(testdbFile) as con:
+        con.execute('create table pending_urls (url varchar(255) NOT NULL PRIMARY KEY,'
+                    ' plugin_name varchar(100), attempts integer)')
+        con.executemany('INSERT INTO pending_urls VALUES (?, ?, ?)',
+                        [('https://site1/old-retried', 'plugin1', 2), ('https://site1/old', 'plugin1', 1),
+                         ('https://site1/too-many', 'plugin1', 5), ('https://site2/other', 'plugin2', 1)])
+    sessionHistoryDB = newslookout.session_hist.SessionHistory(testdbFile, threading.Semaphore())
+    sessionHistoryDB.addURLsToPendingTable(['https://site1/new'], 'plugin1')
+    runStartTime = time.time()
+    assert sessionHistoryDB.countPendingURLs('plugin1') == 4
+    assert sessionHistoryDB.evictPendingURLs('plugin1', maxAttempts=3) == 1
+    firstBatch = sessionHistoryDB.retrievePendingBatch('plugin1', 2, runStartTime)
+    assert firstBatch == ['https://site1/old', 'https://site1/new'], 'Fewest attempts and oldest should come first'
+    assert sessionHistoryDB.retrievePendingBatch('plugin1', 2, runStartTime) == ['https://site1/old-retried']
+    assert sessionHistoryDB.retrievePendingBatch('plugin1', 2, runStartTime) == [], \
+        'URLs being fetched during this run were retrieved again'
+    assert sessionHistoryDB.evictPendingURLs('plugin1', urlList=['https://site1/new']) == 1
+    with sqlite3.connect(testdbFile) as con:
+        attempts = dict(con.execute('SELECT url, attempts FROM pending_urls').fetchall())
+        failedURLs = [row[0] for row in con.execute('SELECT url FROM FAILED_URLS').fetchall()]
+    assert attempts == {'https://site1/old-retried': 3, 'https://site1/old': 2, 'https://site2/other': 1}
+    assert sorted(failedURLs) == ['https://site1/new', 'https://site1/too-many']
+
+
 def test_addURLToFailedTable():
     # Test - addURLToFailedTable()
     (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
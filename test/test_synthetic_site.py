@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_synthetic_site.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for the local synthetic news site server used for load testing
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+# import standard python libraries:
+import io
+import zipfile
+
+import pytest
+import requests
+
+from . import getAppFolders, getMockAppInstance
+
+# ###################################
+
+
+@pytest.fixture()
+def synthetic_site():
+    """Start the synthetic news site on a free port, stop it after the test."""
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    from newslookout.synthetic_site import SyntheticNewsSite
+    site = SyntheticNewsSite(port=0, fixture_dir=testdataFolder, articles_per_page=20, article_count=100).start()
+    yield site
+    site.stop()
+    from newslookout.network import NetworkFetcher
+    NetworkFetcher.cassetteSession = None
+
+
+def getRoutedSession(site):
+    from newslookout.synthetic_site import mountSyntheticSiteAdapter
+    return mountSyntheticSiteAdapter(requests.Session(), site.baseURL)
+
+
+def test_rss_feed_and_list_pages(synthetic_site):
+    session = getRoutedSession(synthetic_site)
+    response = session.get('https://feeds.feedburner.com/ndtvprofit-latest')
+    assert response.status_code == 200
+    assert response.url == 'https://feeds.feedburner.com/ndtvprofit-latest', 'Original URL not retained'
+    assert response.text.count('<item>') == 20
+    assert response.text.find('https://www.ndtv.com/business/synthetic-news-') > 0
+    mainPage = session.get('https://economictimes.indiatimes.com/industry').text
+    assert mainPage.count('/articleshow/') == 20
+    nextPage = session.get('https://economictimes.indiatimes.com/industry?page=1').text
+    assert nextPage != mainPage, 'Subsequent list pages should link to other articles'
+    archivePage = session.get(
+        'https://economictimes.indiatimes.com/archivelist/year-2021,month-6,starttime-44357.cms').text
+    assert archivePage.count('/articleshow/') == 20
+
+
+def test_article_pages_templated_from_fixtures(synthetic_site):
+    session = getRoutedSession(synthetic_site)
+    articleHTML = session.get('https://www.ndtv.com/business/synthetic-news-1000042').text
+    assert articleHTML.find('1000042') > 0
+    assert articleHTML.find('2373245') < 0, 'Fixture article ID was not substituted'
+    genericHTML = session.get('https://trak.in/news/synthetic-news-1000043').text
+    assert genericHTML.find('Synthetic news article 1000043') > 0
+
+
+def test_data_archives(synthetic_site):
+    session = getRoutedSession(synthetic_site)
+    bseArchive = session.get('https://www.bseindia.com/download/BhavCopy/Equity/EQ_ISINCODE_100621.zip')
+    with zipfile.ZipFile(io.BytesIO(bseArchive.content)) as archive:
+        assert archive.namelist() == ['EQ_ISINCODE_100621.CSV']
+    gdeltArchive = session.get('http://data.gdeltproject.org/events/20210203.export.CSV.zip')
+    assert gdeltArchive.headers['Content-Type'] == 'application/zip'
+    assert zipfile.is_zipfile(io.BytesIO(gdeltArchive.content))
+
+
+def test_error_and_throttling_knobs(synthetic_site):
+    session = getRoutedSession(synthetic_site)
+    synthetic_site.throttle_rate = 1.0
+    response = session.get('https://www.ndtv.com/business/synthetic-news-1000001')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
+    synthetic_site.throttle_rate = 0.0
+    synthetic_site.error_rate = 1.0
+    assert session.get('https://www.ndtv.com/business/synthetic-news-1000001').status_code == 500
+    synthetic_site.error_rate = 0.0
+    assert session.get('https://www.ndtv.com/business/synthetic-news-1000001').status_code == 200
+    assert synthetic_site.getStats()['status'] == {429: 1, 500: 1, 200: 1}
+
+
+def test_plugin_fetches_from_synthetic_site(synthetic_site):
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    app_inst.app_config.network_mode = 'synthetic'
+    app_inst.app_config.synthetic_site_url = synthetic_site.baseURL
+    app_inst.app_config.config_parser.set('plugins', 'mod_en_in_ndtv_rss_feeds',
+                                          'https://feeds.feedburner.com/synthetic?page=3')
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    pluginClassInst = mod_en_in_ndtv()
+    pluginClassInst.config(app_inst.app_config)
+    pluginClassInst.initNetworkHelper()
+    assert pluginClassInst.all_rss_feeds == ['https://feeds.feedburner.com/synthetic?page=3']
+    content, http_error = pluginClassInst.networkHelper.fetchRawDataFromURL(
+        pluginClassInst.all_rss_feeds[0], pluginClassInst.pluginName)
+    assert http_error is None
+    assert content.count('https://www.ndtv.com/business/synthetic-news-') == 20
+    assert synthetic_site.getStats()['requests'] == 1
+
+
+# end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ File name: test_url_filter.py
+ Application: The NewsLookout Web Scraping Application
+ Date: 2021-06-23
+ Purpose: Test for the compiled filter of the URLs to be fetched by a plugin
+ Copyright 2021, The NewsLookout Web Scraping Application, Sandeep Singh Sandhu, sandeep.sandhu@gmx.com
+
+
+ Notice:
+ This software is intended for demonstration and educational purposes only. This software is
+ experimental and a work in progress. Under no circumstances should these files be used in
+ relation to any critical system(s). Use of these files is at your own risk.
+
+ Before using it for web scraping any website, always consult that website's terms of use.
+ Do not use this software to fetch any data from any website that has forbidden use of web
+ scraping or similar mechanisms, or violates its terms of use in any other way. The author is
+ not liable for such kind of inappropriate use of this software.
+
+ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR
+ PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE
+ FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ DEALINGS IN THE SOFTWARE.
+
+"""
+
+# ###################################
+
+
+import os
+
+from . import getAppFolders, getMockAppInstance
+from . import read_bz2html_file
+
+# ###################################
+
+
+def test_compileSubStringsPattern():
+    from newslookout.url_filter import compileSubStringsPattern
+    subStrings = ['/video/', '/videos/', '/vid', 'photo', 'a.b*c', None]
+    pattern = compileSubStringsPattern(subStrings)
+    for text in ['x/video/y', 'x/videos/y', 'x/vidz', 'photos', 'xa.b*cx']:
+        assert pattern.search(text) is not None, f'Sub-string not found in {text}'
+    for text in ['x/vi/y', 'phot', 'xa_b*cx', 'a.bbc']:
+        assert pattern.search(text) is None, f'No sub-string should be found in {text}'
+    assert compileSubStringsPattern([]) is None
+    assert compileSubStringsPattern([None]) is None
+
+
+def test_URLFilter_same_as_filter_functions():
+    """ The compiled filter should keep exactly the URLs kept by filtering with the lists of URLs and sub-strings.
+    """
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    from newslookout.plugins.mod_en_in_ecotimes import mod_en_in_ecotimes
+    from newslookout.scraper_utils import retainValidArticles, removeInValidArticles, deDupeList, is_valid_url
+    from newslookout.scraper_utils import sameURLWithoutQueryParams
+    from newslookout.url_filter import URLFilter
+    pluginClassInst = mod_en_in_ecotimes()
+    pluginClassInst.config(app_inst.app_config)
+    assert isinstance(pluginClassInst.urlFilter, URLFilter), 'URL filter not compiled when configuring the plugin'
+    htmlContent = read_bz2html_file(os.path.join(testdataFolder, 'mod_en_in_ecotimes_73837853.html.bz2'))
+    urlList = pluginClassInst.extractLinksFromHTML('https://economictimes.indiatimes.com/markets', htmlContent)
+    urlList = urlList + pluginClassInst.nonContentURLs[:20] + \
+        [nonContentURL + '?from=mdr' for nonContentURL in pluginClassInst.nonContentURLs[20:40]]
+    expectedInvalidFiltered = removeInValidArticles(retainValidArticles(urlList, pluginClassInst.validURLStringsToCheck),
+                                                    pluginClassInst.invalidURLSubStrings)
+    assert pluginClassInst.filterInvalidURLs(urlList) == expectedInvalidFiltered
+    expectedContentURLs = [url for url in deDupeList(expectedInvalidFiltered) if
+                           is_valid_url(url) is True and
+                           not any(sameURLWithoutQueryParams(url, nonContentURL)
+                                   for nonContentURL in pluginClassInst.nonContentURLs) and
+                           not any(nonContentString in url for nonContentString in pluginClassInst.nonContentStrings)]
+    contentURLs = pluginClassInst.filterNonContentURLs(urlList)
+    assert len(contentURLs) > 0
+    assert contentURLs == expectedContentURLs
+    assert pluginClassInst.urlFilter.isNonContentURL(pluginClassInst.nonContentURLs[0] + '?abc=1') is True
+    assert pluginClassInst.urlFilter.isNonContentURL(contentURLs[0]) is False
+
+# end of file
@@ -161,6 +161,752 @@ def test_DataProcessor_processItem_skips_already_processed():
     assert called == [], 'processItem must not call loadDocument for already-processed URLs'
 
 
+def test_DataProcessor_processes_items_back_to_back():
+    """A data processing thread with cheap plugins should process the queued items without sleeping between them."""
+    from unittest.mock import MagicMock, patch
+    from newslookout.queue_manager import QueueManager
+    from newslookout.worker import DataProcessor
+    from newslookout.data_structs import ExecutionResult
+    itemCount = 500
+
+    class CheapPlugin:
+        pluginName = 'cheap'
+
+        def loadDocument(self, fileName):
+            return MagicMock()
+
+        def processDataObj(self, newsEventObj):
+            pass
+    queueManager = QueueManager()
+    for i in range(itemCount):
+        queueManager.dataProcQueue.put(ExecutionResult(
+            f'https://example.com/article/{i}', 1000, 500, '2021-06-10', 'test_plugin',
+            dataFileName=f'/data/test_plugin_{i}', success=True))
+    queueStatus = MagicMock()
+    queueStatus.isPluginStillFetchingoverNetwork = False
+    queueStatus.dataInputQsize = itemCount
+    workerInst = DataProcessor({1: CheapPlugin(), 2: CheapPlugin()}, [1, 2], queueManager, queueStatus,
+                               name='bench', daemon=True)
+    with patch('newslookout.worker.time.sleep') as mockSleep:
+        workerInst.run()
+    assert workerInst.itemsProcessed == itemCount
+    assert queueManager.getDataProcessedQueueSize() == itemCount
+    mockSleep.assert_not_called()
+
+
+def test_DataProcessor_uses_article_in_memory_and_saves_once():
+    """The parsed article should be passed to the data processing plugins in memory and saved once after them."""
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.news_event import NewsEvent
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.queue_manager import QueueManager
+    from newslookout.worker import DataProcessor
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    contentPlugin = mod_en_in_ndtv()
+    contentPlugin.config(app_inst.app_config)
+    contentPlugin.deferArticleWrite = True
+    contentPlugin.writeFiles = MagicMock()
+    article = NewsEvent()
+    article.setURL('https://www.ndtv.com/business/sample-article-2373245')
+    article.setArticleID('2373245')
+    article.setPublishDate('2021-06-10')
+    article.setText('Sample article text. ' * 50)
+    fetchResult = contentPlugin.saveParsedData(article.getURL(), article, [], '<html>sample</html>',
+                                               ExecutionResult(article.getURL(), 0, 0, None, 'mod_en_in_ndtv'))
+    assert fetchResult.wasSuccessful is True
+    assert fetchResult.article is article
+    assert contentPlugin.writeFiles.call_count == 0, 'Article was saved before the data processing plugins'
+    processedBy = []
+
+    class FlagPlugin:
+        pluginName = 'flag'
+
+        def __init__(self, flagName):
+            self.flagName = flagName
+
+        def loadDocument(self, fileName):
+            raise AssertionError('Document must not be re-read from disk')
+
+        def processDataObj(self, newsEventObj):
+            processedBy.append(self.flagName)
+            newsEventObj.setTriggerWordFlag(self.flagName, 1)
+    queueManager = QueueManager()
+    queueManager.pluginNameToObjMap = {'mod_en_in_ndtv': contentPlugin}
+    DataProcessor.processItem(queueManager, fetchResult, [1, 2],
+                              {1: FlagPlugin('first'), 2: FlagPlugin('second')}, 'worker-1')
+    assert processedBy == ['first', 'second']
+    assert contentPlugin.writeFiles.call_count == 1, 'Article was not saved exactly once'
+    savedArticle, savedFileName, savedHTML = contentPlugin.writeFiles.call_args[0]
+    assert savedArticle.getTriggerWords() == {'first': 1, 'second': 1}
+    assert savedFileName == fetchResult.savedDataFileName
+    assert savedHTML == b'<html>sample</html>'
+    assert fetchResult.article is None and fetchResult.rawHTML is None, 'Saved article was not released'
+
+
+def test_DataProcPipeline_runs_independent_plugins_concurrently():
+    """Plugins that do not depend on each other should run concurrently on the same article."""
+    import time
+    from unittest.mock import MagicMock
+    from newslookout.worker import DataProcPipeline
+    events = []
+
+    class TimedPlugin:
+        def __init__(self, pluginName, priority, dependsOnPlugins, duration):
+            self.pluginName = pluginName
+            self.executionPriority = priority
+            self.dependsOnPlugins = dependsOnPlugins
+            self.duration = duration
+
+        def loadDocument(self, fileName):
+            return MagicMock()
+
+        def processDataObj(self, newsEventObj):
+            events.append(('start', self.pluginName, time.time()))
+            time.sleep(self.duration)
+            events.append(('end', self.pluginName, time.time()))
+    pluginsMap = {'prep': TimedPlugin('prep', 1, [], 0.05),
+                  'flags': TimedPlugin('flags', 3, ['prep'], 0.3),
+                  'classify': TimedPlugin('classify', 3, ['prep'], 0.3),
+                  'index': TimedPlugin('index', 5, ['prep', 'flags', 'classify', 'not_enabled'], 0.05)}
+    pipeline = DataProcPipeline(pluginsMap, ['prep', 'classify', 'flags', 'index'], max_parallel=4)
+    assert pipeline.getStatus() == {'stages': [['prep'], ['classify', 'flags'], ['index']], 'parallel': True}
+    assert pipeline.getDependentKeys(['flags']) == ['flags', 'index']
+    startTime = time.time()
+    assert pipeline.run('https://example.com/a', '/data/a.json', 'worker-1') is not None
+    elapsed = time.time() - startTime
+    pipeline.shutdown()
+    times = {(event, name): at for (event, name, at) in events}
+    assert times[('start', 'flags')] >= times[('end', 'prep')]
+    assert times[('start', 'classify')] < times[('end', 'flags')], 'Independent plugins did not overlap'
+    assert times[('start', 'index')] >= max(times[('end', 'flags')], times[('end', 'classify')])
+    # the critical path is 0.4 seconds, running them one by one takes 0.7 seconds:
+    assert elapsed < 0.6
+
+
+def test_DataProcPipeline_keeps_priority_order_without_dependencies():
+    from newslookout.worker import DataProcPipeline
+    processedBy = []
+
+    class PriorityPlugin:
+        def __init__(self, pluginName, priority):
+            self.pluginName = pluginName
+            self.executionPriority = priority
+
+        def processDataObj(self, newsEventObj):
+            processedBy.append(self.pluginName)
+    pluginsMap = {'a': PriorityPlugin('a', 1), 'b': PriorityPlugin('b', 2), 'c': PriorityPlugin('c', 3)}
+    pipeline = DataProcPipeline(pluginsMap, ['a', 'b', 'c'], max_parallel=4)
+    assert pipeline.getStages() == [['a'], ['b'], ['c']]
+    assert pipeline.executor is None, 'No thread pool is needed when plugins cannot run concurrently'
+    pipeline.run('https://example.com/a', '/data/a.json', 'worker-1', article=object())
+    assert processedBy == ['a', 'b', 'c']
+    # cyclic dependencies fall back to the priority order:
+    pluginsMap['a'].dependsOnPlugins = ['c']
+    pluginsMap['c'].dependsOnPlugins = ['a']
+    assert DataProcPipeline(pluginsMap, ['a', 'b', 'c']).getStages() == [['a'], ['b'], ['c']]
+
+
+def test_initDataProcWorkers_keeps_plugins_with_same_priority():
+    from unittest.mock import MagicMock
+    from newslookout.queue_manager import QueueManager
+
+    class SamePriorityPlugin:
+        pluginType = PluginTypes.MODULE_DATA_PROCESSOR
+        executionPriority = 3
+        dependsOnPlugins = []
+
+        def __init__(self, pluginName):
+            self.pluginName = pluginName
+    queueManager = QueueManager()
+    queueManager.app_config = MagicMock(dataproc_mode='threads', dataproc_parallel_plugins=4, dataproc_threads_max=0)
+    queueManager.dataproc_threads = 3
+    queueManager.pluginNameToObjMap = {'mod_keywordflags': SamePriorityPlugin('mod_keywordflags'),
+                                       'mod_eventclass': SamePriorityPlugin('mod_eventclass')}
+    queueManager.initDataProcWorkers()
+    assert sorted(queueManager.dataProcPluginsMap.keys()) == ['mod_eventclass', 'mod_keywordflags']
+    assert queueManager.dataProcPipeline.getStages() == [['mod_eventclass', 'mod_keywordflags']]
+    assert len(queueManager.dataProcessWorkerList) == 3, 'Thread count should not depend on the plugins count'
+    assert queueManager.dataProcAutoscaler is None
+    assert all(worker.pipeline is queueManager.dataProcPipeline for worker in queueManager.dataProcessWorkerList)
+    queueManager.dataProcPipeline.shutdown()
+
+
+def test_DataProcAutoscaler_grows_and_shrinks_with_queue_depth():
+    import time
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.queue_manager import QueueManager
+    from newslookout.worker import DataProcessor, DataProcPipeline, DataProcAutoscaler
+
+    class SlowPlugin:
+        pluginName = 'slow'
+        executionPriority = 1
+
+        def loadDocument(self, fileName):
+            return MagicMock()
+
+        def processDataObj(self, newsEventObj):
+            time.sleep(0.01)
+    queueManager = QueueManager()
+    # a content plugin is still fetching, so the idle threads wait for more items:
+    queueManager.worker_pairs = {'fetching': MagicMock(is_alive=lambda: True)}
+    for i in range(100):
+        queueManager.dataProcQueue.put(ExecutionResult(f'https://example.com/article/{i}', 1000, 500, None,
+                                                       'test_plugin', dataFileName=f'/data/{i}', success=True))
+    pipeline = DataProcPipeline({'slow': SlowPlugin()}, ['slow'])
+    queueStatus = MagicMock(isPluginStillFetchingoverNetwork=True, dataInputQsize=100)
+
+    def create_worker(workerIndex):
+        workerInst = DataProcessor(pipeline.plugins, pipeline.order, queueManager, queueStatus,
+                                   name=f'DataProc-{workerIndex}', daemon=True, pipeline=pipeline)
+        workerInst.queueBlockTimeout = 0.1
+        return workerInst
+    autoscaler = DataProcAutoscaler(queueManager, create_worker, min_threads=1, max_threads=4,
+                                    items_per_thread=10, scale_down_checks=1)
+    autoscaler.check()
+    assert len(autoscaler.getActiveWorkers()) == 4, 'Pool did not grow with the queue depth'
+    deadline = time.time() + 30
+    while not queueManager.dataProcQueue.empty() and time.time() < deadline:
+        time.sleep(0.05)
+    for i in range(5):
+        autoscaler.check()
+    assert len(autoscaler.getActiveWorkers()) == 1, 'Pool did not shrink to its minimum size'
+    assert autoscaler.get_status()['peak_threads'] == 4 and autoscaler.get_status()['scaled_down'] == 3
+    queueManager.shutdown_event.set()
+    for workerInst in queueManager.dataProcessWorkerList:
+        workerInst.join(timeout=10)
+        assert not workerInst.is_alive()
+    assert sum(workerInst.itemsProcessed for workerInst in queueManager.dataProcessWorkerList) == 100
+
+
+def test_DataProcessPool_processes_items_in_worker_processes(tmp_path):
+    """Items should be processed by reference in worker processes that load the plugins once."""
+    import os
+    from datetime import datetime
+    from unittest.mock import MagicMock
+    from newslookout.queue_manager import QueueManager
+    from newslookout.worker import DataProcessor, DataProcessPool
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.news_event import NewsEvent
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    processPool = DataProcessPool(config_file, '2021-06-10', {'mod_keywordflags': 3}, num_processes=2)
+    assert processPool.num_processes == 2
+    processPool.start()
+    queueManager = QueueManager()
+    try:
+        for i in range(6):
+            newsEvent = NewsEvent()
+            newsEvent.setURL(f'https://example.com/article/{i}')
+            newsEvent.setPublishDate(datetime(2021, 6, 10))
+            newsEvent.setText('The company reported a loss and announced a lay-off of its employees.')
+            dataFileName = str(tmp_path / f'mod_test_{i}')
+            with open(dataFileName + '.json', 'wt', encoding='utf-8') as fp:
+                fp.write(newsEvent.toJSON())
+            queueManager.dataProcQueue.put(ExecutionResult(
+                f'https://example.com/article/{i}', 1000, 500, '2021-06-10', 'mod_test',
+                dataFileName=dataFileName, success=True))
+        processIDs = set()
+        while not queueManager.dataProcQueue.empty():
+            itemInQueue = queueManager.fetchFromDataProcInputQ(block=False)
+            processIDs.add(processPool.processItem(itemInQueue))
+        assert os.getpid() not in processIDs, 'Items were not processed in the worker processes'
+        assert len(processIDs) <= 2, 'Worker processes were not reused for subsequent items'
+        for i in range(6):
+            processedEvent = NewsEvent()
+            processedEvent.readFromJSON(str(tmp_path / f'mod_test_{i}.json'))
+            triggerWords = processedEvent.urlData.get('triggerwords', {})
+            assert triggerWords.get('FLAG_EVENT_LAYOFFS') == 1, 'Plugin did not flag the saved document'
+            assert triggerWords.get('FLAG_EVENT_STRIKE') == 0
+        # the data processor hands over items to the pool and collects them into the completed queue:
+        queueManager.dataProcQueue.put(ExecutionResult(
+            'https://example.com/article/99', 1000, 500, '2021-06-10', 'mod_test',
+            dataFileName=str(tmp_path / 'mod_test_0'), success=True))
+        workerInst = DataProcessor({}, [], queueManager, MagicMock(), name='proc', process_pool=processPool)
+        workerInst.processItemInPool(queueManager.fetchFromDataProcInputQ(block=False))
+        assert queueManager.getDataProcessedQueueSize() == 1
+        assert 'https://example.com/article/99' in queueManager.alreadyDataProcList
+    finally:
+        processPool.shutdown()
+
+
+def test_DataProcessPool_fails_to_start_if_plugins_are_not_loaded(tmp_path):
+    """The pool should not start if its worker processes cannot load the plugins."""
+    import pytest
+    from newslookout.worker import DataProcessPool
+    processPool = DataProcessPool(str(tmp_path / 'missing.conf'), '2021-06-10', {'mod_keywordflags': 3},
+                                  num_processes=1)
+    with pytest.raises(Exception):
+        processPool.start()
+    assert processPool.executor is None
+
+
+def test_DataProcessPool_dedupes_items_of_different_worker_processes(tmp_path):
+    """Duplicate articles handed over to different worker processes should still be compared with each other,
+    the de-duplication plugin runs in the application's process."""
+    import difflib
+    import glob
+    from datetime import datetime
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.news_event import NewsEvent
+    from newslookout.plugins.mod_dedupe import mod_dedupe
+    from newslookout.queue_manager import QueueManager
+    from newslookout.worker import DataProcessor, DataProcessPool, DataProcPipeline
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    app_inst.app_config.data_dir = str(tmp_path)
+
+    class TextDoc:
+        """Text embedding with the similarity of the texts, instead of the spacy model."""
+        def __init__(self, text):
+            self.text = text
+
+        def similarity(self, other):
+            return difflib.SequenceMatcher(None, self.text, other.text).ratio()
+    dedupePlugin = mod_dedupe()
+    assert dedupePlugin.runInMainProcess is True
+    dedupePlugin.config(app_inst.app_config)
+    dedupePlugin.sessionHistDB = MagicMock()
+    dedupePlugin.nlpModel = TextDoc
+    pipeline = DataProcPipeline({'mod_dedupe': dedupePlugin}, ['mod_dedupe'], max_parallel=1)
+    queueManager = QueueManager()
+    articleText = 'The central bank kept its policy rate unchanged on Thursday. ' * 40
+    items = []
+    for pluginName, articleID, text in [('mod_en_in_ndtv', '2373245', articleText + 'More details awaited.'),
+                                        ('mod_en_in_livemint', '11623254', articleText)]:
+        article = NewsEvent()
+        article.setURL(f'https://www.example.com/{pluginName}/{articleID}')
+        article.setArticleID(articleID)
+        article.setModuleName(pluginName)
+        article.setPublishDate(datetime(2021, 6, 10))
+        article.setText(text)
+        dataFileName = os.path.join(str(tmp_path), '2021-06-10', f'{pluginName}_{articleID}')
+        os.makedirs(os.path.dirname(dataFileName), exist_ok=True)
+        article.writeToJSON(dataFileName + '.json')
+        items.append(ExecutionResult(article.getURL(), 1000, len(text), '2021-06-10', pluginName,
+                                     dataFileName=dataFileName, success=True))
+    processPool = DataProcessPool(config_file, '2021-06-10', {'mod_keywordflags': 3}, num_processes=2)
+    processPool.start()
+    processIDs = []
+    poolProcessItem = processPool.processItem
+    processPool.processItem = lambda itemInQueue: processIDs.append(poolProcessItem(itemInQueue))
+    try:
+        # each article is handed over to the pool by a separate data processor, at the same time:
+        feederThreads = [threading.Thread(target=DataProcessor({}, [], queueManager, MagicMock(), name=f'proc-{i}',
+                                                               process_pool=processPool,
+                                                               pipeline=pipeline).processItemInPool,
+                                          args=(itemInQueue,))
+                         for i, itemInQueue in enumerate(items)]
+        for feederThread in feederThreads:
+            feederThread.start()
+        for feederThread in feederThreads:
+            feederThread.join(timeout=60)
+    finally:
+        processPool.shutdown()
+    assert len(processIDs) == 2 and os.getpid() not in processIDs, 'Items were not processed in the worker processes'
+    savedFiles = glob.glob(os.path.join(str(tmp_path), '**', '*.json'), recursive=True)
+    assert len(savedFiles) == 1, 'Duplicate article was not removed'
+    assert os.path.basename(savedFiles[0]).startswith('mod_en_in_ndtv'), 'The longer article was not kept'
+    processedEvent = NewsEvent()
+    processedEvent.readFromJSON(savedFiles[0])
+    assert 'FLAG_EVENT_LAYOFFS' in processedEvent.urlData.get('triggerwords', {}), \
+        'Worker process did not process the saved article'
+    assert dedupePlugin.sessionHistDB.addDupURLToDeleteTbl.call_count == 1
+    assert dedupePlugin.sessionHistDB.addDupURLToDeleteTbl.call_args[0][0] == items[1].URL
+    assert queueManager.getDataProcessedQueueSize() == 2
+
+
+def test_ContentFetchWorker_pool_shares_plugin_queue():
+    """A pool of content fetch workers should process every queued URL exactly once."""
+    import queue
+    import time
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_inexp_business import mod_en_in_inexp_business
+    from newslookout.worker import WorkerPair
+    pluginInst = mod_en_in_inexp_business()
+    pluginInst.setURLQueue(queue.Queue())
+    fetchedURLs = []
+    fetchingThreads = set()
+    stateWhileFetching = []
+
+    def fake_fetch(url, workerID):
+        time.sleep(0.01)
+        fetchedURLs.append(url)
+        fetchingThreads.add(threading.current_thread().name)
+        stateWhileFetching.append(pluginInst.pluginState)
+        return None
+    pluginInst.fetchDataFromURL = fake_fetch
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    pair = WorkerPair(pluginInst, MagicMock(), queueManager, worker_id='[1] test')
+    pair.initialize(run_date=None, url_timeout=60, fetch_workers=4)
+    assert len(pair.content_workers) == 4
+    assert pair.content_worker is pair.content_workers[0]
+    urlList = [f'https://www.newindianexpress.com/business/news-{i}' for i in range(40)]
+    for url in urlList:
+        pluginInst.urlQueue.put(url)
+    pluginInst.putQueueEndMarker()
+    pair.url_discovery_complete.set()
+    # the URL worker is not needed here, start only the content workers:
+    with pair._fetch_pool_lock:
+        pair._active_fetch_workers = len(pair.content_workers)
+    for worker in pair.content_workers:
+        worker.start()
+    for worker in pair.content_workers:
+        worker.join(timeout=20)
+    assert not any(w.is_alive() for w in pair.content_workers), 'Workers did not all receive the end marker'
+    assert sorted(fetchedURLs) == sorted(urlList), 'Each URL must be fetched exactly once'
+    assert pluginInst.urlProcessedCount == 40
+    assert len(fetchingThreads) > 1, 'URLs were not shared among the workers of the pool'
+    assert PluginTypes.STATE_STOPPED not in stateWhileFetching
+    assert pluginInst.pluginState == PluginTypes.STATE_STOPPED
+    assert pluginInst.urlQueue.empty(), 'End marker was left in the queue after the last worker exited'
+    assert pair.get_active_fetch_workers() == 0
+    assert pair.get_status()['fetch_workers'] == 4
+
+
+def test_URLDiscoveryWorker_drains_pending_urls(tmp_path):
+    """In the drain_pending run mode, the pending URLs should be queued for fetching instead of discovering URLs."""
+    import queue
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.session_hist import SessionHistory
+    from newslookout.worker import URLDiscoveryWorker
+    sessionHistoryDB = SessionHistory(os.path.join(tmp_path, 'history.db'), threading.Semaphore())
+    contentURLs = [f'https://www.ndtv.com/business/pending-news-{i}-{2373245 + i}' for i in range(25)]
+    sessionHistoryDB.addURLsToPendingTable(contentURLs + ['https://www.ndtv.com/video'], 'mod_en_in_ndtv')
+    pluginInst = mod_en_in_ndtv()
+    pluginInst.setURLQueue(queue.Queue())
+    pluginInst.getURLsListForDate = MagicMock(side_effect=AssertionError('URL discovery should be skipped'))
+    pluginInst.filterNonContentURLs = lambda urls: [url for url in urls if 'pending-news' in url]
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    queueManager.app_config.run_mode = 'drain_pending'
+    queueManager.app_config.drain_pending_batch_size = 10
+    queueManager.app_config.drain_pending_max_attempts = 3
+    completionEvent = threading.Event()
+    workerInst = URLDiscoveryWorker(pluginInst, sessionHistoryDB, queueManager, completionEvent, None, 60, 'drain')
+    queuedURLs = []
+
+    def consume():
+        while True:
+            url = pluginInst.urlQueue.get(timeout=10)
+            if url is None:
+                break
+            queuedURLs.append(url)
+            sessionHistoryDB.evictPendingURLs('mod_en_in_ndtv', urlList=[url])
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    workerInst.run()
+    consumer.join(timeout=10)
+    assert completionEvent.is_set()
+    assert sorted(queuedURLs) == sorted(contentURLs)
+    drainStatus = workerInst.get_drain_status()
+    assert drainStatus['pending_at_start'] == 26
+    assert drainStatus['queued'] == 25 and drainStatus['evicted'] == 1
+    assert drainStatus['pending_now'] == 0
+
+
+def test_URLDiscoveryWorker_streams_urls_during_discovery(tmp_path):
+    """URLs found by each discovery source should be queued before the whole discovery completes."""
+    import queue
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.session_hist import SessionHistory
+    from newslookout.worker import URLDiscoveryWorker
+    sessionHistoryDB = SessionHistory(os.path.join(tmp_path, 'history.db'), threading.Semaphore())
+    rssURLs = [f'https://www.ndtv.com/business/rss-news-{i}-{2373245 + i}' for i in range(3)]
+    mainPageURLs = rssURLs[1:] + ['https://www.ndtv.com/business/main-news-2373300']
+    slowSourceStarted = threading.Event()
+    slowSourceRelease = threading.Event()
+
+    def getURLsListForDate(runDate, sessionHistory):
+        pluginInst.streamDiscoveredURLs(rssURLs)
+        slowSourceStarted.set()
+        # a slow source, such as recursive link extraction:
+        slowSourceRelease.wait(timeout=10)
+        pluginInst.streamDiscoveredURLs(mainPageURLs)
+        return rssURLs + mainPageURLs
+    pluginInst = mod_en_in_ndtv()
+    pluginInst.setURLQueue(queue.Queue())
+    pluginInst.getURLsListForDate = getURLsListForDate
+    pluginInst.filterNonContentURLs = lambda urls: urls
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    queueManager.app_config.run_mode = 'normal'
+    queueManager.backfill = None
+    completionEvent = threading.Event()
+    workerInst = URLDiscoveryWorker(pluginInst, sessionHistoryDB, queueManager, completionEvent, None, 60, 'stream')
+    workerInst.start()
+    assert slowSourceStarted.wait(timeout=10)
+    assert pluginInst.urlQueue.get(timeout=5) == rssURLs[0], 'URLs were not queued during discovery'
+    assert not completionEvent.is_set()
+    slowSourceRelease.set()
+    workerInst.join(timeout=10)
+    assert completionEvent.is_set()
+    queuedURLs = [rssURLs[0]]
+    while True:
+        url = pluginInst.urlQueue.get_nowait()
+        if url is None:
+            break
+        queuedURLs.append(url)
+    assert queuedURLs == rssURLs + mainPageURLs[-1:], 'Duplicate URLs were queued'
+    assert workerInst.streamed_count == 4
+    assert workerInst.get_first_url_delay() is not None
+    assert pluginInst.urlDiscoveryCallback is None
+
+
+def test_URLDiscoveryWorker_cancels_discovery_at_timeout(tmp_path):
+    """At the timeout, discovery should be cancelled and its partial results queued, without orphan threads."""
+    import queue
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.session_hist import SessionHistory
+    from newslookout.worker import URLDiscoveryWorker
+    sessionHistoryDB = SessionHistory(os.path.join(tmp_path, 'history.db'), threading.Semaphore())
+    discoveryThreads = []
+
+    def getURLsListForDate(runDate, sessionHistory):
+        discoveryThreads.append(threading.current_thread())
+        foundURLs = []
+        # an endless discovery loop, such as paging through a site's archive:
+        while not pluginInst.isDiscoveryCancelled():
+            foundURLs.append(f'https://www.ndtv.com/business/archive-news-{2373245 + len(foundURLs)}')
+            pluginInst.getDiscoveryCancelToken().wait(timeout=0.2)
+        return foundURLs
+    pluginInst = mod_en_in_ndtv()
+    pluginInst.setURLQueue(queue.Queue())
+    pluginInst.getURLsListForDate = getURLsListForDate
+    pluginInst.filterNonContentURLs = lambda urls: urls
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    queueManager.app_config.run_mode = 'normal'
+    queueManager.backfill = None
+    completionEvent = threading.Event()
+    workerInst = URLDiscoveryWorker(pluginInst, sessionHistoryDB, queueManager, completionEvent, None, 1, 'cancel')
+    workerInst.start()
+    workerInst.join(timeout=20)
+    assert completionEvent.is_set()
+    assert not discoveryThreads[0].is_alive(), 'Discovery thread was left running after the timeout'
+    assert workerInst.get_cancel_reason() == 'timeout'
+    assert pluginInst.discoveryCancelToken is None
+    assert pluginInst.is_stopped is False, 'Plugin should not be stopped for its next discovery'
+    queuedURLs = []
+    while True:
+        url = pluginInst.urlQueue.get_nowait()
+        if url is None:
+            break
+        queuedURLs.append(url)
+    assert len(queuedURLs) > 5, 'URLs found before the timeout were not queued'
+
+
+def test_URLDiscoveryWorker_backfills_dates_concurrently(tmp_path):
+    """When backfilling, the dates should be discovered concurrently and each URL queued only once."""
+    import queue
+    import time
+    from datetime import datetime
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import BackfillProgress
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.session_hist import SessionHistory
+    from newslookout.worker import URLDiscoveryWorker
+    sessionHistoryDB = SessionHistory(os.path.join(tmp_path, 'history.db'), threading.Semaphore())
+    runDates = BackfillProgress.getDateRange(datetime(2021, 6, 1), datetime(2021, 6, 6))
+    backfill = BackfillProgress(runDates, parallelDates=3, pluginCount=1)
+    concurrency = {'active': 0, 'peak': 0}
+    concurrencyLock = threading.Lock()
+
+    def getURLsListForDate(runDate, sessionHistory):
+        with concurrencyLock:
+            concurrency['active'] += 1
+            concurrency['peak'] = max(concurrency['peak'], concurrency['active'])
+        time.sleep(0.2)
+        with concurrencyLock:
+            concurrency['active'] -= 1
+        # the main page lists the same article on consecutive dates:
+        return [f'https://www.ndtv.com/business/news-{runDate.day}-{2373245 + runDate.day}',
+                f'https://www.ndtv.com/business/news-{runDate.day + 1}-{2373245 + runDate.day + 1}']
+    pluginInst = mod_en_in_ndtv()
+    pluginInst.setURLQueue(queue.Queue())
+    pluginInst.getURLsListForDate = getURLsListForDate
+    pluginInst.filterNonContentURLs = lambda urls: urls
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    queueManager.app_config.run_mode = 'normal'
+    queueManager.backfill = backfill
+    completionEvent = threading.Event()
+    workerInst = URLDiscoveryWorker(pluginInst, sessionHistoryDB, queueManager, completionEvent,
+                                    runDates[0], 60, 'backfill')
+    workerInst.run()
+    assert completionEvent.is_set()
+    queuedURLs = []
+    while True:
+        url = pluginInst.urlQueue.get_nowait()
+        if url is None:
+            break
+        queuedURLs.append(url)
+    assert len(queuedURLs) == len(set(queuedURLs)) == 7
+    assert concurrency['peak'] == 3
+    backfill.recordFetched('mod_en_in_ndtv', queuedURLs[0])
+    status = backfill.getStatus()
+    assert status['date_from'] == '2021-06-01' and status['date_to'] == '2021-06-06'
+    assert all(dateStats['state'] == 'discovered' and dateStats['discovered'] == 2
+               for dateStats in status['dates'].values())
+    assert sum(dateStats['queued'] for dateStats in status['dates'].values()) == 7
+    assert sum(dateStats['fetched'] for dateStats in status['dates'].values()) == 1
+
+
+def test_FetchScheduler_shares_workers_across_plugins():
+    """The global fetch scheduler should move its workers to the plugins that still have work."""
+    import queue
+    import time
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_inexp_business import mod_en_in_inexp_business
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.worker import WorkerPair, FetchScheduler
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    scheduler = FetchScheduler(queueManager, MagicMock(), num_workers=4)
+    smallPlugin = mod_en_in_inexp_business()
+    largePlugin = mod_en_in_ndtv()
+    fetchedBy = {}
+
+    def make_fake_fetch(pluginName):
+        def fake_fetch(url, workerID):
+            time.sleep(0.01)
+            fetchedBy[url] = (pluginName, threading.current_thread().name)
+            return None
+        return fake_fetch
+    pairs = []
+    for pluginInst, urlCount in [(smallPlugin, 3), (largePlugin, 60)]:
+        pluginInst.setURLQueue(queue.Queue())
+        pluginInst.fetchDataFromURL = make_fake_fetch(pluginInst.pluginName)
+        pair = WorkerPair(pluginInst, MagicMock(), queueManager, worker_id=pluginInst.pluginName)
+        pair.initialize(run_date=None, url_timeout=60, fetch_workers=2, fetch_scheduler=scheduler)
+        assert pair.content_workers == [], 'Pair should not start its own content workers'
+        for i in range(urlCount):
+            pluginInst.urlQueue.put(f'https://{pluginInst.pluginName}.example.com/news-{i}')
+        pluginInst.putQueueEndMarker()
+        pair.url_discovery_complete.set()
+        pairs.append(pair)
+    scheduler.start()
+    scheduler.join(timeout=30)
+    assert not scheduler.is_alive(), 'Scheduler workers did not exit after all queues were processed'
+    assert len(fetchedBy) == 63
+    assert smallPlugin.pluginState == PluginTypes.STATE_STOPPED
+    assert largePlugin.pluginState == PluginTypes.STATE_STOPPED
+    largePluginWorkers = set(w for (name, w) in fetchedBy.values() if name == largePlugin.pluginName)
+    assert len(largePluginWorkers) == 4, 'Idle workers did not move to the plugin with the largest backlog'
+    assert scheduler.get_status()['plugins'][largePlugin.pluginName]['fetched'] == 60
+    assert not any(pair.is_alive() for pair in pairs)
+
+
+def test_FetchScheduler_skips_busy_domains():
+    """URLs should be picked from plugins whose web domain is not at its politeness limit."""
+    import queue
+    from unittest.mock import MagicMock
+    from newslookout.network import DomainRateLimiter
+    from newslookout.plugins.mod_en_in_inexp_business import mod_en_in_inexp_business
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.worker import FetchScheduler
+    rateLimiter = DomainRateLimiter(maxConnectionsPerDomain=1, minIntervalSec=0)
+    scheduler = FetchScheduler(MagicMock(), MagicMock(), num_workers=1, rate_limiter=rateLimiter)
+    busyPlugin = mod_en_in_inexp_business()
+    freePlugin = mod_en_in_ndtv()
+    for pluginInst in [busyPlugin, freePlugin]:
+        pluginInst.setURLQueue(queue.Queue())
+        scheduler.register_plugin(pluginInst, threading.Event())
+    for i in range(50):
+        busyPlugin.urlQueue.put(f'{busyPlugin.mainURL}news-{i}')
+    freePlugin.urlQueue.put(f'{freePlugin.mainURL}news-1')
+    assert rateLimiter.acquire(busyPlugin.mainURL) is True
+    plugin, url = scheduler.next_item()
+    assert plugin is freePlugin, 'URL was picked from a plugin whose domain is busy'
+    assert scheduler.next_item() is None
+    rateLimiter.release(busyPlugin.mainURL)
+    plugin, url = scheduler.next_item()
+    assert plugin is busyPlugin
+
+
+def test_ParseStage_parses_fetched_pages_on_separate_workers():
+    """With the parse stage enabled, fetch workers should only download, the parse workers parse and save."""
+    import os
+    import queue
+    from unittest.mock import MagicMock
+    from newslookout.data_structs import ExecutionResult
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.plugins.mod_in_nse import mod_in_nse
+    from newslookout.worker import ParseStage, ContentFetchWorker
+    from . import read_bz2html_file
+    (parentFolder, sourceFolder, testdataFolder, config_file) = getAppFolders()
+    app_inst = getMockAppInstance(parentFolder, '2021-06-10', config_file)
+    pluginInst = mod_en_in_ndtv()
+    pluginInst.config(app_inst.app_config)
+    pluginInst.initNetworkHelper()
+    assert ParseStage.supports_plugin(pluginInst) is True
+    assert ParseStage.supports_plugin(mod_in_nse()) is False, 'Plugins overriding fetchDataFromURL cannot be split'
+    htmlContent = read_bz2html_file(os.path.join(testdataFolder, 'mod_en_in_ndtv_2373245.html.bz2'))
+    threadNames = {'fetch': set(), 'save': set()}
+
+    def fake_fetch(url, workerID):
+        threadNames['fetch'].add(threading.current_thread().name)
+        return ExecutionResult(url, len(htmlContent), 0, None, pluginInst.pluginName), htmlContent
+
+    def fake_save(url, validData, additionalLinks, html, resultVal):
+        threadNames['save'].add(threading.current_thread().name)
+        resultVal.wasSuccessful = validData is not None and validData.getArticleID() is not None
+        resultVal.additionalLinks = []
+        return resultVal
+    pluginInst.fetchRawDataForURL = fake_fetch
+    pluginInst.saveParsedData = fake_save
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    parseStage = ParseStage(queueManager, MagicMock(), num_workers=2, queue_size=4)
+    queueManager.parseStage = parseStage
+    parseStage.start()
+    for i in range(6):
+        ContentFetchWorker.process_url(pluginInst, f'https://www.ndtv.com/business/sample-article-{i}',
+                                       MagicMock(), queueManager, 'fetcher', threading.Event())
+    parseStage.stop(timeout=60)
+    assert not parseStage.is_alive()
+    assert parseStage.get_pending() == 0
+    assert parseStage.get_status()['parsed'] == 6
+    assert threadNames['fetch'] == {threading.current_thread().name}
+    assert threadNames['save'] <= {'Parse-1', 'Parse-2'}, 'Pages were not parsed by the parse workers'
+    assert queueManager.addToScrapeCompletedQueue.call_count == 6, 'Parsed articles were not queued'
+
+
+def test_ParseStage_bounded_queue_blocks_fetchers():
+    """A full parse queue should block the fetch workers until the parse workers catch up."""
+    import time
+    from unittest.mock import MagicMock
+    from newslookout.plugins.mod_en_in_ndtv import mod_en_in_ndtv
+    from newslookout.worker import ParseStage
+    queueManager = MagicMock()
+    queueManager.shutdown_event = threading.Event()
+    parseStage = ParseStage(queueManager, MagicMock(), num_workers=1, queue_size=2)
+    pluginInst = mod_en_in_ndtv()
+    for i in range(2):
+        parseStage.submit(pluginInst, f'https://www.ndtv.com/news-{i}', '<html></html>', MagicMock(), 'fetcher')
+    assert parseStage.get_pending(pluginInst.pluginName) == 2
+    submitter = threading.Thread(target=parseStage.submit,
+                                 args=(pluginInst, 'https://www.ndtv.com/news-2', '<html></html>',
+                                       MagicMock(), 'fetcher'))
+    submitter.start()
+    time.sleep(0.5)
+    assert submitter.is_alive(), 'Fetcher was not blocked by the full parse queue'
+    pluginInst.parseRawData = MagicMock(return_value=(None, [], '<html></html>'))
+    pluginInst.saveParsedData = MagicMock(side_effect=lambda url, data, links, html, result: result)
+    parseStage.start()
+    submitter.join(timeout=10)
+    assert not submitter.is_alive()
+    parseStage.stop(timeout=10)
+    assert parseStage.get_pending() == 0
+    assert pluginInst.parseRawData.call_count == 3
+
+
 if __name__ == "__main__":
     test_worker_init()
 